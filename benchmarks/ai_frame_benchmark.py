@@ -0,0 +1,173 @@
+"""
+Benchmark of the cost of the AI on each frame of a foes turn, comparing the previous
+eager evaluation computing moves and target distances on every frame, the lazy one
+only computing them when the acting entity has to take a decision, and the planned one
+resolving the whole side at the beginning of its turn and playing the plan back.
+
+Run it from the root of the project with: python -m benchmarks.ai_frame_benchmark
+It can be run without any display by setting the SDL_VIDEODRIVER and SDL_AUDIODRIVER
+environment variables to dummy.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from collections.abc import Callable
+from typing import Optional
+
+import pygame
+import pygamepopup
+from lxml import etree
+
+import src.gui.fonts as font
+import src.services.load_from_xml_manager as loader
+from src.constants import MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH
+from src.game_entities.character import Character
+from src.game_entities.movable import EntityState, Movable
+from src.gui.constant_sprites import init_constant_sprites
+from src.gui.position import Position
+from src.services.level_engine import EntityTurn, LevelEngine, LevelStatus
+
+SAVE_PATH = "tests/test_saves/complete_first_level_save.xml"
+SEED = 0
+TURNS = 3
+
+
+def setup() -> None:
+    """
+    Initialize pygame and the game data needed to load a level.
+    """
+    pygame.init()
+    pygamepopup.init()
+    font.init_fonts()
+    pygame.display.set_mode((MAIN_WIN_WIDTH, MAIN_WIN_HEIGHT))
+    Character.init_data(loader.load_races(), loader.load_classes())
+    init_constant_sprites()
+
+
+def load_level(save_path: str) -> LevelEngine:
+    """
+    Return the level described by the given save file, with all its content loaded.
+
+    Keyword arguments:
+    save_path -- the path to the save file
+    """
+    tree_root: etree.Element = etree.parse(save_path).getroot()
+    level_id = int(tree_root.find("level/index").text.strip())
+    level = LevelEngine(
+        f"maps/level_{level_id}/",
+        level_id,
+        LevelStatus[tree_root.find("level/phase").text.strip()],
+        int(tree_root.find("level/turn").text.strip()),
+        tree_root.find("level/entities"),
+    )
+    level.load_level_content()
+    return level
+
+
+def eager_process_entity_action(level: LevelEngine, entity: Movable) -> None:
+    """
+    Previous implementation of LevelEngine.process_entity_action for a foe,
+    computing the moves and the target distances on every call.
+    """
+    possible_moves = level.get_possible_moves(entity.position, entity.max_moves)
+    targets = level.players + level.entities.allies
+    targets_distance = level.distance_between_all(entity, targets)
+    state = entity.state
+    tile: Optional[Position] = entity.act(
+        lambda: possible_moves,
+        lambda: targets_distance,
+        lambda target: level.get_ai_path_towards(entity, target),
+    )
+    if tile:
+        if state is EntityState.HAVE_TO_ACT:
+            level.notify_entity_move(entity)
+            entity.set_move(level.get_ai_path_to(entity, tile))
+        else:
+            level.duel(
+                entity, level.get_entity_on_tile(tile), targets, entity.attack_kind
+            )
+            entity.end_turn()
+
+
+def lazy_process_entity_action(level: LevelEngine, entity: Movable) -> None:
+    """
+    Handle the action of a foe for one frame without any plan,
+    computing the data needed by a decision only when it is taken.
+    """
+    level.compute_entity_action(entity, level.players + level.entities.allies)
+
+
+def play_foes_turns(
+    process_entity_action: Callable[[LevelEngine, Movable], None],
+    planned: bool,
+) -> dict[str, list[float]]:
+    """
+    Return the duration in milliseconds of each frame spent on the AI during several foes turns,
+    by state of the acting entity, along with the duration of each beginning of turn.
+
+    Keyword arguments:
+    process_entity_action -- the function handling the action of a foe for one frame
+    planned -- whether the turn of the foes should be planned at its beginning or not
+    """
+    random.seed(SEED)
+    level = load_level(SAVE_PATH)
+    if not planned:
+        level.schedule_side_turn_plan = lambda is_ally: None
+    durations: dict[str, list[float]] = {"BEGIN_TURN": []}
+    durations.update({state.name: [] for state in EntityState})
+    for _ in range(TURNS):
+        level.side_turn = EntityTurn.FOES
+        start = time.perf_counter()
+        level.begin_turn()
+        durations["BEGIN_TURN"].append((time.perf_counter() - start) * 1000)
+        entity: Optional[Movable] = next(
+            (foe for foe in level.entities.foes if not foe.turn_is_finished()), None
+        )
+        while entity is not None and level.players:
+            state = entity.state
+            start = time.perf_counter()
+            process_entity_action(level, entity)
+            durations[state.name].append((time.perf_counter() - start) * 1000)
+            entity = next(
+                (foe for foe in level.entities.foes if not foe.turn_is_finished()),
+                None,
+            )
+    return durations
+
+
+def run() -> None:
+    """
+    Run the benchmark with both evaluation strategies and print the mean frame cost by state.
+    """
+    setup()
+    for name, process_entity_action, planned in (
+        ("eager", eager_process_entity_action, False),
+        ("lazy", lazy_process_entity_action, False),
+        (
+            "planned",
+            lambda level, entity: level.process_entity_action(entity, False),
+            True,
+        ),
+    ):
+        durations = play_foes_turns(process_entity_action, planned)
+        all_durations = [
+            duration
+            for state_durations in durations.values()
+            for duration in state_durations
+        ]
+        print(
+            f"{name}: {sum(all_durations) / TURNS:.3f} ms of AI per turn, "
+            + ", ".join(
+                f"{state} {statistics.mean(state_durations):.4f} ms "
+                f"({len(state_durations)} frames)"
+                for state, state_durations in durations.items()
+                if state_durations
+            )
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,72 @@
+"""
+Benchmark of the forecast of the outcome of the duels between the players and the foes of
+a level, as computed for the attack preview and the choice of the targets of the AI.
+
+Run it from the root of the project with: python -m benchmarks.duel_forecast_benchmark
+"""
+
+from __future__ import annotations
+
+import time
+
+import pygame
+import pygamepopup
+
+import src.gui.fonts as font
+import src.services.load_from_xml_manager as loader
+from src.game_entities.character import Character
+from src.services.assets_manager import enable_headless_mode
+from src.services.level_engine import LevelEngine
+
+LEVEL = 0
+REPETITIONS = 1000
+
+
+def setup() -> LevelEngine:
+    """
+    Initialize the game data without any display and return the loaded level.
+    """
+    enable_headless_mode()
+    pygame.init()
+    pygamepopup.init()
+    font.init_fonts()
+    Character.init_data(loader.load_races(), loader.load_classes())
+    level = LevelEngine(f"maps/level_{LEVEL}/", LEVEL)
+    level.load_level_content()
+    return level
+
+
+def measure(level: LevelEngine) -> None:
+    """
+    Forecast every duel between a player and a foe of the level several times
+    and print the mean duration of a forecast.
+
+    Keyword arguments:
+    level -- the level whose entities are fighting
+    """
+    duels = [
+        duel
+        for player in level.players
+        for foe in level.entities.foes
+        for duel in ((player, foe), (foe, player))
+    ]
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        for attacker, target in duels:
+            level.forecast_attack(attacker, target)
+    duration = (time.perf_counter() - start) / (REPETITIONS * len(duels))
+    print(
+        f"{len(duels)} duels forecast {REPETITIONS} times: "
+        f"{duration * 1_000_000:.1f} us per forecast"
+    )
+
+
+def run() -> None:
+    """
+    Run the benchmark on the level.
+    """
+    measure(setup())
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,94 @@
+"""
+Benchmark of the cost of drawing a frame of the first level, when the whole screen is drawn again
+and when only the elements that changed are drawn again.
+
+Run it from the root of the project with: python -m benchmarks.frame_cost_benchmark
+It can be run without any display by setting the SDL_VIDEODRIVER and SDL_AUDIODRIVER
+environment variables to dummy.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pygame
+import pygamepopup
+
+import src.gui.fonts as font
+import src.services.load_from_xml_manager as loader
+from src.constants import (MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH, TILE_SIZE,
+                           WIN_HEIGHT, WIN_WIDTH)
+from src.game_entities.character import Character
+from src.gui.constant_sprites import init_constant_sprites
+from src.scenes.level_scene import LevelScene
+
+NB_FRAMES = 300
+
+
+def setup() -> None:
+    """
+    Initialize pygame and the game data needed to load a level.
+    """
+    pygame.init()
+    pygamepopup.init()
+    font.init_fonts()
+    pygame.display.set_mode((MAIN_WIN_WIDTH, MAIN_WIN_HEIGHT))
+    Character.init_data(loader.load_races(), loader.load_classes())
+    init_constant_sprites()
+
+
+def build_level() -> LevelScene:
+    """
+    Load the first level on a surface of the size of the level window, without any menu opened.
+    """
+    level = LevelScene(pygame.Surface((WIN_WIDTH, WIN_HEIGHT)), "maps/level_0/", 0)
+    level.load_level_content()
+    while level.menu_manager.active_menu:
+        level.menu_manager.close_active_menu()
+    return level
+
+
+def measure(level: LevelScene, full_redraw: bool, with_move: bool) -> None:
+    """
+    Draw a number of frames of the level and print the mean duration of a frame.
+
+    Keyword arguments:
+    level -- the level to draw
+    full_redraw -- whether the whole screen is drawn again on every frame or not
+    with_move -- whether a foe moves by one pixel on every frame or not
+    """
+    foe = level.engine.entities.foes[0]
+    start_position = foe.position
+    level.render()
+    start = time.perf_counter()
+    for frame in range(NB_FRAMES):
+        if with_move:
+            foe.position = (
+                start_position[0] + frame % TILE_SIZE,
+                start_position[1],
+            )
+        if full_redraw:
+            level.invalidate(level.screen.get_rect())
+        level.render()
+    duration = time.perf_counter() - start
+    foe.position = start_position
+    print(
+        f"{'full' if full_redraw else 'dirty'} redraw, "
+        f"{'one moving foe' if with_move else 'idle'}: "
+        f"{duration / NB_FRAMES * 1000:.3f} ms per frame"
+    )
+
+
+def run() -> None:
+    """
+    Run the benchmark on the first level.
+    """
+    setup()
+    level = build_level()
+    for with_move in (False, True):
+        measure(level, True, with_move)
+        measure(level, False, with_move)
+
+
+if __name__ == "__main__":
+    run()
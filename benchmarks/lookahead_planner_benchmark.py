@@ -0,0 +1,115 @@
+"""
+Benchmark of the lookahead search of the action of a boss surrounded by its opponents,
+at each depth, with and without the transposition table,
+and with the default budgets to check that the number of positions is reached well before
+the time budget.
+
+Run it from the root of the project with: python -m benchmarks.lookahead_planner_benchmark
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from src.services.lookahead_planner import BoardUnit, LookaheadPlanner
+from src.services.walkability_grid import WalkabilityGrid
+
+WIDTH = 22
+HEIGHT = 14
+OBSTACLE_RATIO = 0.1
+MAX_DEPTH = 4
+
+
+class DisabledTable(dict):
+    """
+    A transposition table that never records anything.
+    """
+
+    def __setitem__(self, key: int, value: any) -> None:
+        pass
+
+
+def build_board(seed: int = 0) -> tuple[WalkabilityGrid, list[BoardUnit]]:
+    """
+    Build a synthetic map with randomly placed obstacles, a boss at its center
+    and four opponents around it.
+
+    Keyword arguments:
+    seed -- the seed used to place the obstacles
+    """
+    generator = random.Random(seed)
+    grid = WalkabilityGrid(0, 0, WIDTH, HEIGHT)
+    for index in range(WIDTH * HEIGHT):
+        grid.blocked[index] = generator.random() < OBSTACLE_RATIO
+    placements = [
+        ((10, 7), 60, 4, (1, 2)),
+        ((5, 7), 20, 5, (1,)),
+        ((14, 4), 20, 5, (1,)),
+        ((12, 11), 15, 5, (1,)),
+        ((16, 7), 25, 3, (2,)),
+    ]
+    units: list[BoardUnit] = []
+    for unit, ((column, row), hit_points, max_moves, reach) in enumerate(placements):
+        tile = row * WIDTH + column
+        grid.blocked[tile] = True
+        damage = (0.0,) + (8.0,) * 4 if unit == 0 else (6.0,) + (0.0,) * 4
+        units.append(BoardUnit(tile, hit_points, max_moves, reach, damage))
+    return grid, units
+
+
+def measure(grid: WalkabilityGrid, units: list[BoardUnit], with_table: bool) -> None:
+    """
+    Search the action of the boss at each depth without any budget
+    and print the number of positions searched and the duration of the search.
+
+    Keyword arguments:
+    grid -- the grid of tiles that can be crossed
+    units -- the boss followed by its opponents
+    with_table -- whether the transposition table is used or not
+    """
+    for depth in range(1, MAX_DEPTH + 1):
+        planner = LookaheadPlanner(
+            grid, units, depth, time_budget=float("inf"), max_nodes=10**9
+        )
+        if not with_table:
+            planner.transposition_table = DisabledTable()
+        start = time.perf_counter()
+        planner.search()
+        duration = time.perf_counter() - start
+        print(
+            f"depth {depth} {'with' if with_table else 'without'} table: "
+            f"{planner.nodes} positions in {duration * 1000:.1f} ms"
+        )
+
+
+def measure_default_budgets(grid: WalkabilityGrid, units: list[BoardUnit]) -> None:
+    """
+    Search the action of the boss with the default budgets
+    and print the depth reached and the share of the time budget spent.
+
+    Keyword arguments:
+    grid -- the grid of tiles that can be crossed
+    units -- the boss followed by its opponents
+    """
+    planner = LookaheadPlanner(grid, units)
+    planner.search()
+    print(
+        f"default budgets: depth {planner.depth} with {planner.nodes} positions "
+        f"in {planner.search_time * 1000:.1f} ms, "
+        f"{planner.search_time / planner.time_budget:.0%} of the time budget"
+    )
+
+
+def run() -> None:
+    """
+    Run the benchmark on a synthetic map.
+    """
+    grid, units = build_board()
+    measure(grid, units, True)
+    measure(grid, units, False)
+    measure_default_budgets(grid, units)
+
+
+if __name__ == "__main__":
+    run()
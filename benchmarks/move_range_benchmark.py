@@ -0,0 +1,137 @@
+"""
+Benchmark of the move range computation, comparing the previous breadth-first search
+working on Position objects with the flood fill over the walkability grid.
+
+Run it from the root of the project with: python -m benchmarks.move_range_benchmark
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from collections.abc import Callable
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.walkability_grid import WalkabilityGrid
+
+OBSTACLE_RATIO = 0.2
+REPETITIONS = 20
+
+
+def build_grid(width: int, height: int, seed: int = 0) -> WalkabilityGrid:
+    """
+    Build a synthetic map with randomly placed obstacles.
+
+    Keyword arguments:
+    width -- the number of tiles on a row of the map
+    height -- the number of tiles on a column of the map
+    seed -- the seed used to place the obstacles
+    """
+    generator = random.Random(seed)
+    grid = WalkabilityGrid(0, 0, width, height)
+    for index in range(width * height):
+        grid.blocked[index] = generator.random() < OBSTACLE_RATIO
+    grid.blocked[(height // 2) * width + width // 2] = 0
+    return grid
+
+
+def legacy_tile_availability(grid: WalkabilityGrid) -> Callable[[Position], bool]:
+    """
+    Return a tile availability check answering like the previous LevelScene.is_tile_available
+    once the occupancy index is available, for the blocked tiles of the given grid.
+    """
+    blocked_positions = {
+        (grid.position_of(index)[0], grid.position_of(index)[1])
+        for index, blocked in enumerate(grid.blocked)
+        if blocked
+    }
+    map_width, map_height = grid.width * TILE_SIZE, grid.height * TILE_SIZE
+
+    def is_tile_available(tile: Position) -> bool:
+        if not (0 <= tile[0] < map_width and 0 <= tile[1] < map_height):
+            return False
+        return (tile[0], tile[1]) not in blocked_positions
+
+    return is_tile_available
+
+
+def legacy_possible_moves(
+    is_tile_available: Callable[[Position], bool], position: Position, max_moves: int
+) -> dict[Position, int]:
+    """
+    Previous implementation of LevelScene.get_possible_moves.
+    """
+    tiles: dict[Position, int] = {Position(position.x, position.y): 0}
+    previously_computed_tiles: dict[Position, int] = tiles
+    for i in range(1, max_moves + 1):
+        tiles_current_level: dict[Position, int] = {}
+        for tile in previously_computed_tiles:
+            for x_coordinate in range(-1, 2):
+                for y_coordinate in (1 - abs(x_coordinate), -1 + abs(x_coordinate)):
+                    tile_position = Position(
+                        tile[0] + (x_coordinate * TILE_SIZE),
+                        tile[1] + (y_coordinate * TILE_SIZE),
+                    )
+                    if is_tile_available(tile_position) and tile_position not in tiles:
+                        tiles_current_level[tile_position] = i
+        tiles.update(previously_computed_tiles)
+        previously_computed_tiles = tiles_current_level
+    tiles.update(previously_computed_tiles)
+    return tiles
+
+
+def grid_possible_moves(
+    grid: WalkabilityGrid, position: Position, max_moves: int
+) -> dict[Position, int]:
+    """
+    Current implementation of LevelEngine.get_possible_moves.
+    """
+    return {
+        grid.position_of(tile): distance
+        for tile, distance in grid.reachable_tiles(
+            grid.index_of(position), max_moves
+        ).items()
+    }
+
+
+def measure(function: Callable[[], object]) -> float:
+    """
+    Return the mean duration in milliseconds of a call to the given function.
+    """
+    return timeit.timeit(function, number=REPETITIONS) / REPETITIONS * 1000
+
+
+def run() -> None:
+    """
+    Run the benchmark on a map of the size of the game levels and on a large synthetic map.
+    """
+    for width, height, max_moves in (
+        (22, 14, 6),
+        (22, 14, 22 * 14),
+        (200, 200, 8),
+        (200, 200, 200 * 200),
+    ):
+        grid = build_grid(width, height)
+        is_tile_available = legacy_tile_availability(grid)
+        start = grid.position_of((height // 2) * width + width // 2)
+        legacy_result = legacy_possible_moves(is_tile_available, start, max_moves)
+        assert legacy_result == grid_possible_moves(grid, start, max_moves)
+
+        legacy_duration = measure(
+            lambda: legacy_possible_moves(is_tile_available, start, max_moves)
+        )
+        grid_duration = measure(lambda: grid_possible_moves(grid, start, max_moves))
+        search_duration = measure(
+            lambda: grid.reachable_tiles(grid.index_of(start), max_moves)
+        )
+        print(
+            f"{width}x{height} map, {max_moves} moves max, {len(legacy_result)} tiles reached: "
+            f"legacy {legacy_duration:.3f} ms, grid {grid_duration:.3f} ms "
+            f"(search only {search_duration:.3f} ms), "
+            f"speedup x{legacy_duration / grid_duration:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,111 @@
+"""
+Benchmark of the planning of a side with hundreds of entities controlled by the AI,
+comparing the planning in the game process with the evaluation of the decisions
+by 1 to N worker processes.
+
+Run it from the root of the project with: python -m benchmarks.parallel_ai_benchmark [N]
+N defaults to the number of CPUs of the machine.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+from src.game_entities.movable import EntityStrategy
+from src.services.parallel_side_turn_planner import (ParallelSideTurnPlanner,
+                                                     create_executor)
+from src.services.side_turn_planner import AgentSnapshot, SideTurnPlanner
+from src.services.walkability_grid import WalkabilityGrid
+
+SEED = 0
+WIDTH = 80
+HEIGHT = 80
+OBSTACLE_RATIO = 0.15
+AGENTS = 400
+TARGETS = 10
+ACTIVE_RATIO = 0.05
+REPETITIONS = 3
+
+
+def build_board() -> tuple[WalkabilityGrid, list[AgentSnapshot], list[int]]:
+    """
+    Return a large map with random obstacles, the entities that should act on it
+    and the tiles of their targets.
+    """
+    generator = random.Random(SEED)
+    grid = WalkabilityGrid(0, 0, WIDTH, HEIGHT)
+    for tile in range(WIDTH * HEIGHT):
+        grid.blocked[tile] = generator.random() < OBSTACLE_RATIO
+    free_tiles = [tile for tile in range(WIDTH * HEIGHT) if not grid.blocked[tile]]
+    occupied_tiles = generator.sample(free_tiles, AGENTS + TARGETS)
+    for tile in occupied_tiles:
+        grid.blocked[tile] = True
+    agents = [
+        AgentSnapshot(
+            tile,
+            generator.randint(3, 6),
+            (1,) if generator.random() < 0.7 else (2, 3),
+            (
+                EntityStrategy.ACTIVE
+                if generator.random() < ACTIVE_RATIO
+                else EntityStrategy.SEMI_ACTIVE
+            ),
+        )
+        for tile in occupied_tiles[:AGENTS]
+    ]
+    return grid, agents, occupied_tiles[AGENTS:]
+
+
+def measure(plan) -> tuple[float, list]:
+    """
+    Return the best duration in milliseconds of the given planning, and its result.
+    """
+    durations = []
+    actions = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        actions = plan()
+        durations.append((time.perf_counter() - start) * 1000)
+    return min(durations), actions
+
+
+def run() -> None:
+    """
+    Run the planning in the game process and with an increasing number of workers,
+    and print the duration of each of them.
+    """
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    grid, agents, targets = build_board()
+    print(f"{WIDTH}x{HEIGHT} map, {len(agents)} entities, {len(targets)} targets")
+    reference_duration, reference = measure(
+        lambda: SideTurnPlanner(grid).plan(agents, targets)
+    )
+    print(f"game process: {reference_duration:.1f} ms")
+    for workers in range(1, max_workers + 1):
+        with create_executor(workers) as executor:
+            # Start the worker processes before measuring
+            list(executor.map(abs, range(workers)))
+            planners = []
+
+            def plan_in_parallel():
+                planners.append(
+                    ParallelSideTurnPlanner(
+                        grid, executor, max(1, len(agents) // (workers * 4))
+                    )
+                )
+                return planners[-1].plan(agents, targets)
+
+            duration, actions = measure(plan_in_parallel)
+        assert actions == reference, "Parallel planning should not change the plan"
+        print(
+            f"{workers} worker(s): {duration:.1f} ms, "
+            f"speedup {reference_duration / duration:.2f}, "
+            f"{planners[-1].reused_decisions} decisions of the workers kept"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,102 @@
+"""
+Benchmark of the replay of the decisions recorded in a command log, played again without
+any display at maximum speed, with the verification of the final state of the level.
+
+Run it from the root of the project with: python -m benchmarks.replay_benchmark [PATH]
+PATH is a command log recorded while playing with the option to record decisions enabled,
+by default in saves/command_logs/.
+Without it, the levels are first played by the automatic player controller
+and their recorded command logs are replayed.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import pygame
+import pygamepopup
+
+import src.gui.fonts as font
+import src.services.load_from_xml_manager as loader
+from src.game_entities.character import Character
+from src.services.assets_manager import enable_headless_mode
+from src.services.command_log import CommandLog
+from src.services.level_engine import LevelEngine
+from src.services.level_replay import replay_level
+from src.services.player_controller import AutoPlayerController
+from src.services.random_service import RandomService
+from src.services.save_state_manager import SaveStateManager
+
+SEED = 0
+LEVELS = 4
+MAX_TURNS = 40
+REPETITIONS = 5
+
+
+def setup() -> None:
+    """
+    Initialize the game data needed to load a level without any display.
+    """
+    enable_headless_mode()
+    pygame.init()
+    pygamepopup.init()
+    font.init_fonts()
+    Character.init_data(loader.load_races(), loader.load_classes())
+
+
+def record(number: int) -> CommandLog:
+    """
+    Return the command log of the given level played by the automatic player controller.
+
+    Keyword arguments:
+    number -- the number identifying the level
+    """
+    level = LevelEngine(
+        f"maps/level_{number}/", number, random_service=RandomService(SEED)
+    )
+    level.command_log = CommandLog.start(level)
+    level.run(AutoPlayerController(), max_turns=MAX_TURNS)
+    level.command_log.state_hash = SaveStateManager(level).compute_state_hash()
+    return level.command_log
+
+
+def measure(name: str, command_log: CommandLog) -> None:
+    """
+    Replay the given command log several times and print the best duration of the replay
+    and whether the final state of the level is the recorded one.
+
+    Keyword arguments:
+    name -- the name of the command log
+    command_log -- the command log that should be replayed
+    """
+    durations = []
+    state_hash = None
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        level = replay_level(command_log)
+        durations.append((time.perf_counter() - start) * 1000)
+        state_hash = SaveStateManager(level).compute_state_hash()
+    duration = min(durations)
+    print(
+        f"{name}: {len(command_log.commands)} commands, {level.turn} turns "
+        f"replayed in {duration:.1f} ms ({duration / max(level.turn, 1):.2f} ms/turn), "
+        f"final state {'verified' if state_hash == command_log.state_hash else 'DIFFERS'}"
+    )
+
+
+def run() -> None:
+    """
+    Replay the given command log or the command logs of the levels played by the
+    automatic player controller, and print the duration of each replay.
+    """
+    setup()
+    if len(sys.argv) > 1:
+        measure(sys.argv[1], CommandLog.load(sys.argv[1]))
+        return
+    for number in range(LEVELS):
+        measure(f"level {number}", record(number))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,67 @@
+"""
+Micro-benchmarks of the keys that can identify a tile in the dictionaries and sets
+of the pathfinding code: Position, pair of floats, Tile and packed integer index.
+
+Run it from the root of the project with: python -m benchmarks.tile_key_benchmark
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable, Hashable
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.tile import Tile
+
+WIDTH = 22
+HEIGHT = 14
+REPETITIONS = 200
+
+
+def build_keys() -> dict[str, list[Hashable]]:
+    """
+    Return the keys of every tile of a map of the size of the game levels, for each kind of key.
+    """
+    tiles = [Tile(column, row) for row in range(HEIGHT) for column in range(WIDTH)]
+    return {
+        "Position": [tile.to_position() for tile in tiles],
+        "float pair": [
+            (float(tile.column * TILE_SIZE), float(tile.row * TILE_SIZE))
+            for tile in tiles
+        ],
+        "Tile": tiles,
+        "packed index": [tile.row * WIDTH + tile.column for tile in tiles],
+    }
+
+
+def measure(function: Callable[[], object]) -> float:
+    """
+    Return the mean duration in microseconds of a call to the given function.
+    """
+    return timeit.timeit(function, number=REPETITIONS) / REPETITIONS * 1_000_000
+
+
+def run() -> None:
+    """
+    Run the benchmarks for each kind of key and print the mean duration for a whole map.
+    """
+    positions = build_keys()["Position"]
+    print(f"{WIDTH}x{HEIGHT} map, durations for all the tiles of the map:")
+    for name, keys in build_keys().items():
+        table = dict.fromkeys(keys, 0)
+        hashing = measure(lambda: [hash(key) for key in keys])
+        building = measure(lambda: dict.fromkeys(keys, 0))
+        lookup = measure(lambda: [table[key] for key in keys])
+        print(
+            f"{name:>12}: hash {hashing:8.1f} us, dict build {building:8.1f} us, "
+            f"dict lookup {lookup:8.1f} us"
+        )
+    conversion = measure(
+        lambda: [Tile.from_position(position) for position in positions]
+    )
+    print(f"Position to Tile conversion: {conversion:.1f} us")
+
+
+if __name__ == "__main__":
+    run()
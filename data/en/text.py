@@ -29,6 +29,10 @@ STR_FAST = "Fast"
 STR_SLOW = "Slow"
 STR_WINDOW = "Window"
 STR_FULL = "Full"
+STR_FAST_FORWARD_ = "Fast forward :"
+STR_RECORD_COMMAND_LOGS_ = "Record decisions :"
+STR_ON = "On"
+STR_OFF = "Off"
 
 # Save game menu
 STR_SAVE_GAME_MENU = "Save Game"
@@ -291,6 +295,10 @@ def f_ATTACKER_GAINED_A_LEVEL(attacker):
     return f"{attacker} gained a level!"
 
 
+def f_DUEL_FORECAST(kill_probability, damage, experience):
+    return f"Kill: {kill_probability:.0%}  Damage: {damage:.1f}  XP: {experience:.1f}"
+
+
 def f_ITEM_CANNOT_BE_TRADED_NOT_ENOUGH_PLACE_IN_RECEIVERS_INVENTORY(receiver):
     return f"Item can't be traded: not enough place in {receiver}'s inventory"
 
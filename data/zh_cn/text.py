@@ -33,6 +33,10 @@ STR_FAST = "快速"
 STR_SLOW = "慢速"
 STR_WINDOW = "窗口化"
 STR_FULL = "全屏"
+STR_FAST_FORWARD_ = "快进："
+STR_RECORD_COMMAND_LOGS_ = "记录决策："
+STR_ON = "开"
+STR_OFF = "关"
 
 # Save game menu
 STR_SAVE_GAME_MENU = "保存游戏"
@@ -292,6 +296,10 @@ def f_ATTACKER_GAINED_A_LEVEL(attacker):
     return f"{attacker}升级了！"  # f"{attacker} gained a level!"
 
 
+def f_DUEL_FORECAST(kill_probability, damage, experience):
+    return f"击杀：{kill_probability:.0%}  伤害：{damage:.1f}  经验：{experience:.1f}"  # f"Kill: {kill_probability:.0%}  Damage: {damage:.1f}  XP: {experience:.1f}"
+
+
 def f_ITEM_CANNOT_BE_TRADED_NOT_ENOUGH_PLACE_IN_RECEIVERS_INVENTORY(receiver):
     return f"不能完成交易：{receiver}的背包中没有足够的空间"  # f"Item can't be traded: not enough place in {receiver}'s inventory"
 
@@ -32,10 +32,15 @@ def main_loop(
     """
     action: QuitActionKind = QuitActionKind.CONTINUE
     while action == QuitActionKind.CONTINUE:
-        screen.fill(BLACK)
         action = game_controller.process_game_iteration()
-        show_fps(screen, clock, fonts.fonts["FPS_FONT"])
-        pygame.display.update()
+        fps_rect: pygame.Rect = show_fps(screen, clock, fonts.fonts["FPS_FONT"])
+        if game_controller.dirty_rects is None:
+            pygame.display.update()
+        else:
+            # Only the parts of the screen that changed are sent to the display
+            pygame.display.update(game_controller.dirty_rects + [fps_rect])
+        # The frame rate is drawn over the scene, which should draw this area again
+        game_controller.invalidate(fps_rect)
         clock.tick(FRAME_RATE)
     return action
 
@@ -46,8 +51,7 @@ if __name__ == "__main__":
     import subprocess
     import sys
 
-    from src.constants import (BLACK, FRAME_RATE, MAIN_WIN_HEIGHT,
-                               MAIN_WIN_WIDTH)
+    from src.constants import FRAME_RATE, MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH
     from src.game_entities.character import Character
     from src.game_entities.movable import Movable
     from src.gui import constant_sprites, fonts
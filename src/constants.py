@@ -6,6 +6,26 @@ Can be imported from anywhere.
 import pygame
 
 FRAME_RATE = 60
+# Maximum time in seconds spent on the AI computations during a single frame
+AI_FRAME_BUDGET = 0.25 / FRAME_RATE
+# Number of worker processes taking the AI decisions of large sides, 0 to disable them
+AI_WORKERS = 0
+# Minimum number of entities of a side for their AI decisions to be taken by worker processes
+AI_WORKERS_MIN_ENTITIES = 64
+# Maximum time in seconds waited for the worker processes taking the AI decisions of a side
+AI_WORKERS_TIMEOUT = 10
+# Maximum number of actions of the entities controlled by the AI played during a single frame
+# in fast-forward mode
+FAST_FORWARD_UPDATES_PER_FRAME = 100
+# Maximum number of actions searched ahead by the entities following the lookahead strategy,
+# counting the actions of the entity and the replies of its opponents
+LOOKAHEAD_DEPTH = 4
+# Maximum time in seconds spent searching the action of an entity following the lookahead strategy,
+# only a safety net for slow machines: the number of positions searched should be reached first
+LOOKAHEAD_TIME_BUDGET = 2.0
+# Maximum number of positions searched for the action of an entity following the lookahead strategy,
+# enough for a complete search at the maximum depth around a boss
+LOOKAHEAD_MAX_NODES = 5000
 
 INITIAL_MAX = 10000
 
@@ -70,6 +90,8 @@ BUTTON_SIZE = (200, 60)
 # Options default values
 ANIMATION_SPEED = 4
 SCREEN_SIZE = 2
+FAST_FORWARD = 0
+RECORD_COMMAND_LOGS = 0
 
 # Value for kind of action on close button
 UNFINAL_ACTION = 1
@@ -77,3 +99,5 @@ FINAL_ACTION = 2
 
 # Number of save slots
 SAVE_SLOTS = 3
+# Directory where the decisions made by the players during the last levels are recorded
+COMMAND_LOGS_DIRECTORY = "saves/command_logs/"
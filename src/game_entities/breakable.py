@@ -5,6 +5,8 @@ Generally, this class helps to represent breakable walls.
 
 from __future__ import annotations
 
+from typing import Optional
+
 import pygame
 from lxml import etree
 
@@ -27,6 +29,7 @@ class Breakable(Destroyable):
 
     Attributes:
     sprite_link -- the relative path to the visual representation of the element
+    _cracked_sprite -- the sprite of the element with the cracks drawn on it, built when first displayed
     """
 
     def __init__(
@@ -40,17 +43,17 @@ class Breakable(Destroyable):
         super().__init__("Breakable", position, sprite, hit_points, defense, resistance)
         # Useful in case of saving
         self.sprite_link: str = sprite
+        self._cracked_sprite: Optional[pygame.Surface] = None
 
-    def display(self, screen: pygame.Surface) -> None:
+    def get_base_sprite(self) -> pygame.Surface:
         """
-        Display the entity on the given screen and adding some cracks on it to add emphasis to its
+        Return the sprite of the entity with some cracks on it to add emphasis to its
         fragile nature.
-
-        Keyword arguments:
-        screen -- the screen on which the entity should be drawn
         """
-        super().display(screen)
-        screen.blit(constant_sprites["cracked"], self.position)
+        if self._cracked_sprite is None:
+            self._cracked_sprite = self.sprite.copy()
+            self._cracked_sprite.blit(constant_sprites["cracked"], (0, 0))
+        return self._cracked_sprite
 
     def save(self, tree_name: str) -> etree.Element:
         """
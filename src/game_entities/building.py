@@ -15,6 +15,7 @@ from src.game_entities.character import Character
 from src.game_entities.entity import Entity
 from src.gui.fonts import fonts
 from src.gui.position import Position
+from src.services.assets_manager import Sound, load_sound
 from src.services.language import *
 
 
@@ -57,16 +58,10 @@ class Building(Entity):
         super().__init__(name, position, sprite if sprite else sprite_link)
         self.sprite_link: str = sprite_link
         self.interaction: dict[str, any] = interaction
-        self.door_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "door.ogg")
-        )
-        self.talk_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "talking.ogg")
-        )
-        self.gold_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "trade.ogg")
-        )
-        self.inventory_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
+        self.door_sfx: Sound = load_sound(os.path.join("sound_fx", "door.ogg"))
+        self.talk_sfx: Sound = load_sound(os.path.join("sound_fx", "talking.ogg"))
+        self.gold_sfx: Sound = load_sound(os.path.join("sound_fx", "trade.ogg"))
+        self.inventory_sfx: Sound = load_sound(
             os.path.join("sound_fx", "inventory.ogg")
         )
 
@@ -87,16 +82,16 @@ class Building(Entity):
         entries: list[list[BoxElement]] = []
 
         if not self.interaction:
-            pygame.mixer.Sound.play(self.door_sfx)
+            self.door_sfx.play()
             entries.append(
                 [TextElement(STR_THIS_HOUSE_SEEMS_CLOSED, font=fonts["ITEM_DESC_FONT"])]
             )
         else:
-            pygame.mixer.Sound.play(self.talk_sfx)
+            self.talk_sfx.play()
             for talk in self.interaction["talks"]:
                 entries.append([TextElement(talk, font=fonts["ITEM_DESC_FONT"])])
             if "gold" in self.interaction and self.interaction["gold"] > 0:
-                pygame.mixer.Sound.play(self.gold_sfx)
+                self.gold_sfx.play()
                 actor.gold += self.interaction["gold"]
                 earn_text: str = f_YOU_RECEIVED_NUMBER_GOLD(self.interaction["gold"])
                 entries.append(
@@ -107,7 +102,7 @@ class Building(Entity):
                     ]
                 )
             if "item" in self.interaction and self.interaction["item"]:
-                pygame.mixer.Sound.play(self.inventory_sfx)
+                self.inventory_sfx.play()
                 actor.set_item(self.interaction["item"])
                 earn_text: str = f_YOU_RECEIVED_ITEM(self.interaction["item"])
                 entries.append(
@@ -5,7 +5,6 @@ Defines Character class, the class defining allied entities or even playable ent
 from __future__ import annotations
 
 import math
-import random
 from collections.abc import Sequence
 from typing import Optional, Union
 
@@ -25,6 +24,8 @@ from src.game_entities.weapon import Weapon
 from src.gui.fonts import fonts
 from src.gui.position import Position
 from src.services.language import *
+from src.services.random_service import (RandomStream, RandomStreamKind,
+                                         get_random_stream)
 
 
 class Character(Movable):
@@ -149,17 +150,23 @@ class Character(Movable):
             element_grid.append(elements_line)
         return element_grid
 
-    def display(self, screen: pygame.Surface) -> None:
+    def get_overlays(self) -> list[pygame.Surface]:
         """
-        Display the character on the given screen.
-        Also display on top of it its equipment.
+        Return the sprites that should be drawn on top of the base sprite of the character:
+        its indicators according to its current state, and then its equipment.
+        """
+        return Movable.get_overlays(self) + [
+            equipment.equipped_sprite for equipment in self.equipments
+        ]
 
-        Keyword arguments:
-        screen -- the screen on which the movable entity should be drawn
+    def get_display_state(self) -> tuple:
         """
-        Movable.display(self, screen)
-        for equipment in self.equipments:
-            equipment.display(screen, self.position, True)
+        Return the values the look of the character on screen depends on,
+        including the sprites of its equipment.
+        """
+        return super().get_display_state() + tuple(
+            id(equipment.equipped_sprite) for equipment in self.equipments
+        )
 
     def lvl_up(self) -> None:
         """
@@ -176,48 +183,71 @@ class Character(Movable):
         """
         for equipment in self.equipments:
             if isinstance(equipment, Shield):
-                parried: bool = random.randint(1, 100) <= equipment.parry
+                parried: bool = (
+                    get_random_stream(RandomStreamKind.COMBAT).randint(1, 100)
+                    <= equipment.parry
+                )
                 if parried:
                     if equipment.used() <= 0:
                         self.remove_equipment(equipment)
                 return parried
         return False
 
-    def attacked(
-        self, entity: Entity, damage: int, kind: DamageKind, allies: Sequence[Entity]
+    def get_damage_taken(
+        self,
+        entity: Entity,
+        damage: int,
+        kind: DamageKind,
+        allies: Sequence[Entity],
+        with_shield: bool = True,
     ) -> int:
         """
-        Compute how much the entity should take and reduce the hit points of
-        the entity by this value.
-
-        Return the current hit points of the entity after applying the damage.
+        Return how much damage the character would take from an attack,
+        regardless of the hit points it has left.
+        The damage is first reduced by the equipments of the character.
 
         Keyword arguments:
         entity -- the other entity that is attacking the entity
         damage -- the attack's power
         kind -- the nature of the attack
         allies -- the allies of the entity
+        with_shield -- whether the shield of the character is taken into account if it has any
         """
         for equipment in self.equipments:
+            if not with_shield and isinstance(equipment, Shield):
+                continue
             if kind is DamageKind.PHYSICAL:
                 damage -= equipment.defense
             elif kind == DamageKind.SPIRITUAL:
                 damage -= equipment.resistance
-        return Movable.attacked(self, entity, damage, kind, allies)
+        return Movable.get_damage_taken(self, entity, damage, kind, allies)
 
-    def attack(self, entity: Entity) -> int:
+    def get_attack_damage(self, entity: Entity, with_weapon: bool = True) -> int:
         """
-        Return the damage that should be dealt to the given entity during an attack.
+        Return the damage that would be dealt to the given entity during an attack,
+        without wearing the weapon of the character.
 
         Keyword arguments:
         entity -- the target of the attack
+        with_weapon -- whether the weapon of the character is taken into account if it has any
         """
         damage: int = self.strength + self.get_stat_change("strength")
         weapon = self.get_weapon()
-        if weapon:
+        if weapon and with_weapon:
             damage += weapon.hit(self, entity)
-            if weapon.used() == 0:
-                self.remove_equipment(weapon)
+        return damage
+
+    def attack(self, entity: Entity) -> int:
+        """
+        Return the damage that should be dealt to the given entity during an attack.
+
+        Keyword arguments:
+        entity -- the target of the attack
+        """
+        damage: int = self.get_attack_damage(entity)
+        weapon = self.get_weapon()
+        if weapon and weapon.used() == 0:
+            self.remove_equipment(weapon)
         return damage
 
     def stats_up(self, nb_lvl: int = 1) -> None:
@@ -227,17 +257,18 @@ class Character(Movable):
         Keyword arguments:
         nb_lvl -- the number of levels earned
         """
+        stream: RandomStream = get_random_stream(RandomStreamKind.GROWTH)
         for _ in range(nb_lvl):
-            hp_increased: int = random.choice(
+            hp_increased: int = stream.choice(
                 self.classes_data[self.classes[0]]["stats_up"]["hp"]
             )
-            self.defense += random.choice(
+            self.defense += stream.choice(
                 self.classes_data[self.classes[0]]["stats_up"]["def"]
             )
-            self.resistance += random.choice(
+            self.resistance += stream.choice(
                 self.classes_data[self.classes[0]]["stats_up"]["res"]
             )
-            self.strength += random.choice(
+            self.strength += stream.choice(
                 self.classes_data[self.classes[0]]["stats_up"]["str"]
             )
             self.hit_points_max += hp_increased
@@ -365,6 +396,7 @@ class Character(Movable):
                     self.set_item(equip)
                     replacement = 1
             self.equipments.append(equipment)
+            self._composite_sprites.clear()
             return replacement
         return -1
 
@@ -388,6 +420,7 @@ class Character(Movable):
         """
         for index, equip in enumerate(self.equipments):
             if equip.identifier == equipment.identifier:
+                self._composite_sprites.clear()
                 return self.equipments.pop(index)
         return None
 
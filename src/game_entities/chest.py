@@ -6,19 +6,17 @@ or items.
 from __future__ import annotations
 
 import os
-import random
 from collections.abc import Sequence
 from typing import Optional
 
 import pygame
 from lxml import etree
 
-from src.constants import TILE_SIZE
 from src.game_entities.entity import Entity
 from src.game_entities.item import Item
 from src.gui.position import Position
-
-random.seed()
+from src.services.assets_manager import Sound, load_sound, load_sprite
+from src.services.random_service import RandomStreamKind, get_random_stream
 
 
 class Chest(Entity):
@@ -58,15 +56,11 @@ class Chest(Entity):
         super().__init__("Chest", position, sprite if sprite else sprite_close)
         self.sprite_close_link: str = sprite_close
         self.sprite_open_link: str = sprite_open
-        self.sprite_open: pygame.Surface = pygame.transform.scale(
-            pygame.image.load(sprite_open).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-        )
+        self.sprite_open: pygame.Surface = load_sprite(sprite_open)
         self.item: Item = Chest.determine_item(potential_items)
         self.opened: bool = False
         self.pick_lock_initiated: bool = False
-        self.chest_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "chest.ogg")
-        )
+        self.chest_sfx: Sound = load_sound(os.path.join("sound_fx", "chest.ogg"))
 
     @staticmethod
     def determine_item(potential_items: Sequence[tuple[Item, float]]) -> Item:
@@ -85,7 +79,7 @@ class Chest(Entity):
             times = int(probability * 100)
             bag += [item] * times
 
-        return random.choice(bag)
+        return get_random_stream(RandomStreamKind.LOOT).choice(bag)
 
     def open(self) -> Optional[Item]:
         """
@@ -99,7 +93,7 @@ class Chest(Entity):
         if not self.opened:
             self.sprite = self.sprite_open
             self.opened = True
-            pygame.mixer.Sound.play(self.chest_sfx)
+            self.chest_sfx.play()
             return self.item
         return None
 
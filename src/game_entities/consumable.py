@@ -7,10 +7,9 @@ from __future__ import annotations
 import os
 from collections.abc import Sequence
 
-import pygame
-
 from src.game_entities.effect import Effect
 from src.game_entities.item import Item
+from src.services.assets_manager import Sound, load_sound
 
 
 class Consumable(Item):
@@ -40,9 +39,7 @@ class Consumable(Item):
     ) -> None:
         super().__init__(name, sprite, description, price)
         self.effects: Sequence[Effect] = effects
-        self.drink_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "potion.ogg")
-        )
+        self.drink_sfx: Sound = load_sound(os.path.join("sound_fx", "potion.ogg"))
 
     def use(self, entity: Movable) -> tuple[bool, Sequence[str]]:  # NOQA
         """
@@ -64,6 +61,6 @@ class Consumable(Item):
             if sub_success:
                 success = True
         if success:
-            pygame.mixer.Sound.play(self.drink_sfx)
+            self.drink_sfx.play()
             entity.remove_item(self)
         return success, messages
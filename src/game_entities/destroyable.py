@@ -5,14 +5,15 @@ Defines Destroyable class, an entity that could be destroyed.
 import os
 from collections.abc import Sequence
 from enum import Enum
-from typing import Union
+from typing import Optional, Union
 
 import pygame
 from lxml import etree
 
 from src.game_entities.entity import Entity
-from src.gui.constant_sprites import constant_sprites
+from src.gui.constant_sprites import get_hit_points_gauge
 from src.gui.position import Position
+from src.services.assets_manager import Sound, load_sound
 
 
 class DamageKind(Enum):
@@ -44,6 +45,8 @@ class Destroyable(Entity):
     defense -- the resistance of the entity from physical attacks
     resistance -- the resistance of the entity from spiritual attacks
     attack_sfx -- the sound that should be started when the entity is taking physical damage
+    _displayed_sprite -- the last sprite of the entity with its hit points gauge drawn on top of it,
+    with the base sprite and the gauge it has been built from
     """
 
     def __init__(
@@ -60,9 +63,71 @@ class Destroyable(Entity):
         self.hit_points: int = hit_points
         self.defense: int = defense
         self.resistance: int = resistance
-        self.attack_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "attack.ogg")
-        )
+        self.attack_sfx: Sound = load_sound(os.path.join("sound_fx", "attack.ogg"))
+        self._displayed_sprite: Optional[
+            tuple[pygame.Surface, pygame.Surface, pygame.Surface]
+        ] = None
+
+    def get_display_state(self) -> tuple:
+        """
+        Return the values the look of the entity on screen depends on,
+        including its hit points shown by its gauge.
+        """
+        return super().get_display_state() + (self.hit_points, self.hit_points_max)
+
+    def get_base_sprite(self) -> pygame.Surface:
+        """
+        Return the sprite of the entity on which its hit points gauge should be drawn.
+        """
+        return self.sprite
+
+    def get_hit_points_gauge(self) -> Optional[pygame.Surface]:
+        """
+        Return the bar indicating the ratio of hit points of the entity relatively to
+        the maximum it could have, or None if the entity is not damaged.
+        """
+        if self.hit_points == self.hit_points_max:
+            return None
+        damage_tier: str = "lightly_damaged"
+        if self.hit_points < self.hit_points_max * 0.1:
+            damage_tier = "almost_dead"
+        elif self.hit_points < self.hit_points_max * 0.25:
+            damage_tier = "severely_damaged"
+        elif self.hit_points < self.hit_points_max * 0.5:
+            damage_tier = "heavily_damaged"
+        elif self.hit_points < self.hit_points_max * 0.75:
+            damage_tier = "moderately_damaged"
+        return get_hit_points_gauge(damage_tier, self.hit_points / self.hit_points_max)
+
+    def get_displayed_sprite(self) -> pygame.Surface:
+        """
+        Return the sprite of the entity with its hit points gauge drawn on top of it if it is damaged.
+        The sprite is built again only when the base sprite or the gauge changed.
+        """
+        sprite: pygame.Surface = self.get_base_sprite()
+        gauge: Optional[pygame.Surface] = self.get_hit_points_gauge()
+        if gauge is None:
+            return sprite
+        # The surfaces are kept and compared by identity, since the identifier of a surface
+        # that has been freed may be given to a new one
+        if (
+            self._displayed_sprite is None
+            or self._displayed_sprite[0] is not sprite
+            or self._displayed_sprite[1] is not gauge
+        ):
+            displayed_sprite: pygame.Surface = sprite.copy()
+            displayed_sprite.blit(gauge, (0, 0))
+            self._displayed_sprite = (sprite, gauge, displayed_sprite)
+        return self._displayed_sprite[2]
+
+    def display(self, screen: pygame.Surface) -> None:
+        """
+        Display the entity on the given screen, with its hit points gauge if it is damaged.
+
+        Keyword arguments:
+        screen -- the screen on which the entity should be drawn
+        """
+        screen.blit(self.get_displayed_sprite(), self.position)
 
     def display_hit_points(self, screen: pygame.Surface) -> None:
         """
@@ -72,38 +137,17 @@ class Destroyable(Entity):
         Keyword arguments:
         screen -- the screen on which the bar should be drawn
         """
-        if self.hit_points != self.hit_points_max:
-            damage_bar = constant_sprites["lightly_damaged"]
-            if self.hit_points < self.hit_points_max * 0.1:
-                damage_bar = constant_sprites["almost_dead"]
-            elif self.hit_points < self.hit_points_max * 0.25:
-                damage_bar = constant_sprites["severely_damaged"]
-            elif self.hit_points < self.hit_points_max * 0.5:
-                damage_bar = constant_sprites["heavily_damaged"]
-            elif self.hit_points < self.hit_points_max * 0.75:
-                damage_bar = constant_sprites["moderately_damaged"]
-            damage_bar = pygame.transform.scale(
-                damage_bar,
-                (
-                    int(
-                        damage_bar.get_width() * (self.hit_points / self.hit_points_max)
-                    ),
-                    damage_bar.get_height(),
-                ),
-            )
-            screen.blit(constant_sprites["hp_bar"], self.position)
-            screen.blit(damage_bar, self.position)
+        gauge: Optional[pygame.Surface] = self.get_hit_points_gauge()
+        if gauge is not None:
+            screen.blit(gauge, self.position)
 
-    def attacked(
+    def get_damage_taken(
         self, entity: Entity, damage: int, kind: DamageKind, allies: Sequence[Entity]
     ) -> int:
         """
-        Compute how much the entity should take and reduce the hit points of
-        the entity by this value.
-
-        Play a sound according to the kind of the damage.
-
-        Return the current hit points of the entity after applying the damage.
+        Return how much damage the entity would take from an attack,
+        regardless of the hit points it has left.
+        The entity is not changed.
 
         Keyword arguments:
         entity -- the other entity that is attacking the entity
@@ -115,14 +159,33 @@ class Destroyable(Entity):
             real_damage = damage - self.resistance
         elif kind is DamageKind.PHYSICAL:
             real_damage = damage - self.defense
-            pygame.mixer.Sound.play(self.attack_sfx)
         else:
             print(f"Error : Invalid kind of attack : {kind}")
             raise SystemError
-        if real_damage < 0:
-            real_damage = 0
-        elif real_damage > self.hit_points:
-            real_damage = self.hit_points
+        return max(real_damage, 0)
+
+    def attacked(
+        self, entity: Entity, damage: int, kind: DamageKind, allies: Sequence[Entity]
+    ) -> int:
+        """
+        Compute how much the entity should take and reduce the hit points of
+        the entity by this value.
+
+        Play a sound according to the kind of the damage.
+
+        Return the current hit points of the entity after applying the damage.
+
+        Keyword arguments:
+        entity -- the other entity that is attacking the entity
+        damage -- the attack's power
+        kind -- the nature of the attack
+        allies -- the allies of the entity
+        """
+        real_damage: int = min(
+            self.get_damage_taken(entity, damage, kind, allies), self.hit_points
+        )
+        if kind is DamageKind.PHYSICAL:
+            self.attack_sfx.play()
         self.hit_points -= real_damage
         return self.hit_points
 
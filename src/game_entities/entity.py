@@ -2,14 +2,18 @@
 Defines Entity class, the base class of all game objects that could be display on the level map.
 """
 
+from __future__ import annotations
+
 import re
-from typing import Union
+from collections.abc import Callable
+from typing import Optional, Union
 
 import pygame
 
-from src.constants import TILE_SIZE
 from src.gui.position import Position
+from src.services.assets_manager import load_sprite
 from src.services.language import *
+from src.services.tile import Tile
 
 
 class Entity:
@@ -26,23 +30,45 @@ class Entity:
     Attributes:
     name -- the name of the entity
     position -- the current position of the entity on screen
+    tile -- the tile of the level map on which the entity currently is, following its position
     sprite -- the pygame Surface corresponding to the appearance of the entity on screen, it should
     match the size of a tile
+    on_position_change -- the callback notified with the entity and its previous position
+    each time the entity changes of position, if there is any
     """
 
     def __init__(
         self, name: str, position: Position, sprite: Union[str, pygame.Surface]
     ) -> None:
         self.name: str = name
-        self.position: Position = position
+        self.on_position_change: Optional[Callable[[Entity, Position], None]] = None
+        self._position: Position = position
+        self.tile: Tile = Tile.from_position(position)
         self.sprite: pygame.Surface = (
-            sprite
-            if isinstance(sprite, pygame.Surface)
-            else pygame.transform.scale(
-                pygame.image.load(sprite).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-            )
+            sprite if isinstance(sprite, pygame.Surface) else load_sprite(sprite)
         )
 
+    @property
+    def position(self) -> Position:
+        """
+        Return the current position of the entity on screen.
+        """
+        return self._position
+
+    @position.setter
+    def position(self, position: Position) -> None:
+        """
+        Move the entity to the given position and notify the change if anyone is listening.
+
+        Keyword arguments:
+        position -- the new position of the entity on screen
+        """
+        previous_position: Position = self._position
+        self._position = position
+        self.tile = Tile.from_position(position)
+        if self.on_position_change is not None:
+            self.on_position_change(self, previous_position)
+
     def display(self, screen: pygame.Surface) -> None:
         """
         Display the entity on the given screen.
@@ -52,6 +78,13 @@ class Entity:
         """
         screen.blit(self.sprite, self.position)
 
+    def get_display_state(self) -> tuple:
+        """
+        Return the values the look of the entity on screen depends on,
+        so that it is only drawn again when one of them changed.
+        """
+        return self.position[0], self.position[1], id(self.sprite)
+
     def get_rect(self) -> pygame.Rect:
         """
         Return the pygame Rect of the sprite of the entity.
@@ -100,9 +133,9 @@ class Entity:
         # Save position
         position: etree.SubElement = etree.SubElement(tree, "position")
         x_coordinate: etree.SubElement = etree.SubElement(position, "x")
-        x_coordinate.text = str(int(self.position[0] // TILE_SIZE))
+        x_coordinate.text = str(self.tile.column)
         y_coordinate: etree.SubElement = etree.SubElement(position, "y")
-        y_coordinate.text = str(int(self.position[1] // TILE_SIZE))
+        y_coordinate.text = str(self.tile.row)
 
         return tree
 
@@ -11,6 +11,7 @@ import pygame
 
 from src.constants import LIGHT_GREY, TILE_SIZE
 from src.game_entities.item import Item
+from src.services.assets_manager import create_surface, load_image, load_sprite
 from src.services.language import TRANSLATIONS
 
 
@@ -67,27 +68,20 @@ class Equipment(Item):
         self.weight: int = weight
         self.restrictions: dict[str, Sequence[str]] = restrictions
         self.body_part: str = body_part
-        raw_equipped_sprite: pygame.Surface = pygame.image.load(
-            equipped_sprites[0]
-        ).convert_alpha()
+        raw_equipped_sprite: pygame.Surface = load_image(equipped_sprites[0])
         self.equipped_sprite: pygame.Surface = pygame.transform.scale(
             raw_equipped_sprite, (TILE_SIZE, TILE_SIZE)
         )
         if len(equipped_sprites) > 1:
             for equipped_sprite in equipped_sprites[1:]:
                 self.equipped_sprite.blit(
-                    pygame.transform.scale(
-                        pygame.image.load(equipped_sprite).convert_alpha(),
-                        (TILE_SIZE, TILE_SIZE),
-                    ),
+                    load_sprite(equipped_sprite),
                     (0, 0),
                 )
 
         # Used when character wearing the equipment cannot be selected
         self.sprite_unavailable: pygame.Surface = self.equipped_sprite.copy()
-        color_image: pygame.Surface = pygame.Surface(
-            self.sprite.get_size()
-        ).convert_alpha()
+        color_image: pygame.Surface = create_surface(self.sprite.get_size())
         color_image.fill(LIGHT_GREY)
         self.sprite_unavailable.blit(
             color_image, (0, 0), special_flags=pygame.BLEND_RGBA_MULT
@@ -4,7 +4,6 @@ Defines Foe class, a hostile entity which targets players and allies.
 
 from __future__ import annotations
 
-import random as rd
 from collections.abc import Sequence
 from enum import Enum, auto
 from typing import Optional, Union
@@ -17,6 +16,8 @@ from src.game_entities.item import Item
 from src.game_entities.movable import Movable
 from src.gui.position import Position
 from src.services.language import *
+from src.services.random_service import (RandomStream, RandomStreamKind,
+                                         get_random_stream)
 
 
 class Keyword(Enum):
@@ -115,11 +116,12 @@ class Foe(Movable):
         levels_earned -- the number of times the stats should be upgraded
         """
         grow_rates: dict[str, Sequence[int]] = Foe.grow_rates[self.name]
+        stream: RandomStream = get_random_stream(RandomStreamKind.GROWTH)
         for _ in range(levels_earned):
-            self.hit_points_max += rd.choice(grow_rates["hp"])
-            self.defense += rd.choice(grow_rates["def"])
-            self.resistance += rd.choice(grow_rates["res"])
-            self.strength += rd.choice(grow_rates["str"])
+            self.hit_points_max += stream.choice(grow_rates["hp"])
+            self.defense += stream.choice(grow_rates["def"])
+            self.resistance += stream.choice(grow_rates["res"])
+            self.strength += stream.choice(grow_rates["str"])
             self.xp_gain = int(self.xp_gain * 1.1)
 
     def roll_for_loot(self) -> Sequence[Item]:
@@ -129,8 +131,9 @@ class Foe(Movable):
         Return the loot list
         """
         loot: list[Item] = []
+        stream: RandomStream = get_random_stream(RandomStreamKind.LOOT)
         for item, probability in self.potential_loot:
-            if rd.random() < probability:
+            if stream.random() < probability:
                 loot.append(item)
         return loot
 
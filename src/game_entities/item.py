@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import pygame
 
-from src.constants import TILE_SIZE
+from src.services.assets_manager import load_sprite
 from src.services.language import *
 
 
@@ -37,9 +37,7 @@ class Item:
         self, name: str, sprite: str, description: str, price: int = 0
     ) -> None:
         self.name: str = name
-        self.sprite: pygame.Surface = pygame.transform.scale(
-            pygame.image.load(sprite).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-        )
+        self.sprite: pygame.Surface = load_sprite(sprite)
         self.sprite_path: str = sprite
         self.description: str = description
         self.price: int = price
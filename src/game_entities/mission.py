@@ -19,7 +19,7 @@ from src.game_entities.player import Player
 from src.gui.position import Position
 
 if TYPE_CHECKING:
-    from src.scenes.level_scene import LevelEntityCollections
+    from src.services.level_engine import LevelEntityCollections
 
 
 class MissionType(Enum):
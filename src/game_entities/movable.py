@@ -6,14 +6,14 @@ different classes handling the management of entities that can move, only living
 from __future__ import annotations
 
 import os
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from enum import Enum, IntEnum, auto
 from typing import Optional, Union
 
 import pygame
 from lxml import etree
 
-from src.constants import ANIMATION_SPEED, INITIAL_MAX, TILE_SIZE
+from src.constants import ANIMATION_SPEED, TILE_SIZE
 from src.game_entities.alteration import Alteration
 from src.game_entities.consumable import Consumable
 from src.game_entities.destroyable import DamageKind, Destroyable
@@ -21,7 +21,9 @@ from src.game_entities.entity import Entity
 from src.game_entities.item import Item
 from src.game_entities.skill import Skill, SkillNature
 from src.gui.position import Position
+from src.services.assets_manager import Sound, load_sound, load_sprite
 from src.services.language import TRANSLATIONS
+from src.services.reach_offsets import get_ring_offsets
 
 TIMER = 60
 NB_ITEMS_MAX = 8
@@ -51,6 +53,9 @@ class EntityStrategy(Enum):
     SEMI_ACTIVE = auto()
     # Entity always move to get closer to opponents
     ACTIVE = auto()
+    # Entity searches the moves and attacks leading to the best outcome a few actions ahead,
+    # for bosses
+    LOOKAHEAD = auto()
     # Entity is controlled by a human player
     MANUAL = auto()
 
@@ -97,6 +102,8 @@ class Movable(Destroyable):
     skeleton_sfx -- the sound started when a skeleton is moving
     necrophage_sfx -- the sound started when a necrophage is moving
     centaur_sfx -- the sound started when a centaur is moving
+    _composite_sprites -- the sprites of the entity with its overlays drawn on top of it,
+    by sprite and overlays
     """
 
     SELECTED_DISPLAY: pygame.Surface = None
@@ -110,9 +117,7 @@ class Movable(Destroyable):
         This operation should be called after the initialization of a pygame window.
         """
         selected_sprite: str = "imgs/dungeon_crawl/misc/cursor.png"
-        Movable.SELECTED_DISPLAY = pygame.transform.scale(
-            pygame.image.load(selected_sprite).convert_alpha(), (TILE_SIZE, TILE_SIZE)
-        )
+        Movable.SELECTED_DISPLAY = load_sprite(selected_sprite)
 
     def __init__(
         self,
@@ -148,10 +153,10 @@ class Movable(Destroyable):
         self.nb_items_max: int = NB_ITEMS_MAX
         self.state: EntityState = EntityState.HAVE_TO_ACT
         self.target: Optional[Entity] = None
+        self._composite_sprites: dict[tuple[pygame.Surface, ...], pygame.Surface] = {}
         if complementary_sprite_link:
-            complementary_sprite: pygame.Surface = pygame.transform.scale(
-                pygame.image.load(complementary_sprite_link).convert_alpha(),
-                (TILE_SIZE, TILE_SIZE),
+            complementary_sprite: pygame.Surface = load_sprite(
+                complementary_sprite_link
             )
             self.sprite.blit(complementary_sprite, (0, 0))
 
@@ -161,30 +166,50 @@ class Movable(Destroyable):
         self.strategy: EntityStrategy = EntityStrategy[strategy]
         self.skills: Sequence[Skill] = skills
 
-        self.walk_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "walk.ogg")
-        )
-        self.skeleton_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
+        self.walk_sfx: Sound = load_sound(os.path.join("sound_fx", "walk.ogg"))
+        self.skeleton_sfx: Sound = load_sound(
             os.path.join("sound_fx", "skeleton_walk.ogg")
         )
-        self.necrophage_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
+        self.necrophage_sfx: Sound = load_sound(
             os.path.join("sound_fx", "necro_walk.ogg")
         )
-        self.centaur_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "cent_walk.ogg")
-        )
+        self.centaur_sfx: Sound = load_sound(os.path.join("sound_fx", "cent_walk.ogg"))
 
-    def display(self, screen: pygame.Surface) -> None:
+    def get_overlays(self) -> list[pygame.Surface]:
         """
-        Display the movable entity on the given screen.
-        Also display an indicator if the entity is currently active.
-
-        Keyword arguments:
-        screen -- the screen on which the movable entity should be drawn
+        Return the sprites that should be drawn on top of the sprite of the entity
+        according to its current state: an indicator if the entity is currently active.
         """
-        Destroyable.display(self, screen)
         if self.state in range(EntityState.ON_MOVE, EntityState.HAVE_TO_ATTACK + 1):
-            screen.blit(Movable.SELECTED_DISPLAY, self.position)
+            return [Movable.SELECTED_DISPLAY]
+        return []
+
+    def get_base_sprite(self) -> pygame.Surface:
+        """
+        Return the sprite of the entity with its overlays drawn on top of it.
+        Each variant, like the greyed one of a player that finished its turn, is built once
+        and kept until the cache is cleared, for instance when the equipment of a character changes.
+        """
+        overlays: list[pygame.Surface] = self.get_overlays()
+        if not overlays:
+            return self.sprite
+        # Surfaces are compared by identity, the key keeps them alive
+        # so that a key always matches the same surfaces
+        key: tuple[pygame.Surface, ...] = (self.sprite, *overlays)
+        composite_sprite: Optional[pygame.Surface] = self._composite_sprites.get(key)
+        if composite_sprite is None:
+            composite_sprite = self.sprite.copy()
+            for overlay in overlays:
+                composite_sprite.blit(overlay, (0, 0))
+            self._composite_sprites[key] = composite_sprite
+        return composite_sprite
+
+    def get_display_state(self) -> tuple:
+        """
+        Return the values the look of the entity on screen depends on,
+        including its state shown by the active indicator.
+        """
+        return super().get_display_state() + (self.state,)
 
     @property
     def attack_kind(self) -> DamageKind:
@@ -193,14 +218,14 @@ class Movable(Destroyable):
         """
         return self._attack_kind
 
-    def attacked(
+    def get_damage_taken(
         self, entity: Entity, damage: int, kind: DamageKind, allies: Sequence[Entity]
     ) -> int:
         """
-        Compute how much the entity should take and reduce the hit points of
-        the entity by this value.
-
-        Return the current hit points of the entity after applying the damage.
+        Return how much damage the entity would take from an attack,
+        regardless of the hit points it has left.
+        Defense and resistance are boosted by the alterations of the entity
+        and by its skills if an ally stands next to it.
 
         Keyword arguments:
         entity -- the other entity that is attacking the entity
@@ -238,13 +263,15 @@ class Movable(Destroyable):
         self.resistance += temp_res_change
 
         # Resolve attack with boosted stats
-        Destroyable.attacked(self, entity, damage, kind, allies)
+        damage_taken: int = Destroyable.get_damage_taken(
+            self, entity, damage, kind, allies
+        )
 
         # Restore stats to normal
         self.defense -= temp_def_change
         self.resistance -= temp_res_change
 
-        return self.hit_points
+        return damage_taken
 
     def end_turn(self) -> None:
         """
@@ -283,16 +310,16 @@ class Movable(Destroyable):
         #  but rather according to specific attribute like the race
         if self.strategy == EntityStrategy.MANUAL:
             if self.name == "chrisemon":
-                pygame.mixer.Sound.play(self.centaur_sfx)
+                self.centaur_sfx.play()
             else:
-                pygame.mixer.Sound.play(self.walk_sfx)
+                self.walk_sfx.play()
         elif self.target is not None:
             if self.name == "skeleton":
-                pygame.mixer.Sound.play(self.skeleton_sfx)
+                self.skeleton_sfx.play()
             elif self.name == "necrophage":
-                pygame.mixer.Sound.play(self.necrophage_sfx)
+                self.necrophage_sfx.play()
             elif self.name == "assassin":
-                pygame.mixer.Sound.play(self.walk_sfx)
+                self.walk_sfx.play()
 
     def get_formatted_alterations(self) -> str:
         """
@@ -473,27 +500,38 @@ class Movable(Destroyable):
         return True
 
     def act(
-        self, possible_moves: dict[Position, int], targets: dict[Entity, int]
+        self,
+        get_possible_moves: Callable[[], dict[Position, int]],
+        get_targets: Callable[[], dict[Entity, int]],
+        get_path_towards: Callable[[Entity], Sequence[Position]],
     ) -> Optional[Position]:
         """
         Determine what action should be done by the entity controlled by AI.
         The action is determined according to the current state of the entity.
+        The data needed to take a decision are only requested in the states consuming them,
+        an entity walking to its destination does not need anything.
 
         Return the selected tile for the move / attack if any should be selected.
 
         Keyword arguments:
-        possible_moves -- the collection of tiles that could be reached by the entity
+        get_possible_moves -- the function returning the collection of tiles that could be reached
+        by the entity with their associated distance from the entity
+        get_targets -- the function returning the collection of entities that could be attacked
         with their associated distance from the entity
-        targets -- the collection of entities that could be attacked with their associated distance from the entity
+        get_path_towards -- the function returning the path the entity should follow this turn
+        to get at reach of the given target
         """
         if self.state is EntityState.HAVE_TO_ACT:
-            return self.determine_move(possible_moves, targets)
+            return self.determine_move(
+                get_possible_moves, get_targets(), get_path_towards
+            )
         if self.state is EntityState.ON_MOVE:
             self.move()
         elif self.state is EntityState.HAVE_TO_ATTACK:
-            attack = self.determine_attack(targets)
-            if self.can_attack() and attack:
-                return attack
+            if self.can_attack():
+                attack = self.determine_attack(get_targets())
+                if attack:
+                    return attack
             self.end_turn()
         return None
 
@@ -508,19 +546,22 @@ class Movable(Destroyable):
         """
         temporary_attack: Optional[Position] = None
         for distance in self.reach:
+            ring_offsets: frozenset[tuple[int, int]] = get_ring_offsets(distance)
             for target in targets:
                 if (
-                    abs(self.position[0] - target.position[0])
-                    + abs(self.position[1] - target.position[1])
-                    == TILE_SIZE * distance
-                ):
+                    target.tile.column - self.tile.column,
+                    target.tile.row - self.tile.row,
+                ) in ring_offsets:
                     if self.target and target == self.target:
                         return target.position
                     temporary_attack = target.position
         return temporary_attack
 
     def determine_move(
-        self, possible_moves: dict[Position, int], targets: dict[Entity, int]
+        self,
+        get_possible_moves: Callable[[], dict[Position, int]],
+        targets: dict[Entity, int],
+        get_path_towards: Callable[[Entity], Sequence[Position]],
     ) -> Position:
         """
         Determine which movement should be selected by the entity controlled by AI.
@@ -529,12 +570,15 @@ class Movable(Destroyable):
         Return the selected tile for the move.
 
         Keyword arguments:
-        possible_moves -- the collection of tiles that could be reached by the entity
-        with their associated distance from the entity
+        get_possible_moves -- the function returning the collection of tiles that could be reached
+        by the entity with their associated distance from the entity
         targets -- the collection of entities that could be attacked with their associated distance from the entity
+        get_path_towards -- the function returning the path the entity should follow this turn
+        to get at reach of the given target
         """
         self.target: Optional[Position] = None
         if self.strategy is EntityStrategy.SEMI_ACTIVE:
+            possible_moves: dict[Position, int] = get_possible_moves()
             for target, dist in targets.items():
                 for distance in self.reach:
                     for move in possible_moves:
@@ -547,24 +591,23 @@ class Movable(Destroyable):
                             self.target = target
                             return move
         elif self.strategy is EntityStrategy.ACTIVE:
-            # Targets the nearest opponent
+            # Targets the nearest opponent and go as far as possible on the shortest path to it
             self.target = min(targets.keys(), key=(lambda k: targets[k]))
-            best_move = self.position
-            min_dist = INITIAL_MAX
-            for distance in self.reach:
-                for move in possible_moves:
-                    # Search for the nearest move to target
-                    dist = (
-                        abs(move[0] - self.target.position[0])
-                        + abs(move[1] - self.target.position[1])
-                        - (TILE_SIZE * distance)
-                    )
-                    if 0 <= dist < min_dist:
-                        best_move = move
-                        min_dist = dist
-            return best_move
+            path: Sequence[Position] = get_path_towards(self.target)
+            return path[-1] if path else self.position
         return self.position
 
+    def get_attack_damage(self, entity: Entity, with_weapon: bool = True) -> int:
+        """
+        Return the damage that would be dealt to the given entity during an attack,
+        without changing the entity.
+
+        Keyword arguments:
+        entity -- the target of the attack
+        with_weapon -- whether the weapon of the entity is taken into account if it has any
+        """
+        return self.strength
+
     def attack(self, entity: Entity) -> int:
         """
         Return the damage that should be dealt to the given entity during an attack.
@@ -572,7 +615,7 @@ class Movable(Destroyable):
         Keyword arguments:
         entity -- the target of the attack
         """
-        return self.strength
+        return self.get_attack_damage(entity)
 
     def new_turn(self) -> None:
         """
@@ -19,6 +19,7 @@ from src.game_entities.entity import Entity
 from src.game_entities.equipment import Equipment
 from src.game_entities.skill import Skill
 from src.gui.position import Position
+from src.services.assets_manager import create_surface
 from src.services.menus import CharacterMenu
 
 
@@ -108,9 +109,7 @@ class Player(Character):
 
         # Sprite displayed when player cannot be selected
         self.sprite_unavailable: pygame.Surface = self.sprite.copy()
-        color_image: pygame.Surface = pygame.Surface(
-            self.sprite.get_size()
-        ).convert_alpha()
+        color_image: pygame.Surface = create_surface(self.sprite.get_size())
         color_image.fill(LIGHT_GREY)
         self.sprite_unavailable.blit(
             color_image, (0, 0), special_flags=pygame.BLEND_RGBA_MULT
@@ -132,19 +131,17 @@ class Player(Character):
         self.position = position
         self.old_position = position
 
-    def display(self, screen: pygame.Surface) -> None:
+    def get_overlays(self) -> list[pygame.Surface]:
         """
-        Display the player on the given screen.
-        Also display on top of it the selected indicator if the player is currently active.
-
-        Keyword arguments:
-        screen -- the screen on which the player should be drawn
+        Return the sprites that should be drawn on top of the base sprite of the player,
+        including the selected indicator if the player is currently active.
         """
-        Character.display(self, screen)
+        overlays: list[pygame.Surface] = Character.get_overlays(self)
         if self.state in range(
             PlayerState.WAITING_MOVE, PlayerState.WAITING_TARGET + 1
         ):
-            screen.blit(Player.SELECTED_DISPLAY, self.position)
+            overlays.append(Player.SELECTED_DISPLAY)
+        return overlays
 
     @staticmethod
     def trade_gold(sender: Character, receiver: Character, amount: int) -> None:
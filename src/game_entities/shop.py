@@ -8,7 +8,7 @@ import os
 from copy import copy
 from typing import Optional
 
-import pygame.mixer
+import pygame
 from lxml import etree
 from pygamepopup.components import BoxElement, Button, InfoBox, TextElement
 
@@ -18,6 +18,7 @@ from src.game_entities.item import Item
 from src.gui.fonts import fonts
 from src.gui.position import Position
 from src.services import menu_creator_manager
+from src.services.assets_manager import Sound, is_headless, load_sound
 from src.services.language import *
 
 
@@ -37,7 +38,7 @@ class Shop(Building):
     Attributes:
     current_visitor -- the reference to the current character visiting the shop
     stock -- the data structure containing all the available items to be bought with their associated quantity
-    menu -- the shop menu displaying all the items that could be bought
+    menu -- the shop menu displaying all the items that could be bought, None in headless mode
     gold_sfx -- the sound that should be started when an item is sold or bought
     shop_balance -- the amount of gold the shop has
     """
@@ -61,12 +62,15 @@ class Shop(Building):
         self.current_visitor: Optional[Character] = None
         self.stock: list[dict[str, any]] = stock
         self.interaction: dict[str, any] = interaction
-        self.menu: InfoBox = menu_creator_manager.create_shop_menu(
-            Shop.interaction_callback, self.stock, 0, self.shop_balance
-        )
-        self.gold_sfx: pygame.mixer.Sound = pygame.mixer.Sound(
-            os.path.join("sound_fx", "trade.ogg")
+        # Menus cannot be built without display, the menu is built again on each visit anyway
+        self.menu: Optional[InfoBox] = (
+            None
+            if is_headless()
+            else menu_creator_manager.create_shop_menu(
+                Shop.interaction_callback, self.stock, 0, self.shop_balance
+            )
         )
+        self.gold_sfx: Sound = load_sound(os.path.join("sound_fx", "trade.ogg"))
 
     def get_item_entry(self, item: Item) -> Optional[dict[str, any]]:
         """
@@ -87,6 +91,8 @@ class Shop(Building):
         Keyword arguments:
         gold -- the new gold amount for the player that should be displayed
         """
+        if is_headless():
+            return
         self.menu = menu_creator_manager.create_shop_menu(
             Shop.interaction_callback, self.stock, gold, self.shop_balance
         )
@@ -104,14 +110,18 @@ class Shop(Building):
         self.current_visitor = actor
         self.update_shop_menu(self.current_visitor.gold)
 
-        grid_element: list[list[BoxElement]] = [
-            [Button(title=STR_BUY, callback=Shop.buy_interface_callback)],
-            [Button(title=STR_SELL, callback=Shop.sell_interface_callback)],
-        ]
+        grid_element: list[list[BoxElement]] = []
+        if not is_headless():
+            grid_element.extend(
+                [
+                    [Button(title=STR_BUY, callback=Shop.buy_interface_callback)],
+                    [Button(title=STR_SELL, callback=Shop.sell_interface_callback)],
+                ]
+            )
 
         if self.interaction:
             for talk in self.interaction["talks"]:
-                pygame.mixer.Sound.play(self.talk_sfx)
+                self.talk_sfx.play()
                 grid_element.append([TextElement(talk, font=fonts["ITEM_DESC_FONT"])])
 
         return grid_element
@@ -129,7 +139,7 @@ class Shop(Building):
         """
         if self.current_visitor.gold >= item.price:
             if len(self.current_visitor.items) < self.current_visitor.nb_items_max:
-                pygame.mixer.Sound.play(self.gold_sfx)
+                self.gold_sfx.play()
                 self.current_visitor.gold -= item.price
                 self.current_visitor.set_item(copy(item))
                 self.shop_balance += item.price
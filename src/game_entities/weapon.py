@@ -4,7 +4,6 @@ Defines Weapon class, specific equipment with which an entity can attack.
 
 from __future__ import annotations
 
-import random
 from collections.abc import Sequence
 
 from lxml import etree
@@ -16,6 +15,7 @@ from src.game_entities.foe import Keyword
 from src.game_entities.skill import SkillNature
 from src.gui.tools import distance
 from src.services.language import TRANSLATIONS
+from src.services.random_service import RandomStreamKind, get_random_stream
 
 
 class Weapon(Equipment):
@@ -143,18 +143,30 @@ class Weapon(Equipment):
         # Try to trigger one or more effects
         effects = []
         for effect in self.effects:
-            probability = effect["probability"]
-            for skill in user.skills:
-                if (
-                    skill.nature is SkillNature.ALTERATION_CHANCE_BOOST
-                    and effect["effect"].alteration in skill.alterations
-                ):
-                    probability += skill.power
-
-            if random.randint(0, 100) < probability:
+            probability = self.get_effect_probability(user, effect)
+            if get_random_stream(RandomStreamKind.COMBAT).randint(0, 100) < probability:
                 effects.append(effect["effect"])
         return effects
 
+    @staticmethod
+    def get_effect_probability(user: Character, effect: dict[str, any]) -> float:
+        """
+        Return the chance, out of 100, that a possible effect of the weapon is triggered
+        when it is used by the given bearer, boosted by the skills of the bearer.
+
+        Keyword arguments:
+        user -- the bearer of the weapon
+        effect -- the possible effect, with its effect and its base probability
+        """
+        probability = effect["probability"]
+        for skill in user.skills:
+            if (
+                skill.nature is SkillNature.ALTERATION_CHANCE_BOOST
+                and effect["effect"].alteration in skill.alterations
+            ):
+                probability += skill.power
+        return probability
+
     def save(self, tree_name: str) -> etree.Element:
         """
         Save the current state of the weapon in XML format.
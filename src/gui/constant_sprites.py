@@ -38,6 +38,9 @@ HP_BAR_SPRITE = "imgs/dungeon_crawl/misc/damage_meter_sample.png"
 
 constant_sprites = {}
 
+# Hit points gauges shared by all the entities, by damage tier and width of the damage meter
+hit_points_gauges: dict[tuple[str, int], pygame.Surface] = {}
+
 
 def init_constant_sprites() -> None:
     """
@@ -129,3 +132,27 @@ def init_constant_sprites() -> None:
     constant_sprites["hp_bar"] = pygame.transform.scale(
         pygame.image.load(HP_BAR_SPRITE).convert_alpha(), (TILE_SIZE, TILE_SIZE)
     )
+    hit_points_gauges.clear()
+
+
+def get_hit_points_gauge(damage_tier: str, ratio: float) -> pygame.Surface:
+    """
+    Return the bar indicating the given ratio of hit points, the damage meter of the given tier
+    scaled to the ratio being drawn on top of the empty bar.
+    Each gauge is built once and shared by all the entities.
+
+    Keyword arguments:
+    damage_tier -- the name of the sprite of the damage meter, from lightly_damaged to almost_dead
+    ratio -- the ratio of hit points of the entity relatively to the maximum it could have
+    """
+    damage_meter: pygame.Surface = constant_sprites[damage_tier]
+    width: int = int(damage_meter.get_width() * ratio)
+    gauge: pygame.Surface = hit_points_gauges.get((damage_tier, width))
+    if gauge is None:
+        gauge = constant_sprites["hp_bar"].copy()
+        gauge.blit(
+            pygame.transform.scale(damage_meter, (width, damage_meter.get_height())),
+            (0, 0),
+        )
+        hit_points_gauges[damage_tier, width] = gauge
+    return gauge
@@ -0,0 +1,178 @@
+"""
+Defines DirtyRectRenderer class, drawing again only the parts of the screen that changed since
+the previous frame, and the DisplayLayer record describing the elements it draws.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Sequence
+from typing import NamedTuple, Optional
+
+import pygame
+
+from src.constants import BLACK
+
+# Ratio of the screen above which the whole screen is drawn again at once
+FULL_REDRAW_RATIO = 0.5
+
+
+class DisplayLayer(NamedTuple):
+    """
+    An element drawn on the screen during a frame.
+
+    Attributes:
+    key -- the identifier of the element, that should be the same from one frame to another
+    rect -- the area of the screen covered by the element
+    state -- the values the look of the element depends on,
+    None if the element may look different on every frame
+    draw -- the function drawing the element
+    """
+
+    key: Hashable
+    rect: pygame.Rect
+    state: any
+    draw: Callable[[], None]
+
+
+def merge_rects(rects: Sequence[pygame.Rect]) -> list[pygame.Rect]:
+    """
+    Return rectangles covering the given ones without any overlap between them:
+    the overlapping rectangles are replaced by their union until none of them overlap.
+
+    Keyword arguments:
+    rects -- the rectangles that should be covered
+    """
+    merged: list[pygame.Rect] = []
+    for rect in rects:
+        if not rect.width or not rect.height:
+            continue
+        rect = rect.copy()
+        overlapping: int = rect.collidelist(merged)
+        while overlapping != -1:
+            rect.union_ip(merged.pop(overlapping))
+            overlapping = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectRenderer:
+    """
+    A DirtyRectRenderer draws the frames of a scene described as an ordered list of layers,
+    but only draws again the areas of the screen covered by the layers that changed
+    since the previous frame.
+
+    A layer changed if it appeared, disappeared, moved, or if its state is different or None.
+    Each dirty area is cleared, then every layer overlapping it is drawn again in order,
+    the drawing being clipped to the area.
+    The areas that have been drawn over by something else than the layers should be invalidated,
+    so that they are drawn again on the next frame.
+    The whole screen is drawn again on the first frame, and when the dirty areas cover
+    a large part of it.
+
+    Keyword arguments:
+    screen -- the surface on which the frames are drawn
+    surfaces -- the subsurfaces of the screen on which some of the layers are drawn
+
+    Attributes:
+    screen -- the surface on which the frames are drawn
+    surfaces -- the screen and its subsurfaces on which the layers are drawn,
+    that should be clipped to the dirty areas
+    previous_layers -- the area and state of each layer drawn during the previous frame, by key
+    invalidated_rects -- the areas that should be drawn again on the next frame
+    full_redraw -- whether the whole screen should be drawn again on the next frame
+    """
+
+    def __init__(
+        self, screen: pygame.Surface, surfaces: Sequence[pygame.Surface] = ()
+    ) -> None:
+        self.screen: pygame.Surface = screen
+        self.surfaces: tuple[pygame.Surface, ...] = (screen,) + tuple(surfaces)
+        self.previous_layers: dict[Hashable, tuple[pygame.Rect, any]] = {}
+        self.invalidated_rects: list[pygame.Rect] = []
+        self.full_redraw: bool = True
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None) -> None:
+        """
+        Mark an area of the screen as needing to be drawn again on the next frame.
+
+        Keyword arguments:
+        rect -- the area that should be drawn again, the whole screen by default
+        """
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.invalidated_rects.append(pygame.Rect(rect))
+
+    def get_dirty_rects(self, layers: Sequence[DisplayLayer]) -> list[pygame.Rect]:
+        """
+        Return the areas of the screen that should be drawn again to show the given layers,
+        according to the layers drawn during the previous frame and the invalidated areas.
+
+        Keyword arguments:
+        layers -- the elements that should be on the screen, in the order in which they are drawn
+        """
+        dirty_rects: list[pygame.Rect] = list(self.invalidated_rects)
+        previous_layers: dict[Hashable, tuple[pygame.Rect, any]] = self.previous_layers
+        keys: set[Hashable] = set()
+        for layer in layers:
+            keys.add(layer.key)
+            previous: Optional[tuple[pygame.Rect, any]] = previous_layers.get(layer.key)
+            if previous is None:
+                dirty_rects.append(layer.rect)
+            elif layer.state is None or previous != (layer.rect, layer.state):
+                dirty_rects.append(layer.rect)
+                if previous[0] != layer.rect:
+                    dirty_rects.append(previous[0])
+        dirty_rects.extend(
+            rect for key, (rect, _) in previous_layers.items() if key not in keys
+        )
+        screen_rect: pygame.Rect = self.screen.get_rect()
+        return merge_rects([rect.clip(screen_rect) for rect in dirty_rects])
+
+    def render(self, layers: Sequence[DisplayLayer]) -> Optional[list[pygame.Rect]]:
+        """
+        Draw the given layers on the screen, only where something changed since the previous frame.
+
+        Return the areas of the screen that have been drawn again,
+        or None if the whole screen has been drawn again.
+
+        Keyword arguments:
+        layers -- the elements that should be on the screen, in the order in which they are drawn
+        """
+        dirty_rects: Optional[list[pygame.Rect]] = None
+        if not self.full_redraw:
+            dirty_rects = self.get_dirty_rects(layers)
+            screen_area: int = self.screen.get_width() * self.screen.get_height()
+            if (
+                sum(rect.width * rect.height for rect in dirty_rects)
+                > screen_area * FULL_REDRAW_RATIO
+            ):
+                dirty_rects = None
+
+        if dirty_rects is None:
+            self.screen.fill(BLACK)
+            for layer in layers:
+                layer.draw()
+        else:
+            for dirty_rect in dirty_rects:
+                self._set_clip(dirty_rect)
+                self.screen.fill(BLACK, dirty_rect)
+                for layer in layers:
+                    if layer.rect.colliderect(dirty_rect):
+                        layer.draw()
+            self._set_clip(None)
+
+        self.previous_layers = {
+            layer.key: (layer.rect, layer.state) for layer in layers
+        }
+        self.invalidated_rects.clear()
+        self.full_redraw = False
+        return dirty_rects
+
+    def _set_clip(self, rect: Optional[pygame.Rect]) -> None:
+        for surface in self.surfaces:
+            if rect is None:
+                surface.set_clip(None)
+            else:
+                offset_x, offset_y = surface.get_abs_offset()
+                surface.set_clip(rect.move(-offset_x, -offset_y))
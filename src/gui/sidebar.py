@@ -3,6 +3,7 @@ Defines Sidebar class, an element of the GUI that will be display permanently
 at the bottom of the screen.
 """
 from collections.abc import Sequence
+from typing import Optional
 
 import pygame
 
@@ -33,6 +34,9 @@ class Sidebar:
     Unlike other interfaces, this interface should be permanently displayed
     and not disturb the progress of the game.
 
+    The sidebar is rendered once on its own surface, that is only rendered again when the turn,
+    the status of the missions or the hovered entity and the information shown about it change.
+
     Keyword arguments:
     size -- the size of the sidebar
     position -- the position of the sidebar on the screen
@@ -45,6 +49,9 @@ class Sidebar:
     sprite -- the pygame Surface representing the background of the sidebar
     missions -- the list of missions that should be accomplished by the players
     level_id -- id of the current level
+    surface -- the pygame Surface on which the sidebar is rendered, drawn on the screen at once
+    rendered_state -- the values the rendered sidebar depends on,
+    None if it has not been rendered yet
     """
 
     def __init__(
@@ -61,9 +68,49 @@ class Sidebar:
         )
         self.missions: Sequence[Mission] = missions
         self.level_id: int = level_id
+        # The sidebar is drawn over a black screen, its transparent parts are rendered as such
+        self.surface: pygame.Surface = pygame.Surface(size).convert()
+        self.rendered_state: Optional[tuple] = None
+
+    def get_display_state(
+        self, number_turns: int, hovered_entity: Optional[Entity]
+    ) -> tuple:
+        """
+        Return the values the look of the sidebar depends on,
+        so that it is only rendered again when one of them changed.
+
+        Keyword arguments:
+        number_turns -- the current turn of the ongoing level
+        hovered_entity -- the currently hovered entity if there is any
+        """
+        state: tuple = (
+            number_turns,
+            tuple(mission.ended for mission in self.missions),
+            id(hovered_entity),
+        )
+        if not hovered_entity:
+            return state
+        state += (str(hovered_entity), id(hovered_entity.sprite))
+        if isinstance(hovered_entity, Destroyable):
+            state += (hovered_entity.hit_points, hovered_entity.hit_points_max)
+        if isinstance(hovered_entity, Movable):
+            state += (
+                hovered_entity.lvl,
+                hovered_entity.get_abbreviated_alterations(),
+            )
+        if isinstance(hovered_entity, Character):
+            state += (hovered_entity.get_formatted_race(),) + tuple(
+                id(equipment.equipped_sprite) for equipment in hovered_entity.equipments
+            )
+        if isinstance(hovered_entity, Player):
+            state += (hovered_entity.get_formatted_classes(),)
+        return state
 
     def display(
-        self, screen: pygame.Surface, number_turns: int, hovered_entity: Entity
+        self,
+        screen: pygame.Surface,
+        number_turns: int,
+        hovered_entity: Optional[Entity],
     ) -> None:
         """
         Display the sidebar and all the expected information on the screen provided.
@@ -73,31 +120,47 @@ class Sidebar:
         number_turns -- the current turn of the ongoing level
         hovered_entity -- the currently hovered entity if there is any
         """
+        state: tuple = self.get_display_state(number_turns, hovered_entity)
+        if state != self.rendered_state:
+            self.render(number_turns, hovered_entity)
+            self.rendered_state = state
+        screen.blit(self.surface, self.position)
+
+    def render(self, number_turns: int, hovered_entity: Optional[Entity]) -> None:
+        """
+        Render the sidebar and all the expected information on its surface.
+
+        Keyword arguments:
+        number_turns -- the current turn of the ongoing level
+        hovered_entity -- the currently hovered entity if there is any
+        """
+        surface: pygame.Surface = self.surface
         # Sidebar background
-        screen.blit(self.sprite, self.position)
+        surface.fill(BLACK)
+        surface.blit(self.sprite, (0, 0))
 
         # Turn indication
         turn_text: pygame.Surface = fonts["MENU_TITLE_FONT"].render(
             f_TURN_NUMBER_SIDEBAR(number_turns), True, BLACK
         )
-        screen.blit(turn_text, (self.position[0] + 50, self.position[1] + 15))
+        surface.blit(turn_text, (50, 15))
 
         # Level indication
         turn_text: pygame.Surface = fonts["MENU_TITLE_FONT"].render(
             f_LEVEL_NUMBER_SIDEBAR(self.level_id), True, BLACK
         )
-        screen.blit(turn_text, (self.position[0] + 50, self.position[1] + 50))
+        surface.blit(turn_text, (50, 50))
 
         # Main mission header
-        screen.blit(
+        surface.blit(
             constant_sprites["main_mission_text"],
-            (self.position[0] + self.size[0] - 500, self.position[1] + 10),
+            (self.size[0] - 500, 10),
         )
         # Secondaries missions header if any
         if len(self.missions) > 1:
-            screen.blit(
+            surface.blit(
                 constant_sprites["secondaries_mission_text"],
-                (self.position[0] + self.size[0] - 300, self.position[1] + 10),
+                (self.size[0] - 300, 10),
             )
         # Missions
         vertical_shift: int = 0
@@ -107,22 +170,19 @@ class Sidebar:
                 f"> {mission.description}", True, mission_color
             )
             if mission.main:
-                screen.blit(
+                surface.blit(
                     mission_description,
                     (
-                        self.position[0] + self.size[0] - 480,
-                        self.position[1]
-                        + 10
-                        + constant_sprites["main_mission_text"].get_height(),
+                        self.size[0] - 480,
+                        10 + constant_sprites["main_mission_text"].get_height(),
                     ),
                 )
             else:
-                screen.blit(
+                surface.blit(
                     mission_description,
                     (
-                        self.position[0] + self.size[0] - 280,
-                        self.position[1]
-                        + 10
+                        self.size[0] - 280,
+                        10
                         + constant_sprites["secondaries_mission_text"].get_height()
                         + vertical_shift * mission_description.get_height(),
                     ),
@@ -150,28 +210,27 @@ class Sidebar:
                 nature, True, color
             )
             nature_position: Position = (
-                self.position[0]
-                + self.size[0] / 4
+                self.size[0] / 4
                 + constant_sprites["frame"].get_width() / 2
                 - nature_display.get_width() / 2,
-                self.position[1] + 5,
+                5,
             )
-            screen.blit(nature_display, nature_position)
+            surface.blit(nature_display, nature_position)
             # Display the entity sprite in a frame
             frame_position: Position = (
-                self.position[0] + self.size[0] // 4,
-                self.position[1] + 5 + nature_display.get_height(),
+                self.size[0] // 4,
+                5 + nature_display.get_height(),
             )
-            screen.blit(constant_sprites["frame"], frame_position)
+            surface.blit(constant_sprites["frame"], frame_position)
             entity_position: Position = (frame_position[0] + 5, frame_position[1] + 5)
-            screen.blit(hovered_entity.sprite, entity_position)
+            surface.blit(hovered_entity.sprite, entity_position)
             # If it is a character
             if isinstance(hovered_entity, Character):
                 for equip in hovered_entity.equipments:
-                    screen.blit(equip.equipped_sprite, entity_position)
+                    surface.blit(equip.equipped_sprite, entity_position)
             # If it is a breakable
             elif isinstance(hovered_entity, Breakable):
-                screen.blit(constant_sprites["cracked"], entity_position)
+                surface.blit(constant_sprites["cracked"], entity_position)
 
             # Display basic information about the entity
             # Name
@@ -181,11 +240,11 @@ class Sidebar:
             name_pre_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
                 STR_NAME_SIDEBAR_, True, color
             )
-            screen.blit(name_pre_text, (text_position_x, frame_position[1]))
+            surface.blit(name_pre_text, (text_position_x, frame_position[1]))
             name_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
                 f"         {hovered_entity}", True, BLACK
             )
-            screen.blit(name_text, (text_position_x, frame_position[1]))
+            surface.blit(name_text, (text_position_x, frame_position[1]))
 
             # HP if it's a destroyable entity
             if isinstance(hovered_entity, Destroyable):
@@ -200,19 +259,19 @@ class Sidebar:
                     + constant_sprites["frame"].get_height()
                     - hit_points_pre_text.get_height(),
                 )
-                screen.blit(hit_points_pre_text, text_position)
+                surface.blit(hit_points_pre_text, text_position)
                 hit_points_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
                     f"      {hit_points}",
                     True,
                     determine_gauge_color(hit_points, hit_points_max, BLACK),
                 )
-                screen.blit(hit_points_text, text_position)
+                surface.blit(hit_points_text, text_position)
                 hp_post_text = fonts["ITEM_FONT_STRONG"].render(
                     f'      {" " * len(str(hit_points))} / {hit_points_max}',
                     True,
                     BLACK,
                 )
-                screen.blit(hp_post_text, text_position)
+                surface.blit(hp_post_text, text_position)
 
                 # Display more information if it is a movable entity
                 if isinstance(hovered_entity, Movable):
@@ -225,7 +284,7 @@ class Sidebar:
                         + constant_sprites["frame"].get_width() / 2
                         - level_text.get_width() / 2
                     )
-                    screen.blit(
+                    surface.blit(
                         level_text,
                         (
                             lvl_text_position_x,
@@ -237,7 +296,7 @@ class Sidebar:
                     status_pre_text: pygame.Surface = fonts["ITEM_FONT_STRONG"].render(
                         STR_ALTERATIONS_, True, color
                     )
-                    screen.blit(
+                    surface.blit(
                         status_pre_text,
                         (
                             text_position_x,
@@ -249,7 +308,7 @@ class Sidebar:
                         True,
                         BLACK,
                     )
-                    screen.blit(
+                    surface.blit(
                         status_text,
                         (
                             text_position_x,
@@ -263,7 +322,7 @@ class Sidebar:
                         race_pre_text: pygame.Surface = fonts[
                             "ITEM_FONT_STRONG"
                         ].render(STR_RACE_, True, color)
-                        screen.blit(
+                        surface.blit(
                             race_pre_text,
                             (
                                 text_position_x,
@@ -274,7 +333,7 @@ class Sidebar:
                         race_text = fonts["ITEM_FONT_STRONG"].render(
                             f"        {race}", True, BLACK
                         )
-                        screen.blit(
+                        surface.blit(
                             race_text,
                             (
                                 text_position_x,
@@ -289,7 +348,7 @@ class Sidebar:
                             classes_pre_text = fonts["ITEM_FONT_STRONG"].render(
                                 STR_CLASS_, True, color
                             )
-                            screen.blit(
+                            surface.blit(
                                 classes_pre_text,
                                 (
                                     text_position_x,
@@ -301,7 +360,7 @@ class Sidebar:
                             classes_text = fonts["ITEM_FONT_STRONG"].render(
                                 "         " + classes, True, BLACK
                             )
-                            screen.blit(
+                            surface.blit(
                                 classes_text,
                                 (
                                     text_position_x,
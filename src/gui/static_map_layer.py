@@ -0,0 +1,127 @@
+"""
+Defines StaticMapLayer class, the image of the map of a level with the entities that never move
+drawn once on its ground.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Optional
+
+import pygame
+
+from src.game_entities.entity import Entity
+from src.gui.dirty_rect_renderer import merge_rects
+from src.gui.position import Position
+
+
+class StaticMapLayer:
+    """
+    A StaticMapLayer bakes the ground of a map and the static entities on it (obstacles,
+    buildings, doors, chests...) into a single surface, that can be drawn in one blit
+    on every frame instead of drawing each entity.
+
+    The baked entities are compared to the given ones on each update: only the tiles covered by
+    an entity that appeared, disappeared or changed, like an opened door or a destroyed breakable,
+    are drawn again on the surface.
+
+    Keyword arguments:
+    ground -- the image of the ground of the map
+    position -- the position of the top left corner of the map on the level screen
+    entities -- the static entities that should be drawn on the ground
+
+    Attributes:
+    ground -- the image of the ground of the map
+    rect -- the area of the level screen covered by the map
+    canvas -- the surface on which the entities are drawn at their position on the level screen,
+    covering the level screen from its top left corner to the bottom right corner of the map
+    surface -- the part of the canvas covered by the map, that should be drawn at the position of
+    the map
+    baked_entities -- the entity, the area and the display state of each entity drawn on the
+    surface, by identity of the entity
+    """
+
+    def __init__(
+        self,
+        ground: pygame.Surface,
+        position: Position,
+        entities: Sequence[Entity] = (),
+    ) -> None:
+        self.ground: pygame.Surface = ground
+        self.rect: pygame.Rect = pygame.Rect(position, ground.get_size())
+        self.canvas: pygame.Surface = pygame.Surface(self.rect.bottomright).convert()
+        self.surface: pygame.Surface = self.canvas.subsurface(self.rect)
+        self.baked_entities: dict[int, tuple[Entity, pygame.Rect, tuple]] = {}
+        self.bake(entities)
+
+    def bake(self, entities: Sequence[Entity]) -> None:
+        """
+        Draw again the whole surface with the given entities.
+
+        Keyword arguments:
+        entities -- the static entities that should be drawn on the ground
+        """
+        self.surface.blit(self.ground, (0, 0))
+        self.baked_entities = {
+            id(entity): (entity, entity.get_rect(), entity.get_display_state())
+            for entity in entities
+        }
+        for entity in entities:
+            entity.display(self.canvas)
+
+    def update(self, entities: Sequence[Entity]) -> list[pygame.Rect]:
+        """
+        Draw again the parts of the surface covered by the entities that changed
+        since the last update.
+
+        Return the areas of the level screen that have been drawn again.
+
+        Keyword arguments:
+        entities -- the static entities that should be drawn on the ground
+        """
+        changed_rects: list[pygame.Rect] = []
+        baked_entities: dict[int, tuple[Entity, pygame.Rect, tuple]] = {}
+        for entity in entities:
+            previous: Optional[tuple[Entity, pygame.Rect, tuple]] = (
+                self.baked_entities.get(id(entity))
+            )
+            state: tuple = entity.get_display_state()
+            if previous is not None and previous[2] == state:
+                baked_entities[id(entity)] = previous
+                continue
+            rect: pygame.Rect = entity.get_rect()
+            changed_rects.append(rect)
+            if previous is not None:
+                changed_rects.append(previous[1])
+            baked_entities[id(entity)] = (entity, rect, state)
+        # Some entities disappeared if they are not all found among the given ones
+        if len(baked_entities) != len(self.baked_entities) or changed_rects:
+            changed_rects.extend(
+                rect
+                for key, (_, rect, _) in self.baked_entities.items()
+                if key not in baked_entities
+            )
+        self.baked_entities = baked_entities
+        if not changed_rects:
+            return []
+
+        changed_rects = merge_rects([rect.clip(self.rect) for rect in changed_rects])
+        for changed_rect in changed_rects:
+            self.canvas.set_clip(changed_rect)
+            self.canvas.blit(
+                self.ground, changed_rect, changed_rect.move(-self.rect.x, -self.rect.y)
+            )
+            for entity in entities:
+                if baked_entities[id(entity)][1].colliderect(changed_rect):
+                    entity.display(self.canvas)
+        self.canvas.set_clip(None)
+        return changed_rects
+
+    def display(self, screen: pygame.Surface) -> None:
+        """
+        Display the map with its static entities on the given screen.
+
+        Keyword arguments:
+        screen -- the level screen on which the map should be drawn
+        """
+        screen.blit(self.surface, self.rect)
@@ -15,17 +15,19 @@ from src.gui.position import Position
 
 def show_fps(
     surface: pygame.Surface, inner_clock: pygame.time.Clock, font: pygame.font.Font
-) -> None:
+) -> pygame.Rect:
     """
     Display in the top left corner of the screen the current frame rate.
 
+    Return the area of the surface on which the frame rate has been drawn.
+
     Keyword arguments:
     screen -- the surface on which the framerate should be drawn
     inner_clock -- the pygame clock running and containing the current frame rate
     font -- the font used to display the frame rate
     """
     fps_text = font.render(f"FPS: {inner_clock.get_fps():.0f}", True, LIGHT_YELLOW)
-    surface.blit(fps_text, (2, 2))
+    return surface.blit(fps_text, (2, 2))
 
 
 def blit_alpha(
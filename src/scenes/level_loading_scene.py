@@ -14,6 +14,7 @@ from src.gui.position import Position
 from src.scenes.level_scene import LevelScene
 from src.scenes.scene import Scene
 from src.services.language import *
+from src.services.level_engine import LevelEngine
 
 DELAY_BETWEEN_FRAMES = 2
 TITLE_VISIBILITY_DURATION = 120
@@ -70,12 +71,13 @@ class LevelLoadingScene(Scene):
 
         Return the surface containing the rendered text.
         """
+        engine: LevelEngine = self.level.engine
         chapter_rendering = fonts["LEVEL_TITLE_FONT"].render(
-            f_CHAPTER_NUMBER(self.level.chapter), True, WHITE
+            f_CHAPTER_NUMBER(engine.chapter), True, WHITE
         )
 
         level_name_rendering = fonts["LEVEL_TITLE_FONT"].render(
-            f_LEVEL_NUMBER_AND_NAME(self.level.number, self.level.name), True, WHITE
+            f_LEVEL_NUMBER_AND_NAME(engine.number, engine.name), True, WHITE
         )
 
         surface_size = (
@@ -114,11 +116,16 @@ class LevelLoadingScene(Scene):
     def update_state(self) -> bool:
         """
         Proceed to loading of level content if needed.
-        Update the animation.
+        Update the animation, skipped in fast-forward mode.
 
         Return whether the scene should be ended or not.
         """
-        if not self.level.is_loaded and self.animation.is_fade_in_finished:
+        if self.level.engine.fast_forward:
+            self.animation = None
+
+        if not self.level.engine.is_loaded and (
+            self.animation is None or self.animation.is_fade_in_finished
+        ):
             self.level.load_level_content()
 
         if self.animation and self.animation.animate():
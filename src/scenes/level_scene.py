@@ -6,113 +6,69 @@ corresponding to an ongoing level.
 from __future__ import annotations
 
 import os
-from collections.abc import Sequence
-from enum import IntEnum, auto
-from typing import Optional, Union
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Optional
 
 import pygame
-import pytmx
-from pygamepopup.components import BoxElement, Button, InfoBox, TextElement
+from pygamepopup.components import Button, InfoBox, TextElement
 from pygamepopup.components.image_button import ImageButton
 from pygamepopup.menu_manager import MenuManager
 
-from src.constants import (BLACK, GRID_HEIGHT, GRID_WIDTH,
+from src.constants import (BLACK, COMMAND_LOGS_DIRECTORY, FAST_FORWARD,
+                           FAST_FORWARD_UPDATES_PER_FRAME,
                            ITEM_DELETE_MENU_WIDTH, ITEM_INFO_MENU_WIDTH,
                            ITEM_MENU_WIDTH, MAX_MAP_HEIGHT, MENU_HEIGHT,
-                           MENU_WIDTH, ORANGE, TILE_SIZE, WIN_HEIGHT,
-                           WIN_WIDTH)
+                           MENU_WIDTH, ORANGE, RECORD_COMMAND_LOGS, TILE_SIZE,
+                           WHITE, WIN_HEIGHT, WIN_WIDTH)
 from src.game_entities.alteration import Alteration
-from src.game_entities.breakable import Breakable
 from src.game_entities.building import Building
 from src.game_entities.character import Character
 from src.game_entities.chest import Chest
-from src.game_entities.destroyable import DamageKind, Destroyable
 from src.game_entities.door import Door
-from src.game_entities.effect import Effect
 from src.game_entities.entity import Entity
-from src.game_entities.equipment import Equipment
-from src.game_entities.foe import Foe
 from src.game_entities.fountain import Fountain
-from src.game_entities.gold import Gold
 from src.game_entities.item import Item
 from src.game_entities.key import Key
-from src.game_entities.mission import Mission, MissionType
 from src.game_entities.movable import Movable
-from src.game_entities.objective import Objective
-from src.game_entities.obstacle import Obstacle
 from src.game_entities.player import Player
 from src.game_entities.portal import Portal
 from src.game_entities.shop import Shop
 from src.game_entities.skill import Skill
-from src.game_entities.weapon import Weapon
 from src.gui.animation import Animation, Frame
 from src.gui.constant_sprites import (ATTACKABLE_OPACITY, INTERACTION_OPACITY,
                                       LANDING_OPACITY, constant_sprites)
+from src.gui.dirty_rect_renderer import DirtyRectRenderer, DisplayLayer
 from src.gui.fonts import fonts
 from src.gui.position import Position
 from src.gui.sidebar import Sidebar
+from src.gui.static_map_layer import StaticMapLayer
 from src.gui.tools import blit_alpha
 from src.scenes.scene import QuitActionKind, Scene
 from src.services import load_from_tmx_manager as tmx_loader
-from src.services import load_from_xml_manager as loader
 from src.services import menu_creator_manager
+from src.services.assets_manager import Sound, load_sound
+from src.services.command_log import CommandLog
+from src.services.duel_forecast import DuelForecast
 from src.services.language import *
+from src.services.level_engine import (EntityTurn, LevelEngine,
+                                       LevelEntityCollections, LevelStatus)
 from src.services.menu_creator_manager import (CHARACTER_ACTION_MENU_ID,
                                                INVENTORY_MENU_ID, SHOP_MENU_ID,
                                                create_event_dialog,
                                                create_save_dialog)
 from src.services.menus import CharacterMenu
+from src.services.move_range import MoveRange
+from src.services.random_service import (RandomService,
+                                         set_active_random_service)
 from src.services.save_state_manager import SaveStateManager
 
 
-class LevelStatus(IntEnum):
-    VERY_BEGINNING = auto()
-    INITIALIZATION = auto()
-    IN_PROGRESS = auto()
-    ENDED_VICTORY = auto()
-    ENDED_DEFEAT = auto()
-
-
-class LevelEntityCollections:
-    def __init__(self):
-        self.obstacles: list[Obstacle] = []
-        self.players: list[Player] = []
-        self.allies: list[Character] = []
-        self.foes: list[Foe] = []
-        self.chests: list[Chest] = []
-        self.buildings: list[Building] = []
-        self.breakables: list[Breakable] = []
-        self.portals: list[Portal] = []
-        self.fountains: list[Fountain] = []
-        self.objectives: list[Objective] = []
-        self.doors: list[Door] = []
-
-    def values(self):
-        return self.__dict__.values()
-
-    def update(self, entities: dict[str, Sequence[Entity]]):
-        self.__dict__.update(entities)
-
-
-class EntityTurn(IntEnum):
-    PLAYER = 0
-    ALLIES = 1
-    FOES = 2
-
-    def get_next(self) -> EntityTurn:
-        """
-        Return the next entity turn, according to the current one
-        """
-        next_value = (
-            self.value + 1 if self.value + 1 < len(EntityTurn.__members__) else 0
-        )
-        return EntityTurn(next_value)
-
-
 class LevelScene(Scene):
     """
     This class is the main scene of the game, handling all the actions of the players for
-    an ongoing level, and also apply the game logic of the level (manage animations, IA turns etc.).
+    an ongoing level and displaying it (level's map, entities, animations, menus etc.).
+    The game logic of the level (turns, duels, AI, missions etc.) is applied by the level engine
+    held by the scene, the scene only gives it the actions of the players and shows its state.
 
     Keywords arguments:
     screen -- the pygame Surface related to the level
@@ -123,29 +79,23 @@ class LevelScene(Scene):
     turn -- the value of the current turn (0 by default for new game)
     data -- saved data in XML format in case where the game is loaded from a save
     players -- the list of players on the level
+    random_service -- the source of the random numbers of the level, a new one by default
 
     Attributes:
+    default_fast_forward -- whether new levels should be played in fast-forward mode,
+    according to the options of the game
+    record_command_log -- whether the decisions of the players during new levels should be
+    recorded and stored on local disk when leaving the level, according to the options of the game
+    engine -- the level engine applying the game logic of the level
     active_screen_part -- the sub part of the screen containing all the elements of the level
-    directory -- the relative path to the directory where all static data
-    concerning the level are stored
-    number -- the number identifying the level
-    map -- a dictionary containing the properties of the level's map
-    chapter -- the id corresponding to the chapter in which the level is part
-    name -- the full title of the level
-    is_loaded -- whether the level is ready to be played or not
-    obstacles -- the list of obstacles on the level
-    events -- a structure containing the data about all the events that could occur
-    possible_placements -- the list of available initial positions for players
+    static_map_layer -- the image of the map with the entities of the level that never move
+    drawn on it
+    renderer -- the renderer drawing again only the elements of the level that changed
+    since the previous frame
+    ground -- the image of the ground of the level's map
     menu_manager -- the reference to the menu manager entity
     a boolean value is associated to each menu in the background to know
     if it should be displayed or not
-    players -- the list of players that are still actives on the level
-    entities -- the structure containing all the entities of the level by category
-    passed_players -- the list of players who left the level
-    missions -- the list of missions to be done
-    main_mission -- the main mission that is the winning condition for players
-    victory -- a boolean indicating whether the game is finished by a victory or not
-    defeat -- a boolean indicating whether the game is finished by a defeat or not
     possible_moves -- the collection of moves that can be done by the active player
     possible_attacks -- the collection of attacks that can be made by the active player
     possible_interactions -- the collection of interactions that can be made by the active player
@@ -153,18 +103,12 @@ class LevelScene(Scene):
     selected_item -- the currently selected item by a player
     active_shop -- the currently visited shop
     quit_request -- a boolean indicating if an exit request has been made
-    game_phase -- the active phase of the game
-    side_turn -- indicated which side should play (players, allies or foes)
-    turn -- the value of the current turn
     animation -- a reference to the ongoing animation if there is any
     watched_entity -- the entity of the level for which its potential actions should be displayed
     hovered_entity -- the entity of the level which is currently hovered
     sidebar -- the reference to the sidebar displaying various information
     wait_for_teleportation_destination -- a boolean indicating if the level is waiting for player
     to choose for the destination of a teleportation
-    diary_entries -- the log of the most recent battles
-    traded_items -- the items that have been trade during the current player turn
-    traded_gold -- the gold that have been trade during the current player turn
     wait_sfx -- the sound that should be started when a player ends his turn
     inventory_sfx -- the sound that should be started when the inventory screen is opening
     armor_sfx -- the sound that should be started when the equipment screen is opening
@@ -173,6 +117,8 @@ class LevelScene(Scene):
     """
 
     IDS = [0, 1, 2, 3]
+    default_fast_forward: bool = bool(FAST_FORWARD)
+    record_command_log: bool = bool(RECORD_COMMAND_LOGS)
 
     def __init__(
         self,
@@ -183,12 +129,19 @@ class LevelScene(Scene):
         turn: int = 0,
         data: Optional[etree.Element] = None,
         players: Optional[Sequence[Player]] = None,
+        random_service: Optional[RandomService] = None,
     ) -> None:
-        if players is None:
-            players = []
-
         super().__init__(screen)
+        self.engine: LevelEngine = LevelEngine(
+            directory, number, status, turn, data, players, random_service
+        )
+        self.engine.set_fast_forward(LevelScene.default_fast_forward)
+        if LevelScene.record_command_log:
+            self.engine.command_log = CommandLog.start(self.engine)
+        self.engine.new_turn_callback = self.show_new_turn
+        self.engine.entity_move_callback = self.follow_entity_move
         self.active_screen_part = self._compute_active_screen_part()
+        self.renderer = DirtyRectRenderer(self.screen, (self.active_screen_part,))
 
         Shop.interaction_callback = self.interact_item_shop
         Shop.buy_interface_callback = lambda: self.menu_manager.open_menu(
@@ -196,57 +149,15 @@ class LevelScene(Scene):
         )
         Shop.sell_interface_callback = self.open_sell_interface
 
-        self.directory: str = directory
-        self.number: int = number
-
-        self.tmx_data = pytmx.load_pygame(self.directory + "map.tmx")
-        self.tmx_map_properties_data = pytmx.load_pygame(
-            DATA_PATH + self.directory + "map_properties.tmx"
-        )
-        map_width, map_height = (
-            self.tmx_data.width * TILE_SIZE,
-            self.tmx_data.height * TILE_SIZE,
-        )
-        map_static_content = tmx_loader.load_ground(
-            self.tmx_data, (map_width, map_height)
+        self.ground: pygame.Surface = tmx_loader.load_ground(
+            self.engine.tmx_data,
+            (self.engine.map["width"], self.engine.map["height"]),
         )
 
-        self.map: dict[str, any] = {
-            "img": map_static_content,
-            "width": map_width,
-            "height": map_height,
-            "x": (GRID_WIDTH - self.tmx_data.width) // 2 * TILE_SIZE,
-            "y": (GRID_HEIGHT - self.tmx_data.height) // 2 * TILE_SIZE,
-        }
-
-        self.data: Optional[etree.Element] = data
-
-        self.chapter: int = self.tmx_map_properties_data.properties["chapter_id"]
-        self.name: str = self.tmx_map_properties_data.properties["level_name"]
-
-        self.is_loaded: bool = False
-
-        self.events: dict[str, any] = {}
-        self.player_possible_placements: Sequence[Position] = []
-
         self.menu_manager = MenuManager(self.screen)
-        self.players: list[Player] = players
-        self.escaped_players: list[Player] = []
-
-        self.entities: LevelEntityCollections = LevelEntityCollections()
-
-        self.missions: Optional[list[Mission]] = None
-        self.main_mission: Optional[Mission] = None
-
-        # Booleans for end game
-        # TODO : these booleans are mutually exclusive and so seem a little redundant.
-        #  Having only one variable with three different states (victory, defeat or "not finished")
-        #  may be better.
-        self.victory: bool = False
-        self.defeat: bool = False
 
         # Data structures for possible actions
-        self.possible_moves: dict[Position, int] = {}
+        self.possible_moves: MoveRange = MoveRange()
         self.possible_attacks: list[Position] = []
         self.possible_interactions: list[Position] = []
 
@@ -256,30 +167,30 @@ class LevelScene(Scene):
         self.active_shop: Optional[Shop] = None
 
         self.quit_request: bool = False
-        self.game_phase: LevelStatus = status
-        self.side_turn: EntityTurn = EntityTurn.PLAYER
-        self.turn: int = turn
         self.animation: Optional[Animation] = None
         self.watched_entity: Optional[Movable] = None
         self.hovered_entity: Optional[Entity] = None
         self.sidebar: Optional[Sidebar] = None
+        self.static_map_layer: Optional[StaticMapLayer] = None
         self.wait_for_teleportation_destination: bool = False
-        self.diary_entries: list[list[BoxElement]] = []
-        self.traded_items: list[list[Union[Item, Player]]] = []
-        self.traded_gold: list[list[Union[int, Player]]] = []
 
-        self.wait_sfx: Optional[pygame.mixer.Sound] = None
-        self.inventory_sfx: Optional[pygame.mixer.Sound] = None
-        self.armor_sfx: Optional[pygame.mixer.Sound] = None
-        self.talk_sfx: Optional[pygame.mixer.Sound] = None
-        self.gold_sfx: Optional[pygame.mixer.Sound] = None
+        self.wait_sfx: Optional[Sound] = None
+        self.inventory_sfx: Optional[Sound] = None
+        self.armor_sfx: Optional[Sound] = None
+        self.talk_sfx: Optional[Sound] = None
+        self.gold_sfx: Optional[Sound] = None
 
     @property
     def diary_entries_text_element_set(self):
         """
         Return a list of TextElements being shown in the menu.
         """
-        default_diary_entries = [
+        if self.engine.diary_entries:
+            return [
+                [TextElement(entry, font=fonts["ITEM_DESC_FONT"])]
+                for entry in self.engine.diary_entries
+            ]
+        return [
             [
                 TextElement(
                     STR_DEFAULT_DIARY_BODY_CONTENT,
@@ -287,9 +198,6 @@ class LevelScene(Scene):
                 )
             ]
         ]
-        if self.diary_entries:
-            return self.diary_entries
-        return default_diary_entries
 
     def no_dont_save(self):
         self.menu_manager.close_active_menu()
@@ -300,110 +208,43 @@ class LevelScene(Scene):
 
     def load_level_content(self) -> None:
         """
-        Load all the content of the level
+        Load all the content of the level.
+        Open the dialogs that should be shown before the initialization phase if any.
         """
+        self.engine.load_level_content()
 
-        self.events = tmx_loader.load_events(
-            self.tmx_data, DATA_PATH + self.directory, self.map["x"], self.map["y"]
-        )
-
-        self.player_possible_placements = tmx_loader.load_player_placements(
-            self.tmx_data, self.map["x"], self.map["y"]
-        )
-
-        self.entities.players = self.players
-        self.entities.obstacles = tmx_loader.load_obstacles(
-            self.tmx_data, self.map["x"], self.map["y"]
-        )
-
-        if self.data is None:
-            # Game is new
-            gap_x, gap_y = (self.map["x"], self.map["y"])
-            if "before_init" in self.events:
-                if "dialogs" in self.events["before_init"]:
-                    for dialog in self.events["before_init"]["dialogs"]:
+        if (
+            self.engine.data is None
+            or self.engine.game_phase == LevelStatus.VERY_BEGINNING
+        ):
+            # Game is new or in very beginning, show dialogs
+            if "before_init" in self.engine.events:
+                if "dialogs" in self.engine.events["before_init"]:
+                    for dialog in self.engine.events["before_init"]["dialogs"]:
                         self.menu_manager.open_menu(create_event_dialog(dialog))
-                if "new_players" in self.events["before_init"]:
-                    for player_el in self.events["before_init"]["new_players"]:
-                        player = loader.init_player(player_el["name"])
-                        player.position = player_el["position"]
-                        self.players.append(player)
-            if self.number != 0:
-                # Level_0 doesn't need save reminder
-                self.menu_manager.open_menu(
-                    create_save_dialog({"yes": self.yes_save, "no": self.no_dont_save})
-                )
-
-            self._determine_players_initial_position()
-
-            self.entities.foes = tmx_loader.load_foes(self.tmx_data, gap_x, gap_y)
-            self.entities.chests = tmx_loader.load_chests(self.tmx_data, gap_x, gap_y)
-            self.entities.allies = tmx_loader.load_allies(self.tmx_data, gap_x, gap_y)
-            self.entities.buildings = tmx_loader.load_buildings(
-                self.tmx_data, DATA_PATH + self.directory, gap_x, gap_y, 500
-            )
-            self.entities.breakables = tmx_loader.load_breakables(
-                self.tmx_data, gap_x, gap_y
-            )
-            self.entities.portals = tmx_loader.load_portals(self.tmx_data, gap_x, gap_y)
-            self.entities.doors = tmx_loader.load_doors(self.tmx_data, gap_x, gap_y)
-            self.entities.fountains = tmx_loader.load_fountains(
-                self.tmx_data, gap_x, gap_y
-            )
-
-        else:
-            # Game is loaded from a save (data)
-            gap_x, gap_y = (0, 0)
-            if self.game_phase == LevelStatus.VERY_BEGINNING:
-                # If game is in very beginning, show dialogs
-                if "before_init" in self.events:
-                    if "dialogs" in self.events["before_init"]:
-                        for dialog in self.events["before_init"]["dialogs"]:
-                            self.menu_manager.open_menu(create_event_dialog(dialog))
-            self.players.extend(loader.load_players(self.data))
-            self.escaped_players = loader.load_escaped_players(self.data)
-            self.entities.update(
-                loader.load_all_entities_from_save(self.data, gap_x, gap_y)
+        if self.engine.data is None and self.engine.number != 0:
+            # Level_0 doesn't need save reminder
+            self.menu_manager.open_menu(
+                create_save_dialog({"yes": self.yes_save, "no": self.no_dont_save})
             )
 
-        self.missions, self.main_mission = tmx_loader.load_missions(
-            self.tmx_data,
-            self.tmx_map_properties_data,
-            self.players,
-            self.map["x"],
-            self.map["y"],
-        )
-        self.entities.objectives = [
-            objective
-            for mission in self.missions
-            for objective in mission.objective_tiles
-        ]
-
         self.sidebar = Sidebar(
             (MENU_WIDTH, MENU_HEIGHT),
             Position(0, MAX_MAP_HEIGHT),
-            self.missions,
-            self.number,
+            self.engine.missions,
+            self.engine.number,
         )
-
-        self.wait_sfx = pygame.mixer.Sound(os.path.join("sound_fx", "waiting.ogg"))
-        self.inventory_sfx = pygame.mixer.Sound(
-            os.path.join("sound_fx", "inventory.ogg")
+        self.static_map_layer = StaticMapLayer(
+            self.ground,
+            Position(self.engine.map["x"], self.engine.map["y"]),
+            self.get_static_entities(),
         )
-        self.armor_sfx = pygame.mixer.Sound(os.path.join("sound_fx", "armor.ogg"))
-        self.talk_sfx = pygame.mixer.Sound(os.path.join("sound_fx", "talking.ogg"))
-        self.gold_sfx = pygame.mixer.Sound(os.path.join("sound_fx", "trade.ogg"))
-
-        self.is_loaded = True
-
-    def _determine_players_initial_position(self):
-        for player in self.players:
-            for tile in self.player_possible_placements:
-                if self.get_entity_on_tile(tile) is None:
-                    player.set_initial_pos(tile)
-                    break
-            else:
-                print(STR_ERROR_NOT_ENOUGH_TILES_TO_SET_PLAYERS)
+
+        self.wait_sfx = load_sound(os.path.join("sound_fx", "waiting.ogg"))
+        self.inventory_sfx = load_sound(os.path.join("sound_fx", "inventory.ogg"))
+        self.armor_sfx = load_sound(os.path.join("sound_fx", "armor.ogg"))
+        self.talk_sfx = load_sound(os.path.join("sound_fx", "talking.ogg"))
+        self.gold_sfx = load_sound(os.path.join("sound_fx", "trade.ogg"))
 
     def open_save_menu(self) -> None:
         """
@@ -420,7 +261,7 @@ class LevelScene(Scene):
         Keyword arguments:
         slot_id -- the id of the slot that should be used to save
         """
-        save_state_manager = SaveStateManager(self)
+        save_state_manager = SaveStateManager(self.engine)
         save_state_manager.save_game(slot_id)
         self.menu_manager.open_menu(
             InfoBox(
@@ -436,42 +277,48 @@ class LevelScene(Scene):
         """
         # At next update, level will be destroyed
         self.quit_request = True
-        if self.game_phase not in (LevelStatus.ENDED_VICTORY, LevelStatus.ENDED_DEFEAT):
-            self.game_phase = LevelStatus.ENDED_DEFEAT
+        if self.engine.command_log is not None:
+            self.save_command_log()
+        if self.engine.game_phase not in (
+            LevelStatus.ENDED_VICTORY,
+            LevelStatus.ENDED_DEFEAT,
+        ):
+            self.engine.game_phase = LevelStatus.ENDED_DEFEAT
 
-    def is_game_started(self) -> bool:
+    def save_command_log(self) -> None:
         """
-        Return whether the game is started or not
+        Store the decisions made by the players during the level in a file on local disk,
+        along with the hash of the current state of the level so that they can be replayed
+        and verified.
         """
-        return self.game_phase is not LevelStatus.INITIALIZATION
+        self.engine.command_log.state_hash = SaveStateManager(
+            self.engine
+        ).compute_state_hash()
+        os.makedirs(COMMAND_LOGS_DIRECTORY, exist_ok=True)
+        self.engine.command_log.save(
+            os.path.join(COMMAND_LOGS_DIRECTORY, f"level_{self.engine.number}.json")
+        )
 
     def end_level(self, animation_surface: pygame.Surface, position: Position) -> None:
         """
         Process to the end of level.
-        In case of victory, verify for each secondary objectives if they have been accomplished.
+        In case of victory, show the rewards of the secondary objectives that have been
+        accomplished.
 
         Keyword arguments:
         animation_surface -- the surface containing the final animation of the level
         position -- the position of the final animation
         """
         self.menu_manager.clear_menus()
-        # Check if some optional objectives have been completed
-        if self.main_mission.ended:
-            for mission in self.missions:
-                if not mission.main and mission.ended:
-                    self.menu_manager.open_menu(
-                        menu_creator_manager.create_reward_menu(mission)
-                    )
-                    if mission.gold:
-                        for player in self.players:
-                            player.gold += mission.gold
-                    if mission.items:
-                        # TODO : Add items reward of optional objective to players
-                        pass
+        if self.engine.main_mission.ended:
+            for mission in self.engine.get_accomplished_secondary_missions():
+                self.menu_manager.open_menu(
+                    menu_creator_manager.create_reward_menu(mission)
+                )
             # Check if there are some post-level events
-            if "at_end" in self.events:
-                if "dialogs" in self.events["at_end"]:
-                    for dialog in self.events["at_end"]["dialogs"]:
+            if "at_end" in self.engine.events:
+                if "dialogs" in self.engine.events["at_end"]:
+                    for dialog in self.engine.events["at_end"]["dialogs"]:
                         self.menu_manager.open_menu(create_event_dialog(dialog))
         self.animation = Animation([Frame(animation_surface, position)], 180)
 
@@ -491,7 +338,7 @@ class LevelScene(Scene):
             if self.animation.animate():
                 self.animation = None
                 if (
-                    self.game_phase > LevelStatus.IN_PROGRESS
+                    self.engine.game_phase > LevelStatus.IN_PROGRESS
                     and not self.menu_manager.active_menu
                 ):
                     self.exit_game()
@@ -500,36 +347,25 @@ class LevelScene(Scene):
         if self.menu_manager.active_menu is not None:
             return False
 
-        if (
-            self.game_phase is LevelStatus.ENDED_DEFEAT
-            or self.game_phase is LevelStatus.ENDED_VICTORY
-        ):
+        if self.engine.is_game_ended():
             return True
 
-        for mission in self.missions:
-            mission.update_state(entities=self.entities, turns=self.turn)
-        if self.main_mission.ended:
-            self.victory = True
-
-        if not self.players:
-            if not self.main_mission.succeeded_chars:
-                self.defeat = True
-            else:
-                self.victory = True
-
-        if self.victory:
+        # Another level may have been loaded meanwhile, like a replay
+        set_active_random_service(self.engine.random_service)
+        self.engine.update_missions()
+        if self.engine.victory:
             self.end_level(constant_sprites["victory"], constant_sprites["victory_pos"])
-            self.game_phase = LevelStatus.ENDED_VICTORY
-            self.victory = False
+            self.engine.finish_level(LevelStatus.ENDED_VICTORY)
+            self.engine.victory = False
             return False
-        if self.defeat:
+        if self.engine.defeat:
             self.end_level(constant_sprites["defeat"], constant_sprites["defeat_pos"])
-            self.game_phase = LevelStatus.ENDED_DEFEAT
-            self.defeat = False
+            self.engine.finish_level(LevelStatus.ENDED_DEFEAT)
+            self.engine.defeat = False
             return False
 
         if self.selected_player:
-            self.selected_player.move()
+            self.engine.move_entity(self.selected_player)
             if (
                 self.selected_player.is_waiting_post_action()
                 and not self.possible_attacks
@@ -538,38 +374,39 @@ class LevelScene(Scene):
                 self.open_player_menu()
             return False
 
-        entities: list[Movable] = []
-        if self.side_turn is EntityTurn.PLAYER:
-            entities = self.players
-        elif self.side_turn is EntityTurn.ALLIES:
-            entities = self.entities.allies
-        elif self.side_turn is EntityTurn.FOES:
-            entities = self.entities.foes
-
-        for entity in entities:
-            if not entity.turn_is_finished():
-                if self.side_turn is not EntityTurn.PLAYER:
-                    self.process_entity_action(
-                        entity, (self.side_turn is EntityTurn.ALLIES)
-                    )
-                break
-        else:
-            self.side_turn = self.side_turn.get_next()
-            self.begin_turn()
-
+        self.engine.update_turn()
+        if self.engine.fast_forward:
+            self._fast_forward_side_turn()
         return False
 
+    def _fast_forward_side_turn(self) -> None:
+        # Let several entities controlled by the AI act during the same frame,
+        # until something has to be shown, the players have to act
+        # or the AI computations have spent the budget of the frame
+        for _ in range(FAST_FORWARD_UPDATES_PER_FRAME - 1):
+            if (
+                self.engine.side_turn is EntityTurn.PLAYER
+                or self.animation
+                or self.menu_manager.active_menu is not None
+                or not self.engine.ai_scheduler.is_idle()
+            ):
+                return
+            self.engine.update_missions()
+            if self.engine.victory or self.engine.defeat:
+                return
+            self.engine.update_turn()
+
     def open_player_menu(self) -> None:
         """
         Open the menu displaying all the actions a playable character can do
         """
         interactable_entities: list[Entity] = (
-            self.entities.chests
-            + self.entities.portals
-            + self.entities.doors
-            + self.entities.fountains
-            + self.entities.allies
-            + self.players
+            self.engine.entities.chests
+            + self.engine.entities.portals
+            + self.engine.entities.doors
+            + self.engine.entities.fountains
+            + self.engine.entities.allies
+            + self.engine.players
         )
         self.menu_manager.open_menu(
             menu_creator_manager.create_player_menu(
@@ -590,10 +427,10 @@ class LevelScene(Scene):
                     "attack": self.select_attack_target,
                 },
                 self.selected_player,
-                self.entities.buildings,
+                self.engine.entities.buildings,
                 interactable_entities,
-                self.missions,
-                self.entities.foes,
+                self.engine.missions,
+                self.engine.entities.foes,
             )
         )
 
@@ -604,53 +441,255 @@ class LevelScene(Scene):
         Display also all the menus in the background (that should be visible)
         and lastly the active menu.
         """
-        self.active_screen_part.blit(self.map["img"], (self.map["x"], self.map["y"]))
-        self.sidebar.display(self.active_screen_part, self.turn, self.hovered_entity)
+        self.static_map_layer.update(self.get_static_entities())
+        for layer in self.get_display_layers():
+            layer.draw()
+
+    def render(self) -> Optional[list[pygame.Rect]]:
+        """
+        Draw again only the elements of the level that changed since the previous frame.
+
+        Return the areas of the screen that have been drawn again,
+        or None if the whole screen has been drawn again.
+        """
+        offset_x, offset_y = self.active_screen_part.get_abs_offset()
+        for rect in self.static_map_layer.update(self.get_static_entities()):
+            self.renderer.invalidate(rect.move(offset_x, offset_y))
+        return self.renderer.render(self.get_display_layers())
+
+    def invalidate(self, rect: pygame.Rect) -> None:
+        """
+        Notify the level that an area of its screen has been drawn over,
+        so that it is drawn again on the next frame.
 
-        for mission in self.missions:
-            mission.display(self.active_screen_part)
+        Keyword arguments:
+        rect -- the area of the screen that has been drawn over
+        """
+        self.renderer.invalidate(rect)
+
+    def get_display_layers(self) -> list[DisplayLayer]:
+        """
+        Return the elements of the level that should be on the screen for the current frame,
+        in the order in which they should be drawn: the map with its static entities,
+        the sidebar, the movable entities, the possible actions,
+        and lastly the animation or the menus.
+        """
+        screen: pygame.Surface = self.active_screen_part
+        offset_x, offset_y = screen.get_abs_offset()
+        layers: list[DisplayLayer] = [
+            # The parts of the map changed by its entities are invalidated when it is updated
+            DisplayLayer(
+                "map",
+                self.static_map_layer.rect.move(offset_x, offset_y),
+                id(self.static_map_layer.surface),
+                lambda: self.static_map_layer.display(screen),
+            ),
+            DisplayLayer(
+                "sidebar",
+                pygame.Rect(self.sidebar.position, self.sidebar.size).move(
+                    offset_x, offset_y
+                ),
+                self.sidebar.get_display_state(self.engine.turn, self.hovered_entity),
+                lambda: self.sidebar.display(
+                    screen, self.engine.turn, self.hovered_entity
+                ),
+            ),
+        ]
 
-        for collection in self.entities.values():
+        for collection in self.engine.entities.values():
             for entity in collection:
-                entity.display(self.active_screen_part)
-                if isinstance(entity, Destroyable):
-                    entity.display_hit_points(self.active_screen_part)
+                if isinstance(entity, Movable):
+                    layers.append(self._get_entity_layer(entity, screen))
 
         if self.watched_entity:
-            self.show_possible_actions(self.watched_entity, self.active_screen_part)
+            layers.extend(
+                self._get_possible_actions_layers(self.watched_entity, "watched")
+            )
 
         # If the game hasn't yet started
-        if self.game_phase is LevelStatus.INITIALIZATION:
-            self.show_possible_placements(self.active_screen_part)
-        else:
-            if self.selected_player:
-                # If player is waiting to move
-                if self.possible_moves:
-                    self.show_possible_actions(
-                        self.selected_player, self.active_screen_part
+        if self.engine.game_phase is LevelStatus.INITIALIZATION:
+            layers.append(
+                self._get_tiles_layer(
+                    "placements",
+                    self.engine.player_possible_placements,
+                    (),
+                    lambda: self.show_possible_placements(screen),
+                )
+            )
+        elif self.selected_player:
+            player: Player = self.selected_player
+            # If player is waiting to move
+            if self.possible_moves:
+                layers.extend(self._get_possible_actions_layers(player, "selected"))
+            elif self.possible_attacks:
+                layers.append(
+                    self._get_tiles_layer(
+                        ("attacks", "selected"),
+                        self.possible_attacks,
+                        (player.position[0], player.position[1]),
+                        lambda: self.show_possible_attacks(player, screen),
                     )
-                elif self.possible_attacks:
-                    self.show_possible_attacks(
-                        self.selected_player, self.active_screen_part
+                )
+                forecast_layer: Optional[DisplayLayer] = self._get_duel_forecast_layer(
+                    player
+                )
+                if forecast_layer is not None:
+                    layers.append(forecast_layer)
+            elif self.possible_interactions:
+                layers.append(
+                    self._get_tiles_layer(
+                        "interactions",
+                        self.possible_interactions,
+                        (),
+                        lambda: self.show_possible_interactions(screen),
                     )
-                elif self.possible_interactions:
-                    self.show_possible_interactions(self.active_screen_part)
+                )
 
         if self.animation:
-            self.animation.display(self.active_screen_part)
+            frame: Frame = self.animation.current_frame
+            layers.append(
+                DisplayLayer(
+                    "animation",
+                    frame.surface.get_rect(topleft=frame.position).move(
+                        offset_x, offset_y
+                    ),
+                    id(frame),
+                    lambda: self.animation.display(screen),
+                )
+            )
         else:
-            self.menu_manager.display()
+            menu_rects: list[pygame.Rect] = [
+                self._get_menu_rect(menu)
+                for menu in self.menu_manager.background_menus
+                if menu.visible_on_background
+            ]
+            if self.menu_manager.active_menu:
+                menu_rects.append(self._get_menu_rect(self.menu_manager.active_menu))
+            if menu_rects:
+                # The elements of the menus are highlighted when hovered,
+                # they are always drawn again
+                layers.append(
+                    DisplayLayer(
+                        "menus",
+                        menu_rects[0].unionall(menu_rects[1:]),
+                        None,
+                        self.menu_manager.display,
+                    )
+                )
+        return layers
 
-    def show_possible_actions(self, movable: Movable, screen: pygame.Surface) -> None:
+    def get_static_entities(self) -> list[Entity]:
         """
-        Display all the possible actions of the given movable entity
-
-        Keyword arguments:
-        movable -- the movable entity concerned
-        screen -- the screen on which the possibilities should be drawn
+        Return the entities of the level that never move, in the order in which they should be
+        drawn: obstacles, chests, buildings, doors and so on, including the objective tiles.
         """
-        self.show_possible_moves(movable, screen)
-        self.show_possible_attacks(movable, screen)
+        return [
+            entity
+            for collection in self.engine.entities.values()
+            for entity in collection
+            if not isinstance(entity, Movable)
+        ]
+
+    @staticmethod
+    def _get_entity_layer(entity: Movable, screen: pygame.Surface) -> DisplayLayer:
+        offset_x, offset_y = screen.get_abs_offset()
+
+        return DisplayLayer(
+            id(entity),
+            entity.get_rect()
+            .union((entity.position[0], entity.position[1], TILE_SIZE, TILE_SIZE))
+            .move(offset_x, offset_y),
+            entity.get_display_state(),
+            lambda: entity.display(screen),
+        )
+
+    def _get_tiles_layer(
+        self,
+        key: Hashable,
+        tiles: Iterable[Position],
+        state: tuple,
+        draw: Callable[[], None],
+    ) -> DisplayLayer:
+        offset_x, offset_y = self.active_screen_part.get_abs_offset()
+        tiles = tuple((tile[0], tile[1]) for tile in tiles)
+        rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+        if tiles:
+            rect = pygame.Rect(tiles[0], (TILE_SIZE, TILE_SIZE)).unionall(
+                [pygame.Rect(tile, (TILE_SIZE, TILE_SIZE)) for tile in tiles[1:]]
+            )
+        return DisplayLayer(key, rect.move(offset_x, offset_y), state + tiles, draw)
+
+    def _get_possible_actions_layers(
+        self, movable: Movable, source: str
+    ) -> list[DisplayLayer]:
+        screen: pygame.Surface = self.active_screen_part
+        position: tuple[float, float] = (movable.position[0], movable.position[1])
+        return [
+            self._get_tiles_layer(
+                ("moves", source),
+                self.possible_moves,
+                position,
+                lambda: self.show_possible_moves(movable, screen),
+            ),
+            self._get_tiles_layer(
+                ("attacks", source),
+                self.possible_attacks,
+                position,
+                lambda: self.show_possible_attacks(movable, screen),
+            ),
+        ]
+
+    def _get_duel_forecast_layer(self, movable: Movable) -> Optional[DisplayLayer]:
+        screen: pygame.Surface = self.active_screen_part
+        forecast: Optional[tuple[str, pygame.Rect]] = self._get_duel_forecast(
+            movable, screen
+        )
+        if forecast is None:
+            return None
+        text, frame = forecast
+        offset_x, offset_y = screen.get_abs_offset()
+        return DisplayLayer(
+            "duel_forecast",
+            frame.move(offset_x, offset_y),
+            text,
+            lambda: self._draw_duel_forecast(text, frame, screen),
+        )
+
+    def _get_duel_forecast(
+        self, movable: Movable, screen: pygame.Surface
+    ) -> Optional[tuple[str, pygame.Rect]]:
+        target: Optional[Entity] = self.hovered_entity
+        if (
+            not isinstance(target, Movable)
+            or target.position not in self.possible_attacks
+        ):
+            return None
+        forecast: DuelForecast = self.engine.forecast_attack(movable, target)
+        text: str = f_DUEL_FORECAST(
+            forecast.kill_probability,
+            forecast.expected_damage,
+            forecast.expected_experience,
+        )
+        frame: pygame.Rect = pygame.Rect((0, 0), fonts["ITEM_FONT"].size(text)).inflate(
+            10, 6
+        )
+        frame.midbottom = (target.position[0] + TILE_SIZE // 2, target.position[1])
+        frame.clamp_ip(screen.get_rect())
+        return text, frame
+
+    @staticmethod
+    def _draw_duel_forecast(
+        text: str, frame: pygame.Rect, screen: pygame.Surface
+    ) -> None:
+        rendered_text: pygame.Surface = fonts["ITEM_FONT"].render(text, True, WHITE)
+        pygame.draw.rect(screen, BLACK, frame)
+        screen.blit(rendered_text, rendered_text.get_rect(center=frame.center))
+
+    def _get_menu_rect(self, menu: InfoBox) -> pygame.Rect:
+        if menu.position is None:
+            # The menu is centered on the screen the first time it is displayed
+            return menu.sprite.get_rect(center=self.screen.get_rect().center)
+        return menu.sprite.get_rect(topleft=menu.position)
 
     def show_possible_attacks(self, movable: Movable, screen: pygame.Surface) -> None:
         """
@@ -697,7 +736,7 @@ class LevelScene(Scene):
         Keyword arguments:
         screen -- the screen on which the possibilities should be drawn
         """
-        for tile in self.player_possible_placements:
+        for tile in self.engine.player_possible_placements:
             blit_alpha(screen, constant_sprites["landing"], tile, LANDING_OPACITY)
 
     def start_game(self) -> None:
@@ -707,208 +746,23 @@ class LevelScene(Scene):
         Trigger the events that should happen after the initialization phase if any.
         """
         self.menu_manager.close_active_menu()
-        self.game_phase = LevelStatus.IN_PROGRESS
-        self.new_turn()
-        if "after_init" in self.events:
-            if "dialogs" in self.events["after_init"]:
-                for dialog in self.events["after_init"]["dialogs"]:
+        self.engine.start_game()
+        if "after_init" in self.engine.events:
+            if "dialogs" in self.engine.events["after_init"]:
+                for dialog in self.engine.events["after_init"]["dialogs"]:
                     self.menu_manager.open_menu(create_event_dialog(dialog))
-            if "new_players" in self.events["after_init"]:
-                for player_el in self.events["after_init"]["new_players"]:
-                    player = loader.init_player(player_el["name"])
-                    player.position = player_el["position"]
-                    self.players.append(player)
 
-    def get_next_cases(self, position: Position) -> list[Optional[Entity]]:
-        """
-        Return the entities that are next to the given tile
-
-        Keyword arguments:
-        position -- the position of the tile whose neighbors must be computed
-        """
-        tiles_content: list[Optional[Entity]] = []
-        for x_coordinate in range(-1, 2):
-            for y_coordinate in (1 - abs(x_coordinate), -1 + abs(x_coordinate)):
-                tile_x: int = position[0] + (x_coordinate * TILE_SIZE)
-                tile_y: int = position[1] + (y_coordinate * TILE_SIZE)
-                tile_position: Position = Position(tile_x, tile_y)
-                tile_content: Optional[Entity] = self.get_entity_on_tile(tile_position)
-                tiles_content.append(tile_content)
-        return tiles_content
-
-    def get_possible_moves(
-        self, position: Position, max_moves: int
-    ) -> dict[Position, int]:
-        """
-        Return all the possible moves with their distance from the starting position
-
-        Keyword arguments:
-        position -- the starting position
-        max_moves -- the maximum number of tiles that could be traveled
-        """
-        new_position = Position(position.x, position.y)
-        tiles: dict[Position, int] = {new_position: 0}
-        previously_computed_tiles: dict[Position, int] = tiles
-        for i in range(1, max_moves + 1):
-            tiles_current_level: dict[Position, int] = {}
-            for tile in previously_computed_tiles:
-                for x_coordinate in range(-1, 2):
-                    for y_coordinate in (1 - abs(x_coordinate), -1 + abs(x_coordinate)):
-                        tile_x: int = tile[0] + (x_coordinate * TILE_SIZE)
-                        tile_y: int = tile[1] + (y_coordinate * TILE_SIZE)
-                        tile_position = Position(tile_x, tile_y)
-                        if (
-                            self.is_tile_available(tile_position)
-                            and tile_position not in tiles
-                        ):
-                            tiles_current_level[tile_position] = i
-            tiles.update(previously_computed_tiles)
-            previously_computed_tiles = tiles_current_level
-        tiles.update(previously_computed_tiles)
-        return tiles
-
-    def get_possible_attacks(
-        self,
-        possible_moves: Sequence[Position],
-        reach: Sequence[int],
-        from_ally_side: bool,
-    ) -> set[Position]:
-        """
-        Return all the tiles that could be targeted for an attack from a specific entity
-
-        Keyword arguments:
-        possible_moves -- the sequence of all possible movements
-        reach -- the reach of the attacking entity
-        from_ally_side -- a boolean indicating whether this is a friendly attack or not
-        """
-        tiles: list[Position] = []
-
-        entities = list(self.entities.breakables)
-        if from_ally_side:
-            entities += self.entities.foes
-        else:
-            entities += self.entities.allies + self.players
-
-        for entity in entities:
-            for i in reach:
-                for x_coordinate in range(-i, i + 1):
-                    for y_coordinate in (i - abs(x_coordinate), -i + abs(x_coordinate)):
-                        tile_x: int = entity.position[0] + (x_coordinate * TILE_SIZE)
-                        tile_y: int = entity.position[1] + (y_coordinate * TILE_SIZE)
-                        tile_position = Position(tile_x, tile_y)
-                        if tile_position in possible_moves:
-                            tiles.append(entity.position)
-
-        return set([Position(i.x, i.y) for i in tiles])
-
-    def is_tile_available(self, tile: Position) -> bool:
-        """
-        Return whether the given tile can be accessed or not
-
-        Keyword arguments:
-        tile -- the position of the tile
-        """
-        min_case: Position = Position(self.map["x"], self.map["y"])
-        max_case: Position = Position(
-            self.map["x"] + self.map["width"],
-            self.map["y"] + self.map["height"],
-        )
-        if not (
-            all(
-                minimum <= case < maximum
-                for minimum, case, maximum in zip(min_case, tile, max_case)
-            )
-        ):
-            return False
-
-        entity_on_tile = self.get_entity_on_tile(tile)
-        if isinstance(entity_on_tile, Objective):
-            if entity_on_tile.is_walkable:
-                return True
-
-        return entity_on_tile is None
-
-    def get_entity_on_tile(self, tile: Position) -> Optional[Entity]:
-        """
-        Return the entity that is on the given tile if there is any
-
-        Keyword arguments:
-        tile -- the position of the tile
-        """
-        # Check all entities
-        for collection in self.entities.values():
-            for entity in collection:
-                if entity.position == tile:
-                    return entity
-        return None
-
-    def determine_path_to(
-        self, destination_tile: Position, distance_for_tile: dict[Position, int]
-    ) -> list[Position]:
-        """
-        Return an ordered list of position that represent the path from one tile to another
-
-        Keyword arguments:
-        destination_tile -- the position of the destination
-        distance -- the distance between the starting tile and the destination
-        """
-        path: list[Position] = [destination_tile]
-        current_tile: Position = destination_tile
-        while distance_for_tile[current_tile] > 1:
-            # Check for neighbour cases
-            available_tiles: dict[Position, int] = self.get_possible_moves(current_tile, 1)
-            for tile in available_tiles:
-                if tile in distance_for_tile:
-                    distance = distance_for_tile[tile]
-                    if distance < distance_for_tile[current_tile]:
-                        current_tile = tile
-                        path.insert(0, current_tile)
-        return path
-
-    def distance_between_all(
-        self, entity: Entity, all_other_entities: Sequence
-    ) -> dict[Entity, int]:
-        """
-        Return the distance between each different given entities for a reference entity
-
-        Keyword arguments:
-        entity -- the entity for which the distance from all other entities should be computed
-        all_other_entities -- all other entities for which the distance should be computed
-        """
-        free_tiles_distance: dict[Position, int] = self.get_possible_moves(
-            entity.position,
-            (self.map["width"] * self.map["height"]) // (TILE_SIZE * TILE_SIZE),
-        )
-        entities_distance: dict[Entity, int] = {
-            entity: self.map["width"] * self.map["height"]
-            for entity in all_other_entities
-        }
-        for tile, distance in free_tiles_distance.items():
-            for neighbour in self.get_next_cases(tile):
-                if (
-                    neighbour in all_other_entities
-                    and distance < entities_distance[neighbour]
-                ):
-                    entities_distance[neighbour] = distance
-        return entities_distance
-
-    def open_chest(self, actor: Character, chest: Chest) -> None:
+    def open_chest(self, actor: Character, chest: Chest, pick_lock: bool) -> None:
         """
         Open a chest and send its content to the given character
 
         Keyword arguments:
         actor -- the character performing the action
         chest -- the object that is being opened
+        pick_lock -- whether the lock of the chest has been picked or a key is used
         """
         # Get object inside the chest
-        item = chest.open()
-
-        if isinstance(item, Gold):
-            # If it was some gold, it should be added to the total amount of the player
-            actor.gold += item.amount
-        else:
-            # Else the item should be added to the inventory
-            actor.set_item(item)
+        item = self.engine.unlock_chest(actor, chest, pick_lock)
 
         # TODO: move the creation of the pop-up in menu_creator_manager
         item_element = ImageButton(
@@ -945,15 +799,17 @@ class LevelScene(Scene):
 
         self.end_active_character_turn(clear_menus=False)
 
-    def open_door(self, door: Door) -> None:
+    def open_door(self, actor: Character, door: Door, pick_lock: bool) -> None:
         """
         Handle the opening of a door.
         Remove it from the level if needed.
 
         Keyword arguments:
+        actor -- the character performing the action
         door -- the door that should be opened
+        pick_lock -- whether the lock of the door has been picked or a key is used
         """
-        self.entities.doors.remove(door)
+        self.engine.unlock_door(actor, door, pick_lock)
 
         # TODO: move the creation of the pop-up in menu_creator_manager
         grid_element = [
@@ -969,36 +825,6 @@ class LevelScene(Scene):
 
         self.end_active_character_turn(clear_menus=False)
 
-    def ally_to_player(self, character: Character) -> None:
-        """
-        Cast a character entity to a player.
-        It is use when an ally or neutral entity suddenly join the player team.
-
-        Keyword argument:
-        character -- the character that should be cast
-        """
-        self.entities.allies.remove(character)
-        player = Player(
-            name=character.name,
-            sprite=character.sprite,
-            hit_points=character.hit_points,
-            defense=character.defense,
-            resistance=character.resistance,
-            strength=character.strength,
-            classes=character.classes,
-            equipments=character.equipments,
-            race=character.race,
-            gold=character.gold,
-            lvl=character.lvl,
-            skills=character.skills,
-            alterations=character.alterations,
-        )
-        self.entities.players.append(player)
-        player.earn_xp(character.experience)
-        player.hit_points = character.hit_points
-        player.position = character.position
-        player.items = character.items
-
     def interact(
         self, actor: Character, target: Entity, target_position: Position
     ) -> None:
@@ -1020,7 +846,7 @@ class LevelScene(Scene):
         if not target:
             if self.wait_for_teleportation_destination:
                 self.wait_for_teleportation_destination = False
-                actor.position = target_position
+                self.engine.teleport(actor, target_position)
 
                 # Turn is finished
                 self.end_active_character_turn()
@@ -1028,12 +854,11 @@ class LevelScene(Scene):
         elif isinstance(target, Chest):
             if actor.has_free_space():
                 if self.selected_player.current_action is CharacterMenu.OPEN_CHEST:
-                    actor.remove_chest_key()
-                    self.open_chest(actor, target)
+                    self.open_chest(actor, target, pick_lock=False)
                 elif self.selected_player.current_action is CharacterMenu.PICK_LOCK:
                     if not target.pick_lock_initiated:
                         # Lock picking has not been already initiated
-                        target.pick_lock_initiated = True
+                        self.engine.unlock_chest(actor, target, pick_lock=True)
                         # TODO: move the creation of the pop-up in menu_creator_manager
                         element_grid = [
                             [
@@ -1053,7 +878,7 @@ class LevelScene(Scene):
                         self.end_active_character_turn(clear_menus=False)
                     else:
                         # Lock picking is finished, get content
-                        self.open_chest(actor, target)
+                        self.open_chest(actor, target, pick_lock=True)
 
             else:
                 # TODO: move the creation of the pop-up in menu_creator_manager
@@ -1067,12 +892,11 @@ class LevelScene(Scene):
         # Check if player tries to open a door
         elif isinstance(target, Door):
             if self.selected_player.current_action is CharacterMenu.OPEN_DOOR:
-                actor.remove_door_key()
-                self.open_door(target)
+                self.open_door(actor, target, pick_lock=False)
             elif self.selected_player.current_action is CharacterMenu.PICK_LOCK:
                 if not target.pick_lock_initiated:
                     # Lock picking has not been already initiated
-                    target.pick_lock_initiated = True
+                    self.engine.unlock_door(actor, target, pick_lock=True)
                     # TODO: move the creation of the pop-up in menu_creator_manager
                     grid_element = [
                         [
@@ -1092,13 +916,13 @@ class LevelScene(Scene):
                     self.end_active_character_turn(clear_menus=False)
                 else:
                     # Lock picking is finished, get content
-                    self.open_door(target)
+                    self.open_door(actor, target, pick_lock=True)
         # Check if player tries to use a portal
         elif isinstance(target, Portal):
             new_based_position: Position = target.linked_to.position
             possible_positions_with_distance: dict[
                 Position, int
-            ] = self.get_possible_moves(new_based_position, 1)
+            ] = self.engine.get_possible_moves(new_based_position, 1)
             # Remove portal pos since player cannot be on the portal
             del possible_positions_with_distance[new_based_position]
             if possible_positions_with_distance:
@@ -1114,7 +938,7 @@ class LevelScene(Scene):
                 )
         # Check if player tries to drink in a fountain
         elif isinstance(target, Fountain):
-            element_grid = target.drink(actor)
+            element_grid = self.engine.drink(actor, target)
             self.menu_manager.open_menu(
                 InfoBox(
                     str(target),
@@ -1138,9 +962,9 @@ class LevelScene(Scene):
             )
         # Check if player tries to talk to a character
         elif isinstance(target, Character):
-            pygame.mixer.Sound.play(self.talk_sfx)
+            self.talk_sfx.play()
 
-            element_grid = target.talk(actor)
+            element_grid = self.engine.talk(actor, target)
             self.menu_manager.open_menu(
                 InfoBox(
                     str(target),
@@ -1149,9 +973,6 @@ class LevelScene(Scene):
                     title_color=ORANGE,
                 )
             )
-            # Check if character is now a player
-            if target.join_team:
-                self.ally_to_player(target)
 
             self.end_active_character_turn(clear_menus=False)
         # Check if player tries to visit a building
@@ -1159,7 +980,7 @@ class LevelScene(Scene):
             if isinstance(target, Shop):
                 self.active_shop = target
 
-            element_grid = target.interact(actor)
+            element_grid = self.engine.visit(actor, target)
             self.menu_manager.open_menu(
                 InfoBox(
                     str(target),
@@ -1171,182 +992,6 @@ class LevelScene(Scene):
 
             self.end_active_character_turn(clear_menus=False)
 
-    def remove_entity(self, entity: Entity) -> None:
-        """
-        Remove an entity from the level
-
-        Keyword arguments:
-        entity -- the entity that should be removed
-        """
-        collection = None
-        if isinstance(entity, Foe):
-            collection = self.entities.foes
-        elif isinstance(entity, Player):
-            collection = self.entities.players
-        elif isinstance(entity, Breakable):
-            collection = self.entities.breakables
-        elif isinstance(entity, Character):
-            collection = self.entities.allies
-        collection.remove(entity)
-
-    def duel(
-        self,
-        attacker: Movable,
-        target: Destroyable,
-        target_allies: Sequence[Destroyable],
-        kind: DamageKind,
-    ) -> None:
-        """
-        Handle the development of an attack from one entity to another
-
-        Keyword arguments:
-        attacker -- the entity that is making the attack
-        target -- the target of the attack
-        attacker_allies -- the allies of the attacker
-        target_allies -- the allies of the target
-        kind -- the nature of the damage that would be dealt
-        """
-        nb_attacks: int = 2 if "double_attack" in attacker.skills else 1
-        for _ in range(nb_attacks):
-            experience: int = 0
-
-            if isinstance(target, Character) and target.parried():
-                # Target parried attack
-                message: str = f_ATTACKER_ATTACKED_TARGET_BUT_PARRIED(attacker, target)
-                self.diary_entries.append(
-                    [TextElement(message, font=fonts["ITEM_DESC_FONT"])]
-                )
-                continue
-
-            damage: int = attacker.attack(target)
-            real_damage: int = target.hit_points - target.attacked(
-                attacker, damage, kind, target_allies
-            )
-            self.diary_entries.append(
-                [
-                    TextElement(
-                        f_ATTACKER_DEALT_DAMAGE_TO_TARGET(
-                            attacker, target, real_damage
-                        ),
-                        font=fonts["ITEM_DESC_FONT"],
-                    )
-                ]
-            )
-            # XP gain for dealt damage
-            experience += real_damage // 2
-            # If target has less than 0 HP at the end of the attack
-            if target.hit_points <= 0:
-                # XP gain increased
-                if isinstance(attacker, Character) and isinstance(target, Foe):
-                    experience += target.xp_gain
-
-                self.diary_entries.append(
-                    [TextElement(f_TARGET_DIED(target), font=fonts["ITEM_DESC_FONT"])]
-                )
-                # Loot
-                if isinstance(attacker, Player) and isinstance(target, Foe):
-                    # Check if foe dropped an item
-                    loot: Sequence[Item] = target.roll_for_loot()
-                    for item in loot:
-                        self.diary_entries.append(
-                            [
-                                TextElement(
-                                    f_TARGET_DROPPED_ITEM(target, item),
-                                    font=fonts["ITEM_DESC_FONT"],
-                                )
-                            ]
-                        )
-                        if isinstance(item, Gold):
-                            attacker.gold += item.amount
-                        elif not attacker.set_item(item):
-                            self.diary_entries.append(
-                                [
-                                    TextElement(
-                                        STR_BUT_THERE_IS_NOT_ENOUGH_SPACE_IN_INVENTORY_TO_TAKE_IT,
-                                        font=fonts["ITEM_DESC_FONT"],
-                                    )
-                                ]
-                            )
-                self.remove_entity(target)
-            else:
-                self.diary_entries.append(
-                    [
-                        TextElement(
-                            f_TARGET_HAS_NOW_NUMBER_HP(target, target.hit_points),
-                            font=fonts["ITEM_DESC_FONT"],
-                        )
-                    ]
-                )
-                # Check if a side effect is applied to target
-                if isinstance(attacker, Character):
-                    weapon: Weapon = attacker.get_weapon()
-                    if weapon:
-                        applied_effects: Sequence[Effect] = weapon.apply_effects(
-                            attacker, target
-                        )
-                        for effect in applied_effects:
-                            _, message = effect.apply_on_ent(target)
-                            self.diary_entries.append(
-                                [TextElement(message, font=fonts["ITEM_DESC_FONT"])]
-                            )
-
-            # XP gain
-            if isinstance(attacker, Player):
-                self.diary_entries.append(
-                    [
-                        TextElement(
-                            f_ATTACKER_EARNED_NUMBER_XP(attacker, experience),
-                            font=fonts["ITEM_DESC_FONT"],
-                        )
-                    ]
-                )
-                if attacker.earn_xp(experience):
-                    # Attacker gained a level
-                    self.diary_entries.append(
-                        [
-                            TextElement(
-                                f_ATTACKER_GAINED_A_LEVEL(attacker),
-                                font=fonts["ITEM_DESC_FONT"],
-                            )
-                        ]
-                    )
-
-            if target.hit_points <= 0:
-                # Target is dead, no more attack needed.
-                break
-        while len(self.diary_entries) > 10:
-            self.diary_entries.pop(0)
-
-    def process_entity_action(self, entity: Movable, is_ally: bool) -> None:
-        """
-        Compute the action of a non-playable entity (AI)
-
-        Keyword arguments:
-        entity -- the entity for which the action should be computed
-        is_ally -- a boolean indicating if the entity is an ally or not
-        """
-        possible_moves: dict[Position, int] = self.get_possible_moves(
-            entity.position, entity.max_moves
-        )
-        targets: Sequence[Movable] = (
-            self.entities.foes if is_ally else self.players + self.entities.allies
-        )
-        tile: Optional[Position] = entity.act(
-            possible_moves, self.distance_between_all(entity, targets)
-        )
-
-        if tile:
-            if tuple(tile) in possible_moves:
-                # Entity choose to move to case
-                self.hovered_entity = entity
-                path = self.determine_path_to(tile, possible_moves)
-                entity.set_move(path)
-            else:
-                # Entity choose to attack the entity on the tile
-                entity_attacked = self.get_entity_on_tile(tile)
-                self.duel(entity, entity_attacked, targets, entity.attack_kind)
-                entity.end_turn()
-
     def interact_item_shop(self, item: Item, item_button: Button) -> None:
         """
         Handle the interaction with an item in a shop
@@ -1411,10 +1056,7 @@ class LevelScene(Scene):
         End the current turn
         """
         self.menu_manager.clear_menus()
-        for player in self.players:
-            player.end_turn()
-        self.side_turn = self.side_turn.get_next()
-        self.begin_turn()
+        self.engine.end_turn()
 
     def select_visit(self):
         """
@@ -1434,22 +1076,9 @@ class LevelScene(Scene):
         """
         Verify for each mission if the active player validated it
         """
-        for mission in self.missions:
-            if (
-                mission.type is MissionType.POSITION
-                or mission.type is MissionType.TOUCH_POSITION
-            ):
-                # Verify that character is not the last if the mission is not the main one
-                if mission.main or len(self.players) > 1:
-                    if mission.is_position_valid(self.selected_player.position):
-                        mission.update_state(self.selected_player)
-                        self.players.remove(self.selected_player)
-                        self.escaped_players.append(self.selected_player)
-                        if mission.main and mission.ended:
-                            self.victory = True
-                        # Turn is finished
-                        self.end_active_character_turn()
-                        break
+        if self.engine.validate_objective(self.selected_player):
+            # Turn is finished
+            self.end_active_character_turn()
 
     def select_talk(self) -> None:
         """
@@ -1458,7 +1087,7 @@ class LevelScene(Scene):
         self.menu_manager.clear_menus()
         self.selected_player.choose_target()
         self.possible_interactions = []
-        for entity in self.get_next_cases(self.selected_player.position):
+        for entity in self.engine.get_next_cases(self.selected_player.position):
             if isinstance(entity, Character) and not isinstance(entity, Player):
                 self.possible_interactions.append(entity.position)
 
@@ -1470,7 +1099,7 @@ class LevelScene(Scene):
         self.selected_player.current_action = CharacterMenu.PICK_LOCK
         self.selected_player.choose_target()
         self.possible_interactions = []
-        for entity in self.get_next_cases(self.selected_player.position):
+        for entity in self.engine.get_next_cases(self.selected_player.position):
             if (isinstance(entity, Chest) and not entity.opened) or isinstance(
                 entity, Door
             ):
@@ -1518,7 +1147,7 @@ class LevelScene(Scene):
             self.selected_player.current_action = CharacterMenu.OPEN_CHEST
             self.selected_player.choose_target()
             self.possible_interactions = []
-            for entity in self.get_next_cases(self.selected_player.position):
+            for entity in self.engine.get_next_cases(self.selected_player.position):
                 if isinstance(entity, Chest) and not entity.opened:
                     self.possible_interactions.append(entity.position)
 
@@ -1528,7 +1157,7 @@ class LevelScene(Scene):
         """
         self.menu_manager.clear_menus()
         self.selected_player.choose_target()
-        self.possible_attacks = self.get_possible_attacks(
+        self.possible_attacks = self.engine.get_possible_attacks(
             [self.selected_player.position], self.selected_player.reach, True
         )
         self.possible_interactions = []
@@ -1551,14 +1180,13 @@ class LevelScene(Scene):
         """
         End the turn of the active character
         """
-        pygame.mixer.Sound.play(self.wait_sfx)
+        self.wait_sfx.play()
         self.selected_item = None
-        self.selected_player.end_turn()
+        self.engine.end_player_turn(self.selected_player)
         self.selected_player = None
-        self.traded_items.clear()
-        self.traded_gold.clear()
-        self.possible_moves.clear()
-        self.possible_attacks.clear()
+        # Possible moves and attacks may be shared with the move range cache, they are replaced
+        self.possible_moves = MoveRange()
+        self.possible_attacks = []
         self.possible_interactions.clear()
         if clear_menus:
             self.menu_manager.clear_menus()
@@ -1571,7 +1199,7 @@ class LevelScene(Scene):
         self.menu_manager.open_menu(
             menu_creator_manager.create_equipment_menu(self.interact_item, equipments),
         )
-        pygame.mixer.Sound.play(self.armor_sfx)
+        self.armor_sfx.play()
 
     def open_inventory(self) -> None:
         """
@@ -1589,7 +1217,7 @@ class LevelScene(Scene):
                 self.interact_item, items, self.selected_player.gold
             )
         )
-        pygame.mixer.Sound.play(self.inventory_sfx)
+        self.inventory_sfx.play()
 
     def select_interaction_with(self, entity_kind: type[Entity]) -> None:
         """
@@ -1601,7 +1229,7 @@ class LevelScene(Scene):
         self.menu_manager.clear_menus()
         self.selected_player.choose_target()
         self.possible_interactions = []
-        for entity in self.get_next_cases(self.selected_player.position):
+        for entity in self.engine.get_next_cases(self.selected_player.position):
             if isinstance(entity, entity_kind):
                 self.possible_interactions.append(entity.position)
 
@@ -1673,11 +1301,11 @@ class LevelScene(Scene):
         is_first_player_owner -- a boolean indicating if the player who initiated the trade is the
         owner of the item
         """
-        pygame.mixer.Sound.play(self.inventory_sfx)
+        self.inventory_sfx.play()
         owner: Player = first_player if is_first_player_owner else second_player
         receiver: Player = second_player if is_first_player_owner else first_player
         # Add item if possible
-        added: bool = receiver.set_item(self.selected_item)
+        added: bool = self.engine.give_item(owner, receiver, self.selected_item)
         self.menu_manager.close_active_menu()
         if not added:
             grid_elements = [
@@ -1692,9 +1320,6 @@ class LevelScene(Scene):
                 ]
             ]
         else:
-            # Remove item from owner inventory according to index
-            owner.remove_item(self.selected_item)
-
             new_trade_menu = menu_creator_manager.create_trade_menu(
                 {
                     "interact_item": self.interact_trade_item,
@@ -1717,8 +1342,6 @@ class LevelScene(Scene):
                 ]
             ]
 
-            self.traded_items.append([self.selected_item, owner, receiver])
-
         self.menu_manager.open_menu(
             InfoBox(
                 str(self.selected_item),
@@ -1744,11 +1367,10 @@ class LevelScene(Scene):
         owner of the gold
         value -- the quantity of gold that should be traded
         """
-        pygame.mixer.Sound.play(self.gold_sfx)
+        self.gold_sfx.play()
         sender: Player = first_player if is_first_player_sender else second_player
         receiver: Player = second_player if is_first_player_sender else first_player
-        Player.trade_gold(sender, receiver, value)
-        self.traded_gold.append([value, sender, receiver])
+        self.engine.give_gold(sender, receiver, value)
         self.menu_manager.close_active_menu()
         self.menu_manager.open_menu(
             menu_creator_manager.create_trade_menu(
@@ -1767,16 +1389,12 @@ class LevelScene(Scene):
         """
         self.menu_manager.close_active_menu()
         # Remove item from inventory/equipment according to the index
-        if isinstance(
-            self.selected_item, Equipment
-        ) and self.selected_player.has_exact_equipment(self.selected_item):
-            self.selected_player.remove_equipment(self.selected_item)
+        if self.engine.throw_item(self.selected_player, self.selected_item):
             equipments = list(self.selected_player.equipments)
             new_items_menu = menu_creator_manager.create_equipment_menu(
                 self.interact_item, equipments
             )
         else:
-            self.selected_player.remove_item(self.selected_item)
             free_spaces: int = self.selected_player.nb_items_max - len(
                 self.selected_player.items
             )
@@ -1811,7 +1429,9 @@ class LevelScene(Scene):
         Handle the sale of the selected item if possible
         """
         self.menu_manager.close_active_menu()
-        sold, result_message = self.active_shop.sell(self.selected_item)
+        sold, result_message = self.engine.sell_item(
+            self.active_shop, self.selected_item
+        )
         popup_title = str(self.selected_item)
         if sold:
             # Remove ref to item
@@ -1851,7 +1471,7 @@ class LevelScene(Scene):
         """
         Handle the purchase of the selected item if possible
         """
-        result_message = self.active_shop.buy(self.selected_item)
+        result_message = self.engine.buy_item(self.active_shop, self.selected_item)
         element_grid = [
             [
                 TextElement(
@@ -1873,7 +1493,7 @@ class LevelScene(Scene):
         Unequip the selected item of the active character if possible
         """
         self.menu_manager.close_active_menu()
-        unequipped = self.selected_player.unequip(self.selected_item)
+        unequipped = self.engine.unequip_item(self.selected_player, self.selected_item)
         result_message = (
             STR_THE_ITEM_CANNOT_BE_UNEQUIPPED_NOT_ENOUGH_SPACE_IN_UR_INVENTORY
         )
@@ -1908,7 +1528,9 @@ class LevelScene(Scene):
         """
         self.menu_manager.close_active_menu()
         # Try to equip the item
-        return_equipped: int = self.selected_player.equip(self.selected_item)
+        return_equipped: int = self.engine.equip_item(
+            self.selected_player, self.selected_item
+        )
         if return_equipped == -1:
             # Item can't be equipped by this player
             result_message = (
@@ -1947,7 +1569,9 @@ class LevelScene(Scene):
         Remove it if it can't be used anymore.
         """
         # Try to use the object
-        used, result_messages = self.selected_player.use_item(self.selected_item)
+        used, result_messages = self.engine.use_item(
+            self.selected_player, self.selected_item
+        )
         # Inventory display is update if object has been used
         if used:
             self.menu_manager.close_active_menu()
@@ -2008,31 +1632,26 @@ class LevelScene(Scene):
             menu_creator_manager.create_alteration_info_menu(alteration)
         )
 
-    def begin_turn(self) -> None:
+    def show_new_turn(self) -> None:
         """
-        Begin next camp's turn
+        Handle the beginning of a new turn by the level engine,
+        the number of the turn is shown unless the level is played in fast-forward mode.
         """
-        entities = []
-        if self.side_turn is EntityTurn.PLAYER:
-            self.new_turn()
-            entities = self.players
-        elif self.side_turn is EntityTurn.ALLIES:
-            entities = self.entities.allies
-        elif self.side_turn is EntityTurn.FOES:
-            entities = self.entities.foes
-
-        for entity in entities:
-            entity.new_turn()
+        if not self.engine.fast_forward:
+            self.animation = Animation(
+                [Frame(constant_sprites["new_turn"], constant_sprites["new_turn_pos"])],
+                60,
+            )
 
-    def new_turn(self) -> None:
+    def follow_entity_move(self, entity: Movable) -> None:
         """
-        Begin of a new turn
+        Handle the beginning of the move of an entity controlled by the AI by the level engine,
+        its information are shown in the sidebar.
+
+        Keyword arguments:
+        entity -- the entity that starts moving
         """
-        self.turn += 1
-        self.animation = Animation(
-            [Frame(constant_sprites["new_turn"], constant_sprites["new_turn_pos"])],
-            60,
-        )
+        self.hovered_entity = entity
 
     def left_click(self, position: Position) -> None:
         """
@@ -2052,21 +1671,20 @@ class LevelScene(Scene):
             return
 
         # Player can only react to active menu if it is not his turn
-        if self.side_turn is not EntityTurn.PLAYER:
+        if self.engine.side_turn is not EntityTurn.PLAYER:
             return
 
         position_inside_level = self._compute_relative_position(position)
         if self.selected_player is not None:
-            if self.game_phase is not LevelStatus.INITIALIZATION:
+            if self.engine.game_phase is not LevelStatus.INITIALIZATION:
                 if self.possible_moves:
                     # Player is waiting to move
                     for move in self.possible_moves:
                         if pygame.Rect(move, (TILE_SIZE, TILE_SIZE)).collidepoint(
                             position_inside_level
                         ):
-                            path = self.determine_path_to(move, self.possible_moves)
-                            self.selected_player.set_move(path)
-                            self.possible_moves = {}
+                            self.engine.move_player(self.selected_player, move)
+                            self.possible_moves = MoveRange()
                             self.possible_attacks = []
                             return
                     # Player click somewhere that is not a valid pos
@@ -2078,13 +1696,7 @@ class LevelScene(Scene):
                         if pygame.Rect(attack, (TILE_SIZE, TILE_SIZE)).collidepoint(
                             position_inside_level
                         ):
-                            entity = self.get_entity_on_tile(attack)
-                            self.duel(
-                                self.selected_player,
-                                entity,
-                                self.entities.foes,
-                                self.selected_player.attack_kind,
-                            )
+                            self.engine.player_attack(self.selected_player, attack)
                             # Turn is finished
                             self.end_active_character_turn(clear_menus=False)
                             return
@@ -2094,24 +1706,20 @@ class LevelScene(Scene):
                         if pygame.Rect(interact, (TILE_SIZE, TILE_SIZE)).collidepoint(
                             position_inside_level
                         ):
-                            entity = self.get_entity_on_tile(interact)
+                            entity = self.engine.get_entity_on_tile(interact)
                             self.interact(self.selected_player, entity, interact)
                             return
             else:
                 # Initialization phase : player try to change the place of the selected character
-                for tile in self.player_possible_placements:
+                for tile in self.engine.player_possible_placements:
                     if pygame.Rect(tile, (TILE_SIZE, TILE_SIZE)).collidepoint(
                         position_inside_level
                     ):
-                        # Test if a character is on the tile, in this case, characters are swapped
-                        entity = self.get_entity_on_tile(tile)
-                        if entity:
-                            entity.set_initial_pos(self.selected_player.position)
-
-                        self.selected_player.set_initial_pos(tile)
+                        # If a character is on the tile, characters are swapped
+                        self.engine.place_player(self.selected_player, tile)
                         return
             return
-        for player in self.players:
+        for player in self.engine.players:
             if player.is_on_position(position_inside_level):
                 if player.turn_is_finished():
                     self.menu_manager.open_menu(
@@ -2126,19 +1734,17 @@ class LevelScene(Scene):
                 else:
                     player.selected = True
                     self.selected_player = player
-                    self.possible_moves = self.get_possible_moves(
-                        player.position,
-                        player.max_moves + player.get_stat_change("speed"),
+                    max_moves: int = player.max_moves + player.get_stat_change("speed")
+                    self.possible_moves = self.engine.get_entity_possible_moves(
+                        player, max_moves
                     )
                     self.possible_attacks = (
-                        self.get_possible_attacks(
-                            self.possible_moves, self.selected_player.reach, True
-                        )
+                        self.engine.get_entity_possible_attacks(player, max_moves, True)
                         if player.can_attack()
                         else {}
                     )
                 return
-        for entity in self.entities.foes + self.entities.allies:
+        for entity in self.engine.entities.foes + self.engine.entities.allies:
             if entity.is_on_position(position_inside_level):
                 self.menu_manager.open_menu(
                     menu_creator_manager.create_status_entity_menu(
@@ -2151,7 +1757,7 @@ class LevelScene(Scene):
                 )
                 return
 
-        is_initialization = self.game_phase is LevelStatus.INITIALIZATION
+        is_initialization = self.engine.game_phase is LevelStatus.INITIALIZATION
         self.menu_manager.open_menu(
             menu_creator_manager.create_main_menu(
                 {
@@ -2177,35 +1783,14 @@ class LevelScene(Scene):
                 # Player was waiting to move
                 self.selected_player.selected = False
                 self.selected_player = None
-                self.possible_moves = {}
+                self.possible_moves = MoveRange()
             elif self.menu_manager.active_menu is not None:
                 # Test if player is on character's main menu, in this case,
                 # current move should be cancelled if possible
                 if self.menu_manager.active_menu.identifier == CHARACTER_ACTION_MENU_ID:
-                    if self.selected_player.cancel_move():
-                        if self.traded_items:
-                            # Return traded items
-                            for item in self.traded_items:
-                                if item[1] == self.selected_player:
-                                    item[2].remove_item(item[0])
-                                    self.selected_player.set_item(item[0])
-                                else:
-                                    self.selected_player.remove_item(item[0])
-                                    item[1].set_item(item[0])
-                            self.traded_items.clear()
-                        if self.traded_gold:
-                            # Return traded gold
-                            for gold in self.traded_gold:
-                                if gold[1] == self.selected_player:
-                                    self.selected_player.gold += gold[0]
-                                    gold[2].gold -= gold[0]
-                                else:
-                                    self.selected_player.gold -= gold[0]
-                                    gold[2].gold += gold[0]
-                            self.traded_gold.clear()
-                        self.selected_player.selected = False
+                    if self.engine.cancel_player_move(self.selected_player):
                         self.selected_player = None
-                        self.possible_moves = {}
+                        self.possible_moves = MoveRange()
                         self.menu_manager.clear_menus()
                     return
                 self.menu_manager.close_active_menu()
@@ -2220,7 +1805,7 @@ class LevelScene(Scene):
             self.menu_manager.close_active_menu()
         if self.watched_entity:
             self.watched_entity = None
-            self.possible_moves = {}
+            self.possible_moves = MoveRange()
             self.possible_attacks = []
 
     def click(self, button: int, position: Position) -> QuitActionKind:
@@ -2241,10 +1826,10 @@ class LevelScene(Scene):
         elif button == 3:
             self.right_click()
 
-        if self.game_phase == LevelStatus.VERY_BEGINNING:
+        if self.engine.game_phase == LevelStatus.VERY_BEGINNING:
             # Update game phase if dialogs at the very beginning are all closed
             if not self.menu_manager.active_menu:
-                self.game_phase = LevelStatus.INITIALIZATION
+                self.engine.game_phase = LevelStatus.INITIALIZATION
 
         return QuitActionKind.CONTINUE
 
@@ -2261,25 +1846,26 @@ class LevelScene(Scene):
             if (
                 not self.menu_manager.active_menu
                 and not self.selected_player
-                and self.side_turn is EntityTurn.PLAYER
+                and self.engine.side_turn is EntityTurn.PLAYER
             ):
                 position_inside_level = self._compute_relative_position(position)
-                for collection in self.entities.values():
+                for collection in self.engine.entities.values():
                     for entity in collection:
                         if isinstance(
                             entity, Movable
                         ) and entity.get_rect().collidepoint(position_inside_level):
                             self.watched_entity = entity
-                            self.possible_moves = self.get_possible_moves(
-                                entity.position, entity.max_moves
+                            self.possible_moves = self.engine.get_entity_possible_moves(
+                                entity, entity.max_moves
                             )
-                            reach: Sequence[int] = self.watched_entity.reach
                             self.possible_attacks = {}
                             if entity.can_attack():
-                                self.possible_attacks = self.get_possible_attacks(
-                                    self.possible_moves,
-                                    reach,
-                                    isinstance(entity, Character),
+                                self.possible_attacks = (
+                                    self.engine.get_entity_possible_attacks(
+                                        entity,
+                                        entity.max_moves,
+                                        isinstance(entity, Character),
+                                    )
                                 )
                             return
 
@@ -2309,7 +1895,7 @@ class LevelScene(Scene):
         if not self.menu_manager.active_menu:
             position_inside_level = self._compute_relative_position(position)
             self.hovered_entity = None
-            for collection in self.entities.values():
+            for collection in self.engine.entities.values():
                 for entity in collection:
                     if entity.get_rect().collidepoint(position_inside_level):
                         self.hovered_entity = entity
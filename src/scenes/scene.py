@@ -5,9 +5,11 @@ Define Scene class, the abstract base class for any other scene.
 from __future__ import annotations
 
 from enum import IntEnum, auto
+from typing import Optional
 
 import pygame
 
+from src.constants import BLACK
 from src.gui.position import Position
 
 
@@ -43,6 +45,28 @@ class Scene:
         """
         pass
 
+    def render(self) -> Optional[list[pygame.Rect]]:
+        """
+        Draw the current frame of the scene on its screen.
+        The whole screen is drawn again by default.
+
+        Return the areas of the screen that changed since the previous frame,
+        or None if the whole screen should be updated.
+        """
+        self.screen.fill(BLACK)
+        self.display()
+        return None
+
+    def invalidate(self, rect: pygame.Rect) -> None:
+        """
+        Notify the scene that an area of its screen has been drawn over,
+        so that it is drawn again on the next frame.
+
+        Keyword arguments:
+        rect -- the area of the screen that has been drawn over
+        """
+        pass
+
     def update_state(self) -> bool:
         """
         Take care of updating the state of the scene and returning whether it's finished or not.
@@ -12,13 +12,15 @@ from lxml.etree import XMLSyntaxError
 from pygamepopup.components import InfoBox, TextElement
 from pygamepopup.menu_manager import MenuManager
 
-from src.constants import SCREEN_SIZE, WIN_HEIGHT, WIN_WIDTH
+from src.constants import (FAST_FORWARD, RECORD_COMMAND_LOGS, SCREEN_SIZE,
+                           WIN_HEIGHT, WIN_WIDTH)
 from src.game_entities.movable import Movable
 from src.game_entities.player import Player
 from src.gui.fonts import fonts
 from src.gui.position import Position
 from src.scenes.level_scene import LevelScene, LevelStatus
 from src.scenes.scene import QuitActionKind, Scene
+from src.services import load_from_xml_manager as loader
 from src.services import menu_creator_manager
 from src.services.language import *
 
@@ -82,8 +84,16 @@ class StartScene(Scene):
         self.options_file = etree.parse("saves/options.xml").getroot()
         Movable.move_speed = int(self.read_option("move_speed"))
         StartScene.screen_size = int(self.read_option("screen_size"))
+        LevelScene.default_fast_forward = bool(
+            int(self.read_option("fast_forward", str(FAST_FORWARD)))
+        )
+        LevelScene.record_command_log = bool(
+            int(self.read_option("record_command_logs", str(RECORD_COMMAND_LOGS)))
+        )
 
-    def read_option(self, element_to_read: str) -> str:
+    def read_option(
+        self, element_to_read: str, default_value: Optional[str] = None
+    ) -> str:
         """
         Read and parse a specific option saved in the local configuration file.
 
@@ -91,8 +101,12 @@ class StartScene(Scene):
 
         Keyword arguments:
         element_to_read -- a name corresponding to the option that should be read
+        default_value -- the value of the option if it is missing from the configuration file,
+        as it can be for files written by older versions of the game
         """
         element = self.options_file.find(".//" + element_to_read)
+        if element is None and default_value is not None:
+            return default_value
         return element.text.strip()
 
     def modify_options_file(self, element_to_edit: str, new_value: str) -> None:
@@ -104,6 +118,8 @@ class StartScene(Scene):
         new_value -- the new value of the option
         """
         element: etree.Element = self.options_file.find(".//" + element_to_edit)
+        if element is None:
+            element = etree.SubElement(self.options_file, element_to_edit)
         element.text = new_value
         et = etree.ElementTree(self.options_file)
         et.write("saves/options.xml")
@@ -178,6 +194,7 @@ class StartScene(Scene):
                 level_path = f"maps/level_{level_id}/"
                 game_status = tree_root.find("level/phase").text.strip()
                 turn_nb = int(tree_root.find("level/turn").text.strip())
+                random_element = tree_root.find("level/random")
 
                 self.level = LevelScene(
                     StartScene.generate_level_window(),
@@ -186,6 +203,11 @@ class StartScene(Scene):
                     LevelStatus[game_status],
                     turn_nb,
                     tree_root.find("level/entities"),
+                    random_service=(
+                        loader.load_random_service(random_element)
+                        if random_element is not None
+                        else None
+                    ),
                 )
 
         except XMLSyntaxError:
@@ -248,6 +270,14 @@ class StartScene(Scene):
                     "language": str(self.read_option("language")),
                     "move_speed": int(self.read_option("move_speed")),
                     "screen_size": int(self.read_option("screen_size")),
+                    "fast_forward": int(
+                        self.read_option("fast_forward", str(FAST_FORWARD))
+                    ),
+                    "record_command_logs": int(
+                        self.read_option(
+                            "record_command_logs", str(RECORD_COMMAND_LOGS)
+                        )
+                    ),
                 },
                 self.modify_option_value,
             )
@@ -282,6 +312,10 @@ class StartScene(Scene):
             Movable.move_speed = option_value
         elif option_name == "screen_size":
             StartScene.screen_size = option_value
+        elif option_name == "fast_forward":
+            LevelScene.default_fast_forward = bool(option_value)
+        elif option_name == "record_command_logs":
+            LevelScene.record_command_log = bool(option_value)
         else:
             print(f"Unrecognized option name : {option_name} with value {option_value}")
             return
@@ -0,0 +1,135 @@
+"""
+Defines AIScheduler class, running the computations of the AI as resumable tasks
+within a time budget for each frame, and SideTurnMetrics class, the record of the frames
+spanned by the turn of a side.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import Optional
+
+
+class SideTurnMetrics:
+    """
+    A SideTurnMetrics records how the turn of a side has been spread across frames.
+
+    Keyword arguments:
+    side -- the name of the side that is playing
+
+    Attributes:
+    side -- the name of the side that is playing
+    frames -- the number of frames during which the side has been playing
+    computing_frames -- the number of frames during which AI computations have been done
+    computation_time -- the total time in seconds spent on AI computations
+    longest_frame_time -- the longest time in seconds spent on AI computations during a frame
+    """
+
+    def __init__(self, side: str) -> None:
+        self.side: str = side
+        self.frames: int = 0
+        self.computing_frames: int = 0
+        self.computation_time: float = 0.0
+        self.longest_frame_time: float = 0.0
+
+
+class AIScheduler:
+    """
+    An AIScheduler runs the computations of the AI as generators that are resumed frame after frame,
+    so that a long computation never stalls the rendering of the game.
+
+    Each frame, the pending tasks are resumed one step at a time, in the order in which they have
+    been scheduled, until the time budget of the frame is spent.
+    At least one step is done on each frame so that every task eventually ends.
+
+    Keyword arguments:
+    frame_budget -- the maximum time in seconds that should be spent on the tasks during a frame
+    history_size -- the number of side turns for which the metrics are kept
+
+    Attributes:
+    frame_budget -- the maximum time in seconds that should be spent on the tasks during a frame
+    tasks -- the tasks that have not ended yet, in the order in which they have been scheduled
+    current_turn -- the metrics of the side turn in progress if there is any
+    history -- the metrics of the most recent side turns that have ended
+    """
+
+    def __init__(self, frame_budget: float, history_size: int = 50) -> None:
+        self.frame_budget: float = frame_budget
+        self.tasks: deque[Iterator[None]] = deque()
+        self.current_turn: Optional[SideTurnMetrics] = None
+        self.history: deque[SideTurnMetrics] = deque(maxlen=history_size)
+
+    def begin_side_turn(self, side: str) -> None:
+        """
+        Start recording the metrics of a new side turn, ending the previous one if needed.
+
+        Keyword arguments:
+        side -- the name of the side that is starting to play
+        """
+        self.end_side_turn()
+        self.current_turn = SideTurnMetrics(side)
+
+    def end_side_turn(self) -> None:
+        """
+        Stop recording the metrics of the side turn in progress if there is any.
+        """
+        if self.current_turn is not None:
+            self.history.append(self.current_turn)
+            self.current_turn = None
+
+    def schedule(self, task: Iterator[None]) -> None:
+        """
+        Add a task to run after all the pending ones.
+
+        Keyword arguments:
+        task -- the generator doing one step of the computation each time it is resumed
+        """
+        self.tasks.append(task)
+
+    def is_idle(self) -> bool:
+        """
+        Return whether all the scheduled tasks have ended or not.
+        """
+        return not self.tasks
+
+    def run_frame(self) -> bool:
+        """
+        Resume the pending tasks until the time budget of the frame is spent,
+        and count the frame in the metrics of the side turn in progress.
+
+        Return whether all the scheduled tasks have ended or not.
+        """
+        elapsed_time: float = 0.0
+        if self.tasks:
+            start: float = time.perf_counter()
+            deadline: float = start + self.frame_budget
+            while self.tasks:
+                self._step()
+                if time.perf_counter() >= deadline:
+                    break
+            elapsed_time = time.perf_counter() - start
+
+        if self.current_turn is not None:
+            self.current_turn.frames += 1
+            if elapsed_time:
+                self.current_turn.computing_frames += 1
+                self.current_turn.computation_time += elapsed_time
+                self.current_turn.longest_frame_time = max(
+                    self.current_turn.longest_frame_time, elapsed_time
+                )
+        return not self.tasks
+
+    def run_until_idle(self) -> None:
+        """
+        Run all the pending tasks to their end, regardless of the time budget.
+        """
+        while self.tasks:
+            self._step()
+
+    def _step(self) -> None:
+        try:
+            next(self.tasks[0])
+        except StopIteration:
+            self.tasks.popleft()
@@ -0,0 +1,147 @@
+"""
+Defines functions loading the images, sounds and maps used by the entities and the levels.
+
+In headless mode, nothing is read from the disk and no display or audio device is needed:
+images are replaced by blank surfaces of the expected size and sounds by silent ones,
+so the rules of a level can run on a machine without screen nor sound card.
+The headless mode should be enabled before loading any level.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Optional, Union
+
+import pygame
+import pytmx
+
+from src.constants import TILE_SIZE
+
+_headless: bool = False
+
+
+class SilentSound:
+    """
+    A SilentSound stands for a sound in headless mode,
+    offering the methods of pygame sounds used by the game without doing anything.
+    """
+
+    def play(self, *args, **kwargs) -> None:
+        """
+        Do nothing, a silent sound has nothing to play.
+        """
+
+    def stop(self) -> None:
+        """
+        Do nothing, a silent sound is never playing.
+        """
+
+    def set_volume(self, value: float) -> None:
+        """
+        Do nothing, a silent sound has no volume.
+
+        Keyword arguments:
+        value -- the new volume of the sound
+        """
+
+
+Sound = Union[pygame.mixer.Sound, SilentSound]
+
+SILENT_SOUND: SilentSound = SilentSound()
+
+
+def enable_headless_mode(enabled: bool = True) -> None:
+    """
+    Enable or disable the headless mode.
+
+    Keyword arguments:
+    enabled -- whether the assets should be replaced by blank ones or not
+    """
+    global _headless
+    _headless = enabled
+
+
+def is_headless() -> bool:
+    """
+    Return whether the headless mode is enabled or not.
+    """
+    return _headless
+
+
+def create_surface(size: tuple[int, int]) -> pygame.Surface:
+    """
+    Return a new transparent surface of the given size, with per-pixel alpha.
+
+    Keyword arguments:
+    size -- the width and the height of the surface in pixels
+    """
+    if _headless:
+        return pygame.Surface(size, pygame.SRCALPHA)
+    return pygame.Surface(size).convert_alpha()
+
+
+def load_image(path: str) -> pygame.Surface:
+    """
+    Return the image stored at the given path, converted for a fast display.
+    A blank tile is returned in headless mode.
+
+    Keyword arguments:
+    path -- the relative path to the image
+    """
+    if _headless:
+        return pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    return pygame.image.load(path).convert_alpha()
+
+
+def load_sprite(
+    path: str, size: tuple[int, int] = (TILE_SIZE, TILE_SIZE)
+) -> pygame.Surface:
+    """
+    Return the image stored at the given path, scaled to the given size.
+    A blank surface of the given size is returned in headless mode.
+
+    Keyword arguments:
+    path -- the relative path to the image
+    size -- the width and the height of the sprite in pixels, a tile by default
+    """
+    if _headless:
+        return pygame.Surface(size, pygame.SRCALPHA)
+    return pygame.transform.scale(load_image(path), size)
+
+
+def load_sound(path: str) -> Sound:
+    """
+    Return the sound stored at the given path.
+    A silent sound is returned in headless mode.
+
+    Keyword arguments:
+    path -- the relative path to the sound
+    """
+    if _headless:
+        return SILENT_SOUND
+    return pygame.mixer.Sound(path)
+
+
+def _load_blank_tileset(
+    filename: str, colorkey: Optional[str], **kwargs
+) -> Callable[..., pygame.Surface]:
+    def load_tile(
+        rect: Optional[tuple[int, int, int, int]] = None, flags: Optional = None
+    ) -> pygame.Surface:
+        size: tuple[int, int] = (rect[2], rect[3]) if rect else (TILE_SIZE, TILE_SIZE)
+        return pygame.Surface(size, pygame.SRCALPHA)
+
+    return load_tile
+
+
+def load_tmx(path: str) -> pytmx.TiledMap:
+    """
+    Return the Tiled map stored at the given path, with the images of its tiles.
+    Tiles are blank in headless mode, their tilesets are not read.
+
+    Keyword arguments:
+    path -- the relative path to the tmx file
+    """
+    if _headless:
+        return pytmx.TiledMap(path, image_loader=_load_blank_tileset)
+    return pytmx.load_pygame(path)
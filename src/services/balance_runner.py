@@ -0,0 +1,380 @@
+"""
+Defines the functions playing a level many times with different seeds in worker processes,
+the players being moved by the automatic player controller, and aggregating the outcome of
+these simulations in a report to help tuning the foes and the layout of the level.
+The team of the players is built by playing all the previous levels of the game first.
+
+Run it from the root of the project with:
+python -m src.services.balance_runner LEVEL [RUNS] [REPORT]
+LEVEL is the directory of the level, like maps/level_2, or its number.
+RUNS is the number of simulations, 100 by default.
+REPORT is the path of the JSON or CSV file in which the report is written,
+the summary of the report is printed if it is not given.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import re
+import statistics
+import sys
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import pygame
+import pygamepopup
+
+import src.gui.fonts as font
+import src.services.load_from_xml_manager as loader
+from src.game_entities.character import Character
+from src.game_entities.player import Player
+from src.services.assets_manager import enable_headless_mode
+from src.services.level_engine import LevelEngine, LevelStatus
+from src.services.player_controller import AutoPlayerController
+from src.services.random_service import RandomService
+
+RUNS = 100
+FIRST_SEED = 0
+MAX_TURNS = 100
+NOT_REACHED = "NOT_REACHED"
+
+CSV_FIELDS = (
+    "seed",
+    "status",
+    "turns",
+    "hits_dealt",
+    "damage_dealt",
+    "hits_taken",
+    "damage_taken",
+    "experience",
+    "foes_killed",
+    "players_killed",
+    "items_dropped",
+    "gold_dropped",
+)
+
+
+class SimulationResult(NamedTuple):
+    """
+    The outcome of a single play of a level, made only of plain data
+    so it can be sent back by a worker process.
+
+    Attributes:
+    seed -- the seed of the random service used to play the level
+    status -- the name of the final status of the level,
+    IN_PROGRESS if it was not over after the maximum number of turns,
+    NOT_REACHED if the team did not win the previous levels
+    turns -- the number of turns played
+    damage_dealt -- the number of hits dealt by the players for each value of damage
+    damage_taken -- the number of hits taken by the players for each value of damage
+    experience -- the experience earned by the players through fights
+    foes_killed -- the number of foes killed
+    players_killed -- the number of players killed
+    loot -- the number of each item dropped by the foes, by name
+    gold -- the quantity of gold dropped by the foes
+    """
+
+    seed: int
+    status: str
+    turns: int
+    damage_dealt: dict[int, int]
+    damage_taken: dict[int, int]
+    experience: int
+    foes_killed: int
+    players_killed: int
+    loot: dict[str, int]
+    gold: int
+
+
+def get_level_directory(level: str) -> tuple[str, int]:
+    """
+    Return the directory of the given level and its number.
+
+    Raise a ValueError if the level cannot be identified.
+
+    Keyword arguments:
+    level -- the directory of the level, like maps/level_2, or its number
+    """
+    if level.isdigit():
+        return f"maps/level_{level}/", int(level)
+    match: Optional[re.Match] = re.search(r"level_(\d+)/?$", level)
+    if match is None:
+        raise ValueError(f"{level} is not the directory of a level")
+    return level.rstrip("/") + "/", int(match.group(1))
+
+
+def init_simulation_process() -> None:
+    """
+    Initialize the game data needed to play a level without any display.
+    This is done once in each worker process.
+    """
+    enable_headless_mode()
+    pygame.init()
+    pygamepopup.init()
+    font.init_fonts()
+    Character.init_data(loader.load_races(), loader.load_classes())
+
+
+def build_team(
+    number: int, seed: int, max_turns: int = MAX_TURNS
+) -> Optional[list[Player]]:
+    """
+    Return the team of players as it would be at the beginning of the given level,
+    by playing all the previous levels with the automatic player controller.
+    The team is healed between levels, as it is in the game.
+
+    Return None if the team did not win one of the previous levels.
+
+    Keyword arguments:
+    number -- the number identifying the level the team should reach
+    seed -- the seed of the random service used to play the previous levels
+    max_turns -- the number of turns after which a previous level is stopped if it is not over
+    """
+    team: list[Player] = []
+    for previous_number in range(number):
+        level = LevelEngine(
+            f"maps/level_{previous_number}/",
+            previous_number,
+            players=team,
+            random_service=RandomService(seed),
+        )
+        if (
+            level.run(AutoPlayerController(), max_turns=max_turns)
+            is not LevelStatus.ENDED_VICTORY
+        ):
+            return None
+        team = level.escaped_players + level.players
+        for player in team:
+            player.healed(player.hit_points_max)
+            player.new_turn()
+    return team
+
+
+def simulate(
+    directory: str, number: int, seed: int, max_turns: int = MAX_TURNS
+) -> SimulationResult:
+    """
+    Play a level from its beginning with the automatic player controller
+    and return the outcome of the play.
+    The team is the one built by playing the previous levels with the same seed,
+    the status of the play is NOT_REACHED if it did not win all of them.
+    The game data should have been initialized and the headless mode enabled.
+
+    Keyword arguments:
+    directory -- the directory of the level
+    number -- the number identifying the level
+    seed -- the seed of the random service used to play the levels
+    max_turns -- the number of turns after which a level is stopped if it is not over
+    """
+    team: Optional[list[Player]] = build_team(number, seed, max_turns)
+    if team is None:
+        return SimulationResult(seed, NOT_REACHED, 0, {}, {}, 0, 0, 0, {}, 0)
+    level = LevelEngine(
+        directory, number, players=team, random_service=RandomService(seed)
+    )
+    status: LevelStatus = level.run(AutoPlayerController(), max_turns=max_turns)
+    battle_statistics = level.battle_statistics
+    return SimulationResult(
+        seed,
+        status.name,
+        level.turn,
+        dict(battle_statistics.damage_dealt),
+        dict(battle_statistics.damage_taken),
+        battle_statistics.experience,
+        battle_statistics.foes_killed,
+        battle_statistics.players_killed,
+        dict(battle_statistics.loot),
+        battle_statistics.gold,
+    )
+
+
+def _simulate_seed(arguments: tuple[str, int, int, int]) -> SimulationResult:
+    return simulate(*arguments)
+
+
+def run_simulations(
+    directory: str,
+    number: int,
+    seeds: Iterable[int],
+    max_turns: int = MAX_TURNS,
+    workers: Optional[int] = None,
+) -> list[SimulationResult]:
+    """
+    Play a level once for each of the given seeds and return the outcome of each play,
+    in the order of the seeds.
+    The plays are spread over worker processes, or done one after the other in the current
+    process if there are no workers: the game data should then have been initialized
+    and the headless mode enabled.
+
+    Keyword arguments:
+    directory -- the directory of the level
+    number -- the number identifying the level
+    seeds -- the seed of the random service of each play
+    max_turns -- the number of turns after which a play is stopped if the level is not over
+    workers -- the number of worker processes, 0 to play in the current process,
+    the number of CPUs of the machine by default
+    """
+    tasks: list[tuple[str, int, int, int]] = [
+        (directory, number, seed, max_turns) for seed in seeds
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 0:
+        return [_simulate_seed(task) for task in tasks]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_simulation_process
+    ) as executor:
+        return list(
+            executor.map(
+                _simulate_seed, tasks, chunksize=max(1, len(tasks) // (workers * 4))
+            )
+        )
+
+
+def _describe(values: Sequence[int]) -> Optional[dict[str, float]]:
+    if not values:
+        return None
+    return {
+        "mean": statistics.mean(values),
+        "median": statistics.median(values),
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def _describe_hits(hits: Counter[int]) -> dict[str, any]:
+    values: list[int] = sorted(hits.elements())
+    return {
+        "hits": len(values),
+        "total": sum(values),
+        "per_hit": _describe(values),
+        "histogram": {str(damage): hits[damage] for damage in sorted(hits)},
+    }
+
+
+def aggregate(results: Sequence[SimulationResult]) -> dict[str, any]:
+    """
+    Return the summary of the outcome of several plays of a level:
+    the rate of each final status, the number of turns needed to win,
+    the distribution of the damage dealt and taken by the players,
+    and the experience and loot earned per play.
+
+    Raise a ValueError if there is no result to aggregate.
+
+    Keyword arguments:
+    results -- the outcome of each play
+    """
+    if not results:
+        raise ValueError("There is no simulation result to aggregate")
+    runs: int = len(results)
+    statuses: Counter[str] = Counter(result.status for result in results)
+    damage_dealt: Counter[int] = Counter()
+    damage_taken: Counter[int] = Counter()
+    loot: Counter[str] = Counter()
+    for result in results:
+        damage_dealt.update(result.damage_dealt)
+        damage_taken.update(result.damage_taken)
+        loot.update(result.loot)
+    return {
+        "runs": runs,
+        "win_rate": statuses[LevelStatus.ENDED_VICTORY.name] / runs,
+        "defeat_rate": statuses[LevelStatus.ENDED_DEFEAT.name] / runs,
+        "unfinished_rate": statuses[LevelStatus.IN_PROGRESS.name] / runs,
+        "not_reached_rate": statuses[NOT_REACHED] / runs,
+        "turns_to_victory": _describe(
+            [
+                result.turns
+                for result in results
+                if result.status == LevelStatus.ENDED_VICTORY.name
+            ]
+        ),
+        "damage_dealt": _describe_hits(damage_dealt),
+        "damage_taken": _describe_hits(damage_taken),
+        "experience": _describe([result.experience for result in results]),
+        "foes_killed": _describe([result.foes_killed for result in results]),
+        "players_killed": _describe([result.players_killed for result in results]),
+        "gold": _describe([result.gold for result in results]),
+        "loot": {name: loot[name] / runs for name in sorted(loot)},
+    }
+
+
+def _to_row(result: SimulationResult) -> dict[str, any]:
+    return {
+        "seed": result.seed,
+        "status": result.status,
+        "turns": result.turns,
+        "hits_dealt": sum(result.damage_dealt.values()),
+        "damage_dealt": sum(
+            damage * hits for damage, hits in result.damage_dealt.items()
+        ),
+        "hits_taken": sum(result.damage_taken.values()),
+        "damage_taken": sum(
+            damage * hits for damage, hits in result.damage_taken.items()
+        ),
+        "experience": result.experience,
+        "foes_killed": result.foes_killed,
+        "players_killed": result.players_killed,
+        "items_dropped": ";".join(
+            f"{name}:{count}" for name, count in sorted(result.loot.items())
+        ),
+        "gold_dropped": result.gold,
+    }
+
+
+def write_report(path: str, level: str, results: Sequence[SimulationResult]) -> None:
+    """
+    Write the report of several plays of a level in the given file.
+    A JSON report holds the summary of the plays and the outcome of each of them,
+    a CSV report holds one row per play.
+
+    Raise a ValueError if the extension of the file is neither .json nor .csv.
+
+    Keyword arguments:
+    path -- the path of the report file
+    level -- the directory of the level that has been played
+    results -- the outcome of each play
+    """
+    extension: str = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(
+                {
+                    "level": level,
+                    "summary": aggregate(results),
+                    "simulations": [_to_row(result) for result in results],
+                },
+                report_file,
+                indent=2,
+            )
+    elif extension == ".csv":
+        with open(path, "w", encoding="utf-8", newline="") as report_file:
+            writer = csv.DictWriter(report_file, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(_to_row(result) for result in results)
+    else:
+        raise ValueError(f"Cannot write a report in {path}, use .json or .csv")
+
+
+def run() -> None:
+    """
+    Play the level given on the command line as many times as requested on all the CPUs
+    of the machine, then write or print the report.
+    """
+    directory, number = get_level_directory(sys.argv[1])
+    runs: int = int(sys.argv[2]) if len(sys.argv) > 2 else RUNS
+    results: list[SimulationResult] = run_simulations(
+        directory, number, range(FIRST_SEED, FIRST_SEED + runs)
+    )
+    if len(sys.argv) > 3:
+        write_report(sys.argv[3], directory, results)
+        print(f"Report of {runs} simulations of {directory} written in {sys.argv[3]}")
+    else:
+        print(json.dumps(aggregate(results), indent=2))
+
+
+if __name__ == "__main__":
+    run()
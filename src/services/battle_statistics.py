@@ -0,0 +1,84 @@
+"""
+Defines BattleStatistics class, the tally of the outcome of the fights of a level:
+damage dealt and taken by the players, experience earned, deaths and loot dropped by the foes.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from src.game_entities.destroyable import Destroyable
+from src.game_entities.foe import Foe
+from src.game_entities.gold import Gold
+from src.game_entities.item import Item
+from src.game_entities.player import Player
+
+
+class BattleStatistics:
+    """
+    A BattleStatistics tallies what happened during the fights of a level,
+    to compare several plays of the same level.
+    Damage is counted by value so the distribution of the hits can be studied
+    without keeping every hit.
+
+    Attributes:
+    damage_dealt -- the number of hits dealt by the players for each value of damage
+    damage_taken -- the number of hits taken by the players for each value of damage
+    experience -- the experience earned by the players through fights
+    foes_killed -- the number of foes killed by any entity
+    players_killed -- the number of players killed during the level
+    loot -- the number of each item dropped by the foes killed by the players, by name
+    gold -- the quantity of gold dropped by the foes killed by the players
+    """
+
+    def __init__(self) -> None:
+        self.damage_dealt: Counter[int] = Counter()
+        self.damage_taken: Counter[int] = Counter()
+        self.experience: int = 0
+        self.foes_killed: int = 0
+        self.players_killed: int = 0
+        self.loot: Counter[str] = Counter()
+        self.gold: int = 0
+
+    def record_hit(
+        self, attacker: Destroyable, target: Destroyable, damage: int
+    ) -> None:
+        """
+        Count a hit if it has been dealt or taken by a player,
+        and the death of the target if it did not survive it.
+
+        Keyword arguments:
+        attacker -- the entity that made the attack
+        target -- the entity that received the attack
+        damage -- the hit points actually lost by the target
+        """
+        if isinstance(attacker, Player):
+            self.damage_dealt[damage] += 1
+        if isinstance(target, Player):
+            self.damage_taken[damage] += 1
+        if target.hit_points <= 0:
+            if isinstance(target, Foe):
+                self.foes_killed += 1
+            elif isinstance(target, Player):
+                self.players_killed += 1
+
+    def record_experience(self, experience: int) -> None:
+        """
+        Count the experience earned by a player through a fight.
+
+        Keyword arguments:
+        experience -- the quantity of experience earned
+        """
+        self.experience += experience
+
+    def record_loot(self, item: Item) -> None:
+        """
+        Count an item dropped by a foe killed by a player.
+
+        Keyword arguments:
+        item -- the item that has been dropped
+        """
+        if isinstance(item, Gold):
+            self.gold += item.amount
+        else:
+            self.loot[item.name] += 1
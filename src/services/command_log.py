@@ -0,0 +1,244 @@
+"""
+Defines CommandLog class, the record of all the decisions made by the players during a level,
+along with the seed and the initial state needed to play them again,
+and the LevelCommand structure and CommandKind enum describing a single decision.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from lxml import etree
+
+from src.gui.position import Position
+from src.services.random_service import RandomStreamKind
+
+if TYPE_CHECKING:
+    from src.services.level_engine import LevelEngine
+
+COMMAND_LOG_VERSION = 1
+
+
+class CommandKind(Enum):
+    """
+    Define the decisions that can be made by the players during a level.
+    """
+
+    PLACE_PLAYER = "place_player"
+    START_GAME = "start_game"
+    MOVE = "move"
+    CANCEL_MOVE = "cancel_move"
+    ATTACK = "attack"
+    OPEN_CHEST = "open_chest"
+    OPEN_DOOR = "open_door"
+    TELEPORT = "teleport"
+    DRINK = "drink"
+    TALK = "talk"
+    VISIT = "visit"
+    GIVE_ITEM = "give_item"
+    GIVE_GOLD = "give_gold"
+    USE_ITEM = "use_item"
+    EQUIP_ITEM = "equip_item"
+    UNEQUIP_ITEM = "unequip_item"
+    THROW_ITEM = "throw_item"
+    BUY_ITEM = "buy_item"
+    SELL_ITEM = "sell_item"
+    TAKE_OBJECTIVE = "take_objective"
+    END_PLAYER_TURN = "end_player_turn"
+    END_TURN = "end_turn"
+
+
+class LevelCommand(NamedTuple):
+    """
+    A single decision of a player.
+    Players are referred to by their name, the other entities by the position of their tile
+    and items by their index in the inventory or the equipment of their owner.
+
+    Attributes:
+    kind -- the nature of the decision
+    turn -- the turn during which the decision has been made
+    arguments -- the parameters of the decision, only made of JSON compatible values
+    """
+
+    kind: CommandKind
+    turn: int
+    arguments: tuple
+
+
+def _to_json_value(value: any) -> any:
+    if isinstance(value, Position):
+        return [int(value.x), int(value.y)]
+    return value
+
+
+class CommandLog:
+    """
+    A CommandLog records the decisions made by the players during a level as a compact stream
+    of commands.
+    It also holds everything needed to build the level again in the same state as when the
+    recording started: the directory and the number of the level, its saved data,
+    the players that joined it and the seed and position of its random streams.
+    The hash of the state of the level can be attached at the end of the recording,
+    so that the replay of the commands can be verified.
+
+    Keyword arguments:
+    directory -- the relative path to the directory where all static data
+    concerning the level are stored
+    level_number -- the number identifying the level
+    status -- the status of the game for this level when the recording started
+    turn -- the value of the turn when the recording started
+    seed -- the seed of the random service of the level
+    random_draws -- the number of draws already made in each random stream
+    data -- saved data in XML format if the level was loaded from a save
+    players -- the players that joined the level, in XML format
+    commands -- the commands already recorded
+
+    Attributes:
+    directory -- the relative path to the directory where all static data
+    concerning the level are stored
+    level_number -- the number identifying the level
+    status -- the name of the status of the game when the recording started
+    turn -- the value of the turn when the recording started
+    seed -- the seed of the random service of the level
+    random_draws -- the number of draws already made in each random stream,
+    by name of the stream
+    data -- saved data of the level in XML format, None if the level was new
+    players -- the players that joined the level, in XML format
+    commands -- the commands recorded, in order
+    state_hash -- the hash of the state of the level when the recording ended, if known
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        level_number: int,
+        status: str,
+        turn: int,
+        seed: int,
+        random_draws: dict[str, int],
+        data: Optional[str] = None,
+        players: Sequence[str] = (),
+        commands: Sequence[LevelCommand] = (),
+    ) -> None:
+        self.directory: str = directory
+        self.level_number: int = level_number
+        self.status: str = status
+        self.turn: int = turn
+        self.seed: int = seed
+        self.random_draws: dict[str, int] = random_draws
+        self.data: Optional[str] = data
+        self.players: list[str] = list(players)
+        self.commands: list[LevelCommand] = list(commands)
+        self.state_hash: Optional[str] = None
+
+    @staticmethod
+    def start(level: LevelEngine) -> CommandLog:
+        """
+        Return a new command log for the given level, holding its current state.
+        It should be started before the content of the level is loaded.
+
+        Keyword arguments:
+        level -- the level whose commands should be recorded
+        """
+        return CommandLog(
+            level.directory,
+            level.number,
+            level.game_phase.name,
+            level.turn,
+            level.random_service.seed,
+            {
+                kind.value: draws
+                for kind, draws in level.random_service.get_draws().items()
+            },
+            (
+                etree.tostring(level.data, encoding="unicode")
+                if level.data is not None
+                else None
+            ),
+            [
+                etree.tostring(player.save("player"), encoding="unicode")
+                for player in level.players
+            ],
+        )
+
+    def get_random_draws(self) -> dict[RandomStreamKind, int]:
+        """
+        Return the number of draws already made in each random stream when the recording started.
+        """
+        return {
+            RandomStreamKind(name): draws for name, draws in self.random_draws.items()
+        }
+
+    def record(self, kind: CommandKind, turn: int, *arguments: any) -> None:
+        """
+        Add a command at the end of the log.
+
+        Keyword arguments:
+        kind -- the nature of the decision
+        turn -- the turn during which the decision has been made
+        arguments -- the parameters of the decision
+        """
+        self.commands.append(
+            LevelCommand(
+                kind, turn, tuple(_to_json_value(value) for value in arguments)
+            )
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Write the command log to the given file, in JSON format.
+
+        Keyword arguments:
+        path -- the path to the file
+        """
+        with open(path, "w", encoding="utf-8") as log_file:
+            json.dump(
+                {
+                    "version": COMMAND_LOG_VERSION,
+                    "directory": self.directory,
+                    "level": self.level_number,
+                    "status": self.status,
+                    "turn": self.turn,
+                    "seed": self.seed,
+                    "random_draws": self.random_draws,
+                    "data": self.data,
+                    "players": self.players,
+                    "commands": [
+                        [command.kind.value, command.turn, *command.arguments]
+                        for command in self.commands
+                    ],
+                    "state_hash": self.state_hash,
+                },
+                log_file,
+                separators=(",", ":"),
+            )
+
+    @staticmethod
+    def load(path: str) -> CommandLog:
+        """
+        Return the command log stored in the given file.
+
+        Keyword arguments:
+        path -- the path to the file
+        """
+        with open(path, "r", encoding="utf-8") as log_file:
+            content: dict[str, any] = json.load(log_file)
+        command_log = CommandLog(
+            content["directory"],
+            content["level"],
+            content["status"],
+            content["turn"],
+            content["seed"],
+            content["random_draws"],
+            content["data"],
+            content["players"],
+            [
+                LevelCommand(CommandKind(kind), turn, tuple(arguments))
+                for kind, turn, *arguments in content["commands"]
+            ],
+        )
+        command_log.state_hash = content["state_hash"]
+        return command_log
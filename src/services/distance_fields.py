@@ -0,0 +1,121 @@
+"""
+Defines DistanceFields class, the cache of the distances between each free tile of a level
+and the entities that could be targeted by the AI.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from src.game_entities.entity import Entity
+from src.services.occupancy_index import OccupancyIndex
+from src.services.walkability_grid import WalkabilityGrid
+
+
+class DistanceFields:
+    """
+    A DistanceFields computes, for a targeted entity, the number of moves needed from each free
+    tile of the level to reach a tile next to the target.
+    Each field is computed with a single search starting from all the free tiles around the target,
+    and shared by all the entities looking for the distance to this target.
+
+    Fields are kept as long as the occupancy of the level is unchanged,
+    and all dropped as soon as an entity is placed on or removed from a tile.
+    Without any occupancy to follow, fields are kept until the cache is explicitly cleared.
+
+    Keyword arguments:
+    walkability_grid -- the grid of tiles that can be crossed
+    occupancy -- the index of the entities standing on each tile of the level if there is any
+
+    Attributes:
+    walkability_grid -- the grid of tiles that can be crossed
+    occupancy -- the index of the entities standing on each tile of the level if there is any
+    _fields -- the distance field computed for each target, by index of the tile of the target
+    _version -- the version of the occupancy for which the fields have been computed
+    """
+
+    def __init__(
+        self,
+        walkability_grid: WalkabilityGrid,
+        occupancy: Optional[OccupancyIndex] = None,
+    ) -> None:
+        self.walkability_grid: WalkabilityGrid = walkability_grid
+        self.occupancy: Optional[OccupancyIndex] = occupancy
+        self._fields: dict[int, dict[int, int]] = {}
+        self._version: int = occupancy.version if occupancy is not None else 0
+
+    def clear(self) -> None:
+        """
+        Drop all the computed fields.
+        """
+        self._fields.clear()
+
+    def get_field(self, target: Entity) -> dict[int, int]:
+        """
+        Return the number of moves needed from each tile that can be crossed
+        to reach a tile next to the given target.
+        Tiles from which no tile next to the target can be reached are not part of the result.
+
+        Keyword arguments:
+        target -- the entity that should be reached
+        """
+        target_tile: Optional[int] = self.walkability_grid.index_of_tile(target.tile)
+        if target_tile is None:
+            return {}
+        return self.get_tile_field(target_tile)
+
+    def get_tile_field(self, target_tile: int) -> dict[int, int]:
+        """
+        Return the number of moves needed from each tile that can be crossed
+        to reach a tile next to the given one.
+        Tiles from which no tile next to the given one can be reached are not part of the result.
+
+        Keyword arguments:
+        target_tile -- the index of the tile that should be reached
+        """
+        if self.occupancy is not None and self._version != self.occupancy.version:
+            self._fields.clear()
+            self._version = self.occupancy.version
+        field: Optional[dict[int, int]] = self._fields.get(target_tile)
+        if field is None:
+            blocked: bytearray = self.walkability_grid.blocked
+            field = self.walkability_grid.distances_from(
+                neighbour
+                for neighbour in self.walkability_grid.neighbours[target_tile]
+                if not blocked[neighbour]
+            )
+            self._fields[target_tile] = field
+        return field
+
+    def distance_between(self, entity: Entity, target: Entity) -> Optional[int]:
+        """
+        Return the number of moves the given entity would need to end next to the given target,
+        or None if there is no free path between them.
+
+        Keyword arguments:
+        entity -- the entity that is moving
+        target -- the entity that should be reached
+        """
+        start: Optional[int] = self.walkability_grid.index_of_tile(entity.tile)
+        target_tile: Optional[int] = self.walkability_grid.index_of_tile(target.tile)
+        if start is None or target_tile is None:
+            return None
+        return self.distance_between_tiles(start, target_tile)
+
+    def distance_between_tiles(self, start: int, target_tile: int) -> Optional[int]:
+        """
+        Return the number of moves needed from a tile to end next to another one,
+        or None if there is no free path between them.
+
+        Keyword arguments:
+        start -- the index of the starting tile
+        target_tile -- the index of the tile that should be reached
+        """
+        neighbours: tuple[int, ...] = self.walkability_grid.neighbours[start]
+        if target_tile in neighbours:
+            return 0
+        field: dict[int, int] = self.get_tile_field(target_tile)
+        distances: list[int] = [
+            field[neighbour] for neighbour in neighbours if neighbour in field
+        ]
+        return 1 + min(distances) if distances else None
@@ -0,0 +1,229 @@
+"""
+Defines DuelForecast class, the outcome of a duel predicted before it happens,
+and the functions computing it exactly from the probabilities of the rolls of a duel.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import NamedTuple, Optional
+
+from src.game_entities.character import Character
+from src.game_entities.destroyable import DamageKind, Destroyable
+from src.game_entities.entity import Entity
+from src.game_entities.foe import Foe
+from src.game_entities.movable import Movable
+from src.game_entities.player import Player
+from src.game_entities.shield import Shield
+from src.game_entities.weapon import Weapon
+
+
+class DuelForecast(NamedTuple):
+    """
+    The predicted outcome of an attack from one entity to another,
+    with the parries, the double attacks and the wear of the weapon and the shield.
+
+    Attributes:
+    kill_probability -- the probability that the target dies during the duel
+    expected_damage -- the mean of the hit points lost by the target
+    expected_experience -- the mean of the experience earned by the attacker
+    damage_distribution -- the probability of each quantity of hit points lost by the target
+    effect_probabilities -- the probability that each effect of the weapon of the attacker
+    is applied at least once to the target, by name
+    """
+
+    kill_probability: float
+    expected_damage: float
+    expected_experience: float
+    damage_distribution: dict[int, float]
+    effect_probabilities: dict[str, float]
+
+
+class _DuelBranch(NamedTuple):
+    hit_points: int
+    shield_uses: int
+    weapon_uses: int
+    experience: int
+    effects_missed: tuple[float, ...]
+
+
+def _get_shield(target: Destroyable) -> Optional[Shield]:
+    # Only the first shield of a character is used to parry
+    if isinstance(target, Character):
+        for equipment in target.equipments:
+            if isinstance(equipment, Shield):
+                return equipment
+    return None
+
+
+def get_parry_probability(target: Destroyable) -> float:
+    """
+    Return the probability that the given entity parries an attack.
+
+    Keyword arguments:
+    target -- the entity being attacked
+    """
+    shield: Optional[Shield] = _get_shield(target)
+    if shield is None:
+        return 0.0
+    # An attack is parried if a roll between 1 and 100 is at most the parry of the shield
+    return min(max(math.floor(shield.parry), 0), 100) / 100
+
+
+def _get_trigger_probability(probability: float) -> float:
+    # An effect is triggered if a roll between 0 and 100 is below its probability
+    return min(max(math.ceil(probability), 0), 101) / 101
+
+
+def _get_damage_taken(
+    attacker: Movable,
+    target: Destroyable,
+    target_allies: Sequence[Entity],
+    kind: DamageKind,
+    with_weapon: bool,
+    with_shield: bool,
+) -> int:
+    damage: int = attacker.get_attack_damage(target, with_weapon)
+    if isinstance(target, Character):
+        return target.get_damage_taken(
+            attacker, damage, kind, target_allies, with_shield
+        )
+    return target.get_damage_taken(attacker, damage, kind, target_allies)
+
+
+def forecast_duel(
+    attacker: Movable,
+    target: Destroyable,
+    target_allies: Sequence[Entity],
+    kind: DamageKind,
+) -> DuelForecast:
+    """
+    Return the predicted outcome of a duel as it would be resolved by the level engine,
+    without changing any of the entities nor drawing any random value.
+    The probabilities are computed exactly by following every possible outcome of the rolls,
+    there are at most four of them.
+    The alterations applied by the effects of the weapon do not change the second attack
+    of a double attack.
+
+    Keyword arguments:
+    attacker -- the entity that would make the attack
+    target -- the target of the attack
+    target_allies -- the allies of the target
+    kind -- the nature of the damage that would be dealt
+    """
+    nb_attacks: int = 2 if "double_attack" in attacker.skills else 1
+    parry_probability: float = get_parry_probability(target)
+    shield: Optional[Shield] = _get_shield(target)
+    weapon: Optional[Weapon] = (
+        attacker.get_weapon() if isinstance(attacker, Character) else None
+    )
+    effects: Sequence[dict[str, any]] = weapon.effects if weapon else ()
+    trigger_probabilities: list[float] = [
+        _get_trigger_probability(Weapon.get_effect_probability(attacker, effect))
+        for effect in effects
+    ]
+    # The damage depends on whether the weapon and the shield broke during the duel
+    damage_table: dict[tuple[bool, bool], int] = {
+        (with_weapon, with_shield): _get_damage_taken(
+            attacker,
+            target,
+            target_allies,
+            kind,
+            with_weapon,
+            with_shield,
+        )
+        for with_weapon in ((True, False) if weapon else (False,))
+        for with_shield in ((True, False) if shield else (False,))
+    }
+    earns_experience: bool = isinstance(attacker, Player)
+    kill_experience: int = (
+        target.xp_gain
+        if isinstance(attacker, Character) and isinstance(target, Foe)
+        else 0
+    )
+
+    branches: dict[_DuelBranch, float] = {
+        _DuelBranch(
+            target.hit_points,
+            shield.durability if shield else 0,
+            weapon.durability if weapon else 0,
+            0,
+            (1.0,) * len(effects),
+        ): 1.0
+    }
+    for _ in range(nb_attacks):
+        next_branches: dict[_DuelBranch, float] = {}
+        for branch, probability in branches.items():
+            if branch.hit_points <= 0:
+                next_branches[branch] = next_branches.get(branch, 0.0) + probability
+                continue
+            branch_parry_probability: float = (
+                parry_probability if branch.shield_uses > 0 else 0.0
+            )
+            if branch_parry_probability > 0:
+                parried: _DuelBranch = branch._replace(
+                    shield_uses=branch.shield_uses - 1
+                )
+                next_branches[parried] = (
+                    next_branches.get(parried, 0.0)
+                    + probability * branch_parry_probability
+                )
+            if branch_parry_probability >= 1:
+                continue
+
+            has_weapon: bool = branch.weapon_uses > 0
+            real_damage: int = min(
+                damage_table[has_weapon, branch.shield_uses > 0], branch.hit_points
+            )
+            hit_points: int = branch.hit_points - real_damage
+            weapon_uses: int = branch.weapon_uses - 1 if has_weapon else 0
+            experience: int = real_damage // 2
+            effects_missed: tuple[float, ...] = branch.effects_missed
+            if hit_points <= 0:
+                experience += kill_experience
+            elif weapon_uses > 0:
+                # Effects are only applied by a weapon that did not break and on a living target
+                effects_missed = tuple(
+                    missed * (1 - trigger_probability)
+                    for missed, trigger_probability in zip(
+                        effects_missed, trigger_probabilities
+                    )
+                )
+            hit: _DuelBranch = _DuelBranch(
+                hit_points,
+                branch.shield_uses,
+                weapon_uses,
+                branch.experience + (experience if earns_experience else 0),
+                effects_missed,
+            )
+            next_branches[hit] = next_branches.get(hit, 0.0) + probability * (
+                1 - branch_parry_probability
+            )
+        branches = next_branches
+
+    damage_distribution: dict[int, float] = {}
+    effect_probabilities: dict[str, float] = {}
+    for branch, probability in branches.items():
+        damage: int = target.hit_points - branch.hit_points
+        damage_distribution[damage] = damage_distribution.get(damage, 0.0) + probability
+        for effect, missed in zip(effects, branch.effects_missed):
+            name: str = effect["effect"].name
+            effect_probabilities[name] = effect_probabilities.get(name, 0.0) + (
+                probability * (1 - missed)
+            )
+    return DuelForecast(
+        sum(
+            probability
+            for branch, probability in branches.items()
+            if branch.hit_points <= 0
+        ),
+        sum(
+            damage * probability for damage, probability in damage_distribution.items()
+        ),
+        sum(
+            branch.experience * probability for branch, probability in branches.items()
+        ),
+        damage_distribution,
+        effect_probabilities,
+    )
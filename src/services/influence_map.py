@@ -0,0 +1,94 @@
+"""
+Defines InfluenceMap class, the record of the tiles from which the targets of a side
+controlled by the AI could be attacked.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+from src.services.reach_offsets import get_ring_offsets
+
+
+class InfluenceMap:
+    """
+    An InfluenceMap stores, for each target of a side and each attack distance, the tiles that are
+    exactly at this distance from the target, and reciprocally the targets at each distance
+    of each tile.
+    Finding a tile from which a target can be attacked, or the targets that can be attacked
+    from a tile, is then a lookup instead of a search over all the tiles or all the targets.
+
+    Keyword arguments:
+    width -- the number of tiles on a row of the map
+    height -- the number of tiles on a column of the map
+    distances -- the attack distances for which the tiles around the targets should be recorded
+
+    Attributes:
+    width -- the number of tiles on a row of the map
+    height -- the number of tiles on a column of the map
+    distances -- the attack distances for which the tiles around the targets are recorded
+    _attack_tiles -- the tiles at each recorded distance of each target, by target
+    _targets_by_tile -- the targets at each recorded distance of each tile, sorted,
+    by distance and tile
+    """
+
+    def __init__(self, width: int, height: int, distances: Iterable[int]) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.distances: tuple[int, ...] = tuple(sorted(set(distances)))
+        self._attack_tiles: dict[int, dict[int, tuple[int, ...]]] = {}
+        self._targets_by_tile: dict[int, dict[int, list[int]]] = {
+            distance: {} for distance in self.distances
+        }
+
+    def _get_ring(self, tile: int, distance: int) -> tuple[int, ...]:
+        column, row = tile % self.width, tile // self.width
+        return tuple(
+            (row + row_offset) * self.width + column + column_offset
+            for column_offset, row_offset in get_ring_offsets(distance)
+            if 0 <= column + column_offset < self.width
+            and 0 <= row + row_offset < self.height
+        )
+
+    def add_target(self, target: int, tile: int) -> None:
+        """
+        Record a target standing on the given tile.
+
+        Keyword arguments:
+        target -- the identifier of the target, the order of the identifiers is the order in which
+        the targets are returned by lookups
+        tile -- the index of the tile of the target
+        """
+        self._attack_tiles[target] = {}
+        for distance in self.distances:
+            ring: tuple[int, ...] = self._get_ring(tile, distance)
+            self._attack_tiles[target][distance] = ring
+            targets_by_tile: dict[int, list[int]] = self._targets_by_tile[distance]
+            for ring_tile in ring:
+                bisect.insort(targets_by_tile.setdefault(ring_tile, []), target)
+
+    def get_attack_tiles(self, target: int, distance: int) -> tuple[int, ...]:
+        """
+        Return the indices of the tiles at the given distance from a target.
+
+        Keyword arguments:
+        target -- the identifier of the target
+        distance -- the distance in tiles, should be one of the recorded distances
+        """
+        attack_tiles: Optional[dict[int, tuple[int, ...]]] = self._attack_tiles.get(
+            target
+        )
+        return attack_tiles[distance] if attack_tiles is not None else ()
+
+    def get_targets_at(self, tile: int, distance: int) -> Sequence[int]:
+        """
+        Return the identifiers of the targets at the given distance from a tile, in order.
+        The returned value should not be modified.
+
+        Keyword arguments:
+        tile -- the index of the tile
+        distance -- the distance in tiles, should be one of the recorded distances
+        """
+        return self._targets_by_tile[distance].get(tile, ())
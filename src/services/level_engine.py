@@ -0,0 +1,1713 @@
+"""
+Defines LevelEngine class, the rules of an ongoing level without any display, sound or menu,
+and the structures describing the state of a level.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from enum import IntEnum, auto
+from typing import TYPE_CHECKING, Optional, Union
+
+import pytmx
+
+from src.constants import (AI_FRAME_BUDGET, AI_WORKERS,
+                           AI_WORKERS_MIN_ENTITIES, GRID_HEIGHT, GRID_WIDTH,
+                           TILE_SIZE)
+from src.game_entities.breakable import Breakable
+from src.game_entities.building import Building
+from src.game_entities.character import Character
+from src.game_entities.chest import Chest
+from src.game_entities.destroyable import DamageKind, Destroyable
+from src.game_entities.door import Door
+from src.game_entities.effect import Effect
+from src.game_entities.entity import Entity
+from src.game_entities.equipment import Equipment
+from src.game_entities.foe import Foe
+from src.game_entities.fountain import Fountain
+from src.game_entities.gold import Gold
+from src.game_entities.item import Item
+from src.game_entities.mission import Mission, MissionType
+from src.game_entities.movable import EntityState, EntityStrategy, Movable
+from src.game_entities.objective import Objective
+from src.game_entities.obstacle import Obstacle
+from src.game_entities.player import Player
+from src.game_entities.portal import Portal
+from src.game_entities.shop import Shop
+from src.game_entities.weapon import Weapon
+from src.gui.position import Position
+from src.services import load_from_tmx_manager as tmx_loader
+from src.services import load_from_xml_manager as loader
+from src.services.ai_scheduler import AIScheduler
+from src.services.assets_manager import load_tmx
+from src.services.battle_statistics import BattleStatistics
+from src.services.command_log import CommandKind, CommandLog
+from src.services.distance_fields import DistanceFields
+from src.services.duel_forecast import DuelForecast, forecast_duel
+from src.services.language import *
+from src.services.lookahead_planner import BoardUnit, LookaheadPlanner
+from src.services.move_range import MoveRange
+from src.services.occupancy_index import OccupancyIndex
+from src.services.parallel_side_turn_planner import (ParallelSideTurnPlanner,
+                                                     get_executor)
+from src.services.path_finder import PathFinder
+from src.services.random_service import (RandomService, RandomStreamKind,
+                                         set_active_random_service)
+from src.services.reach_offsets import get_reach_offsets
+from src.services.side_turn_planner import (AgentSnapshot, PlannedAction,
+                                            SideTurnPlanner)
+from src.services.walkability_grid import WalkabilityGrid
+
+if TYPE_CHECKING:
+    from pygamepopup.components import BoxElement
+
+    from src.services.player_controller import PlayerCommand, PlayerController
+
+DIARY_MAX_ENTRIES = 10
+
+
+def _get_index(items: Sequence[Item], item: Item) -> int:
+    # Items are compared by name, the exact item is looked for
+    return next(index for index, other_item in enumerate(items) if other_item is item)
+
+
+class LevelStatus(IntEnum):
+    VERY_BEGINNING = auto()
+    INITIALIZATION = auto()
+    IN_PROGRESS = auto()
+    ENDED_VICTORY = auto()
+    ENDED_DEFEAT = auto()
+
+
+class LevelEntityCollections:
+    def __init__(self):
+        self.obstacles: list[Obstacle] = []
+        self.players: list[Player] = []
+        self.allies: list[Character] = []
+        self.foes: list[Foe] = []
+        self.chests: list[Chest] = []
+        self.buildings: list[Building] = []
+        self.breakables: list[Breakable] = []
+        self.portals: list[Portal] = []
+        self.fountains: list[Fountain] = []
+        self.objectives: list[Objective] = []
+        self.doors: list[Door] = []
+
+    def values(self):
+        return self.__dict__.values()
+
+    def update(self, entities: dict[str, Sequence[Entity]]):
+        self.__dict__.update(entities)
+
+
+class EntityTurn(IntEnum):
+    PLAYER = 0
+    ALLIES = 1
+    FOES = 2
+
+    def get_next(self) -> EntityTurn:
+        """
+        Return the next entity turn, according to the current one
+        """
+        next_value = (
+            self.value + 1 if self.value + 1 < len(EntityTurn.__members__) else 0
+        )
+        return EntityTurn(next_value)
+
+
+class LevelEngine:
+    """
+    This class applies the game logic of an ongoing level: loading of its content, turn order,
+    moves, duels, AI, missions and end of the level.
+    It does not display anything, play any sound or open any menu, the actions of the players
+    are either made through the level scene holding it or given by a player controller.
+    Combined with the headless mode of the assets manager, complete levels can then be played
+    on a machine without screen nor sound card.
+
+    Keywords arguments:
+    directory -- the relative path to the directory where all static data
+    concerning the level are stored
+    number -- the number identifying the level
+    status -- the status of the game for this level
+    turn -- the value of the current turn (0 by default for new game)
+    data -- saved data in XML format in case where the game is loaded from a save
+    players -- the list of players on the level
+    random_service -- the source of the random numbers of the level, with its seed and the position
+    of its streams if the game is loaded from a save, a new one with a new seed by default
+
+    Attributes:
+    directory -- the relative path to the directory where all static data
+    concerning the level are stored
+    number -- the number identifying the level
+    random_service -- the source of all the random numbers drawn while the level is played
+    tmx_data -- the Tiled map of the level
+    tmx_map_properties_data -- the Tiled map holding the properties of the level
+    map -- a dictionary containing the dimensions and the position of the level's map
+    data -- saved data in XML format in case where the game is loaded from a save
+    chapter -- the id corresponding to the chapter in which the level is part
+    name -- the full title of the level
+    is_loaded -- whether the level is ready to be played or not
+    events -- a structure containing the data about all the events that could occur
+    player_possible_placements -- the list of available initial positions for players
+    players -- the list of players that are still actives on the level
+    escaped_players -- the list of players who left the level
+    entities -- the structure containing all the entities of the level by category
+    occupancy -- the spatial index giving the entity standing on each tile of the level
+    walkability_grid -- the grid of tiles that can be crossed, kept up-to-date by the occupancy index
+    distance_fields -- the distances to the targets of the AI, shared until the occupancy changes
+    path_finder -- the search finding the shortest paths toward the targets of the AI
+    move_range_cache -- the possible moves and attacks computed for each entity, by entity, tile,
+    max number of moves and reach, kept as long as the occupancy is unchanged
+    move_range_cache_version -- the version of the occupancy for which the cached moves are valid
+    missions -- the list of missions to be done
+    main_mission -- the main mission that is the winning condition for players
+    victory -- a boolean indicating whether the game is finished by a victory or not
+    defeat -- a boolean indicating whether the game is finished by a defeat or not
+    ai_possible_moves -- the possible moves of each entity controlled by the AI during the current turn,
+    computed only once they are needed
+    ai_targets -- the potential targets of each entity controlled by the AI during the current turn
+    with their distance, computed only once they are needed
+    ai_paths -- the path toward its target of each entity controlled by the AI during the current turn
+    side_plan -- the action planned for each entity of the side controlled by the AI that is playing,
+    dropped as soon as an entity is removed from the level
+    ai_scheduler -- the scheduler spreading the AI computations over several frames if needed,
+    also recording how many frames each side turn spanned
+    ai_workers -- the number of worker processes taking the AI decisions of large sides,
+    0 if they should be taken in the game process
+    player_controller -- the controller giving the actions of the players,
+    None if they are made through the level scene
+    new_turn_callback -- the function called when a new turn begins, None if there is none
+    entity_move_callback -- the function called with an entity controlled by the AI when it starts
+    moving, None if there is none
+    command_log -- the record of the decisions made by the players, None if they are not recorded
+    traded_items -- the items that have been trade during the current player turn
+    traded_gold -- the gold that have been trade during the current player turn
+    instant_moves -- whether the entities reach the end of their path at once or tile by tile
+    over several updates
+    fast_forward -- whether the level is played as fast as possible: moves are instant
+    and the AI computations are never spread over several updates
+    game_phase -- the active phase of the game
+    side_turn -- indicated which side should play (players, allies or foes)
+    turn -- the value of the current turn
+    diary_entries -- the log of the most recent battles
+    battle_statistics -- the tally of the outcome of all the battles of the level
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        number: int,
+        status: LevelStatus = LevelStatus.VERY_BEGINNING,
+        turn: int = 0,
+        data: Optional[etree.Element] = None,
+        players: Optional[Sequence[Player]] = None,
+        random_service: Optional[RandomService] = None,
+    ) -> None:
+        if players is None:
+            players = []
+        if random_service is None:
+            random_service = RandomService()
+
+        self.directory: str = directory
+        self.number: int = number
+        self.random_service: RandomService = random_service
+
+        self.tmx_data: pytmx.TiledMap = load_tmx(self.directory + "map.tmx")
+        self.tmx_map_properties_data: pytmx.TiledMap = load_tmx(
+            DATA_PATH + self.directory + "map_properties.tmx"
+        )
+        self.map: dict[str, any] = {
+            "width": self.tmx_data.width * TILE_SIZE,
+            "height": self.tmx_data.height * TILE_SIZE,
+            "x": (GRID_WIDTH - self.tmx_data.width) // 2 * TILE_SIZE,
+            "y": (GRID_HEIGHT - self.tmx_data.height) // 2 * TILE_SIZE,
+        }
+
+        self.data: Optional[etree.Element] = data
+
+        self.chapter: int = self.tmx_map_properties_data.properties["chapter_id"]
+        self.name: str = self.tmx_map_properties_data.properties["level_name"]
+
+        self.is_loaded: bool = False
+
+        self.events: dict[str, any] = {}
+        self.player_possible_placements: Sequence[Position] = []
+
+        self.players: list[Player] = players
+        self.escaped_players: list[Player] = []
+
+        self.entities: LevelEntityCollections = LevelEntityCollections()
+        self.walkability_grid: WalkabilityGrid = WalkabilityGrid(
+            self.map["x"], self.map["y"], self.tmx_data.width, self.tmx_data.height
+        )
+        self.occupancy: OccupancyIndex = OccupancyIndex(
+            walkability_grid=self.walkability_grid
+        )
+        self.distance_fields: DistanceFields = DistanceFields(
+            self.walkability_grid, self.occupancy
+        )
+        self.path_finder: PathFinder = PathFinder(self.walkability_grid)
+        self.move_range_cache: dict[tuple, Union[MoveRange, set[Position]]] = {}
+        self.move_range_cache_version: int = self.occupancy.version
+
+        self.missions: Optional[list[Mission]] = None
+        self.main_mission: Optional[Mission] = None
+
+        # Booleans for end game
+        # TODO : these booleans are mutually exclusive and so seem a little redundant.
+        #  Having only one variable with three different states (victory, defeat or "not finished")
+        #  may be better.
+        self.victory: bool = False
+        self.defeat: bool = False
+
+        # Data structures for the AI
+        self.ai_possible_moves: dict[Movable, MoveRange] = {}
+        self.ai_targets: dict[Movable, dict[Entity, int]] = {}
+        self.ai_paths: dict[Movable, list[Position]] = {}
+        self.side_plan: dict[Movable, PlannedAction] = {}
+        self.ai_scheduler: AIScheduler = AIScheduler(AI_FRAME_BUDGET)
+        self.ai_workers: int = AI_WORKERS
+
+        self.player_controller: Optional[PlayerController] = None
+        self.new_turn_callback: Optional[Callable[[], None]] = None
+        self.entity_move_callback: Optional[Callable[[Movable], None]] = None
+        self.command_log: Optional[CommandLog] = None
+        self.traded_items: list[list[Union[Item, Player]]] = []
+        self.traded_gold: list[list[Union[int, Player]]] = []
+        self.instant_moves: bool = False
+        self.fast_forward: bool = False
+
+        self.game_phase: LevelStatus = status
+        self.side_turn: EntityTurn = EntityTurn.PLAYER
+        self.turn: int = turn
+        self.diary_entries: list[str] = []
+        self.battle_statistics: BattleStatistics = BattleStatistics()
+
+    def load_level_content(self) -> None:
+        """
+        Load all the content of the level
+        """
+        set_active_random_service(self.random_service)
+        # Entities restored from a save should not move the random streams
+        random_draws: dict[RandomStreamKind, int] = self.random_service.get_draws()
+
+        self.events = tmx_loader.load_events(
+            self.tmx_data, DATA_PATH + self.directory, self.map["x"], self.map["y"]
+        )
+
+        self.player_possible_placements = tmx_loader.load_player_placements(
+            self.tmx_data, self.map["x"], self.map["y"]
+        )
+
+        self.entities.players = self.players
+        self.entities.obstacles = tmx_loader.load_obstacles(
+            self.tmx_data, self.map["x"], self.map["y"]
+        )
+
+        if self.data is None:
+            # Game is new
+            gap_x, gap_y = (self.map["x"], self.map["y"])
+            if "before_init" in self.events:
+                if "new_players" in self.events["before_init"]:
+                    for player_el in self.events["before_init"]["new_players"]:
+                        player = loader.init_player(player_el["name"])
+                        player.position = player_el["position"]
+                        self.players.append(player)
+
+            self.occupancy.rebuild(self.entities)
+            self._determine_players_initial_position()
+
+            self.entities.foes = tmx_loader.load_foes(self.tmx_data, gap_x, gap_y)
+            self.entities.chests = tmx_loader.load_chests(self.tmx_data, gap_x, gap_y)
+            self.entities.allies = tmx_loader.load_allies(self.tmx_data, gap_x, gap_y)
+            self.entities.buildings = tmx_loader.load_buildings(
+                self.tmx_data, DATA_PATH + self.directory, gap_x, gap_y, 500
+            )
+            self.entities.breakables = tmx_loader.load_breakables(
+                self.tmx_data, gap_x, gap_y
+            )
+            self.entities.portals = tmx_loader.load_portals(self.tmx_data, gap_x, gap_y)
+            self.entities.doors = tmx_loader.load_doors(self.tmx_data, gap_x, gap_y)
+            self.entities.fountains = tmx_loader.load_fountains(
+                self.tmx_data, gap_x, gap_y
+            )
+
+        else:
+            # Game is loaded from a save (data)
+            gap_x, gap_y = (0, 0)
+            self.players.extend(loader.load_players(self.data))
+            self.escaped_players = loader.load_escaped_players(self.data)
+            self.entities.update(
+                loader.load_all_entities_from_save(self.data, gap_x, gap_y)
+            )
+            self.random_service.set_draws(random_draws)
+
+        self.missions, self.main_mission = tmx_loader.load_missions(
+            self.tmx_data,
+            self.tmx_map_properties_data,
+            self.players,
+            self.map["x"],
+            self.map["y"],
+        )
+        self.entities.objectives = [
+            objective
+            for mission in self.missions
+            for objective in mission.objective_tiles
+        ]
+        self.occupancy.rebuild(self.entities)
+
+        self.is_loaded = True
+
+    def _determine_players_initial_position(self):
+        for player in self.players:
+            for tile in self.player_possible_placements:
+                if self.get_entity_on_tile(tile) is None:
+                    player.set_initial_pos(tile)
+                    break
+            else:
+                print(STR_ERROR_NOT_ENOUGH_TILES_TO_SET_PLAYERS)
+
+    def is_game_started(self) -> bool:
+        """
+        Return whether the game is started or not
+        """
+        return self.game_phase is not LevelStatus.INITIALIZATION
+
+    def is_game_ended(self) -> bool:
+        """
+        Return whether the level is over, by a victory or a defeat
+        """
+        return self.game_phase in (LevelStatus.ENDED_VICTORY, LevelStatus.ENDED_DEFEAT)
+
+    def start_game(self) -> None:
+        """
+        Handle the launch of the game.
+        Begin a new turn (the first one).
+        Add the players joining the level after the initialization phase if any.
+        """
+        self._record(CommandKind.START_GAME)
+        self.game_phase = LevelStatus.IN_PROGRESS
+        self.new_turn()
+        if "after_init" in self.events:
+            if "new_players" in self.events["after_init"]:
+                for player_el in self.events["after_init"]["new_players"]:
+                    player = loader.init_player(player_el["name"])
+                    player.position = player_el["position"]
+                    self.players.append(player)
+                    self.occupancy.add(player)
+
+    def finish_level(self, status: LevelStatus) -> None:
+        """
+        End the level with the given status.
+        In case of victory, reward the players for each secondary objective that has been
+        accomplished.
+
+        Keyword arguments:
+        status -- the final status of the level
+        """
+        if self.main_mission.ended:
+            for mission in self.get_accomplished_secondary_missions():
+                if mission.gold:
+                    for player in self.players:
+                        player.gold += mission.gold
+                if mission.items:
+                    # TODO : Add items reward of optional objective to players
+                    pass
+        self.game_phase = status
+
+    def get_accomplished_secondary_missions(self) -> list[Mission]:
+        """
+        Return the secondary missions that have been accomplished
+        """
+        return [
+            mission for mission in self.missions if not mission.main and mission.ended
+        ]
+
+    def run(
+        self, player_controller: PlayerController, max_turns: Optional[int] = None
+    ) -> LevelStatus:
+        """
+        Play the level until its end, the actions of the players being given
+        by the given controller.
+        The level is played in fast-forward mode.
+
+        Return the final status of the level,
+        IN_PROGRESS if it is not over after the given number of turns.
+
+        Keyword arguments:
+        player_controller -- the controller giving the actions of the players
+        max_turns -- the number of turns after which the level is stopped if it is not over,
+        no limit by default
+        """
+        self.player_controller = player_controller
+        self.set_fast_forward(True)
+        if not self.is_loaded:
+            self.load_level_content()
+        if self.game_phase in (LevelStatus.VERY_BEGINNING, LevelStatus.INITIALIZATION):
+            self.start_game()
+        while not self.update_state():
+            if max_turns is not None and self.turn > max_turns:
+                break
+        return self.game_phase
+
+    def set_fast_forward(self, enabled: bool) -> None:
+        """
+        Enable or disable the fast-forward mode.
+        In fast-forward mode, entities reach the end of their path at once and
+        the AI computations of a side turn are done during a single update.
+
+        Keyword arguments:
+        enabled -- whether the level should be played as fast as possible or not
+        """
+        self.fast_forward = enabled
+        self.instant_moves = enabled
+        self.ai_scheduler.frame_budget = float("inf") if enabled else AI_FRAME_BUDGET
+
+    def update_state(self) -> bool:
+        """
+        Update the state of the game.
+        Verify if victory or defeat conditions are met.
+        Handle the next action of the side whose turn it is.
+
+        Return whether the level is over or not.
+        """
+        if self.is_game_ended():
+            return True
+
+        # Another level may have been loaded meanwhile, like a replay
+        set_active_random_service(self.random_service)
+        self.update_missions()
+        if self.victory:
+            self.finish_level(LevelStatus.ENDED_VICTORY)
+            self.victory = False
+            return True
+        if self.defeat:
+            self.finish_level(LevelStatus.ENDED_DEFEAT)
+            self.defeat = False
+            return True
+
+        self.update_turn()
+        return False
+
+    def update_missions(self) -> None:
+        """
+        Update the state of all the missions, and determine if the level has been won or lost.
+        """
+        for mission in self.missions:
+            mission.update_state(entities=self.entities, turns=self.turn)
+        if self.main_mission.ended:
+            self.victory = True
+
+        if not self.players:
+            if not self.main_mission.succeeded_chars:
+                self.defeat = True
+            else:
+                self.victory = True
+
+    def update_turn(self) -> None:
+        """
+        Let the next entity of the side whose turn it is act,
+        or begin the turn of the next side if all the entities of this one acted.
+        Players only act here if there is a player controller.
+        """
+        entities: list[Movable] = []
+        if self.side_turn is EntityTurn.PLAYER:
+            entities = self.players
+        elif self.side_turn is EntityTurn.ALLIES:
+            entities = self.entities.allies
+        elif self.side_turn is EntityTurn.FOES:
+            entities = self.entities.foes
+
+        for entity in entities:
+            if not entity.turn_is_finished():
+                if self.side_turn is not EntityTurn.PLAYER:
+                    is_ally: bool = self.side_turn is EntityTurn.ALLIES
+                    if (
+                        entity not in self.side_plan
+                        and entity.state is EntityState.HAVE_TO_ACT
+                        and self.ai_scheduler.is_idle()
+                    ):
+                        if entity.strategy is EntityStrategy.LOOKAHEAD:
+                            self.schedule_lookahead_action(entity, is_ally)
+                        else:
+                            self.schedule_side_turn_plan(is_ally)
+                    # Wait for the AI computations to end without stalling the rendering
+                    if self.ai_scheduler.run_frame():
+                        self.process_entity_action(entity, is_ally)
+                elif self.player_controller is not None:
+                    self.play_player_command(
+                        entity, self.player_controller.get_command(self, entity)
+                    )
+                break
+        else:
+            self.side_turn = self.side_turn.get_next()
+            self.begin_turn()
+
+    def play_player_command(self, player: Player, command: PlayerCommand) -> None:
+        """
+        Play the whole turn of a player according to the given command:
+        move to the destination, then attack the target or take the objective if any.
+
+        Raise a ValueError if the command cannot be played by the player.
+
+        Keyword arguments:
+        player -- the player that is acting
+        command -- the actions of the player for this turn
+        """
+        player.selected = True
+        if command.destination is not None and command.destination != player.position:
+            self.move_player(player, command.destination)
+
+        if command.target is not None:
+            self.player_attack(player, command.target)
+        elif command.take_objective and not self.validate_objective(player):
+            raise ValueError(f"{player} cannot take any objective")
+        self.end_player_turn(player)
+
+    def _record(self, kind: CommandKind, *arguments: any) -> None:
+        if self.command_log is not None:
+            self.command_log.record(kind, self.turn, *arguments)
+
+    def get_player_by_name(self, name: str) -> Player:
+        """
+        Return the player with the given name, whether it is still on the level or it left it.
+
+        Raise a ValueError if there is no such player.
+
+        Keyword arguments:
+        name -- the name of the player
+        """
+        for player in self.players + self.escaped_players:
+            if player.name == name:
+                return player
+        raise ValueError(f"There is no player named {name} on the level")
+
+    def place_player(self, player: Player, tile: Position) -> None:
+        """
+        Change the initial position of a player during the initialization phase.
+        The player is swapped with the one already standing on the tile if there is any.
+
+        Keyword arguments:
+        player -- the player that should be placed
+        tile -- the position of the new initial tile of the player
+        """
+        self._record(CommandKind.PLACE_PLAYER, player.name, tile)
+        entity: Optional[Entity] = self.get_entity_on_tile(tile)
+        if entity:
+            entity.set_initial_pos(player.position)
+        player.set_initial_pos(tile)
+
+    def move_player(self, player: Player, destination: Position) -> None:
+        """
+        Let a player start moving toward the given destination.
+
+        Raise a ValueError if the destination cannot be reached by the player during this turn.
+
+        Keyword arguments:
+        player -- the player that is moving
+        destination -- the position of the tile the player should reach
+        """
+        max_moves: int = player.max_moves + player.get_stat_change("speed")
+        possible_moves: MoveRange = self.get_entity_possible_moves(player, max_moves)
+        if destination not in possible_moves:
+            raise ValueError(f"{player} cannot move to {destination} during this turn")
+        self._record(CommandKind.MOVE, player.name, destination)
+        player.selected = True
+        player.set_move(self.determine_path_to(destination, possible_moves))
+        self.move_entity(player)
+
+    def cancel_player_move(self, player: Player) -> bool:
+        """
+        Cancel the last move of a player if it is still possible,
+        along with the trades made since then.
+
+        Return whether the move has been cancelled or not.
+
+        Keyword arguments:
+        player -- the player whose move should be cancelled
+        """
+        self._record(CommandKind.CANCEL_MOVE, player.name)
+        if not player.cancel_move():
+            return False
+        # Return traded items
+        for item, owner, receiver in self.traded_items:
+            if owner == player:
+                receiver.remove_item(item)
+                player.set_item(item)
+            else:
+                player.remove_item(item)
+                owner.set_item(item)
+        self.traded_items.clear()
+        # Return traded gold
+        for value, sender, receiver in self.traded_gold:
+            if sender == player:
+                player.gold += value
+                receiver.gold -= value
+            else:
+                player.gold -= value
+                receiver.gold += value
+        self.traded_gold.clear()
+        player.selected = False
+        return True
+
+    def player_attack(self, player: Player, target_position: Position) -> None:
+        """
+        Let a player attack the entity standing on the given tile.
+
+        Raise a ValueError if the entity cannot be attacked by the player.
+
+        Keyword arguments:
+        player -- the player that is attacking
+        target_position -- the position of the tile of the target
+        """
+        if not player.can_attack() or target_position not in self.get_possible_attacks(
+            [player.position], player.reach, True
+        ):
+            raise ValueError(f"{player} cannot attack {target_position}")
+        self._record(CommandKind.ATTACK, player.name, target_position)
+        self.duel(
+            player,
+            self.get_entity_on_tile(target_position),
+            self.entities.foes,
+            player.attack_kind,
+        )
+
+    def unlock_chest(
+        self, actor: Character, chest: Chest, pick_lock: bool
+    ) -> Optional[Item]:
+        """
+        Let a character open a chest, with a key or by picking its lock,
+        the content of the chest is then sent to the character.
+        Picking a lock takes two tries, the first one only initiates it.
+
+        Return the content of the chest, None if the chest has not been opened.
+
+        Keyword arguments:
+        actor -- the character performing the action
+        chest -- the chest that is being opened
+        pick_lock -- whether the lock of the chest is picked or a key is used
+        """
+        self._record(CommandKind.OPEN_CHEST, actor.name, chest.position, pick_lock)
+        if pick_lock and not chest.pick_lock_initiated:
+            chest.pick_lock_initiated = True
+            return None
+        if not pick_lock:
+            actor.remove_chest_key()
+        item: Optional[Item] = chest.open()
+        if isinstance(item, Gold):
+            actor.gold += item.amount
+        elif item is not None:
+            actor.set_item(item)
+        return item
+
+    def unlock_door(self, actor: Character, door: Door, pick_lock: bool) -> bool:
+        """
+        Let a character open a door, with a key or by picking its lock,
+        the door is then removed from the level.
+        Picking a lock takes two tries, the first one only initiates it.
+
+        Return whether the door has been opened or not.
+
+        Keyword arguments:
+        actor -- the character performing the action
+        door -- the door that is being opened
+        pick_lock -- whether the lock of the door is picked or a key is used
+        """
+        self._record(CommandKind.OPEN_DOOR, actor.name, door.position, pick_lock)
+        if pick_lock and not door.pick_lock_initiated:
+            door.pick_lock_initiated = True
+            return False
+        if not pick_lock:
+            actor.remove_door_key()
+        self.entities.doors.remove(door)
+        self.occupancy.remove(door)
+        return True
+
+    def teleport(self, actor: Character, destination: Position) -> None:
+        """
+        Move a character at once to the given tile, through a portal.
+
+        Keyword arguments:
+        actor -- the character using the portal
+        destination -- the position of the tile where the character should appear
+        """
+        self._record(CommandKind.TELEPORT, actor.name, destination)
+        actor.position = destination
+
+    def drink(self, actor: Character, fountain: Fountain) -> list[list[BoxElement]]:
+        """
+        Let a character drink in a fountain.
+
+        Return the dialog that should be displayed to the player.
+
+        Keyword arguments:
+        actor -- the character drinking
+        fountain -- the fountain the character is drinking in
+        """
+        self._record(CommandKind.DRINK, actor.name, fountain.position)
+        return fountain.drink(actor)
+
+    def talk(self, actor: Character, character: Character) -> list[list[BoxElement]]:
+        """
+        Let a character talk with another one, who may join the team of the players.
+
+        Return the dialog that should be displayed to the player.
+
+        Keyword arguments:
+        actor -- the character starting the talk
+        character -- the character being talked to
+        """
+        self._record(CommandKind.TALK, actor.name, character.position)
+        entries: list[list[BoxElement]] = character.talk(actor)
+        # Check if character is now a player
+        if character.join_team:
+            self.ally_to_player(character)
+        return entries
+
+    def visit(self, actor: Character, building: Building) -> list[list[BoxElement]]:
+        """
+        Let a character visit a building.
+
+        Return the entries that should be displayed to the player.
+
+        Keyword arguments:
+        actor -- the character visiting the building
+        building -- the building being visited
+        """
+        self._record(CommandKind.VISIT, actor.name, building.position)
+        return building.interact(actor)
+
+    def ally_to_player(self, character: Character) -> None:
+        """
+        Cast a character entity to a player.
+        It is use when an ally or neutral entity suddenly join the player team.
+
+        Keyword argument:
+        character -- the character that should be cast
+        """
+        self.entities.allies.remove(character)
+        self.occupancy.remove(character)
+        player = Player(
+            name=character.name,
+            sprite=character.sprite,
+            hit_points=character.hit_points,
+            defense=character.defense,
+            resistance=character.resistance,
+            strength=character.strength,
+            classes=character.classes,
+            equipments=character.equipments,
+            race=character.race,
+            gold=character.gold,
+            lvl=character.lvl,
+            skills=character.skills,
+            alterations=character.alterations,
+        )
+        self.entities.players.append(player)
+        player.earn_xp(character.experience)
+        player.hit_points = character.hit_points
+        player.position = character.position
+        player.items = character.items
+        self.occupancy.add(player)
+
+    def give_item(self, owner: Player, receiver: Player, item: Item) -> bool:
+        """
+        Move an item from the inventory of a player to the inventory of another one.
+        The trade is cancelled along with the move of the player who initiated it.
+
+        Return whether the item has been given or not,
+        it is not if there is no free space in the inventory of the receiver.
+
+        Keyword arguments:
+        owner -- the player owning the item
+        receiver -- the player receiving the item
+        item -- the item that should be given
+        """
+        self._record(
+            CommandKind.GIVE_ITEM,
+            owner.name,
+            receiver.name,
+            _get_index(owner.items, item),
+        )
+        if not receiver.set_item(item):
+            return False
+        owner.remove_item(item)
+        self.traded_items.append([item, owner, receiver])
+        return True
+
+    def give_gold(self, sender: Player, receiver: Player, value: int) -> None:
+        """
+        Move some gold from a player to another one.
+        The trade is cancelled along with the move of the player who initiated it.
+
+        Keyword arguments:
+        sender -- the player sending the gold
+        receiver -- the player receiving the gold
+        value -- the quantity of gold that should be given
+        """
+        self._record(CommandKind.GIVE_GOLD, sender.name, receiver.name, value)
+        Player.trade_gold(sender, receiver, value)
+        self.traded_gold.append([value, sender, receiver])
+
+    def use_item(self, player: Player, item: Item) -> tuple[bool, Sequence[str]]:
+        """
+        Let a player use an item of their inventory.
+
+        Return whether the item has been used or not and the messages that should be sent
+        to the player.
+
+        Keyword arguments:
+        player -- the player using the item
+        item -- the item that should be used
+        """
+        self._record(CommandKind.USE_ITEM, player.name, _get_index(player.items, item))
+        return player.use_item(item)
+
+    def equip_item(self, player: Player, item: Item) -> int:
+        """
+        Let a player equip an item of their inventory.
+
+        Return -1 if the item cannot be equipped by the player, 1 if it replaced another equipment
+        and 0 otherwise.
+
+        Keyword arguments:
+        player -- the player equipping the item
+        item -- the item that should be equipped
+        """
+        self._record(
+            CommandKind.EQUIP_ITEM, player.name, _get_index(player.items, item)
+        )
+        return player.equip(item)
+
+    def unequip_item(self, player: Player, item: Item) -> bool:
+        """
+        Let a player put one of their equipments back in their inventory.
+
+        Return whether the item has been unequipped or not.
+
+        Keyword arguments:
+        player -- the player unequipping the item
+        item -- the equipment that should be unequipped
+        """
+        self._record(
+            CommandKind.UNEQUIP_ITEM,
+            player.name,
+            _get_index(player.equipments, item),
+        )
+        return player.unequip(item)
+
+    def throw_item(self, player: Player, item: Item) -> bool:
+        """
+        Let a player throw away an item of their inventory or one of their equipments.
+
+        Return whether the item was equipped or not.
+
+        Keyword arguments:
+        player -- the player throwing the item
+        item -- the item that should be thrown away
+        """
+        is_equipped: bool = isinstance(item, Equipment) and player.has_exact_equipment(
+            item
+        )
+        self._record(
+            CommandKind.THROW_ITEM,
+            player.name,
+            is_equipped,
+            _get_index(player.equipments if is_equipped else player.items, item),
+        )
+        if is_equipped:
+            player.remove_equipment(item)
+        else:
+            player.remove_item(item)
+        return is_equipped
+
+    def buy_item(self, shop: Shop, item: Item) -> str:
+        """
+        Let the current visitor of a shop buy an item of its stock.
+
+        Return the message that should be displayed to the player.
+
+        Keyword arguments:
+        shop -- the shop selling the item
+        item -- the item that should be bought
+        """
+        self._record(
+            CommandKind.BUY_ITEM,
+            shop.position,
+            _get_index([entry["item"] for entry in shop.stock], item),
+        )
+        return shop.buy(item)
+
+    def sell_item(self, shop: Shop, item: Item) -> tuple[bool, str]:
+        """
+        Let the current visitor of a shop sell an item of their inventory.
+
+        Return whether the item has been sold or not and the message that should be displayed
+        to the player.
+
+        Keyword arguments:
+        shop -- the shop buying the item
+        item -- the item that should be sold
+        """
+        self._record(
+            CommandKind.SELL_ITEM,
+            shop.position,
+            _get_index(shop.current_visitor.items, item),
+        )
+        return shop.sell(item)
+
+    def end_player_turn(self, player: Player) -> None:
+        """
+        End the turn of a player, the actions made during it cannot be cancelled anymore.
+
+        Keyword arguments:
+        player -- the player whose turn is over
+        """
+        self._record(CommandKind.END_PLAYER_TURN, player.name)
+        player.end_turn()
+        self.traded_items.clear()
+        self.traded_gold.clear()
+
+    def move_entity(self, entity: Movable) -> None:
+        """
+        Let an entity progress along its path, by one step
+        or until the end of the path if moves are instant.
+
+        Keyword arguments:
+        entity -- the entity that is moving
+        """
+        entity.move()
+        while self.instant_moves and entity.on_move:
+            entity.move()
+
+    def validate_objective(self, player: Player) -> bool:
+        """
+        Let a player accomplish the mission whose objective is at reach,
+        the player then leaves the level.
+
+        Return whether a mission has been accomplished or not.
+
+        Keyword arguments:
+        player -- the player taking the objective
+        """
+        self._record(CommandKind.TAKE_OBJECTIVE, player.name)
+        for mission in self.missions:
+            if (
+                mission.type is MissionType.POSITION
+                or mission.type is MissionType.TOUCH_POSITION
+            ):
+                # Verify that character is not the last if the mission is not the main one
+                if mission.main or len(self.players) > 1:
+                    if mission.is_position_valid(player.position):
+                        mission.update_state(player)
+                        self.players.remove(player)
+                        self.occupancy.remove(player)
+                        self.escaped_players.append(player)
+                        if mission.main and mission.ended:
+                            self.victory = True
+                        return True
+        return False
+
+    def end_turn(self) -> None:
+        """
+        End the current turn
+        """
+        self._record(CommandKind.END_TURN)
+        for player in self.players:
+            player.end_turn()
+        self.side_turn = self.side_turn.get_next()
+        self.begin_turn()
+
+    def begin_turn(self) -> None:
+        """
+        Begin next camp's turn
+        """
+        self.ai_possible_moves.clear()
+        self.ai_targets.clear()
+        self.ai_paths.clear()
+        self.side_plan.clear()
+        entities = []
+        if self.side_turn is EntityTurn.PLAYER:
+            self.new_turn()
+            entities = self.players
+        elif self.side_turn is EntityTurn.ALLIES:
+            entities = self.entities.allies
+        elif self.side_turn is EntityTurn.FOES:
+            entities = self.entities.foes
+
+        for entity in entities:
+            entity.new_turn()
+
+        if self.side_turn is EntityTurn.PLAYER:
+            self.ai_scheduler.end_side_turn()
+        else:
+            self.ai_scheduler.begin_side_turn(self.side_turn.name)
+            self.schedule_side_turn_plan(self.side_turn is EntityTurn.ALLIES)
+
+    def new_turn(self) -> None:
+        """
+        Begin of a new turn
+        """
+        self.turn += 1
+        if self.new_turn_callback is not None:
+            self.new_turn_callback()
+
+    def get_next_cases(self, position: Position) -> list[Optional[Entity]]:
+        """
+        Return the entities that are next to the given tile
+
+        Keyword arguments:
+        position -- the position of the tile whose neighbors must be computed
+        """
+        tiles_content: list[Optional[Entity]] = []
+        for x_coordinate in range(-1, 2):
+            for y_coordinate in (1 - abs(x_coordinate), -1 + abs(x_coordinate)):
+                tile_x: int = position[0] + (x_coordinate * TILE_SIZE)
+                tile_y: int = position[1] + (y_coordinate * TILE_SIZE)
+                tile_position: Position = Position(tile_x, tile_y)
+                tile_content: Optional[Entity] = self.get_entity_on_tile(tile_position)
+                tiles_content.append(tile_content)
+        return tiles_content
+
+    def get_possible_moves(self, position: Position, max_moves: int) -> MoveRange:
+        """
+        Return all the possible moves with their distance from the starting position,
+        along with the tile from which each of them is reached
+
+        Keyword arguments:
+        position -- the starting position
+        max_moves -- the maximum number of tiles that could be traveled
+        """
+        start: Optional[int] = self.walkability_grid.index_of(position)
+        if start is None:
+            return MoveRange({Position(position[0], position[1]): 0})
+        predecessors: dict[int, int] = {}
+        distances: dict[int, int] = self.walkability_grid.reachable_tiles(
+            start, max_moves, predecessors
+        )
+        positions: dict[int, Position] = {
+            tile: self.walkability_grid.position_of(tile) for tile in distances
+        }
+        return MoveRange(
+            {positions[tile]: distance for tile, distance in distances.items()},
+            {
+                positions[tile]: positions[predecessor]
+                for tile, predecessor in predecessors.items()
+            },
+        )
+
+    def get_entity_possible_moves(self, entity: Movable, max_moves: int) -> MoveRange:
+        """
+        Return all the possible moves of the given entity with their distance from it.
+        The moves computed for an entity are reused as long as nothing moved on the level,
+        the returned value should then not be modified.
+
+        Keyword arguments:
+        entity -- the entity that would move
+        max_moves -- the maximum number of tiles that could be traveled
+        """
+        self._synchronize_move_range_cache()
+        key: tuple = (entity, entity.tile, max_moves)
+        if key not in self.move_range_cache:
+            self.move_range_cache[key] = self.get_possible_moves(
+                entity.position, max_moves
+            )
+        return self.move_range_cache[key]
+
+    def get_entity_possible_attacks(
+        self, entity: Movable, max_moves: int, from_ally_side: bool
+    ) -> set[Position]:
+        """
+        Return all the tiles that could be targeted for an attack by the given entity
+        after moving.
+        The attacks computed for an entity are reused as long as nothing moved on the level,
+        the returned value should then not be modified.
+
+        Keyword arguments:
+        entity -- the entity that would attack
+        max_moves -- the maximum number of tiles that could be traveled before attacking
+        from_ally_side -- a boolean indicating whether this is a friendly attack or not
+        """
+        self._synchronize_move_range_cache()
+        key: tuple = (
+            entity,
+            entity.tile,
+            max_moves,
+            tuple(entity.reach),
+            from_ally_side,
+        )
+        if key not in self.move_range_cache:
+            self.move_range_cache[key] = self.get_possible_attacks(
+                self.get_entity_possible_moves(entity, max_moves),
+                entity.reach,
+                from_ally_side,
+            )
+        return self.move_range_cache[key]
+
+    def _synchronize_move_range_cache(self) -> None:
+        if self.move_range_cache_version != self.occupancy.version:
+            self.move_range_cache.clear()
+            self.move_range_cache_version = self.occupancy.version
+
+    def get_possible_attacks(
+        self,
+        possible_moves: Iterable[Position],
+        reach: Sequence[int],
+        from_ally_side: bool,
+    ) -> set[Position]:
+        """
+        Return all the tiles that could be targeted for an attack from a specific entity
+
+        Keyword arguments:
+        possible_moves -- the tiles from which the entity could attack
+        reach -- the reach of the attacking entity
+        from_ally_side -- a boolean indicating whether this is a friendly attack or not
+        """
+        entities = list(self.entities.breakables)
+        if from_ally_side:
+            entities += self.entities.foes
+        else:
+            entities += self.entities.allies + self.players
+
+        attack_tiles: set[tuple[int, int]] = {
+            (int(tile[0] // TILE_SIZE), int(tile[1] // TILE_SIZE))
+            for tile in possible_moves
+        }
+        reach_offsets: frozenset[tuple[int, int]] = get_reach_offsets(reach)
+        return {
+            Position(entity.position.x, entity.position.y)
+            for entity in entities
+            if not attack_tiles.isdisjoint(
+                (entity.tile.column + column_offset, entity.tile.row + row_offset)
+                for column_offset, row_offset in reach_offsets
+            )
+        }
+
+    def is_tile_available(self, tile: Position) -> bool:
+        """
+        Return whether the given tile can be accessed or not
+
+        Keyword arguments:
+        tile -- the position of the tile
+        """
+        return self.walkability_grid.is_walkable(tile)
+
+    def get_entity_on_tile(self, tile: Position) -> Optional[Entity]:
+        """
+        Return the entity that is on the given tile if there is any
+
+        Keyword arguments:
+        tile -- the position of the tile
+        """
+        return self.occupancy.get_entity(tile)
+
+    def determine_path_to(
+        self, destination_tile: Position, distance_for_tile: MoveRange
+    ) -> list[Position]:
+        """
+        Return an ordered list of position that represent the path from one tile to another
+
+        Keyword arguments:
+        destination_tile -- the position of the destination
+        distance_for_tile -- the possible moves from the starting tile, as computed by get_possible_moves
+        """
+        return distance_for_tile.path_to(destination_tile)
+
+    def distance_between_all(
+        self, entity: Entity, all_other_entities: Sequence
+    ) -> dict[Entity, int]:
+        """
+        Return the distance between each different given entities for a reference entity
+
+        Keyword arguments:
+        entity -- the entity for which the distance from all other entities should be computed
+        all_other_entities -- all other entities for which the distance should be computed
+        """
+        entities_distance: dict[Entity, int] = {}
+        for other_entity in all_other_entities:
+            distance: Optional[int] = self.distance_fields.distance_between(
+                entity, other_entity
+            )
+            entities_distance[other_entity] = (
+                distance
+                if distance is not None
+                else self.map["width"] * self.map["height"]
+            )
+        return entities_distance
+
+    def remove_entity(self, entity: Entity) -> None:
+        """
+        Remove an entity from the level
+
+        Keyword arguments:
+        entity -- the entity that should be removed
+        """
+        collection = None
+        if isinstance(entity, Foe):
+            collection = self.entities.foes
+        elif isinstance(entity, Player):
+            collection = self.entities.players
+        elif isinstance(entity, Breakable):
+            collection = self.entities.breakables
+        elif isinstance(entity, Character):
+            collection = self.entities.allies
+        collection.remove(entity)
+        self.occupancy.remove(entity)
+        # Remaining entities may take other decisions, they will be planned again
+        self.side_plan.clear()
+
+    def duel(
+        self,
+        attacker: Movable,
+        target: Destroyable,
+        target_allies: Sequence[Destroyable],
+        kind: DamageKind,
+    ) -> None:
+        """
+        Handle the development of an attack from one entity to another
+
+        Keyword arguments:
+        attacker -- the entity that is making the attack
+        target -- the target of the attack
+        attacker_allies -- the allies of the attacker
+        target_allies -- the allies of the target
+        kind -- the nature of the damage that would be dealt
+        """
+        nb_attacks: int = 2 if "double_attack" in attacker.skills else 1
+        for _ in range(nb_attacks):
+            experience: int = 0
+
+            if isinstance(target, Character) and target.parried():
+                # Target parried attack
+                self.diary_entries.append(
+                    f_ATTACKER_ATTACKED_TARGET_BUT_PARRIED(attacker, target)
+                )
+                continue
+
+            damage: int = attacker.attack(target)
+            real_damage: int = target.hit_points - target.attacked(
+                attacker, damage, kind, target_allies
+            )
+            self.diary_entries.append(
+                f_ATTACKER_DEALT_DAMAGE_TO_TARGET(attacker, target, real_damage)
+            )
+            self.battle_statistics.record_hit(attacker, target, real_damage)
+            # XP gain for dealt damage
+            experience += real_damage // 2
+            # If target has less than 0 HP at the end of the attack
+            if target.hit_points <= 0:
+                # XP gain increased
+                if isinstance(attacker, Character) and isinstance(target, Foe):
+                    experience += target.xp_gain
+
+                self.diary_entries.append(f_TARGET_DIED(target))
+                # Loot
+                if isinstance(attacker, Player) and isinstance(target, Foe):
+                    # Check if foe dropped an item
+                    loot: Sequence[Item] = target.roll_for_loot()
+                    for item in loot:
+                        self.diary_entries.append(f_TARGET_DROPPED_ITEM(target, item))
+                        self.battle_statistics.record_loot(item)
+                        if isinstance(item, Gold):
+                            attacker.gold += item.amount
+                        elif not attacker.set_item(item):
+                            self.diary_entries.append(
+                                STR_BUT_THERE_IS_NOT_ENOUGH_SPACE_IN_INVENTORY_TO_TAKE_IT
+                            )
+                self.remove_entity(target)
+            else:
+                self.diary_entries.append(
+                    f_TARGET_HAS_NOW_NUMBER_HP(target, target.hit_points)
+                )
+                # Check if a side effect is applied to target
+                if isinstance(attacker, Character):
+                    weapon: Weapon = attacker.get_weapon()
+                    if weapon:
+                        applied_effects: Sequence[Effect] = weapon.apply_effects(
+                            attacker, target
+                        )
+                        for effect in applied_effects:
+                            _, message = effect.apply_on_ent(target)
+                            self.diary_entries.append(message)
+
+            # XP gain
+            if isinstance(attacker, Player):
+                self.diary_entries.append(
+                    f_ATTACKER_EARNED_NUMBER_XP(attacker, experience)
+                )
+                self.battle_statistics.record_experience(experience)
+                if attacker.earn_xp(experience):
+                    # Attacker gained a level
+                    self.diary_entries.append(f_ATTACKER_GAINED_A_LEVEL(attacker))
+
+            if target.hit_points <= 0:
+                # Target is dead, no more attack needed.
+                break
+        while len(self.diary_entries) > DIARY_MAX_ENTRIES:
+            self.diary_entries.pop(0)
+
+    def process_entity_action(self, entity: Movable, is_ally: bool) -> None:
+        """
+        Compute the action of a non-playable entity (AI).
+        The action planned for the entity at the beginning of the turn of its side is played back,
+        the side is planned again if the plan has been dropped in the meantime.
+
+        Keyword arguments:
+        entity -- the entity for which the action should be computed
+        is_ally -- a boolean indicating if the entity is an ally or not
+        """
+        targets: Sequence[Movable] = (
+            self.entities.foes if is_ally else self.players + self.entities.allies
+        )
+        if entity not in self.side_plan and entity.state is EntityState.HAVE_TO_ACT:
+            # The plan may still be in progress
+            self.ai_scheduler.run_until_idle()
+            if entity not in self.side_plan:
+                if entity.strategy is EntityStrategy.LOOKAHEAD:
+                    self.schedule_lookahead_action(entity, is_ally)
+                    self.ai_scheduler.run_until_idle()
+                else:
+                    self.plan_side_turn(is_ally)
+        action: Optional[PlannedAction] = self.side_plan.get(entity)
+        if action is not None:
+            self.play_planned_action(entity, action, targets)
+        else:
+            self.compute_entity_action(entity, targets)
+
+    def plan_side_turn(self, is_ally: bool) -> None:
+        """
+        Plan the actions of all the entities of a side controlled by the AI
+        that did not act yet during the current turn, from the current state of the level.
+
+        Keyword arguments:
+        is_ally -- a boolean indicating if the side is the allies one or the foes one
+        """
+        self.schedule_side_turn_plan(is_ally)
+        self.ai_scheduler.run_until_idle()
+
+    def schedule_side_turn_plan(self, is_ally: bool) -> None:
+        """
+        Schedule the planning of the actions of all the entities of a side controlled by the AI
+        that did not act yet during the current turn.
+        The current state of the level is captured immediately, while the actions are planned
+        one after the other by the AI scheduler during the next frames.
+
+        Keyword arguments:
+        is_ally -- a boolean indicating if the side is the allies one or the foes one
+        """
+        entities: Sequence[Movable] = (
+            self.entities.allies if is_ally else self.entities.foes
+        )
+        targets: Sequence[Movable] = (
+            self.entities.foes if is_ally else self.players + self.entities.allies
+        )
+        # The entities following the lookahead strategy search their action when their turn comes
+        agents: list[Movable] = [
+            entity
+            for entity in entities
+            if entity.state is EntityState.HAVE_TO_ACT
+            and entity.strategy is not EntityStrategy.LOOKAHEAD
+        ]
+        grid: WalkabilityGrid = self.walkability_grid
+        planner: Union[SideTurnPlanner, ParallelSideTurnPlanner] = SideTurnPlanner(grid)
+        if self.ai_workers > 0 and len(agents) >= AI_WORKERS_MIN_ENTITIES:
+            planner = ParallelSideTurnPlanner(
+                grid,
+                get_executor(self.ai_workers),
+                # Several chunks by worker to balance their load
+                max(1, len(agents) // (self.ai_workers * 4)),
+            )
+        actions: Iterator[Optional[PlannedAction]] = planner.iter_plan(
+            [
+                AgentSnapshot(
+                    grid.index_of_tile(agent.tile),
+                    agent.max_moves,
+                    tuple(agent.reach),
+                    agent.strategy,
+                )
+                for agent in agents
+            ],
+            [grid.index_of_tile(target.tile) for target in targets],
+        )
+        self.ai_scheduler.schedule(self._build_side_plan(agents, actions))
+
+    def _build_side_plan(
+        self, agents: Sequence[Movable], actions: Iterator[Optional[PlannedAction]]
+    ) -> Iterator[None]:
+        side_plan: dict[Movable, PlannedAction] = {}
+        remaining_agents: Iterator[Movable] = iter(agents)
+        for action in actions:
+            # Nothing is planned while waiting for worker processes
+            if action is not None:
+                side_plan[next(remaining_agents)] = action
+            yield
+        self.side_plan = side_plan
+
+    def schedule_lookahead_action(self, entity: Movable, is_ally: bool) -> None:
+        """
+        Schedule the search of the action of an entity following the lookahead strategy.
+        The current state of the level is captured immediately, while the search is resumed
+        by the AI scheduler during the next frames until its own time budget is spent.
+        The actions planned for the other entities of the side are dropped if the entity moves,
+        since they have been planned with the entity standing on its tile.
+
+        Keyword arguments:
+        entity -- the entity that should act
+        is_ally -- a boolean indicating if the entity is an ally or not
+        """
+        targets: Sequence[Movable] = (
+            self.entities.foes if is_ally else self.players + self.entities.allies
+        )
+        grid: WalkabilityGrid = self.walkability_grid
+        start: Optional[int] = grid.index_of_tile(entity.tile)
+        opponents: list[int] = [
+            index
+            for index, target in enumerate(targets)
+            if grid.index_of_tile(target.tile) is not None
+        ]
+        if start is None or not opponents:
+            self.side_plan[entity] = PlannedAction((), None, None)
+            return
+        units: list[BoardUnit] = [
+            BoardUnit(
+                start,
+                entity.hit_points,
+                entity.max_moves,
+                tuple(entity.reach),
+                (0.0,)
+                + tuple(
+                    self.forecast_attack(entity, targets[index]).expected_damage
+                    for index in opponents
+                ),
+            )
+        ]
+        for index in opponents:
+            target: Movable = targets[index]
+            units.append(
+                BoardUnit(
+                    grid.index_of_tile(target.tile),
+                    target.hit_points,
+                    target.max_moves,
+                    tuple(target.reach),
+                    (self.forecast_attack(target, entity).expected_damage,)
+                    + (0.0,) * len(opponents),
+                )
+            )
+        self.ai_scheduler.schedule(
+            self._build_lookahead_action(
+                entity, start, LookaheadPlanner(grid, units), opponents
+            )
+        )
+
+    def _build_lookahead_action(
+        self,
+        entity: Movable,
+        start: int,
+        planner: LookaheadPlanner,
+        opponents: Sequence[int],
+    ) -> Iterator[None]:
+        yield from planner.iter_search()
+        path, _, attack = planner.action
+        # The units of the board are the entity followed by its opponents
+        target: Optional[int] = opponents[attack - 1] if attack is not None else None
+        action: PlannedAction = PlannedAction(path, target, target)
+        if path and path[-1] != start:
+            self.side_plan = {entity: action}
+        else:
+            self.side_plan[entity] = action
+
+    def play_planned_action(
+        self, entity: Movable, action: PlannedAction, targets: Sequence[Movable]
+    ) -> None:
+        """
+        Play back the part of the planned action of a non-playable entity (AI)
+        matching its current state.
+
+        Keyword arguments:
+        entity -- the entity that is acting
+        action -- the action planned for the entity
+        targets -- the entities that could be targeted by the entity, as given to the planner
+        """
+        if entity.state is EntityState.HAVE_TO_ACT:
+            entity.target = (
+                targets[action.target] if action.target is not None else None
+            )
+            self.notify_entity_move(entity)
+            entity.set_move(
+                [self.walkability_grid.position_of(tile) for tile in action.path]
+                if action.path
+                else [entity.position]
+            )
+        elif entity.state is EntityState.ON_MOVE:
+            self.move_entity(entity)
+        elif entity.state is EntityState.HAVE_TO_ATTACK:
+            if entity.can_attack() and action.attack is not None:
+                self.duel(
+                    entity,
+                    self.choose_ai_attack_target(
+                        entity, targets[action.attack], targets
+                    ),
+                    targets,
+                    entity.attack_kind,
+                )
+            entity.end_turn()
+
+    def compute_entity_action(
+        self, entity: Movable, targets: Sequence[Movable]
+    ) -> None:
+        """
+        Compute the action of a non-playable entity (AI) matching its current state,
+        without relying on any plan
+
+        Keyword arguments:
+        entity -- the entity for which the action should be computed
+        targets -- the entities that could be targeted by the entity
+        """
+        state: EntityState = entity.state
+        tile: Optional[Position] = entity.act(
+            lambda: self.get_ai_possible_moves(entity),
+            lambda: self.get_ai_targets(entity, targets),
+            lambda target: self.get_ai_path_towards(entity, target),
+        )
+
+        if tile:
+            if state is EntityState.HAVE_TO_ACT:
+                # Entity choose to move to case
+                self.notify_entity_move(entity)
+                entity.set_move(self.get_ai_path_to(entity, tile))
+            else:
+                # Entity choose to attack the entity on the tile
+                entity_attacked = self.choose_ai_attack_target(
+                    entity, self.get_entity_on_tile(tile), targets
+                )
+                self.duel(entity, entity_attacked, targets, entity.attack_kind)
+                entity.end_turn()
+        elif state is EntityState.ON_MOVE:
+            # The entity already made one step while acting
+            while self.instant_moves and entity.on_move:
+                entity.move()
+
+    def forecast_attack(self, attacker: Movable, target: Destroyable) -> DuelForecast:
+        """
+        Return the predicted outcome of an attack of an entity against another,
+        as it would be resolved by a duel on the level in its current state.
+
+        Keyword arguments:
+        attacker -- the entity that would make the attack
+        target -- the target of the attack
+        """
+        target_allies: Sequence[Destroyable] = (
+            self.entities.foes
+            if isinstance(target, Foe)
+            else self.players + self.entities.allies
+        )
+        return forecast_duel(attacker, target, target_allies, attacker.attack_kind)
+
+    def choose_ai_attack_target(
+        self, entity: Movable, target: Movable, targets: Sequence[Movable]
+    ) -> Movable:
+        """
+        Return the entity that an entity controlled by the AI should attack:
+        the chosen target, unless another target at reach is more likely to be killed.
+
+        Keyword arguments:
+        entity -- the entity that is attacking
+        target -- the target chosen by the entity
+        targets -- the entities that could be targeted by the entity
+        """
+        reach_offsets: frozenset[tuple[int, int]] = get_reach_offsets(entity.reach)
+        best_target: Movable = target
+        best_kill_probability: float = self.forecast_attack(
+            entity, target
+        ).kill_probability
+        for other_target in targets:
+            if other_target is target or (
+                other_target.tile.column - entity.tile.column,
+                other_target.tile.row - entity.tile.row,
+            ) not in reach_offsets:
+                continue
+            kill_probability: float = self.forecast_attack(
+                entity, other_target
+            ).kill_probability
+            if kill_probability > best_kill_probability:
+                best_target, best_kill_probability = other_target, kill_probability
+        return best_target
+
+    def notify_entity_move(self, entity: Movable) -> None:
+        """
+        Handle the beginning of the move of an entity controlled by the AI.
+        Nothing is done by the engine itself, the level scene may follow the entity.
+
+        Keyword arguments:
+        entity -- the entity that starts moving
+        """
+        if self.entity_move_callback is not None:
+            self.entity_move_callback(entity)
+
+    def get_ai_possible_moves(self, entity: Movable) -> MoveRange:
+        """
+        Return the possible moves of an entity controlled by the AI for the current turn,
+        only computing them the first time they are requested during the turn
+
+        Keyword arguments:
+        entity -- the entity for which the possible moves should be returned
+        """
+        if entity not in self.ai_possible_moves:
+            self.ai_possible_moves[entity] = self.get_possible_moves(
+                entity.position, entity.max_moves
+            )
+        return self.ai_possible_moves[entity]
+
+    def get_ai_path_towards(self, entity: Movable, target: Entity) -> list[Position]:
+        """
+        Return the part of the shortest path toward a target that an entity controlled by the AI
+        could travel during the current turn.
+        The path leads to a tile from which the target is at reach if there is any,
+        or to the tile getting the closest to the target otherwise.
+
+        Keyword arguments:
+        entity -- the entity that is moving
+        target -- the entity that should be reached
+        """
+        start: Optional[int] = self.walkability_grid.index_of_tile(entity.tile)
+        target_tile: Optional[int] = self.walkability_grid.index_of_tile(target.tile)
+        path: list[Position] = []
+        if start is not None and target_tile is not None:
+            tiles, _ = self.path_finder.find_path(start, target_tile, entity.reach)
+            path = [
+                self.walkability_grid.position_of(tile)
+                for tile in tiles[: entity.max_moves]
+            ]
+        self.ai_paths[entity] = path
+        return path
+
+    def get_ai_path_to(self, entity: Movable, tile: Position) -> list[Position]:
+        """
+        Return the path that an entity controlled by the AI should follow to reach the given tile,
+        reusing the path computed toward its target if it leads there
+
+        Keyword arguments:
+        entity -- the entity that is moving
+        tile -- the destination, that should be part of the possible moves of the entity
+        """
+        path: Optional[list[Position]] = self.ai_paths.get(entity)
+        if path and path[-1] == tile:
+            return path
+        if tile == entity.position:
+            return [tile]
+        return self.determine_path_to(tile, self.get_ai_possible_moves(entity))
+
+    def get_ai_targets(
+        self, entity: Movable, targets: Sequence[Movable]
+    ) -> dict[Entity, int]:
+        """
+        Return the potential targets of an entity controlled by the AI for the current turn
+        with their distance from the entity,
+        only computing them the first time they are requested during the turn
+
+        Keyword arguments:
+        entity -- the entity for which the targets should be returned
+        targets -- all the entities that could be targeted by the entity
+        """
+        if entity not in self.ai_targets:
+            self.ai_targets[entity] = self.distance_between_all(entity, targets)
+        return self.ai_targets[entity]
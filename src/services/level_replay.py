@@ -0,0 +1,180 @@
+"""
+Defines the functions playing again the decisions recorded in a command log on a level engine,
+as fast as possible and without any display, to reproduce and verify a played level.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from lxml import etree
+
+from src.gui.position import Position
+from src.services import load_from_xml_manager as loader
+from src.services.command_log import CommandKind, CommandLog, LevelCommand
+from src.services.level_engine import EntityTurn, LevelEngine, LevelStatus
+from src.services.random_service import RandomService
+from src.services.save_state_manager import SaveStateManager
+
+
+def build_level(command_log: CommandLog) -> LevelEngine:
+    """
+    Return the level in the state it was when the recording of the given command log started,
+    with all its content loaded and in fast-forward mode.
+    The level is not in headless mode by itself, the assets manager should be set accordingly
+    and the game data and fonts should have been initialized.
+
+    Keyword arguments:
+    command_log -- the record of the level
+    """
+    level = LevelEngine(
+        command_log.directory,
+        command_log.level_number,
+        LevelStatus[command_log.status],
+        command_log.turn,
+        etree.fromstring(command_log.data) if command_log.data is not None else None,
+        [
+            loader.load_player(etree.fromstring(player), True)
+            for player in command_log.players
+        ],
+        RandomService(command_log.seed, command_log.get_random_draws()),
+    )
+    level.set_fast_forward(True)
+    level.load_level_content()
+    if level.game_phase is LevelStatus.VERY_BEGINNING:
+        # The dialogs shown before the initialization phase are skipped
+        level.game_phase = LevelStatus.INITIALIZATION
+    return level
+
+
+def _tile(arguments: list[int]) -> Position:
+    return Position(arguments[0], arguments[1])
+
+
+def play_command(level: LevelEngine, command: LevelCommand) -> None:
+    """
+    Apply a recorded decision on the level.
+
+    Raise a ValueError if the decision cannot be applied, the level is then not in the
+    state it was when the decision has been recorded.
+
+    Keyword arguments:
+    level -- the level on which the decision should be applied
+    command -- the decision
+    """
+    kind: CommandKind = command.kind
+    arguments: tuple = command.arguments
+    if kind is CommandKind.START_GAME:
+        level.start_game()
+        return
+    if kind is CommandKind.END_TURN:
+        level.end_turn()
+        return
+    if kind in (CommandKind.BUY_ITEM, CommandKind.SELL_ITEM):
+        shop = level.get_entity_on_tile(_tile(arguments[0]))
+        if kind is CommandKind.BUY_ITEM:
+            level.buy_item(shop, shop.stock[arguments[1]]["item"])
+        else:
+            level.sell_item(shop, shop.current_visitor.items[arguments[1]])
+        return
+
+    player = level.get_player_by_name(arguments[0])
+    handlers: dict[CommandKind, Callable[[], any]] = {
+        CommandKind.PLACE_PLAYER: lambda: level.place_player(
+            player, _tile(arguments[1])
+        ),
+        CommandKind.MOVE: lambda: level.move_player(player, _tile(arguments[1])),
+        CommandKind.CANCEL_MOVE: lambda: level.cancel_player_move(player),
+        CommandKind.ATTACK: lambda: level.player_attack(player, _tile(arguments[1])),
+        CommandKind.OPEN_CHEST: lambda: level.unlock_chest(
+            player, level.get_entity_on_tile(_tile(arguments[1])), arguments[2]
+        ),
+        CommandKind.OPEN_DOOR: lambda: level.unlock_door(
+            player, level.get_entity_on_tile(_tile(arguments[1])), arguments[2]
+        ),
+        CommandKind.TELEPORT: lambda: level.teleport(player, _tile(arguments[1])),
+        CommandKind.DRINK: lambda: level.drink(
+            player, level.get_entity_on_tile(_tile(arguments[1]))
+        ),
+        CommandKind.TALK: lambda: level.talk(
+            player, level.get_entity_on_tile(_tile(arguments[1]))
+        ),
+        CommandKind.VISIT: lambda: level.visit(
+            player, level.get_entity_on_tile(_tile(arguments[1]))
+        ),
+        CommandKind.GIVE_ITEM: lambda: level.give_item(
+            player,
+            level.get_player_by_name(arguments[1]),
+            player.items[arguments[2]],
+        ),
+        CommandKind.GIVE_GOLD: lambda: level.give_gold(
+            player, level.get_player_by_name(arguments[1]), arguments[2]
+        ),
+        CommandKind.USE_ITEM: lambda: level.use_item(
+            player, player.items[arguments[1]]
+        ),
+        CommandKind.EQUIP_ITEM: lambda: level.equip_item(
+            player, player.items[arguments[1]]
+        ),
+        CommandKind.UNEQUIP_ITEM: lambda: level.unequip_item(
+            player, player.equipments[arguments[1]]
+        ),
+        CommandKind.THROW_ITEM: lambda: level.throw_item(
+            player,
+            (player.equipments if arguments[1] else player.items)[arguments[2]],
+        ),
+        CommandKind.TAKE_OBJECTIVE: lambda: level.validate_objective(player),
+        CommandKind.END_PLAYER_TURN: lambda: level.end_player_turn(player),
+    }
+    handlers[kind]()
+
+
+def _is_waiting_for_players(level: LevelEngine) -> bool:
+    return level.side_turn is EntityTurn.PLAYER and any(
+        not player.turn_is_finished() for player in level.players
+    )
+
+
+def replay_level(command_log: CommandLog) -> LevelEngine:
+    """
+    Play again all the decisions of the given command log on a new level
+    and return this level in its final state.
+    Before each decision, the level is updated until the turn during which it has been made,
+    the other sides playing their turns as fast as possible.
+    At the end, the level is updated until the players have to act again or it is over.
+
+    Raise a ValueError if the players have to act before the turn of the next decision is
+    reached, the replay then diverged from the recorded level.
+
+    Keyword arguments:
+    command_log -- the record of the level
+    """
+    level: LevelEngine = build_level(command_log)
+    for command in command_log.commands:
+        while level.turn < command.turn:
+            if _is_waiting_for_players(level):
+                raise ValueError(
+                    f"The players have to act before the turn {command.turn} is reached"
+                )
+            if level.update_state():
+                break
+        play_command(level, command)
+    while not level.update_state() and not _is_waiting_for_players(level):
+        pass
+    return level
+
+
+def verify_replay(command_log: CommandLog) -> bool:
+    """
+    Return whether playing again the decisions of the given command log leads to the
+    state of the level that has been recorded.
+
+    Raise a ValueError if the command log holds no recorded state.
+
+    Keyword arguments:
+    command_log -- the record of the level
+    """
+    if command_log.state_hash is None:
+        raise ValueError("The command log holds no state to verify")
+    level: LevelEngine = replay_level(command_log)
+    return SaveStateManager(level).compute_state_hash() == command_log.state_hash
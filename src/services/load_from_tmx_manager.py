@@ -24,6 +24,7 @@ from src.game_entities.shop import Shop
 from src.gui.position import Position
 from src.services import load_from_xml_manager as xml_loader
 from src.services.global_foes import foes_by_mission, link_foe_to_mission
+from src.services.tile import Tile
 
 objective_tile_by_mission: dict[str, list[Objective]] = {}
 
@@ -31,8 +32,12 @@ objective_tile_by_mission: dict[str, list[Objective]] = {}
 def _get_object_position(
         tile_object: TiledObject, horizontal_gap: int, vertical_gap: int
 ) -> Position:
+    tile = Tile(
+        int(tile_object.x) // tile_object.parent.tilewidth,
+        int(tile_object.y) // tile_object.parent.tileheight,
+    )
     return Position(
-        tile_object.x * 1.5 + horizontal_gap, tile_object.y * 1.5 + vertical_gap
+        tile.column * TILE_SIZE + horizontal_gap, tile.row * TILE_SIZE + vertical_gap
     )
 
 
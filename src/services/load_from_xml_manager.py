@@ -30,6 +30,7 @@ from src.game_entities.weapon import Weapon
 from src.gui.position import Position
 from src.services.language import *
 from src.services.global_foes import link_foe_to_mission
+from src.services.random_service import RandomService, RandomStreamKind
 
 foes_data = {}
 fountains_data = {}
@@ -1107,6 +1108,24 @@ def load_escaped_players(data):
     return players
 
 
+def load_random_service(random_element) -> RandomService:
+    """
+    Load the seed of a level and the position of its random streams from a save.
+
+    Return the random service of the level.
+
+    Keyword arguments:
+    random_element -- the XML element holding the saved random service
+    """
+    seed = int(random_element.find("seed").text.strip())
+    draws = {}
+    for kind in RandomStreamKind:
+        draws_element = random_element.find("draws/" + kind.value)
+        if draws_element is not None:
+            draws[kind] = int(draws_element.text.strip())
+    return RandomService(seed, draws)
+
+
 def init_player(name):
     """
 
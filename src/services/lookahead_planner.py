@@ -0,0 +1,474 @@
+"""
+Defines LookaheadPlanner class, the search of the best action of an entity controlled by the AI
+over the next few actions of the entity and of its opponents,
+and the BoardUnit record describing the entities it works with.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Generator, Iterator, Sequence
+from enum import Enum, auto
+from typing import NamedTuple, Optional
+
+from src.constants import (LOOKAHEAD_DEPTH, LOOKAHEAD_MAX_NODES,
+                           LOOKAHEAD_TIME_BUDGET)
+from src.services.reach_offsets import get_reach_offsets
+from src.services.side_turn_planner import PlannedAction
+from src.services.walkability_grid import WalkabilityGrid
+
+# Seed of the keys hashing the positions, they are not drawn from the random service of the game
+ZOBRIST_SEED = 0
+# Value of an entity being alive, on top of its hit points
+ALIVE_VALUE = 100.0
+# Value of each tile between the searching entity and its closest opponent,
+# so that it gets closer to them when no attack is at hand
+DISTANCE_VALUE = 0.1
+# Number of positions searched during a step of the search, between two checks of the time budget
+BUDGET_CHECK_INTERVAL = 16
+
+
+class BoardUnit(NamedTuple):
+    """
+    The data about an entity needed to foresee its actions during a search.
+
+    Attributes:
+    tile -- the index of the tile of the entity
+    hit_points -- the current hit points of the entity
+    max_moves -- the maximum number of tiles the entity could travel in a turn
+    reach -- the distances in tiles from which the entity can attack
+    damage -- the expected damage dealt by an attack of the entity against each unit of the board,
+    by index of unit
+    """
+
+    tile: int
+    hit_points: float
+    max_moves: int
+    reach: tuple[int, ...]
+    damage: tuple[float, ...]
+
+
+class _Bound(Enum):
+    EXACT = auto()
+    LOWER = auto()
+    UPPER = auto()
+
+
+# The unit that is acting, its destination and the unit it attacks if any
+_Move = tuple[int, int, Optional[int]]
+
+
+class _TableEntry(NamedTuple):
+    depth: int
+    value: float
+    bound: _Bound
+    moves: list[Optional[_Move]]
+
+
+class _SearchInterrupted(Exception):
+    pass
+
+
+class LookaheadPlanner:
+    """
+    A LookaheadPlanner chooses the action of an entity by searching the possible sequences of
+    actions of the entity and of its opponents a few plies ahead, on a lightweight model of
+    the board: the tiles and hit points of the entities, and the damage they deal to each other.
+    The entity and its opponents take turns, each reply of the opponents being the most harmful
+    action of one of them, and the attacks deal their expected damage.
+    The positions at the end of the search are valued by the hit points of the entities alive.
+
+    The search is a minimax with alpha-beta pruning, deepened one ply at a time until the maximum
+    depth is reached or the budget is spent, in which case the best action found by the last
+    complete search is kept.
+    The budget is a number of positions, so that the action chosen does not depend on the speed
+    of the machine. The time budget is only a safety net for slow machines.
+    Each position is identified by a Zobrist hash updated incrementally with the moves.
+    A transposition table keeps the value and the moves of the positions already searched,
+    the best one first, so that the best moves of the previous deepening are searched first.
+    Since the attacks are already searched first and transpositions are rare within a few plies,
+    the table only spares a few percent of the positions: the pruning is what keeps the search
+    within its budget.
+
+    A planner works on its own copy of the walkability grid and should only be used once.
+
+    Keyword arguments:
+    walkability_grid -- the grid of tiles that can be crossed, the tiles of the units being blocked
+    units -- the entities on the board, the first one being the entity that is searching its action
+    and the other ones its opponents
+    max_depth -- the maximum number of plies searched
+    time_budget -- the maximum time in seconds spent on the search, it should not be reached
+    before the maximum number of positions
+    max_nodes -- the maximum number of positions searched
+
+    Attributes:
+    walkability_grid -- the copy of the grid on which the units are moved during the search
+    units -- the entities on the board as they were at the beginning of the search
+    max_depth -- the maximum number of plies searched
+    time_budget -- the maximum time in seconds spent on the search
+    max_nodes -- the maximum number of positions searched
+    tiles -- the current tile of each unit during the search
+    hit_points -- the current hit points of each unit during the search
+    hash -- the Zobrist hash of the current position
+    tiles_hash -- the Zobrist hash of the tiles of the units alive in the current position
+    transposition_table -- the value and best move of the positions already searched, by hash
+    nodes -- the number of positions searched
+    search_time -- the time in seconds spent on the search
+    depth -- the depth of the last complete search
+    action -- the action chosen for the entity, with indices of units as targets,
+    None while the search is not over
+    """
+
+    def __init__(
+        self,
+        walkability_grid: WalkabilityGrid,
+        units: Sequence[BoardUnit],
+        max_depth: int = LOOKAHEAD_DEPTH,
+        time_budget: float = LOOKAHEAD_TIME_BUDGET,
+        max_nodes: int = LOOKAHEAD_MAX_NODES,
+    ) -> None:
+        self.walkability_grid: WalkabilityGrid = walkability_grid.copy()
+        self._initial_blocked: bytes = bytes(walkability_grid.blocked)
+        self.units: tuple[BoardUnit, ...] = tuple(units)
+        self.max_depth: int = max_depth
+        self.time_budget: float = time_budget
+        self.max_nodes: int = max_nodes
+        self.tiles: list[int] = [unit.tile for unit in self.units]
+        self.hit_points: list[float] = [unit.hit_points for unit in self.units]
+        self.transposition_table: dict[int, _TableEntry] = {}
+        self.nodes: int = 0
+        self.search_time: float = 0.0
+        self.depth: int = 0
+        self.action: Optional[PlannedAction] = None
+        self._resumed_at: float = 0.0
+
+        self._random: random.Random = random.Random(ZOBRIST_SEED)
+        size: int = walkability_grid.width * walkability_grid.height
+        self._tile_keys: list[list[int]] = [
+            [self._random.getrandbits(64) for _ in range(size)] for _ in self.units
+        ]
+        self._hit_points_keys: dict[tuple[int, float], int] = {}
+        self._attack_tiles: dict[tuple[int, tuple[int, ...]], tuple[int, ...]] = {}
+        self._opponents_turn_key: int = self._random.getrandbits(64)
+        self._reachable_tiles: dict[tuple[int, int], dict[int, int]] = {}
+        self.tiles_hash: int = 0
+        self.hash: int = 0
+        for unit, tile in enumerate(self.tiles):
+            self.tiles_hash ^= self._tile_keys[unit][tile]
+            self.hash ^= self._get_hit_points_key(unit, self.hit_points[unit])
+        self.hash ^= self.tiles_hash
+
+    def _get_hit_points_key(self, unit: int, hit_points: float) -> int:
+        # Hit points can take any value, their keys are drawn the first time they are met
+        key: Optional[int] = self._hit_points_keys.get((unit, hit_points))
+        if key is None:
+            key = self._random.getrandbits(64)
+            self._hit_points_keys[unit, hit_points] = key
+        return key
+
+    def iter_search(self) -> Iterator[None]:
+        """
+        Return a generator searching the action of the entity, a few positions at a time
+        each time it is resumed.
+        The time spent between two steps is not taken from the time budget.
+        The chosen action is available in the action attribute once the generator is exhausted.
+        """
+        self._resumed_at = time.perf_counter()
+        moves: list[_Move] = self._get_moves(True)
+        best_move: _Move = moves[0]
+        try:
+            for depth in range(1, self.max_depth + 1):
+                # The best move of the previous search is searched first
+                moves.remove(best_move)
+                moves.insert(0, best_move)
+                alpha: float = -float("inf")
+                depth_best_move: _Move = best_move
+                for move in moves:
+                    undo: tuple[int, float] = self._make(move)
+                    value: float = yield from self._search(
+                        depth - 1, alpha, float("inf"), False
+                    )
+                    self._unmake(move, undo)
+                    if value > alpha:
+                        alpha = value
+                        depth_best_move = move
+                best_move = depth_best_move
+                self.depth = depth
+        except _SearchInterrupted:
+            pass
+        self.search_time += time.perf_counter() - self._resumed_at
+        self.action = self._to_action(best_move)
+
+    def search(self) -> PlannedAction:
+        """
+        Return the action chosen for the entity, with indices of units as targets,
+        searching it at once.
+        """
+        for _ in self.iter_search():
+            pass
+        return self.action
+
+    def _to_action(self, move: _Move) -> PlannedAction:
+        start: int = self.units[0].tile
+        _, destination, target = move
+        path: list[int] = []
+        if destination != start:
+            predecessors: dict[int, int] = {}
+            grid: WalkabilityGrid = self.walkability_grid
+            # The board is restored on the grid since the search may have been interrupted
+            grid.blocked[:] = self._initial_blocked
+            grid.reachable_tiles(start, self.units[0].max_moves, predecessors)
+            tile: int = destination
+            while tile != start:
+                path.append(tile)
+                tile = predecessors[tile]
+            path.reverse()
+        return PlannedAction(tuple(path), target, target)
+
+    def _end_step(self) -> Iterator[None]:
+        # The time spent until the search is resumed is not taken from the time budget
+        resumed_at: float = time.perf_counter()
+        self.search_time += resumed_at - self._resumed_at
+        self._resumed_at = resumed_at
+        if self.search_time >= self.time_budget:
+            raise _SearchInterrupted()
+        yield
+        self._resumed_at = time.perf_counter()
+
+    def _search(
+        self, depth: int, alpha: float, beta: float, is_entity_turn: bool
+    ) -> Generator[None, None, float]:
+        self.nodes += 1
+        if self.nodes >= self.max_nodes:
+            raise _SearchInterrupted()
+        if self.nodes % BUDGET_CHECK_INTERVAL == 0:
+            yield from self._end_step()
+        hit_points: list[float] = self.hit_points
+        if (
+            depth == 0
+            or hit_points[0] <= 0
+            or not any(value > 0 for value in hit_points[1:])
+        ):
+            return self.evaluate()
+
+        entry: Optional[_TableEntry] = self.transposition_table.get(self.hash)
+        moves: list[Optional[_Move]]
+        if entry is not None:
+            if entry.depth >= depth:
+                if entry.bound is _Bound.EXACT:
+                    return entry.value
+                if entry.bound is _Bound.LOWER:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
+                if alpha >= beta:
+                    return entry.value
+            # The moves of a position are only generated once, the best one being searched first
+            moves = entry.moves
+        else:
+            moves = self._get_moves(is_entity_turn)
+        initial_alpha: float = alpha
+        initial_beta: float = beta
+        best_value: float = -float("inf") if is_entity_turn else float("inf")
+        best_move: Optional[_Move] = None
+        for move in moves:
+            undo: tuple[int, float] = self._make(move)
+            value: float = yield from self._search(
+                depth - 1, alpha, beta, not is_entity_turn
+            )
+            self._unmake(move, undo)
+            if is_entity_turn:
+                if value > best_value:
+                    best_value, best_move = value, move
+                alpha = max(alpha, value)
+            else:
+                if value < best_value:
+                    best_value, best_move = value, move
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+
+        bound: _Bound = _Bound.EXACT
+        if best_value <= initial_alpha:
+            bound = _Bound.UPPER
+        elif best_value >= initial_beta:
+            bound = _Bound.LOWER
+        if best_move is not moves[0]:
+            moves = moves.copy()
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+        self.transposition_table[self.hash] = _TableEntry(
+            depth, best_value, bound, moves
+        )
+        return best_value
+
+    def evaluate(self) -> float:
+        """
+        Return the value of the current position for the entity:
+        the value of the entity being alive and its hit points, minus those of its opponents,
+        and minus a small value for each tile separating the entity from its closest opponent.
+        """
+        hit_points: list[float] = self.hit_points
+        value: float = ALIVE_VALUE + hit_points[0] if hit_points[0] > 0 else 0.0
+        width: int = self.walkability_grid.width
+        column, row = self.tiles[0] % width, self.tiles[0] // width
+        closest_distance: Optional[int] = None
+        for unit in range(1, len(self.units)):
+            if hit_points[unit] > 0:
+                value -= ALIVE_VALUE + hit_points[unit]
+                tile: int = self.tiles[unit]
+                distance: int = abs(tile % width - column) + abs(tile // width - row)
+                if closest_distance is None or distance < closest_distance:
+                    closest_distance = distance
+        if closest_distance is not None:
+            value -= DISTANCE_VALUE * closest_distance
+        return value
+
+    def _get_moves(self, is_entity_turn: bool) -> list[Optional[_Move]]:
+        # The moves of the entity or the attacks of its opponents against it, the most damaging
+        # first: an attack is always made when there is one at hand from the destination
+        hit_points: list[float] = self.hit_points
+        width: int = self.walkability_grid.width
+        moves: list[tuple[float, int, _Move]] = []
+        acting_units: Sequence[int] = (
+            (0,)
+            if is_entity_turn
+            else [unit for unit in range(1, len(self.units)) if hit_points[unit] > 0]
+        )
+        for unit in acting_units:
+            board_unit: BoardUnit = self.units[unit]
+            targets: list[tuple[int, int, int]] = [
+                (target, self.tiles[target] % width, self.tiles[target] // width)
+                for target in (range(1, len(self.units)) if is_entity_turn else (0,))
+                if hit_points[target] > 0
+            ]
+            if not is_entity_turn and not self._may_attack(board_unit, unit, targets):
+                continue
+            destinations: dict[int, int] = self._get_reachable_tiles(unit)
+            attack_destinations: set[int] = set()
+            for target, _, _ in targets:
+                damage: float = min(board_unit.damage[target], hit_points[target])
+                priority: float = -damage - (
+                    ALIVE_VALUE if damage >= hit_points[target] else 0.0
+                )
+                for destination in self._get_attack_tiles(
+                    self.tiles[target], board_unit.reach
+                ):
+                    if destination in destinations:
+                        attack_destinations.add(destination)
+                        moves.append(
+                            (priority, len(moves), (unit, destination, target))
+                        )
+            if is_entity_turn:
+                moves.extend(
+                    (0.0, len(moves) + rank, (unit, destination, None))
+                    for rank, destination in enumerate(
+                        destination
+                        for destination in destinations
+                        if destination not in attack_destinations
+                    )
+                )
+        if not moves:
+            # None of the opponents can harm the entity, they pass
+            return [None]
+        moves.sort()
+        return [move for _, _, move in moves]
+
+    def _get_reachable_tiles(self, unit: int) -> dict[int, int]:
+        # The tiles reached by a unit only depend on the tiles of the units alive,
+        # whatever their hit points
+        reachable_tiles: Optional[dict[int, int]] = self._reachable_tiles.get(
+            (unit, self.tiles_hash)
+        )
+        if reachable_tiles is None:
+            reachable_tiles = self.walkability_grid.reachable_tiles(
+                self.tiles[unit], self.units[unit].max_moves
+            )
+            self._reachable_tiles[unit, self.tiles_hash] = reachable_tiles
+        return reachable_tiles
+
+    def _get_attack_tiles(self, tile: int, reach: tuple[int, ...]) -> tuple[int, ...]:
+        # The tiles from which a tile is at reach only depend on the map, they are computed once
+        attack_tiles: Optional[tuple[int, ...]] = self._attack_tiles.get((tile, reach))
+        if attack_tiles is None:
+            width: int = self.walkability_grid.width
+            height: int = self.walkability_grid.height
+            column, row = tile % width, tile // width
+            attack_tiles = tuple(
+                sorted(
+                    (row + row_offset) * width + column + column_offset
+                    for column_offset, row_offset in get_reach_offsets(reach)
+                    if 0 <= column + column_offset < width
+                    and 0 <= row + row_offset < height
+                )
+            )
+            self._attack_tiles[tile, reach] = attack_tiles
+        return attack_tiles
+
+    def _may_attack(
+        self, board_unit: BoardUnit, unit: int, targets: Sequence[tuple[int, int, int]]
+    ) -> bool:
+        # An opponent too far away to attack the entity this turn is not searched
+        width: int = self.walkability_grid.width
+        tile: int = self.tiles[unit]
+        column, row = tile % width, tile // width
+        max_distance: int = board_unit.max_moves + max(board_unit.reach, default=0)
+        return any(
+            abs(target_column - column) + abs(target_row - row) <= max_distance
+            for _, target_column, target_row in targets
+        )
+
+    def _make(self, move: Optional[_Move]) -> tuple[int, float]:
+        self.hash ^= self._opponents_turn_key
+        if move is None:
+            return -1, 0.0
+        unit, destination, target = move
+        origin: int = self.tiles[unit]
+        blocked: bytearray = self.walkability_grid.blocked
+        if destination != origin:
+            blocked[origin] = False
+            blocked[destination] = True
+            self.tiles[unit] = destination
+            tile_keys: list[int] = self._tile_keys[unit]
+            self.tiles_hash ^= tile_keys[origin] ^ tile_keys[destination]
+            self.hash ^= tile_keys[origin] ^ tile_keys[destination]
+        previous_hit_points: float = 0.0
+        if target is not None:
+            previous_hit_points = self.hit_points[target]
+            hit_points: float = max(
+                previous_hit_points - self.units[unit].damage[target], 0.0
+            )
+            self.hit_points[target] = hit_points
+            self.hash ^= self._get_hit_points_key(
+                target, previous_hit_points
+            ) ^ self._get_hit_points_key(target, hit_points)
+            if hit_points <= 0:
+                # A dead entity frees its tile
+                blocked[self.tiles[target]] = False
+                self.tiles_hash ^= self._tile_keys[target][self.tiles[target]]
+        return origin, previous_hit_points
+
+    def _unmake(self, move: Optional[_Move], undo: tuple[int, float]) -> None:
+        self.hash ^= self._opponents_turn_key
+        if move is None:
+            return
+        unit, destination, target = move
+        origin, previous_hit_points = undo
+        blocked: bytearray = self.walkability_grid.blocked
+        if target is not None:
+            hit_points: float = self.hit_points[target]
+            if hit_points <= 0:
+                blocked[self.tiles[target]] = True
+                self.tiles_hash ^= self._tile_keys[target][self.tiles[target]]
+            self.hit_points[target] = previous_hit_points
+            self.hash ^= self._get_hit_points_key(
+                target, hit_points
+            ) ^ self._get_hit_points_key(target, previous_hit_points)
+        if destination != origin:
+            blocked[destination] = False
+            blocked[origin] = True
+            self.tiles[unit] = origin
+            tile_keys: list[int] = self._tile_keys[unit]
+            self.tiles_hash ^= tile_keys[origin] ^ tile_keys[destination]
+            self.hash ^= tile_keys[origin] ^ tile_keys[destination]
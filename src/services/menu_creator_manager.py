@@ -1351,6 +1351,28 @@ def create_options_menu(
                     lambda value: modify_option_function("screen_size", value),
                 ),
             ],
+            [
+                load_parameter_button(
+                    STR_FAST_FORWARD_,
+                    [
+                        {"label": STR_OFF, "value": 0},
+                        {"label": STR_ON, "value": 1},
+                    ],
+                    parameters["fast_forward"],
+                    lambda value: modify_option_function("fast_forward", value),
+                ),
+            ],
+            [
+                load_parameter_button(
+                    STR_RECORD_COMMAND_LOGS_,
+                    [
+                        {"label": STR_OFF, "value": 0},
+                        {"label": STR_ON, "value": 1},
+                    ],
+                    parameters["record_command_logs"],
+                    lambda value: modify_option_function("record_command_logs", value),
+                ),
+            ],
         ],
         width=START_MENU_WIDTH,
     )
@@ -0,0 +1,62 @@
+"""
+Defines MoveRange class, the tiles that can be reached by an entity
+together with the way to reach each of them.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from src.gui.position import Position
+
+
+class MoveRange(dict):
+    """
+    A MoveRange maps each tile that can be reached from a starting tile to the number of moves
+    needed to reach it, just like a regular dictionary.
+
+    It also remembers from which tile each tile has been entered during the search,
+    so that the path to any tile of the range can be rebuilt by walking back to the start
+    without searching the level again.
+
+    Keyword arguments:
+    distances -- the number of moves needed to reach each tile
+    predecessors -- the tile from which each tile has been reached, except the starting tile
+
+    Attributes:
+    predecessors -- the tile from which each tile has been reached, except the starting tile
+    """
+
+    def __init__(
+        self,
+        distances: Optional[dict[Position, int]] = None,
+        predecessors: Optional[dict[Position, Position]] = None,
+    ) -> None:
+        super().__init__(distances if distances is not None else {})
+        self.predecessors: dict[Position, Position] = (
+            predecessors if predecessors is not None else {}
+        )
+
+    def clear(self) -> None:
+        """
+        Remove all the tiles of the range.
+        """
+        super().clear()
+        self.predecessors.clear()
+
+    def path_to(self, destination_tile: Position) -> list[Position]:
+        """
+        Return the ordered list of tiles that should be crossed to go from the starting tile
+        to the given one, the starting tile excluded.
+        The destination tile alone is returned if it is the starting tile.
+
+        Keyword arguments:
+        destination_tile -- the position of the destination, that should be part of the range
+        """
+        path: list[Position] = [destination_tile]
+        current_tile: Optional[Position] = self.predecessors.get(destination_tile)
+        while current_tile is not None and current_tile in self.predecessors:
+            path.append(current_tile)
+            current_tile = self.predecessors[current_tile]
+        path.reverse()
+        return path
@@ -0,0 +1,181 @@
+"""
+Defines OccupancyIndex class, the spatial index keeping track of which entities
+are standing on each tile of a level.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from src.game_entities.entity import Entity
+from src.game_entities.objective import Objective
+from src.gui.position import Position
+from src.services.tile import Tile
+from src.services.walkability_grid import WalkabilityGrid
+
+if TYPE_CHECKING:
+    from src.services.level_engine import LevelEntityCollections
+
+
+class OccupancyIndex:
+    """
+    An OccupancyIndex maps each occupied tile of a level to the entities standing on it,
+    so that finding what is on a tile does not require to go through every entity of the level.
+
+    Indexed entities notify the index whenever their position changes,
+    the index is then kept up-to-date without any action from the level.
+
+    When several entities are sharing the same tile (e.g. a player on a walkable objective),
+    the one belonging to the first collection of the level is returned by lookups,
+    following the order of the level entity collections.
+
+    The index also keeps the walkability grid of the level in sync: a tile is blocked as soon as
+    an entity that is not a walkable objective stands on it.
+
+    Keyword arguments:
+    entities -- the collections of entities of the level that should be indexed
+    walkability_grid -- the grid of blocked tiles that should be kept up-to-date if there is any
+
+    Attributes:
+    entities -- the collections of entities of the level that are indexed
+    walkability_grid -- the grid of blocked tiles kept up-to-date if there is any
+    version -- the counter incremented each time an entity is placed on or removed from a tile,
+    used by other services to know when the data they derived from the occupancy is outdated
+    _entities_by_tile -- the entities standing on each occupied tile, sorted by collection order
+    _rank_by_entity -- the rank of the collection of each indexed entity, by entity identity
+    """
+
+    def __init__(
+        self,
+        entities: Optional[LevelEntityCollections] = None,
+        walkability_grid: Optional[WalkabilityGrid] = None,
+    ) -> None:
+        self.entities: Optional[LevelEntityCollections] = entities
+        self.walkability_grid: Optional[WalkabilityGrid] = walkability_grid
+        self.version: int = 0
+        self._entities_by_tile: dict[Tile, list[Entity]] = {}
+        self._rank_by_entity: dict[int, int] = {}
+        if entities is not None:
+            self.rebuild(entities)
+
+    @staticmethod
+    def _tile_key(position: Position) -> Tile:
+        return Tile.from_position(position)
+
+    def rebuild(self, entities: LevelEntityCollections) -> None:
+        """
+        Index again all the entities of the given collections from scratch.
+
+        Keyword arguments:
+        entities -- the collections of entities of the level that should be indexed
+        """
+        self.clear()
+        self.entities = entities
+        for rank, collection in enumerate(entities.values()):
+            for entity in collection:
+                self._insert(entity, rank)
+
+    def clear(self) -> None:
+        """
+        Stop tracking every indexed entity.
+        """
+        for entities_on_tile in self._entities_by_tile.values():
+            for entity in entities_on_tile:
+                entity.on_position_change = None
+        self._entities_by_tile.clear()
+        self._rank_by_entity.clear()
+        self.version += 1
+        if self.walkability_grid is not None:
+            self.walkability_grid.clear()
+
+    def add(self, entity: Entity) -> None:
+        """
+        Start tracking an entity that just joined one of the indexed collections.
+
+        Keyword arguments:
+        entity -- the entity that should be indexed
+        """
+        if id(entity) in self._rank_by_entity:
+            return
+        rank: int = 0
+        if self.entities is not None:
+            collections = list(self.entities.values())
+            rank = next(
+                (
+                    collection_rank
+                    for collection_rank, collection in enumerate(collections)
+                    if any(element is entity for element in collection)
+                ),
+                len(collections),
+            )
+        self._insert(entity, rank)
+
+    def remove(self, entity: Entity) -> None:
+        """
+        Stop tracking an entity that is leaving the level.
+
+        Keyword arguments:
+        entity -- the entity that should not be indexed anymore
+        """
+        if self._rank_by_entity.pop(id(entity), None) is None:
+            return
+        self._discard(entity, entity.position)
+        entity.on_position_change = None
+
+    def get_entity(self, tile: Position) -> Optional[Entity]:
+        """
+        Return the entity that is on the given tile if there is any.
+
+        Keyword arguments:
+        tile -- the position of the tile
+        """
+        entities_on_tile = self._entities_by_tile.get(self._tile_key(tile))
+        return entities_on_tile[0] if entities_on_tile else None
+
+    def _insert(self, entity: Entity, rank: int) -> None:
+        self._rank_by_entity[id(entity)] = rank
+        self._place(entity, entity.position)
+        entity.on_position_change = self._on_entity_moved
+
+    def _place(self, entity: Entity, position: Position) -> None:
+        entities_on_tile = self._entities_by_tile.setdefault(
+            self._tile_key(position), []
+        )
+        rank = self._rank_by_entity[id(entity)]
+        index = 0
+        while (
+            index < len(entities_on_tile)
+            and self._rank_by_entity[id(entities_on_tile[index])] <= rank
+        ):
+            index += 1
+        entities_on_tile.insert(index, entity)
+        self.version += 1
+        self._refresh_walkability(position, entities_on_tile)
+
+    def _discard(self, entity: Entity, position: Position) -> None:
+        key = self._tile_key(position)
+        entities_on_tile = self._entities_by_tile.get(key, [])
+        for index, element in enumerate(entities_on_tile):
+            if element is entity:
+                del entities_on_tile[index]
+                break
+        if not entities_on_tile:
+            self._entities_by_tile.pop(key, None)
+        self.version += 1
+        self._refresh_walkability(position, entities_on_tile)
+
+    def _refresh_walkability(
+        self, position: Position, entities_on_tile: list[Entity]
+    ) -> None:
+        if self.walkability_grid is not None:
+            self.walkability_grid.set_blocked(
+                position,
+                any(
+                    not (isinstance(entity, Objective) and entity.is_walkable)
+                    for entity in entities_on_tile
+                ),
+            )
+
+    def _on_entity_moved(self, entity: Entity, previous_position: Position) -> None:
+        self._discard(entity, previous_position)
+        self._place(entity, entity.position)
@@ -0,0 +1,240 @@
+"""
+Defines ParallelSideTurnPlanner class, the planner evaluating the decisions of the entities
+of a large side controlled by the AI in worker processes, and the BoardSnapshot record
+sent to the workers.
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, wait
+from typing import NamedTuple, Optional
+
+from src.constants import AI_FRAME_BUDGET, AI_WORKERS_TIMEOUT
+from src.services.side_turn_planner import (AgentSnapshot, PlannedAction,
+                                            SideTurnPlanner)
+from src.services.walkability_grid import WalkabilityGrid
+
+
+class BoardSnapshot(NamedTuple):
+    """
+    The state of the board needed by a worker process to evaluate the decisions of entities,
+    made only of plain data so it can be sent to another process.
+
+    Attributes:
+    width -- the number of tiles on a row of the map
+    height -- the number of tiles on a column of the map
+    blocked -- the flat grid of tiles, non-zero values are tiles that cannot be crossed
+    targets -- the index of the tile of each entity that could be attacked,
+    None if it is outside the map
+    """
+
+    width: int
+    height: int
+    blocked: bytes
+    targets: tuple[Optional[int], ...]
+
+
+def evaluate_agents(
+    snapshot: BoardSnapshot, agents: Sequence[AgentSnapshot]
+) -> list[tuple[PlannedAction, Optional[frozenset[int]]]]:
+    """
+    Return the action each of the given entities would take on the given board if it was the
+    first one to act, along with the tiles read to take the decision.
+    This is the function run by the worker processes.
+
+    Keyword arguments:
+    snapshot -- the board on which the decisions are taken
+    agents -- the entities for which the decision should be taken
+    """
+    grid: WalkabilityGrid = WalkabilityGrid(0, 0, snapshot.width, snapshot.height)
+    grid.blocked[:] = snapshot.blocked
+    planner: SideTurnPlanner = SideTurnPlanner(grid)
+    return [
+        (planner.decide(agent, snapshot.targets), planner.get_footprint(agent))
+        for agent in agents
+    ]
+
+
+executors: dict[int, ProcessPoolExecutor] = {}
+
+
+def create_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Return a new pool of worker processes with the given size.
+    The workers are started from a fresh interpreter rather than forked,
+    since forking a process already running pygame threads may leave the workers deadlocked.
+
+    Keyword arguments:
+    workers -- the number of worker processes
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Return the pool of worker processes with the given size,
+    created the first time it is requested and shared afterwards until the game exits.
+
+    Keyword arguments:
+    workers -- the number of worker processes
+    """
+    if workers not in executors:
+        executors[workers] = create_executor(workers)
+    return executors[workers]
+
+
+@atexit.register
+def shutdown_executors() -> None:
+    """
+    Stop the worker processes of all the shared pools.
+    """
+    for executor in executors.values():
+        executor.shutdown(cancel_futures=True)
+    executors.clear()
+
+
+class ParallelSideTurnPlanner:
+    """
+    A ParallelSideTurnPlanner plans the turn of a side controlled by the AI with the same result
+    as a SideTurnPlanner, but spreads the evaluation of the decisions over worker processes.
+
+    Workers take the decision of each entity on the board as it was at the beginning of the turn.
+    Decisions are then applied in the order in which the entities act: a decision is kept
+    if none of the tiles read to take it changed because of the moves of the previous entities,
+    otherwise it is taken again in the current process on the board as currently planned.
+    Decisions of entities looking for targets on the whole map (ACTIVE strategy) can therefore
+    only be reused until the first entity moves.
+
+    Keyword arguments:
+    walkability_grid -- the grid of tiles that can be crossed at the beginning of the turn
+    executor -- the pool of workers evaluating the decisions
+    chunk_size -- the number of entities sent to a worker at once
+    timeout -- the maximum time in seconds waited for the workers
+
+    Attributes:
+    planner -- the planner committing the moves and taking again outdated decisions
+    executor -- the pool of workers evaluating the decisions
+    chunk_size -- the number of entities sent to a worker at once
+    timeout -- the maximum time in seconds waited for the workers
+    reused_decisions -- the number of decisions taken by the workers that have been kept
+    """
+
+    def __init__(
+        self,
+        walkability_grid: WalkabilityGrid,
+        executor: Executor,
+        chunk_size: int,
+        timeout: float = AI_WORKERS_TIMEOUT,
+    ) -> None:
+        self.planner: SideTurnPlanner = SideTurnPlanner(walkability_grid)
+        self.executor: Executor = executor
+        self.chunk_size: int = chunk_size
+        self.timeout: float = timeout
+        self.reused_decisions: int = 0
+
+    def plan(
+        self, agents: Sequence[AgentSnapshot], targets: Sequence[Optional[int]]
+    ) -> list[PlannedAction]:
+        """
+        Return the action of each of the given entities, in the order in which they will act.
+
+        Raise TimeoutError if the workers did not finish in time,
+        or the error raised by a worker, like BrokenProcessPool if a worker died.
+
+        Keyword arguments:
+        agents -- the entities that should act, in the order in which they will act
+        targets -- the index of the tile of each entity that could be attacked,
+        None if it is outside the map
+        """
+        futures: list[Future] = self._submit(agents, targets)
+        if wait(futures, timeout=self.timeout).not_done:
+            self._raise_timeout(futures)
+        return list(self._apply(agents, targets, futures))
+
+    def iter_plan(
+        self, agents: Sequence[AgentSnapshot], targets: Sequence[Optional[int]]
+    ) -> Iterator[Optional[PlannedAction]]:
+        """
+        Return a generator planning the action of each of the given entities
+        in the order in which they will act, yielding None while waiting for the workers.
+        The decisions are submitted to the workers as soon as the generator is created,
+        each step of the generator waits for them at most during the AI frame budget.
+
+        The generator raises TimeoutError if the workers did not finish in time,
+        or the error raised by a worker, like BrokenProcessPool if a worker died.
+
+        Keyword arguments:
+        agents -- the entities that should act, in the order in which they will act
+        targets -- the index of the tile of each entity that could be attacked,
+        None if it is outside the map
+        """
+        futures: list[Future] = self._submit(agents, targets)
+        return self._wait_and_apply(agents, targets, futures)
+
+    def _wait_and_apply(
+        self,
+        agents: Sequence[AgentSnapshot],
+        targets: Sequence[Optional[int]],
+        futures: list[Future],
+    ) -> Iterator[Optional[PlannedAction]]:
+        deadline: float = time.perf_counter() + self.timeout
+        while wait(futures, timeout=AI_FRAME_BUDGET).not_done:
+            if time.perf_counter() >= deadline:
+                self._raise_timeout(futures)
+            yield None
+        yield from self._apply(agents, targets, futures)
+
+    def _raise_timeout(self, futures: list[Future]) -> None:
+        for future in futures:
+            future.cancel()
+        raise TimeoutError(
+            f"AI workers did not evaluate the decisions within {self.timeout} seconds"
+        )
+
+    def _submit(
+        self, agents: Sequence[AgentSnapshot], targets: Sequence[Optional[int]]
+    ) -> list[Future]:
+        grid: WalkabilityGrid = self.planner.walkability_grid
+        snapshot: BoardSnapshot = BoardSnapshot(
+            grid.width, grid.height, bytes(grid.blocked), tuple(targets)
+        )
+        return [
+            self.executor.submit(
+                evaluate_agents, snapshot, agents[start : start + self.chunk_size]
+            )
+            for start in range(0, len(agents), self.chunk_size)
+        ]
+
+    def _apply(
+        self,
+        agents: Sequence[AgentSnapshot],
+        targets: Sequence[Optional[int]],
+        futures: list[Future],
+    ) -> Iterator[PlannedAction]:
+        blocked: bytearray = self.planner.walkability_grid.blocked
+        initial_blocked: bytes = bytes(blocked)
+        changed_tiles: set[int] = set()
+        evaluations: Iterator[tuple[PlannedAction, Optional[frozenset[int]]]] = (
+            evaluation for future in futures for evaluation in future.result()
+        )
+        for agent, (action, footprint) in zip(agents, evaluations):
+            if changed_tiles and (
+                footprint is None or not changed_tiles.isdisjoint(footprint)
+            ):
+                action = self.planner.decide(agent, targets)
+            else:
+                self.reused_decisions += 1
+            self.planner.commit(agent, action)
+            for tile in (agent.tile, action.path[-1] if action.path else None):
+                if tile is not None:
+                    if blocked[tile] != initial_blocked[tile]:
+                        changed_tiles.add(tile)
+                    else:
+                        changed_tiles.discard(tile)
+            yield action
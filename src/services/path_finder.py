@@ -0,0 +1,153 @@
+"""
+Defines PathFinder class, the A* search used to find the shortest path toward a target
+on the walkability grid of a level.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Sequence
+from typing import Optional
+
+from src.services.walkability_grid import WalkabilityGrid
+
+
+class PathFinder:
+    """
+    A PathFinder looks for the shortest path from a tile to any tile from which a target
+    could be reached, according to a reach given as a sequence of distances in tiles.
+
+    The search is an A* guided by the Manhattan distance to the target and stops as soon as
+    a suitable tile is found, so only the tiles between the starting point and the target
+    are usually explored.
+    The open list and the per-tile bookkeeping are allocated once and reused by every search.
+
+    Keyword arguments:
+    walkability_grid -- the grid of tiles that can be crossed
+
+    Attributes:
+    walkability_grid -- the grid of tiles that can be crossed
+    _open_list -- the heap of tiles to explore, reused from one search to another
+    _cost -- the number of moves needed to reach each tile during the current search
+    _predecessor -- the tile from which each tile has been reached during the current search
+    _visit_marks -- the search during which each tile has last been reached
+    _closed_marks -- the search during which each tile has last been explored
+    _current_search -- the identifier of the current search
+    """
+
+    def __init__(self, walkability_grid: WalkabilityGrid) -> None:
+        self.walkability_grid: WalkabilityGrid = walkability_grid
+        size: int = walkability_grid.width * walkability_grid.height
+        self._open_list: list[tuple[int, int, int, int]] = []
+        self._cost: list[int] = [0] * size
+        self._predecessor: list[int] = [-1] * size
+        self._visit_marks: list[int] = [0] * size
+        self._closed_marks: list[int] = [0] * size
+        self._current_search: int = 0
+
+    def find_path(
+        self,
+        start: int,
+        target: int,
+        reach: Sequence[int],
+        max_moves: Optional[int] = None,
+    ) -> tuple[list[int], bool]:
+        """
+        Return the shortest path from the starting tile to a tile from which the target is at reach,
+        the starting tile excluded, and whether such a tile has been found.
+
+        If no tile at reach of the target can be reached, the path leads to the explored tile that
+        is the closest from being at reach of the target instead.
+
+        Keyword arguments:
+        start -- the index of the starting tile
+        target -- the index of the tile of the target
+        reach -- the distances in tiles from which the target can be reached
+        max_moves -- the maximum number of tiles that could be traveled, if there is any
+        """
+        grid: WalkabilityGrid = self.walkability_grid
+        blocked: bytearray = grid.blocked
+        neighbours: list[tuple[int, ...]] = grid.neighbours
+        width: int = grid.width
+        target_column, target_row = target % width, target // width
+        # The heuristic only depends on the Manhattan distance to the target,
+        # it is the number of moves needed to have the target at reach without any obstacle
+        heuristic_by_distance: list[int] = [
+            (
+                min(abs(distance - reach_distance) for reach_distance in reach)
+                if reach
+                else distance
+            )
+            for distance in range(width + grid.height + 1)
+        ]
+
+        self._current_search += 1
+        search: int = self._current_search
+        cost: list[int] = self._cost
+        predecessor: list[int] = self._predecessor
+        visit_marks: list[int] = self._visit_marks
+        closed_marks: list[int] = self._closed_marks
+        open_list: list[tuple[int, int, int, int]] = self._open_list
+        open_list.clear()
+
+        heuristic: int = heuristic_by_distance[
+            abs(start % width - target_column) + abs(start // width - target_row)
+        ]
+        cost[start] = 0
+        predecessor[start] = -1
+        visit_marks[start] = search
+        order: int = 0
+        heapq.heappush(open_list, (heuristic, heuristic, order, start))
+        best_tile: int = start
+        best_score: tuple[int, int] = (heuristic, 0)
+        found: bool = False
+
+        while open_list:
+            _, heuristic, _, tile = heapq.heappop(open_list)
+            if closed_marks[tile] == search:
+                continue
+            closed_marks[tile] = search
+            tile_cost: int = cost[tile]
+            if heuristic == 0 and tile != target:
+                best_tile = tile
+                found = True
+                break
+            if (heuristic, tile_cost) < best_score:
+                best_tile = tile
+                best_score = (heuristic, tile_cost)
+            if max_moves is not None and tile_cost >= max_moves:
+                continue
+            neighbour_cost: int = tile_cost + 1
+            for neighbour in neighbours[tile]:
+                if blocked[neighbour] or closed_marks[neighbour] == search:
+                    continue
+                if (
+                    visit_marks[neighbour] == search
+                    and cost[neighbour] <= neighbour_cost
+                ):
+                    continue
+                visit_marks[neighbour] = search
+                cost[neighbour] = neighbour_cost
+                predecessor[neighbour] = tile
+                neighbour_heuristic: int = heuristic_by_distance[
+                    abs(neighbour % width - target_column)
+                    + abs(neighbour // width - target_row)
+                ]
+                order += 1
+                heapq.heappush(
+                    open_list,
+                    (
+                        neighbour_cost + neighbour_heuristic,
+                        neighbour_heuristic,
+                        order,
+                        neighbour,
+                    ),
+                )
+
+        path: list[int] = []
+        tile = best_tile
+        while tile != start:
+            path.append(tile)
+            tile = predecessor[tile]
+        path.reverse()
+        return path, found
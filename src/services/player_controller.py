@@ -0,0 +1,156 @@
+"""
+Defines PlayerController class, the source of the actions of the players when a level is played
+without anybody at the controls, its ScriptedPlayerController and AutoPlayerController
+implementations, and the PlayerCommand record describing the turn of a player.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from src.game_entities.mission import Mission, MissionType
+from src.game_entities.movable import EntityStrategy
+from src.game_entities.player import Player
+from src.gui.position import Position
+from src.services.move_range import MoveRange
+from src.services.side_turn_planner import (AgentSnapshot, PlannedAction,
+                                            SideTurnPlanner)
+from src.services.walkability_grid import WalkabilityGrid
+
+if TYPE_CHECKING:
+    from src.services.level_engine import LevelEngine
+
+
+class PlayerCommand(NamedTuple):
+    """
+    The actions of a player during its turn.
+    The player moves first, then either attacks, takes an objective or waits.
+
+    Attributes:
+    destination -- the position of the tile the player should move to, None to stay in place
+    target -- the position of the entity the player should attack after moving, if any
+    take_objective -- whether the player should accomplish the mission whose objective is at reach
+    after moving or not
+    """
+
+    destination: Optional[Position] = None
+    target: Optional[Position] = None
+    take_objective: bool = False
+
+
+class PlayerController:
+    """
+    This class is the abstract base class for the controllers giving the actions of the players
+    to a level engine, in place of the clicks and menus of the level scene.
+    """
+
+    def get_command(self, level: LevelEngine, player: Player) -> PlayerCommand:
+        """
+        Return the actions that the given player should do during its turn.
+
+        Keyword arguments:
+        level -- the level being played
+        player -- the player that should act
+        """
+        raise NotImplementedError
+
+
+class ScriptedPlayerController(PlayerController):
+    """
+    A ScriptedPlayerController plays back a list of commands written in advance,
+    one command each time a player should act.
+    Players wait once all the commands have been played.
+
+    Keyword arguments:
+    commands -- the commands that should be played, in order
+
+    Attributes:
+    commands -- the commands that have not been played yet
+    """
+
+    def __init__(self, commands: Iterable[PlayerCommand]) -> None:
+        self.commands: deque[PlayerCommand] = deque(commands)
+
+    def get_command(self, level: LevelEngine, player: Player) -> PlayerCommand:
+        """
+        Return the next command of the script, or a command doing nothing if there is none left.
+
+        Keyword arguments:
+        level -- the level being played
+        player -- the player that should act
+        """
+        return self.commands.popleft() if self.commands else PlayerCommand()
+
+
+class AutoPlayerController(PlayerController):
+    """
+    An AutoPlayerController plays the players with simple rules, so a level can be played
+    from the beginning to the end without any script.
+    A player goes toward the objective of the main mission if it has to be reached,
+    and otherwise acts like an entity controlled by the AI looking for foes on the whole map.
+    """
+
+    def get_command(self, level: LevelEngine, player: Player) -> PlayerCommand:
+        """
+        Return the actions that the given player should do during its turn.
+
+        Keyword arguments:
+        level -- the level being played
+        player -- the player that should act
+        """
+        max_moves: int = player.max_moves + player.get_stat_change("speed")
+        if level.main_mission.type in (
+            MissionType.POSITION,
+            MissionType.TOUCH_POSITION,
+        ):
+            return self._reach_objective(level, player, level.main_mission, max_moves)
+        return self._attack_foes(level, player, max_moves)
+
+    @staticmethod
+    def _reach_objective(
+        level: LevelEngine, player: Player, mission: Mission, max_moves: int
+    ) -> PlayerCommand:
+        grid: WalkabilityGrid = level.walkability_grid
+        possible_moves: MoveRange = level.get_entity_possible_moves(player, max_moves)
+        for move in possible_moves:
+            if mission.is_position_valid(move):
+                return PlayerCommand(move, take_objective=True)
+        objective_fields: list[dict[int, int]] = [
+            level.distance_fields.get_tile_field(grid.index_of_tile(objective.tile))
+            for objective in mission.objective_tiles
+        ]
+        unreachable: int = len(grid.blocked)
+        destination: Position = min(
+            possible_moves,
+            key=lambda move: min(
+                field.get(grid.index_of(move), unreachable)
+                for field in objective_fields
+            ),
+        )
+        return PlayerCommand(destination)
+
+    @staticmethod
+    def _attack_foes(
+        level: LevelEngine, player: Player, max_moves: int
+    ) -> PlayerCommand:
+        grid: WalkabilityGrid = level.walkability_grid
+        foes: list = level.entities.foes
+        action: PlannedAction = SideTurnPlanner(grid).decide(
+            AgentSnapshot(
+                grid.index_of_tile(player.tile),
+                max_moves,
+                tuple(player.reach),
+                EntityStrategy.ACTIVE,
+            ),
+            [grid.index_of_tile(foe.tile) for foe in foes],
+        )
+        return PlayerCommand(
+            grid.position_of(action.path[-1]) if action.path else None,
+            (
+                foes[action.attack].position
+                if action.attack is not None and player.can_attack()
+                else None
+            ),
+        )
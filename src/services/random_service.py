@@ -0,0 +1,201 @@
+"""
+Defines RandomService class, the source of all the randomness of a level,
+its RandomStream streams, one for each subsystem of the game listed by RandomStreamKind enum,
+and the functions giving access to the random service of the active level.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from typing import Optional, TypeVar
+
+from lxml import etree
+
+MAX_SEED = 2**32
+
+T = TypeVar("T")
+
+
+class RandomStreamKind(Enum):
+    """
+    Define the subsystems of the game drawing random numbers, each one having its own stream.
+    """
+
+    LOOT = "loot"
+    GROWTH = "growth"
+    COMBAT = "combat"
+
+
+class RandomStream:
+    """
+    A RandomStream is an independent sequence of random numbers used by a single subsystem.
+    Each draw consumes exactly one number of the underlying generator,
+    so the position of the stream is only given by the number of draws made
+    and can be restored from it.
+
+    Keyword arguments:
+    seed -- the seed of the underlying generator
+    draws -- the number of draws that have already been made in the stream
+
+    Attributes:
+    seed -- the seed of the underlying generator
+    draws -- the number of draws made in the stream since its beginning
+    _generator -- the generator of the random numbers
+    """
+
+    def __init__(self, seed: str, draws: int = 0) -> None:
+        self.seed: str = seed
+        self.draws: int = 0
+        self._generator: random.Random = random.Random(seed)
+        self.skip_to(draws)
+
+    def skip_to(self, draws: int) -> None:
+        """
+        Move the stream to the position it has after the given number of draws.
+
+        Keyword arguments:
+        draws -- the number of draws that should have been made in the stream
+        """
+        if draws < self.draws:
+            self._generator.seed(self.seed)
+            self.draws = 0
+        for _ in range(draws - self.draws):
+            self._generator.random()
+        self.draws = draws
+
+    def random(self) -> float:
+        """
+        Return the next random floating point number in the range [0.0, 1.0).
+        """
+        self.draws += 1
+        return self._generator.random()
+
+    def randint(self, lower_bound: int, upper_bound: int) -> int:
+        """
+        Return a random integer between the given bounds, both included.
+
+        Keyword arguments:
+        lower_bound -- the lowest value that can be returned
+        upper_bound -- the highest value that can be returned
+        """
+        return lower_bound + int(self.random() * (upper_bound - lower_bound + 1))
+
+    def choice(self, sequence: Sequence[T]) -> T:
+        """
+        Return a random element of the given non-empty sequence.
+
+        Keyword arguments:
+        sequence -- the sequence the element is picked from
+        """
+        return sequence[int(self.random() * len(sequence))]
+
+
+class RandomService:
+    """
+    A RandomService gives the random numbers used by the rules of a level.
+    Each subsystem of the game has its own stream, derived from the seed of the level,
+    so the numbers drawn by a subsystem don't depend on how many numbers the others drew.
+    Playing a level twice with the same seed and the same actions gives the same results.
+
+    Keyword arguments:
+    seed -- the seed of the level, a new one is picked if not provided
+    draws -- the number of draws already made in each stream, if the level is loaded from a save
+
+    Attributes:
+    seed -- the seed of the level
+    streams -- the stream of each subsystem
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        draws: Optional[Mapping[RandomStreamKind, int]] = None,
+    ) -> None:
+        if seed is None:
+            seed = random.randrange(MAX_SEED)
+        if draws is None:
+            draws = {}
+        self.seed: int = seed
+        self.streams: dict[RandomStreamKind, RandomStream] = {
+            kind: RandomStream(f"{seed}:{kind.value}", draws.get(kind, 0))
+            for kind in RandomStreamKind
+        }
+
+    def get_stream(self, kind: RandomStreamKind) -> RandomStream:
+        """
+        Return the stream of the given subsystem.
+
+        Keyword arguments:
+        kind -- the subsystem drawing the random numbers
+        """
+        return self.streams[kind]
+
+    def get_draws(self) -> dict[RandomStreamKind, int]:
+        """
+        Return the number of draws made in each stream.
+        """
+        return {kind: stream.draws for kind, stream in self.streams.items()}
+
+    def set_draws(self, draws: Mapping[RandomStreamKind, int]) -> None:
+        """
+        Move each stream to the position it has after the given number of draws.
+
+        Keyword arguments:
+        draws -- the number of draws that should have been made in each stream
+        """
+        for kind, stream in self.streams.items():
+            stream.skip_to(draws.get(kind, 0))
+
+    def save(self, tree_name: str) -> etree.Element:
+        """
+        Save the seed and the number of draws made in each stream in XML format.
+
+        Return the result of this generation.
+
+        Keyword arguments:
+        tree_name -- the name that should be given to the root element of the generated XML.
+        """
+        tree: etree.Element = etree.Element(tree_name)
+
+        seed: etree.SubElement = etree.SubElement(tree, "seed")
+        seed.text = str(self.seed)
+
+        draws: etree.SubElement = etree.SubElement(tree, "draws")
+        for kind, stream in self.streams.items():
+            stream_draws: etree.SubElement = etree.SubElement(draws, kind.value)
+            stream_draws.text = str(stream.draws)
+
+        return tree
+
+
+_active_service: RandomService = RandomService()
+
+
+def set_active_random_service(service: RandomService) -> None:
+    """
+    Make the given service the source of the random numbers drawn by the game entities.
+
+    Keyword arguments:
+    service -- the random service of the level being played
+    """
+    global _active_service
+    _active_service = service
+
+
+def get_active_random_service() -> RandomService:
+    """
+    Return the source of the random numbers drawn by the game entities.
+    """
+    return _active_service
+
+
+def get_random_stream(kind: RandomStreamKind) -> RandomStream:
+    """
+    Return the stream of the given subsystem in the active random service.
+
+    Keyword arguments:
+    kind -- the subsystem drawing the random numbers
+    """
+    return _active_service.get_stream(kind)
@@ -0,0 +1,44 @@
+"""
+Defines functions giving the offsets in tiles of the tiles that are at reach from a tile,
+computed once for each reach and shared by all the entities.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_ring_offsets(distance: int) -> frozenset[tuple[int, int]]:
+    """
+    Return the offsets in columns and rows of all the tiles that are exactly at the given distance
+    from a tile, the distance being the number of tiles crossed horizontally and vertically.
+
+    Keyword arguments:
+    distance -- the distance in tiles
+    """
+    return frozenset(
+        (x_coordinate, y_coordinate)
+        for x_coordinate in range(-distance, distance + 1)
+        for y_coordinate in (
+            distance - abs(x_coordinate),
+            -distance + abs(x_coordinate),
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_reach_offsets(reach: tuple[int, ...]) -> frozenset[tuple[int, int]]:
+    return frozenset().union(*(get_ring_offsets(distance) for distance in reach))
+
+
+def get_reach_offsets(reach: Sequence[int]) -> frozenset[tuple[int, int]]:
+    """
+    Return the offsets in columns and rows of all the tiles that could be reached from a tile
+    by an entity having the given reach.
+
+    Keyword arguments:
+    reach -- the distances in tiles at which the entity can attack
+    """
+    return _get_reach_offsets(tuple(reach))
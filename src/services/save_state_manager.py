@@ -1,3 +1,4 @@
+import hashlib
 from collections.abc import Sequence
 
 from lxml import etree
@@ -30,6 +31,17 @@ class SaveStateManager:
                 etree.tostring(self.tree, pretty_print=True, encoding="unicode")
             )
 
+    def compute_state_hash(self) -> str:
+        """
+        Return a digest of the current state of the level, as it would be saved,
+        along with the side whose turn it is.
+        Two levels in the same state have the same digest.
+        """
+        level = self._save_level()
+        side_turn = etree.SubElement(level, "side_turn")
+        side_turn.text = self.level.side_turn.name
+        return hashlib.sha256(etree.tostring(level)).hexdigest()
+
     def _save_level(self):
         """
 
@@ -50,6 +62,9 @@ class SaveStateManager:
             turn = etree.SubElement(level, "turn")
             turn.text = str(self.level.turn)
 
+        # Save seed and position of random streams
+        level.append(self.level.random_service.save("random"))
+
         # Save current entities stats and position
         entities = self._save_entities()
         level.append(entities)
@@ -4,6 +4,8 @@ Define SceneManager class, the orchestrator of the communication between every d
 
 from __future__ import annotations
 
+from typing import Optional
+
 import pygame
 
 from src.constants import MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH
@@ -11,6 +13,7 @@ from src.scenes.level_loading_scene import LevelLoadingScene
 from src.scenes.level_scene import LevelScene, LevelStatus
 from src.scenes.scene import QuitActionKind, Scene
 from src.scenes.start_scene import StartScene
+from src.services.level_engine import LevelEngine
 
 
 class SceneManager:
@@ -24,10 +27,13 @@ class SceneManager:
 
     Attributes:
     active_scene -- the current active scene that should handle all incoming events
+    dirty_rects -- the areas of the screen that changed during the last game iteration,
+    None if the whole screen changed
     """
 
     def __init__(self, screen: pygame.Surface) -> None:
         self.active_scene: Scene = StartScene(screen)
+        self.dirty_rects: Optional[list[pygame.Rect]] = None
 
     def process_game_iteration(self) -> QuitActionKind:
         """
@@ -53,10 +59,22 @@ class SceneManager:
                 self.active_scene.key_down(event.key)
         if self.active_scene.update_state():
             self.start_new_scene()
+            # Nothing is drawn until the next iteration
+            self.dirty_rects = []
             return QuitActionKind.CONTINUE
-        self.active_scene.display()
+        self.dirty_rects = self.active_scene.render()
         return quit_game
 
+    def invalidate(self, rect: pygame.Rect) -> None:
+        """
+        Notify the active scene that an area of the screen has been drawn over,
+        so that it is drawn again on the next game iteration.
+
+        Keyword arguments:
+        rect -- the area of the screen that has been drawn over
+        """
+        self.active_scene.invalidate(rect)
+
     def start_new_scene(self) -> None:
         """
         Switch to a new scene.
@@ -73,12 +91,13 @@ class SceneManager:
             return
 
         if isinstance(self.active_scene, LevelScene):
-            next_level_number = self.active_scene.number + 1
+            engine: LevelEngine = self.active_scene.engine
+            next_level_number = engine.number + 1
             if (
-                self.active_scene.game_phase is LevelStatus.ENDED_VICTORY
+                engine.game_phase is LevelStatus.ENDED_VICTORY
                 and next_level_number in LevelScene.IDS
             ):
-                team = self.active_scene.escaped_players + self.active_scene.players
+                team = engine.escaped_players + engine.players
                 for player in team:
                     player.healed(player.hit_points_max)
                     player.new_turn()
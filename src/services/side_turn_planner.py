@@ -0,0 +1,264 @@
+"""
+Defines SideTurnPlanner class, the planner computing at once the actions of all the entities
+of a side controlled by the AI, and the AgentSnapshot and PlannedAction records it works with.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import NamedTuple, Optional
+
+from src.game_entities.movable import EntityStrategy
+from src.services.distance_fields import DistanceFields
+from src.services.path_finder import PathFinder
+from src.services.influence_map import InfluenceMap
+from src.services.walkability_grid import WalkabilityGrid
+
+
+class AgentSnapshot(NamedTuple):
+    """
+    The data about an entity controlled by the AI needed to plan its action.
+
+    Attributes:
+    tile -- the index of the tile of the entity, None if it is outside the map
+    max_moves -- the maximum number of tiles the entity could travel this turn
+    reach -- the distances in tiles from which the entity can attack
+    strategy -- the strategy followed by the entity
+    """
+
+    tile: Optional[int]
+    max_moves: int
+    reach: tuple[int, ...]
+    strategy: EntityStrategy
+
+
+class PlannedAction(NamedTuple):
+    """
+    The action planned for an entity controlled by the AI.
+
+    Attributes:
+    path -- the indices of the tiles the entity should cross, its destination being the last one,
+    empty if the entity should stay on its tile
+    target -- the index of the target selected by the entity while moving if there is any
+    attack -- the index of the target the entity should attack after moving if there is any
+    """
+
+    path: tuple[int, ...]
+    target: Optional[int]
+    attack: Optional[int]
+
+
+class SideTurnPlanner:
+    """
+    A SideTurnPlanner resolves the whole turn of a side controlled by the AI in one pass,
+    following the same rules than the decisions taken entity by entity.
+
+    It works on its own copy of the walkability grid of the level, taken at the beginning
+    of the turn of the side: each time the move of an entity is planned, its tile is freed and
+    its destination blocked on the copy, so that the next entities are planned on the board as
+    it will be once the previous ones moved.
+    The distance fields toward the targets are shared by all the entities,
+    and only computed again when an entity actually changes its tile.
+
+    Keyword arguments:
+    walkability_grid -- the grid of tiles that can be crossed at the beginning of the turn
+
+    Attributes:
+    walkability_grid -- the copy of the grid on which the moves of the entities are planned
+    distance_fields -- the distances to the targets, shared until a planned move changes the grid
+    path_finder -- the search finding the shortest paths toward the targets
+    influence_map -- the tiles from which each target can be attacked, built once the first
+    decision needing it is taken
+    _influence_map_targets -- the tiles of the targets recorded in the influence map
+    """
+
+    def __init__(self, walkability_grid: WalkabilityGrid) -> None:
+        self.walkability_grid: WalkabilityGrid = walkability_grid.copy()
+        self.distance_fields: DistanceFields = DistanceFields(self.walkability_grid)
+        self.path_finder: PathFinder = PathFinder(self.walkability_grid)
+        self.influence_map: Optional[InfluenceMap] = None
+        self._influence_map_targets: tuple[Optional[int], ...] = ()
+
+    def plan(
+        self, agents: Sequence[AgentSnapshot], targets: Sequence[Optional[int]]
+    ) -> list[PlannedAction]:
+        """
+        Return the action of each of the given entities, in the order in which they will act.
+
+        Keyword arguments:
+        agents -- the entities that should act, in the order in which they will act
+        targets -- the index of the tile of each entity that could be attacked,
+        None if it is outside the map
+        """
+        return list(self.iter_plan(agents, targets))
+
+    def iter_plan(
+        self, agents: Sequence[AgentSnapshot], targets: Sequence[Optional[int]]
+    ) -> Iterator[PlannedAction]:
+        """
+        Return a generator planning the action of each of the given entities
+        only when it is requested, in the order in which they will act.
+
+        Keyword arguments:
+        agents -- the entities that should act, in the order in which they will act
+        targets -- the index of the tile of each entity that could be attacked,
+        None if it is outside the map
+        """
+        for agent in agents:
+            action: PlannedAction = self.decide(agent, targets)
+            self.commit(agent, action)
+            yield action
+
+    def decide(
+        self, agent: AgentSnapshot, targets: Sequence[Optional[int]]
+    ) -> PlannedAction:
+        """
+        Return the action the given entity would take on the board as currently planned,
+        without committing its move.
+
+        Keyword arguments:
+        agent -- the entity that should act
+        targets -- the index of the tile of each entity that could be attacked,
+        None if it is outside the map
+        """
+        if agent.tile is None:
+            return PlannedAction((), None, None)
+        path, target = self._plan_move(agent, targets)
+        destination: int = path[-1] if path else agent.tile
+        return PlannedAction(
+            path, target, self._plan_attack(agent, destination, targets, target)
+        )
+
+    def commit(self, agent: AgentSnapshot, action: PlannedAction) -> None:
+        """
+        Apply the move of the given action on the board, so that the next decisions are taken
+        with the entity standing on its destination.
+
+        Keyword arguments:
+        agent -- the entity that is acting
+        action -- the action planned for the entity
+        """
+        if action.path and action.path[-1] != agent.tile:
+            self.walkability_grid.blocked[agent.tile] = False
+            self.walkability_grid.blocked[action.path[-1]] = True
+            self.distance_fields.clear()
+
+    def get_footprint(self, agent: AgentSnapshot) -> Optional[frozenset[int]]:
+        """
+        Return the indices of the tiles whose state is read to take the decision
+        of the given entity, or None if the decision may depend on any tile of the map.
+
+        Keyword arguments:
+        agent -- the entity that should act
+        """
+        if agent.tile is None:
+            return frozenset()
+        if agent.strategy is EntityStrategy.SEMI_ACTIVE:
+            neighbours: list[tuple[int, ...]] = self.walkability_grid.neighbours
+            possible_moves: dict[int, int] = self.walkability_grid.reachable_tiles(
+                agent.tile, agent.max_moves
+            )
+            return frozenset(
+                neighbour
+                for tile, distance in possible_moves.items()
+                if distance < agent.max_moves
+                for neighbour in neighbours[tile]
+            )
+        if agent.strategy is EntityStrategy.ACTIVE:
+            # Distances to the targets are measured on the whole map
+            return None
+        return frozenset()
+
+    def _get_influence_map(
+        self, targets: Sequence[Optional[int]], reach: Sequence[int]
+    ) -> InfluenceMap:
+        targets = tuple(targets)
+        influence_map: Optional[InfluenceMap] = self.influence_map
+        if (
+            influence_map is not None
+            and targets == self._influence_map_targets
+            and all(distance in influence_map.distances for distance in reach)
+        ):
+            return influence_map
+
+        distances: set[int] = set(reach)
+        if influence_map is not None and targets == self._influence_map_targets:
+            distances.update(influence_map.distances)
+        influence_map = InfluenceMap(
+            self.walkability_grid.width, self.walkability_grid.height, distances
+        )
+        for target_index, target_tile in enumerate(targets):
+            if target_tile is not None:
+                influence_map.add_target(target_index, target_tile)
+        self.influence_map = influence_map
+        self._influence_map_targets = targets
+        return influence_map
+
+    def _plan_move(
+        self, agent: AgentSnapshot, targets: Sequence[Optional[int]]
+    ) -> tuple[tuple[int, ...], Optional[int]]:
+        if agent.strategy is EntityStrategy.SEMI_ACTIVE:
+            predecessors: dict[int, int] = {}
+            possible_moves: dict[int, int] = self.walkability_grid.reachable_tiles(
+                agent.tile, agent.max_moves, predecessors
+            )
+            influence_map: InfluenceMap = self._get_influence_map(targets, agent.reach)
+            # Try to find move next to one target: the first target in order is preferred,
+            # then the first distance of the reach and then the first move found
+            best_rank: Optional[tuple[int, int]] = None
+            best_move: int = agent.tile
+            for move in possible_moves:
+                for distance_rank, distance in enumerate(agent.reach):
+                    targets_at_reach: Sequence[int] = influence_map.get_targets_at(
+                        move, distance
+                    )
+                    if targets_at_reach and (
+                        best_rank is None
+                        or (targets_at_reach[0], distance_rank) < best_rank
+                    ):
+                        best_rank = (targets_at_reach[0], distance_rank)
+                        best_move = move
+            if best_rank is not None:
+                path: list[int] = []
+                while best_move != agent.tile:
+                    path.append(best_move)
+                    best_move = predecessors[best_move]
+                return tuple(reversed(path)), best_rank[0]
+        elif agent.strategy is EntityStrategy.ACTIVE and targets:
+            # Targets the nearest opponent and go as far as possible on the shortest path to it
+            unreachable: int = len(self.walkability_grid.blocked)
+            distances: list[int] = []
+            for target_tile in targets:
+                distance: Optional[int] = (
+                    self.distance_fields.distance_between_tiles(agent.tile, target_tile)
+                    if target_tile is not None
+                    else None
+                )
+                distances.append(distance if distance is not None else unreachable)
+            target_index: int = distances.index(min(distances))
+            if targets[target_index] is None:
+                return (), target_index
+            tiles, _ = self.path_finder.find_path(
+                agent.tile, targets[target_index], agent.reach
+            )
+            return tuple(tiles[: agent.max_moves]), target_index
+        return (), None
+
+    def _plan_attack(
+        self,
+        agent: AgentSnapshot,
+        tile: int,
+        targets: Sequence[Optional[int]],
+        selected_target: Optional[int],
+    ) -> Optional[int]:
+        influence_map: InfluenceMap = self._get_influence_map(targets, agent.reach)
+        temporary_attack: Optional[int] = None
+        for distance in agent.reach:
+            targets_at_reach: Sequence[int] = influence_map.get_targets_at(
+                tile, distance
+            )
+            if selected_target in targets_at_reach:
+                return selected_target
+            if targets_at_reach:
+                temporary_attack = targets_at_reach[-1]
+        return temporary_attack
@@ -0,0 +1,48 @@
+"""
+Defines Tile class, the integer coordinate of a tile of the level map used by the game logic.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+
+
+class Tile(NamedTuple):
+    """
+    A Tile is the immutable coordinate of a tile of the level map, counted in tiles from the top
+    left corner of the screen.
+
+    Contrary to Position, which is a mutable pair of floats meant to draw things on screen,
+    a Tile is a plain tuple of integers: it is hashed and compared natively,
+    which makes it the key to use in the dictionaries and sets of the game logic.
+    Conversion to and from Position should only happen when reaching the display.
+
+    Attributes:
+    column -- the index of the column of the tile
+    row -- the index of the row of the tile
+    """
+
+    column: int
+    row: int
+
+    @classmethod
+    def from_position(cls, position: tuple[float, float]) -> Tile:
+        """
+        Return the tile containing the given position on screen.
+
+        Keyword arguments:
+        position -- the position on screen
+        """
+        # Bypass the generated constructor, this is called each time an entity moves
+        return tuple.__new__(
+            cls, (int(position[0] // TILE_SIZE), int(position[1] // TILE_SIZE))
+        )
+
+    def to_position(self) -> Position:
+        """
+        Return the position on screen of the top left corner of the tile.
+        """
+        return Position(self.column * TILE_SIZE, self.row * TILE_SIZE)
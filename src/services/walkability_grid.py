@@ -0,0 +1,209 @@
+"""
+Defines WalkabilityGrid class, the dense representation of the tiles of a level
+that can or cannot be crossed by movable entities.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterable
+from typing import Optional
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.tile import Tile
+
+
+class WalkabilityGrid:
+    """
+    A WalkabilityGrid stores, for each tile of a level map, whether the tile is blocked or not.
+    Tiles are identified by their index in row-major order so the whole grid is a flat bytearray,
+    and the neighbours of each tile are computed once at creation.
+
+    It is used to compute move ranges by expanding a frontier of tiles level by level,
+    without creating any Position or querying any entity during the search.
+
+    Keyword arguments:
+    origin_x -- the horizontal position on screen of the top left tile of the map
+    origin_y -- the vertical position on screen of the top left tile of the map
+    width -- the number of tiles on a row of the map
+    height -- the number of tiles on a column of the map
+
+    Attributes:
+    origin_x -- the horizontal position on screen of the top left tile of the map
+    origin_y -- the vertical position on screen of the top left tile of the map
+    width -- the number of tiles on a row of the map
+    height -- the number of tiles on a column of the map
+    blocked -- the flat grid of tiles, non-zero values are tiles that cannot be crossed
+    neighbours -- the indices of the adjacent tiles of each tile
+    """
+
+    def __init__(self, origin_x: int, origin_y: int, width: int, height: int) -> None:
+        self.origin_x: int = origin_x
+        self.origin_y: int = origin_y
+        self.width: int = width
+        self.height: int = height
+        self.blocked: bytearray = bytearray(width * height)
+        self.neighbours: list[tuple[int, ...]] = [
+            self._compute_neighbours(index) for index in range(width * height)
+        ]
+
+    def _compute_neighbours(self, index: int) -> tuple[int, ...]:
+        # Order matters: left, bottom, top and right tiles, so that the order of the tiles found
+        # by a search is stable and the choices of the AI are not affected
+        column, row = index % self.width, index // self.width
+        neighbours: list[int] = []
+        if column > 0:
+            neighbours.append(index - 1)
+        if row < self.height - 1:
+            neighbours.append(index + self.width)
+        if row > 0:
+            neighbours.append(index - self.width)
+        if column < self.width - 1:
+            neighbours.append(index + 1)
+        return tuple(neighbours)
+
+    def index_of(self, position: Position) -> Optional[int]:
+        """
+        Return the index of the tile at the given position on screen,
+        or None if the position is outside the map.
+
+        Keyword arguments:
+        position -- the position on screen of the tile
+        """
+        column: int = int(position[0] - self.origin_x) // TILE_SIZE
+        row: int = int(position[1] - self.origin_y) // TILE_SIZE
+        if 0 <= column < self.width and 0 <= row < self.height:
+            return row * self.width + column
+        return None
+
+    def index_of_tile(self, tile: Tile) -> Optional[int]:
+        """
+        Return the index of the given tile, or None if the tile is outside the map.
+
+        Keyword arguments:
+        tile -- the coordinate of the tile
+        """
+        column: int = tile[0] - self.origin_x // TILE_SIZE
+        row: int = tile[1] - self.origin_y // TILE_SIZE
+        if 0 <= column < self.width and 0 <= row < self.height:
+            return row * self.width + column
+        return None
+
+    def tile_of(self, index: int) -> Tile:
+        """
+        Return the coordinate of the tile with the given index.
+
+        Keyword arguments:
+        index -- the index of the tile
+        """
+        return Tile(
+            self.origin_x // TILE_SIZE + index % self.width,
+            self.origin_y // TILE_SIZE + index // self.width,
+        )
+
+    def position_of(self, index: int) -> Position:
+        """
+        Return the position on screen of the tile with the given index.
+
+        Keyword arguments:
+        index -- the index of the tile
+        """
+        return Position(
+            self.origin_x + (index % self.width) * TILE_SIZE,
+            self.origin_y + (index // self.width) * TILE_SIZE,
+        )
+
+    def is_walkable(self, position: Position) -> bool:
+        """
+        Return whether the tile at the given position is inside the map and can be crossed.
+
+        Keyword arguments:
+        position -- the position on screen of the tile
+        """
+        index: Optional[int] = self.index_of(position)
+        return index is not None and not self.blocked[index]
+
+    def set_blocked(self, position: Position, blocked: bool) -> None:
+        """
+        Mark the tile at the given position as blocked or not, does nothing if the position is
+        outside the map.
+
+        Keyword arguments:
+        position -- the position on screen of the tile
+        blocked -- whether the tile cannot be crossed anymore or not
+        """
+        index: Optional[int] = self.index_of(position)
+        if index is not None:
+            self.blocked[index] = blocked
+
+    def clear(self) -> None:
+        """
+        Mark every tile of the grid as walkable.
+        """
+        self.blocked[:] = bytes(len(self.blocked))
+
+    def copy(self) -> WalkabilityGrid:
+        """
+        Return a copy of the grid, whose tiles can be blocked or freed without altering this one.
+        """
+        grid: WalkabilityGrid = copy.copy(self)
+        grid.blocked = bytearray(self.blocked)
+        return grid
+
+    def reachable_tiles(
+        self, start: int, max_moves: int, predecessors: Optional[dict[int, int]] = None
+    ) -> dict[int, int]:
+        """
+        Return the indices of all the tiles that could be reached from the given tile in
+        the given number of moves, with the number of moves needed to reach them.
+        The starting tile is always part of the result, even if it is occupied.
+
+        Keyword arguments:
+        start -- the index of the starting tile
+        max_moves -- the maximum number of tiles that could be traveled
+        predecessors -- the mapping to fill with the tile from which each reached tile
+        has been entered first, if there is any
+        """
+        blocked: bytearray = self.blocked
+        neighbours: list[tuple[int, ...]] = self.neighbours
+        parents: dict[int, int] = predecessors if predecessors is not None else {}
+        distances: dict[int, int] = {start: 0}
+        frontier: list[int] = [start]
+        for distance in range(1, max_moves + 1):
+            next_frontier: list[int] = []
+            for tile in frontier:
+                for neighbour in neighbours[tile]:
+                    if not blocked[neighbour] and neighbour not in distances:
+                        distances[neighbour] = distance
+                        parents[neighbour] = tile
+                        next_frontier.append(neighbour)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return distances
+
+    def distances_from(self, sources: Iterable[int]) -> dict[int, int]:
+        """
+        Return the indices of all the tiles that could be reached from any of the given tiles,
+        with the number of moves needed to reach them from the closest one.
+        The given tiles are all part of the result with a distance of zero.
+
+        Keyword arguments:
+        sources -- the indices of the tiles from which the distances are measured
+        """
+        blocked: bytearray = self.blocked
+        neighbours: list[tuple[int, ...]] = self.neighbours
+        distances: dict[int, int] = dict.fromkeys(sources, 0)
+        frontier: list[int] = list(distances)
+        distance: int = 0
+        while frontier:
+            distance += 1
+            next_frontier: list[int] = []
+            for tile in frontier:
+                for neighbour in neighbours[tile]:
+                    if not blocked[neighbour] and neighbour not in distances:
+                        distances[neighbour] = distance
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        return distances
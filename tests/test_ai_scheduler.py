@@ -0,0 +1,71 @@
+import time
+import unittest
+
+from src.services.ai_scheduler import AIScheduler
+
+
+def counting_task(steps, done, duration=0.0):
+    for _ in range(steps):
+        if duration:
+            time.sleep(duration)
+        done.append(1)
+        yield
+
+
+class TestAIScheduler(unittest.TestCase):
+    def test_tasks_are_run_in_order(self):
+        scheduler = AIScheduler(frame_budget=1.0)
+        results = []
+        scheduler.schedule(iter(results.append(step) for step in ("a", "b")))
+        scheduler.schedule(iter(results.append(step) for step in ("c",)))
+        self.assertFalse(scheduler.is_idle())
+        self.assertTrue(scheduler.run_frame())
+        self.assertEqual(["a", "b", "c"], results)
+        self.assertTrue(scheduler.is_idle())
+
+    def test_budget_spreads_task_over_frames(self):
+        scheduler = AIScheduler(frame_budget=0.0)
+        done = []
+        scheduler.schedule(counting_task(3, done))
+        # A single step is done per frame when the budget is exhausted
+        self.assertFalse(scheduler.run_frame())
+        self.assertEqual(1, len(done))
+        self.assertFalse(scheduler.run_frame())
+        self.assertFalse(scheduler.run_frame())
+        self.assertEqual(3, len(done))
+        self.assertTrue(scheduler.run_frame())
+
+    def test_run_until_idle(self):
+        scheduler = AIScheduler(frame_budget=0.0)
+        done = []
+        scheduler.schedule(counting_task(5, done))
+        scheduler.run_until_idle()
+        self.assertEqual(5, len(done))
+        self.assertTrue(scheduler.is_idle())
+
+    def test_side_turn_metrics(self):
+        scheduler = AIScheduler(frame_budget=0.0)
+        done = []
+        scheduler.begin_side_turn("FOES")
+        scheduler.schedule(counting_task(2, done, 0.001))
+        for _ in range(4):
+            scheduler.run_frame()
+        scheduler.begin_side_turn("ALLIES")
+        scheduler.run_frame()
+        scheduler.end_side_turn()
+
+        self.assertIsNone(scheduler.current_turn)
+        foes_turn, allies_turn = scheduler.history
+        self.assertEqual("FOES", foes_turn.side)
+        self.assertEqual(4, foes_turn.frames)
+        # The end of the task is only noticed when resuming it after its last step
+        self.assertEqual(3, foes_turn.computing_frames)
+        self.assertGreaterEqual(foes_turn.computation_time, 0.002)
+        self.assertGreaterEqual(foes_turn.longest_frame_time, 0.001)
+        self.assertEqual("ALLIES", allies_turn.side)
+        self.assertEqual(1, allies_turn.frames)
+        self.assertEqual(0, allies_turn.computing_frames)
+
+
+if __name__ == "__main__":
+    unittest.main()
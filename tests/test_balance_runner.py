@@ -0,0 +1,155 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.services.assets_manager import enable_headless_mode
+from src.services.balance_runner import (NOT_REACHED, SimulationResult,
+                                         aggregate, build_team,
+                                         get_level_directory, run_simulations,
+                                         write_report)
+from src.services.level_engine import LevelEngine, LevelStatus
+from src.services.player_controller import AutoPlayerController
+from src.services.random_service import RandomService
+from tests.tools import minimal_setup_for_game
+
+
+class TestBalanceRunner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        enable_headless_mode()
+
+    def tearDown(self):
+        enable_headless_mode(False)
+
+    def test_get_level_directory(self):
+        self.assertEqual(("maps/level_2/", 2), get_level_directory("maps/level_2"))
+        self.assertEqual(("maps/level_2/", 2), get_level_directory("maps/level_2/"))
+        self.assertEqual(("maps/level_3/", 3), get_level_directory("3"))
+        with self.assertRaises(ValueError):
+            get_level_directory("maps")
+
+    def test_build_team(self):
+        team = build_team(1, 0, 40)
+
+        self.assertTrue(team)
+        for player in team:
+            self.assertEqual(player.hit_points_max, player.hit_points)
+        self.assertEqual([], build_team(0, 0, 40))
+
+    def test_battle_statistics_of_level(self):
+        level = LevelEngine(
+            "maps/level_1/",
+            1,
+            players=build_team(1, 0, 40),
+            random_service=RandomService(0),
+        )
+        level.run(AutoPlayerController(), max_turns=40)
+        battle_statistics = level.battle_statistics
+
+        self.assertGreater(sum(battle_statistics.damage_dealt.values()), 0)
+        self.assertGreater(sum(battle_statistics.damage_taken.values()), 0)
+        self.assertGreater(battle_statistics.experience, 0)
+        self.assertGreater(battle_statistics.foes_killed, 0)
+        initial_level = LevelEngine("maps/level_1/", 1)
+        initial_level.load_level_content()
+        self.assertEqual(
+            len(initial_level.entities.foes),
+            len(level.entities.foes) + battle_statistics.foes_killed,
+        )
+
+    def test_simulations_are_reproducible(self):
+        results = run_simulations("maps/level_1/", 1, range(3), 40, workers=0)
+
+        self.assertEqual([0, 1, 2], [result.seed for result in results])
+        self.assertEqual(
+            results, run_simulations("maps/level_1/", 1, range(3), 40, workers=0)
+        )
+        for result in results:
+            self.assertIn(
+                result.status,
+                (
+                    LevelStatus.ENDED_VICTORY.name,
+                    LevelStatus.ENDED_DEFEAT.name,
+                    LevelStatus.IN_PROGRESS.name,
+                ),
+            )
+            self.assertGreater(result.turns, 0)
+
+    def test_simulations_in_worker_processes(self):
+        results = run_simulations("maps/level_0/", 0, range(4), 40, workers=2)
+
+        self.assertEqual(
+            run_simulations("maps/level_0/", 0, range(4), 40, workers=0), results
+        )
+
+    def test_aggregate(self):
+        results = [
+            SimulationResult(
+                0, LevelStatus.ENDED_VICTORY.name, 10, {4: 2}, {3: 1}, 50, 3, 0, {}, 10
+            ),
+            SimulationResult(
+                1,
+                LevelStatus.ENDED_VICTORY.name,
+                14,
+                {6: 1},
+                {},
+                30,
+                2,
+                0,
+                {"key": 1},
+                0,
+            ),
+            SimulationResult(
+                2, LevelStatus.ENDED_DEFEAT.name, 8, {2: 1}, {5: 3}, 10, 1, 2, {}, 0
+            ),
+            SimulationResult(3, NOT_REACHED, 0, {}, {}, 0, 0, 0, {}, 0),
+        ]
+
+        report = aggregate(results)
+
+        self.assertEqual(4, report["runs"])
+        self.assertEqual(0.5, report["win_rate"])
+        self.assertEqual(0.25, report["defeat_rate"])
+        self.assertEqual(0.25, report["not_reached_rate"])
+        self.assertEqual(12, report["turns_to_victory"]["mean"])
+        self.assertEqual(4, report["damage_dealt"]["hits"])
+        self.assertEqual(16, report["damage_dealt"]["total"])
+        self.assertEqual({"2": 1, "4": 2, "6": 1}, report["damage_dealt"]["histogram"])
+        self.assertEqual(5, report["damage_taken"]["per_hit"]["max"])
+        self.assertEqual(22.5, report["experience"]["mean"])
+        self.assertEqual({"key": 0.25}, report["loot"])
+        with self.assertRaises(ValueError):
+            aggregate([])
+
+    def test_write_report(self):
+        results = run_simulations("maps/level_0/", 0, range(2), 40, workers=0)
+        directory = tempfile.mkdtemp()
+        try:
+            json_path = os.path.join(directory, "report.json")
+            write_report(json_path, "maps/level_0/", results)
+            with open(json_path, encoding="utf-8") as report_file:
+                report = json.load(report_file)
+            csv_path = os.path.join(directory, "report.csv")
+            write_report(csv_path, "maps/level_0/", results)
+            with open(csv_path, encoding="utf-8", newline="") as report_file:
+                rows = list(csv.DictReader(report_file))
+            with self.assertRaises(ValueError):
+                write_report(os.path.join(directory, "report.txt"), "", results)
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual(aggregate(results)["win_rate"], report["summary"]["win_rate"])
+        self.assertEqual(2, len(report["simulations"]))
+        self.assertEqual(
+            [str(result.turns) for result in results], [row["turns"] for row in rows]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 
+import pygame
+
 from src.game_entities.character import Character
-from src.game_entities.movable import DamageKind
+from src.game_entities.movable import DamageKind, EntityState, Movable
 from tests.random_data_library import (random_character_entity,
                                        random_equipment, random_foe_entity,
                                        random_shield, random_weapon)
@@ -12,6 +14,7 @@ class TestCharacter(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         minimal_setup_for_game()
+        Movable.init_constant_sprites()
 
     def test_init_character(self):
         name = "character_test"
@@ -126,6 +129,24 @@ class TestCharacter(unittest.TestCase):
         character_test.attacked(random_foe_entity(), damage, DamageKind.SPIRITUAL, [])
         self.assertEqual(character_test.hit_points_max - 2, character_test.hit_points)
 
+    def test_damage_taken_without_shield(self):
+        shield = random_shield()
+        shield.defense = 3
+        character_test = random_character_entity(equipments=[shield])
+        foe = random_foe_entity()
+        damage = character_test.defense + shield.defense + 5
+
+        self.assertEqual(
+            5, character_test.get_damage_taken(foe, damage, DamageKind.PHYSICAL, [])
+        )
+        self.assertEqual(
+            8,
+            character_test.get_damage_taken(
+                foe, damage, DamageKind.PHYSICAL, [], with_shield=False
+            ),
+        )
+        self.assertEqual([shield], character_test.equipments)
+
     def test_attack_with_weapon(self):
         weapon = random_weapon(strong_against=[])
         equipments = [weapon]
@@ -135,3 +156,60 @@ class TestCharacter(unittest.TestCase):
             character_test.strength + weapon.attack,
             character_test.attack(random_foe_entity()),
         )
+
+    def test_composite_sprite_is_cached_until_equipment_changes(self):
+        helmet = random_equipment()
+        equipments = [helmet, random_weapon()]
+        character_test = random_character_entity(equipments=equipments)
+        expected_sprite = character_test.sprite.copy()
+        for equipment in equipments:
+            expected_sprite.blit(equipment.equipped_sprite, (0, 0))
+
+        composite_sprite = character_test.get_base_sprite()
+
+        self.assertEqual(
+            pygame.image.tobytes(expected_sprite, "RGBA"),
+            pygame.image.tobytes(composite_sprite, "RGBA"),
+        )
+        self.assertIs(composite_sprite, character_test.get_base_sprite())
+
+        character_test.remove_equipment(helmet)
+
+        self.assertIsNot(composite_sprite, character_test.get_base_sprite())
+
+    def test_displayed_sprite_changes_when_damaged_character_removes_equipment(self):
+        armor = random_equipment()
+        helmet = random_equipment()
+        character_test = random_character_entity(equipments=[armor, helmet])
+        armor.equipped_sprite = pygame.Surface(character_test.sprite.get_size())
+        armor.equipped_sprite.fill((255, 0, 0))
+        character_test.hit_points = character_test.hit_points_max // 2
+        displayed_sprite = pygame.image.tobytes(
+            character_test.get_displayed_sprite(), "RGBA"
+        )
+
+        character_test.remove_equipment(armor)
+        new_displayed_sprite = pygame.image.tobytes(
+            character_test.get_displayed_sprite(), "RGBA"
+        )
+        expected_sprite = character_test.sprite.copy()
+        expected_sprite.blit(helmet.equipped_sprite, (0, 0))
+        expected_sprite.blit(character_test.get_hit_points_gauge(), (0, 0))
+
+        self.assertNotEqual(displayed_sprite, new_displayed_sprite)
+        self.assertEqual(
+            pygame.image.tobytes(expected_sprite, "RGBA"), new_displayed_sprite
+        )
+
+    def test_equipment_is_drawn_over_active_indicator(self):
+        armor = random_equipment()
+        character_test = random_character_entity(equipments=[armor])
+        # The armor covers the whole character
+        armor.equipped_sprite = pygame.Surface(character_test.sprite.get_size())
+        armor.equipped_sprite.fill((255, 0, 0))
+        character_test.state = EntityState.ON_MOVE
+
+        self.assertEqual(
+            pygame.image.tobytes(armor.equipped_sprite, "RGB"),
+            pygame.image.tobytes(character_test.get_base_sprite(), "RGB"),
+        )
@@ -146,6 +146,37 @@ class TestDestroyable(unittest.TestCase):
         self.assertEqual(destroyable.hit_points_max, destroyable.hit_points)
         self.assertEqual(hp_max_init, destroyable.hit_points_max)
 
+    def test_hit_points_gauge_is_shared(self):
+        first_destroyable = random_destroyable_entity(min_hp=20, max_hp=20)
+        second_destroyable = random_destroyable_entity(min_hp=20, max_hp=20)
+
+        self.assertIsNone(first_destroyable.get_hit_points_gauge())
+        self.assertIs(
+            first_destroyable.get_base_sprite(),
+            first_destroyable.get_displayed_sprite(),
+        )
+
+        first_destroyable.hit_points = 7
+        second_destroyable.hit_points = 7
+        gauge = first_destroyable.get_hit_points_gauge()
+
+        self.assertIs(gauge, second_destroyable.get_hit_points_gauge())
+        second_destroyable.hit_points = 8
+        self.assertIsNot(gauge, second_destroyable.get_hit_points_gauge())
+
+    def test_displayed_sprite_is_cached_until_hit_points_change(self):
+        destroyable = random_destroyable_entity(min_hp=20, max_hp=20)
+        destroyable.hit_points = 12
+
+        displayed_sprite = destroyable.get_displayed_sprite()
+
+        self.assertIsNot(destroyable.sprite, displayed_sprite)
+        self.assertIs(displayed_sprite, destroyable.get_displayed_sprite())
+
+        destroyable.hit_points = 5
+
+        self.assertIsNot(displayed_sprite, destroyable.get_displayed_sprite())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+
+import pygame
+
+from src.constants import WIN_HEIGHT, WIN_WIDTH
+from src.gui.dirty_rect_renderer import (DirtyRectRenderer, DisplayLayer,
+                                         merge_rects)
+from src.scenes.level_scene import LevelScene
+from tests.tools import minimal_setup_for_game
+
+
+class TestDirtyRectRenderer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.screen = pygame.Surface((200, 100))
+        self.renderer = DirtyRectRenderer(self.screen)
+        self.draws = []
+
+    def layer(self, key, rect, state):
+        return DisplayLayer(
+            key, pygame.Rect(rect), state, lambda: self.draws.append(key)
+        )
+
+    def test_merge_rects(self):
+        rects = merge_rects(
+            [
+                pygame.Rect(0, 0, 10, 10),
+                pygame.Rect(50, 50, 10, 10),
+                pygame.Rect(5, 5, 10, 10),
+                pygame.Rect(20, 20, 0, 10),
+            ]
+        )
+
+        self.assertEqual(
+            [pygame.Rect(50, 50, 10, 10), pygame.Rect(0, 0, 15, 15)], rects
+        )
+
+    def test_only_changed_layers_are_drawn_again(self):
+        background = self.layer("background", (0, 0, 200, 100), 0)
+        first = self.layer("first", (10, 10, 10, 10), 0)
+        second = self.layer("second", (100, 10, 10, 10), 0)
+
+        self.assertIsNone(self.renderer.render([background, first, second]))
+        self.assertEqual(["background", "first", "second"], self.draws)
+
+        self.draws.clear()
+        self.assertEqual([], self.renderer.render([background, first, second]))
+        self.assertEqual([], self.draws)
+
+        moved_first = self.layer("first", (15, 10, 10, 10), 0)
+        self.assertEqual(
+            [pygame.Rect(10, 10, 15, 10)],
+            self.renderer.render([background, moved_first, second]),
+        )
+        self.assertEqual(["background", "first"], self.draws)
+
+        self.draws.clear()
+        changed_second = self.layer("second", (100, 10, 10, 10), 1)
+        self.assertEqual(
+            [pygame.Rect(100, 10, 10, 10)],
+            self.renderer.render([background, moved_first, changed_second]),
+        )
+        self.assertEqual(["background", "second"], self.draws)
+
+        self.draws.clear()
+        self.assertEqual(
+            [pygame.Rect(100, 10, 10, 10)],
+            self.renderer.render([background, moved_first]),
+        )
+        self.assertEqual(["background"], self.draws)
+
+    def test_invalidated_and_volatile_areas_are_drawn_again(self):
+        background = self.layer("background", (0, 0, 200, 100), 0)
+        volatile = self.layer("volatile", (10, 10, 10, 10), None)
+        self.renderer.render([background, volatile])
+
+        self.renderer.invalidate(pygame.Rect(150, 0, 20, 10))
+
+        self.assertEqual(
+            [pygame.Rect(150, 0, 20, 10), pygame.Rect(10, 10, 10, 10)],
+            self.renderer.render([background, volatile]),
+        )
+
+        self.renderer.invalidate()
+
+        self.assertIsNone(self.renderer.render([background, volatile]))
+
+    def test_large_changes_draw_whole_screen_again(self):
+        self.renderer.render([self.layer("large", (0, 0, 150, 100), 0)])
+
+        self.assertIsNone(
+            self.renderer.render([self.layer("large", (0, 0, 150, 100), 1)])
+        )
+
+    def test_level_scene_render(self):
+        screen = pygame.Surface((WIN_WIDTH, WIN_HEIGHT))
+        level = LevelScene(screen, "maps/level_0/", 0)
+        level.load_level_content()
+        while level.menu_manager.active_menu:
+            level.menu_manager.close_active_menu()
+        level.render()
+        foe = level.engine.entities.foes[0]
+
+        foe.position = (foe.position[0], foe.position[1] + 48)
+        dirty_rects = level.render()
+
+        self.assertTrue(dirty_rects)
+        self.assertIn(foe.get_rect(), dirty_rects[0].unionall(dirty_rects))
+        partial_frame = pygame.image.tobytes(screen, "RGB")
+        level.invalidate(screen.get_rect())
+        self.assertIsNone(level.render())
+        self.assertEqual(partial_frame, pygame.image.tobytes(screen, "RGB"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.scenes.level_scene import LevelEntityCollections
+from src.services.distance_fields import DistanceFields
+from src.services.occupancy_index import OccupancyIndex
+from src.services.walkability_grid import WalkabilityGrid
+from tests.random_data_library import random_foe_entity, random_player_entity
+from tests.tools import minimal_setup_for_game
+
+
+class TestDistanceFields(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.entities = LevelEntityCollections()
+        self.foe = random_foe_entity()
+        self.foe.position = Position(0, 0)
+        self.player = random_player_entity()
+        self.player.set_initial_pos(Position(6 * TILE_SIZE, 0))
+        self.entities.foes.append(self.foe)
+        self.entities.players.append(self.player)
+        self.grid = WalkabilityGrid(0, 0, 8, 3)
+        self.occupancy = OccupancyIndex(self.entities, self.grid)
+        self.distance_fields = DistanceFields(self.grid, self.occupancy)
+
+    def test_distance_between(self):
+        self.assertEqual(
+            5, self.distance_fields.distance_between(self.foe, self.player)
+        )
+        self.assertEqual(
+            5, self.distance_fields.distance_between(self.player, self.foe)
+        )
+
+        self.foe.position = Position(5 * TILE_SIZE, 0)
+        self.assertEqual(
+            0, self.distance_fields.distance_between(self.foe, self.player)
+        )
+
+    def test_no_path_between_entities(self):
+        for row in range(3):
+            self.grid.set_blocked(Position(3 * TILE_SIZE, row * TILE_SIZE), True)
+        self.occupancy.version += 1
+        self.assertIsNone(self.distance_fields.distance_between(self.foe, self.player))
+
+    def test_field_is_shared_until_occupancy_changes(self):
+        field = self.distance_fields.get_field(self.player)
+        other_foe = random_foe_entity()
+        other_foe.position = Position(0, 2 * TILE_SIZE)
+        self.assertIs(field, self.distance_fields.get_field(self.player))
+        self.assertEqual(
+            7, self.distance_fields.distance_between(other_foe, self.player)
+        )
+
+        # Blocking the shortest path makes the foe take a detour
+        self.entities.foes.append(other_foe)
+        self.occupancy.add(other_foe)
+        other_foe.position = Position(TILE_SIZE, 0)
+        self.assertIsNot(field, self.distance_fields.get_field(self.player))
+        self.assertEqual(
+            7, self.distance_fields.distance_between(self.foe, self.player)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.game_entities.destroyable import DamageKind
+from src.game_entities.effect import Effect
+from src.gui.position import Position
+from src.services.assets_manager import enable_headless_mode
+from src.services.duel_forecast import forecast_duel, get_parry_probability
+from src.services.level_engine import LevelEngine
+from src.services.load_from_xml_manager import get_skill_data
+from tests.random_data_library import (random_foe_entity, random_player_entity,
+                                       random_shield, random_weapon)
+from tests.tools import minimal_setup_for_game
+
+
+class TestDuelForecast(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def test_forecast_without_randomness(self):
+        player = random_player_entity()
+        foe = random_foe_entity(min_hp=20, max_hp=20, max_defense=0)
+        player.strength = 8
+
+        forecast = forecast_duel(player, foe, [], DamageKind.PHYSICAL)
+
+        self.assertEqual(0, forecast.kill_probability)
+        self.assertEqual(8, forecast.expected_damage)
+        self.assertEqual({8: 1.0}, forecast.damage_distribution)
+        self.assertEqual(4, forecast.expected_experience)
+
+        foe.hit_points = 8
+        forecast = forecast_duel(player, foe, [], DamageKind.PHYSICAL)
+
+        self.assertEqual(1, forecast.kill_probability)
+        self.assertEqual(4 + foe.xp_gain, forecast.expected_experience)
+
+    def test_forecast_matches_attack(self):
+        weapon = random_weapon(atk=5, strong_against=[], attack_kind="PHYSICAL")
+        player = random_player_entity(equipments=[weapon])
+        foe = random_foe_entity(min_hp=30, max_hp=30, keywords=[])
+
+        forecast = forecast_duel(player, foe, [], DamageKind.PHYSICAL)
+        hit_points = foe.attacked(player, player.attack(foe), DamageKind.PHYSICAL, [])
+
+        self.assertEqual(
+            {foe.hit_points_max - hit_points: 1.0}, forecast.damage_distribution
+        )
+
+    def test_forecast_with_parry(self):
+        shield = random_shield(durability=10, parry_rate=40)
+        player = random_player_entity(min_hp=20, max_hp=20, equipments=[shield])
+        foe = random_foe_entity()
+        damage = player.get_damage_taken(
+            foe, foe.get_attack_damage(player), DamageKind.PHYSICAL, []
+        )
+
+        forecast = forecast_duel(foe, player, [], DamageKind.PHYSICAL)
+
+        self.assertEqual(0.4, get_parry_probability(player))
+        self.assertAlmostEqual(0.6 * damage, forecast.expected_damage)
+        self.assertEqual(0, forecast.expected_experience)
+
+    def test_forecast_double_attack_breaking_shield(self):
+        shield = random_shield(durability=1, parry_rate=50)
+        player = random_player_entity(min_hp=20, max_hp=20, equipments=[shield])
+        foe = random_foe_entity()
+        shield.defense = 3
+        foe.strength = player.defense + shield.defense + 5
+        foe.skills.append(get_skill_data("double_attack"))
+
+        forecast = forecast_duel(foe, player, [], DamageKind.PHYSICAL)
+
+        # The shield breaks after parrying once, its defense is then lost
+        self.assertEqual({5, 8, 10}, set(forecast.damage_distribution))
+        self.assertAlmostEqual(0.25, forecast.damage_distribution[5])
+        self.assertAlmostEqual(0.5, forecast.damage_distribution[8])
+        self.assertAlmostEqual(0.25, forecast.damage_distribution[10])
+        self.assertEqual([shield], player.equipments)
+        self.assertEqual(1, shield.durability)
+        self.assertEqual(20, player.hit_points)
+
+    def test_forecast_weapon_effects(self):
+        weapon = random_weapon(
+            durability=1, atk=1, strong_against=[], attack_kind="PHYSICAL"
+        )
+        weapon.effects = [{"effect": Effect("stun", 0, 2), "probability": 50}]
+        player = random_player_entity(equipments=[weapon])
+        foe = random_foe_entity(min_hp=30, max_hp=30, keywords=[])
+
+        forecast = forecast_duel(player, foe, [], DamageKind.PHYSICAL)
+
+        # The weapon breaks during the attack, no effect can be applied
+        self.assertEqual({"stun": 0.0}, forecast.effect_probabilities)
+
+        weapon.durability = 10
+        forecast = forecast_duel(player, foe, [], DamageKind.PHYSICAL)
+
+        self.assertAlmostEqual(50 / 101, forecast.effect_probabilities["stun"])
+
+    def test_ai_attacks_target_it_can_kill(self):
+        enable_headless_mode()
+        try:
+            level = LevelEngine("maps/level_0/", 0)
+        finally:
+            enable_headless_mode(False)
+        foe = random_foe_entity(reach=[1])
+        foe.position = Position(5 * TILE_SIZE, 5 * TILE_SIZE)
+        strong_player = random_player_entity(min_hp=1000, max_hp=1000)
+        strong_player.position = Position(6 * TILE_SIZE, 5 * TILE_SIZE)
+        weak_player = random_player_entity(min_hp=1, max_hp=1, max_defense=0)
+        weak_player.defense = 0
+        weak_player.resistance = 0
+        weak_player.position = Position(5 * TILE_SIZE, 6 * TILE_SIZE)
+        distant_player = random_player_entity(min_hp=1, max_hp=1, max_defense=0)
+        distant_player.defense = 0
+        distant_player.resistance = 0
+        distant_player.position = Position(8 * TILE_SIZE, 5 * TILE_SIZE)
+        foe.strength = 10
+        targets = [strong_player, weak_player, distant_player]
+
+        self.assertIs(
+            weak_player, level.choose_ai_attack_target(foe, strong_player, targets)
+        )
+        self.assertIs(
+            weak_player, level.choose_ai_attack_target(foe, weak_player, targets)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
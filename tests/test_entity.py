@@ -4,6 +4,7 @@ import unittest
 from src.constants import MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH, TILE_SIZE
 from src.game_entities.entity import Entity
 from src.gui.position import Position
+from src.services.tile import Tile
 from tests.random_data_library import random_position
 from tests.tools import minimal_setup_for_game
 
@@ -69,6 +70,19 @@ class TestEntity(unittest.TestCase):
             )
         )
 
+    def test_tile_follows_position(self):
+        entity = Entity(
+            "test",
+            Position(2 * TILE_SIZE, 4 * TILE_SIZE),
+            "imgs/dungeon_crawl/monster/angel.png",
+        )
+        self.assertEqual(Tile(2, 4), entity.tile)
+
+        entity.position = Position(5 * TILE_SIZE, TILE_SIZE)
+        self.assertEqual(Tile(5, 1), entity.tile)
+        self.assertEqual("5", entity.save("entity").find("position/x").text)
+        self.assertEqual("1", entity.save("entity").find("position/y").text)
+
 
 if __name__ == "__main__":
     unittest.main()
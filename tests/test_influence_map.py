@@ -0,0 +1,41 @@
+import unittest
+
+from src.services.influence_map import InfluenceMap
+
+
+class TestInfluenceMap(unittest.TestCase):
+    def setUp(self):
+        # A 5x4 map, tiles are identified by row * 5 + column
+        self.influence_map = InfluenceMap(5, 4, (1, 2))
+
+    def test_attack_tiles(self):
+        self.influence_map.add_target(0, 1 * 5 + 1)
+        self.assertEqual(
+            {0 * 5 + 1, 2 * 5 + 1, 1 * 5 + 0, 1 * 5 + 2},
+            set(self.influence_map.get_attack_tiles(0, 1)),
+        )
+        # Tiles outside the map are ignored
+        self.assertEqual(
+            {
+                3 * 5 + 1,
+                1 * 5 + 3,
+                0 * 5 + 0,
+                0 * 5 + 2,
+                2 * 5 + 0,
+                2 * 5 + 2,
+            },
+            set(self.influence_map.get_attack_tiles(0, 2)),
+        )
+        self.assertEqual((), self.influence_map.get_attack_tiles(1, 1))
+
+    def test_targets_at_are_sorted(self):
+        self.influence_map.add_target(3, 1 * 5 + 2)
+        self.influence_map.add_target(1, 1 * 5 + 0)
+        self.assertEqual([1, 3], self.influence_map.get_targets_at(1 * 5 + 1, 1))
+        self.assertEqual([3], self.influence_map.get_targets_at(1 * 5 + 3, 1))
+        self.assertEqual([1], self.influence_map.get_targets_at(1 * 5 + 2, 2))
+        self.assertEqual((), self.influence_map.get_targets_at(3 * 5 + 4, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
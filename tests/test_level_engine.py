@@ -0,0 +1,128 @@
+import unittest
+
+from src.gui.position import Position
+from src.services.assets_manager import (SILENT_SOUND, enable_headless_mode,
+                                         is_headless)
+from src.services.level_engine import LevelEngine, LevelStatus
+from src.services.player_controller import (AutoPlayerController,
+                                            PlayerCommand,
+                                            ScriptedPlayerController)
+from src.services.random_service import (RandomService,
+                                         get_active_random_service)
+from tests.tools import minimal_setup_for_game
+
+
+class TestLevelEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        enable_headless_mode()
+
+    def tearDown(self):
+        enable_headless_mode(False)
+
+    def test_init_level_engine_headless(self):
+        level = LevelEngine("maps/level_0/", 0)
+        level.load_level_content()
+
+        self.assertTrue(is_headless())
+        self.assertTrue(level.is_loaded)
+        self.assertEqual(LevelStatus.VERY_BEGINNING, level.game_phase)
+        self.assertTrue(level.players)
+        for player in level.players:
+            self.assertIs(SILENT_SOUND, player.attack_sfx)
+
+    def test_init_level_engine_keeps_active_random_service(self):
+        active_service = get_active_random_service()
+        level = LevelEngine("maps/level_0/", 0, random_service=RandomService(1))
+
+        self.assertIs(active_service, get_active_random_service())
+
+        level.load_level_content()
+
+        self.assertIs(level.random_service, get_active_random_service())
+
+    def test_run_level_with_auto_controller(self):
+        level = LevelEngine("maps/level_0/", 0)
+
+        status = level.run(AutoPlayerController(), max_turns=40)
+
+        self.assertEqual(LevelStatus.ENDED_VICTORY, status)
+        self.assertTrue(level.escaped_players)
+        self.assertLessEqual(level.turn, 40)
+
+    def test_run_level_until_max_turns(self):
+        level = LevelEngine("maps/level_0/", 0)
+
+        status = level.run(ScriptedPlayerController([]), max_turns=2)
+
+        self.assertEqual(LevelStatus.IN_PROGRESS, status)
+        self.assertEqual(3, level.turn)
+        self.assertFalse(level.escaped_players)
+
+    def test_same_seed_same_level(self):
+        results = []
+        for _ in range(2):
+            level = LevelEngine("maps/level_1/", 1, random_service=RandomService(42))
+            status = level.run(AutoPlayerController(), max_turns=10)
+            results.append(
+                (
+                    status,
+                    level.turn,
+                    [(foe.position, foe.hit_points) for foe in level.entities.foes],
+                    [(player.position, player.hit_points) for player in level.players],
+                    [chest.item.name for chest in level.entities.chests],
+                    level.random_service.get_draws(),
+                )
+            )
+
+        self.assertEqual(results[0], results[1])
+
+    def test_set_fast_forward(self):
+        level = LevelEngine("maps/level_0/", 0)
+        default_frame_budget = level.ai_scheduler.frame_budget
+
+        level.set_fast_forward(True)
+        self.assertTrue(level.fast_forward)
+        self.assertTrue(level.instant_moves)
+        self.assertEqual(float("inf"), level.ai_scheduler.frame_budget)
+
+        level.set_fast_forward(False)
+        self.assertFalse(level.fast_forward)
+        self.assertFalse(level.instant_moves)
+        self.assertEqual(default_frame_budget, level.ai_scheduler.frame_budget)
+
+    def test_scripted_command_moves_player(self):
+        level = LevelEngine("maps/level_0/", 0)
+        level.load_level_content()
+        level.start_game()
+        level.set_fast_forward(True)
+        player = level.players[0]
+        destination = next(
+            move
+            for move in level.get_entity_possible_moves(player, player.max_moves)
+            if move != player.position
+        )
+
+        level.play_player_command(player, PlayerCommand(destination))
+
+        self.assertEqual(destination, player.position)
+        self.assertTrue(player.turn_is_finished())
+        self.assertIs(player, level.get_entity_on_tile(destination))
+
+    def test_invalid_scripted_command(self):
+        level = LevelEngine("maps/level_0/", 0)
+        level.load_level_content()
+        level.start_game()
+        player = level.players[0]
+        start_position = player.position
+
+        with self.assertRaises(ValueError):
+            level.play_player_command(player, PlayerCommand(Position(-1, -1)))
+        self.assertEqual(start_position, player.position)
+
+
+if __name__ == "__main__":
+    unittest.main()
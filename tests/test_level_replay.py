@@ -0,0 +1,160 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pygame as pg
+from pygamepopup.components import Button
+
+from src.constants import MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH
+from src.scenes.level_scene import LevelScene
+from src.scenes.start_scene import StartScene
+from src.services.assets_manager import enable_headless_mode
+from src.services.command_log import CommandKind, CommandLog
+from src.services.level_engine import EntityTurn, LevelEngine
+from src.services.level_replay import replay_level, verify_replay
+from src.services.player_controller import AutoPlayerController
+from src.services.random_service import RandomService
+from src.services.save_state_manager import SaveStateManager
+from tests.tools import minimal_setup_for_game
+
+
+class TestLevelReplay(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+        cls.save_path = "saves/save_0.xml"
+
+    def record_headless_run(self, number: int, max_turns: int) -> CommandLog:
+        enable_headless_mode()
+        try:
+            level = LevelEngine(
+                f"maps/level_{number}/", number, random_service=RandomService(3)
+            )
+            level.command_log = CommandLog.start(level)
+            level.run(AutoPlayerController(), max_turns=max_turns)
+            level.command_log.state_hash = SaveStateManager(level).compute_state_hash()
+        finally:
+            enable_headless_mode(False)
+        return level.command_log
+
+    def test_replay_headless_run(self):
+        command_log = self.record_headless_run(0, 40)
+
+        self.assertEqual(CommandKind.START_GAME, command_log.commands[0].kind)
+        self.assertIn(
+            CommandKind.TAKE_OBJECTIVE,
+            [command.kind for command in command_log.commands],
+        )
+        self.assertTrue(verify_replay(command_log))
+
+    def test_save_and_load_command_log(self):
+        command_log = self.record_headless_run(1, 5)
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "command_log.json")
+            command_log.save(path)
+            loaded_command_log = CommandLog.load(path)
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual(command_log.commands, loaded_command_log.commands)
+        self.assertEqual(command_log.players, loaded_command_log.players)
+        self.assertEqual(command_log.seed, loaded_command_log.seed)
+        self.assertEqual(command_log.state_hash, loaded_command_log.state_hash)
+        self.assertTrue(verify_replay(loaded_command_log))
+
+    def test_altered_command_log_is_detected(self):
+        command_log = self.record_headless_run(1, 5)
+        command_log.seed += 1
+
+        self.assertFalse(verify_replay(command_log))
+
+        command_log.state_hash = None
+        with self.assertRaises(ValueError):
+            verify_replay(command_log)
+
+    def test_diverging_replay_is_detected(self):
+        command_log = self.record_headless_run(1, 5)
+        last_command = command_log.commands[-1]
+        # The players skip their turns until the last decision
+        command_log.commands = [
+            command_log.commands[0],
+            last_command._replace(turn=last_command.turn + 10),
+        ]
+
+        with self.assertRaises(ValueError):
+            replay_level(command_log)
+
+    def test_replay_decisions_made_in_level_scene(self):
+        screen = pg.display.set_mode((MAIN_WIN_WIDTH, MAIN_WIN_HEIGHT))
+        start_screen = StartScene(screen)
+        shutil.copyfile(
+            "tests/test_saves/complete_first_level_save.xml", self.save_path
+        )
+        start_screen.load_menu()
+        LevelScene.record_command_log = True
+        self.addCleanup(setattr, LevelScene, "record_command_log", False)
+        start_screen.load_game(0)
+        level = start_screen.level
+        level.load_level_content()
+        level.menu_manager.clear_menus()
+        level.engine.set_fast_forward(True)
+
+        players = {player.name: player for player in level.engine.players}
+        active_player = players["raimund"]
+        partner = players["braern"]
+
+        # Move, trade an item and cancel the move
+        level.selected_player = active_player
+        level.engine.move_player(active_player, active_player.position)
+        level.open_player_menu()
+        level.interact(active_player, partner, partner.position)
+        level.interact_trade_item(
+            active_player.items[0], Button(), (active_player, partner), True
+        )
+        level.trade_item(active_player, partner, True)
+        level.menu_manager.clear_menus()
+        level.open_player_menu()
+        level.right_click()
+
+        # Move again, give an item and end the turn
+        level.selected_player = active_player
+        level.engine.move_player(active_player, active_player.position)
+        level.open_player_menu()
+        level.interact(active_player, partner, partner.position)
+        level.interact_trade_item(
+            partner.items[0], Button(), (active_player, partner), False
+        )
+        level.trade_item(active_player, partner, False)
+        level.end_active_character_turn()
+        level.end_turn()
+        while level.engine.side_turn is not EntityTurn.PLAYER:
+            level.update_state()
+
+        command_kinds = [command.kind for command in level.engine.command_log.commands]
+        self.assertEqual(
+            [
+                CommandKind.MOVE,
+                CommandKind.GIVE_ITEM,
+                CommandKind.CANCEL_MOVE,
+                CommandKind.MOVE,
+                CommandKind.GIVE_ITEM,
+                CommandKind.END_PLAYER_TURN,
+                CommandKind.END_TURN,
+            ],
+            command_kinds,
+        )
+        replayed_level = replay_level(level.engine.command_log)
+        self.assertEqual(
+            SaveStateManager(level.engine).compute_state_hash(),
+            SaveStateManager(replayed_level).compute_state_hash(),
+        )
+        self.assertEqual(
+            [item.name for item in active_player.items],
+            [item.name for item in replayed_level.get_player_by_name("raimund").items],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ from pygamepopup.components import Button
 
 from src.constants import MAIN_WIN_HEIGHT, MAIN_WIN_WIDTH, TILE_SIZE
 from src.gui.position import Position
+from src.scenes.level_scene import EntityTurn
 from src.scenes.start_scene import StartScene
 from src.services import menu_creator_manager
 from src.services.load_from_xml_manager import parse_item_file
@@ -49,9 +50,9 @@ class TestLevel(unittest.TestCase):
         # Import simple save file
         self.import_save_file("tests/test_saves/simple_save.xml")
 
-        players = self.level.players
-        foe = self.level.entities.foes[0]
-        entities_with_dist = self.level.distance_between_all(foe, players)
+        players = self.level.engine.players
+        foe = self.level.engine.entities.foes[0]
+        entities_with_dist = self.level.engine.distance_between_all(foe, players)
 
         self.assertEqual(5, entities_with_dist[players[0]])
 
@@ -59,8 +60,8 @@ class TestLevel(unittest.TestCase):
         # Import complete save file
         self.import_save_file("tests/test_saves/complete_first_level_save.xml")
 
-        players = self.level.players
-        foes = self.level.entities.foes
+        players = self.level.engine.players
+        foes = self.level.engine.entities.foes
 
         raimund = None
         braern = None
@@ -82,24 +83,139 @@ class TestLevel(unittest.TestCase):
             if position == (9, 7):
                 specific_necrophage = foe
 
-        entities_distance_to_skeleton = self.level.distance_between_all(
+        entities_distance_to_skeleton = self.level.engine.distance_between_all(
             specific_skeleton, players
         )
         self.assertEqual(5, entities_distance_to_skeleton[raimund])
         self.assertEqual(6, entities_distance_to_skeleton[braern])
         self.assertEqual(2, entities_distance_to_skeleton[thokdrum])
 
-        entities_distance_to_necrophage = self.level.distance_between_all(
+        entities_distance_to_necrophage = self.level.engine.distance_between_all(
             specific_necrophage, players
         )
         self.assertEqual(7, entities_distance_to_necrophage[raimund])
         self.assertEqual(8, entities_distance_to_necrophage[braern])
 
+    def test_determine_path_to(self):
+        # Import complete save file
+        self.import_save_file("tests/test_saves/complete_first_level_save.xml")
+
+        for entity in self.level.engine.players + self.level.engine.entities.foes:
+            possible_moves = self.level.engine.get_possible_moves(
+                entity.position, entity.max_moves
+            )
+            for tile, distance in possible_moves.items():
+                path = self.level.engine.determine_path_to(tile, possible_moves)
+                self.assertEqual(max(distance, 1), len(path))
+                self.assertEqual(tile, path[-1])
+                previous_tile = entity.position
+                for step in path[:distance]:
+                    self.assertEqual(
+                        TILE_SIZE,
+                        abs(step[0] - previous_tile[0])
+                        + abs(step[1] - previous_tile[1]),
+                    )
+                    self.assertTrue(self.level.engine.is_tile_available(step))
+                    previous_tile = step
+
+    def test_get_possible_attacks(self):
+        # Import complete save file
+        self.import_save_file("tests/test_saves/complete_first_level_save.xml")
+
+        for player in self.level.engine.players:
+            possible_moves = self.level.engine.get_possible_moves(
+                player.position, player.max_moves
+            )
+            for reach in ([1], [1, 2]):
+                possible_attacks = self.level.engine.get_possible_attacks(
+                    possible_moves, reach, True
+                )
+                for foe in self.level.engine.entities.foes:
+                    is_at_reach = any(
+                        abs(foe.position[0] - move[0]) + abs(foe.position[1] - move[1])
+                        in [distance * TILE_SIZE for distance in reach]
+                        for move in possible_moves
+                    )
+                    self.assertEqual(is_at_reach, foe.position in possible_attacks)
+
+    def test_side_turn_plan(self):
+        # Import complete save file
+        self.import_save_file("tests/test_saves/complete_first_level_save.xml")
+
+        self.level.engine.side_turn = EntityTurn.FOES
+        self.level.engine.begin_turn()
+        foes = self.level.engine.entities.foes
+        # The planning is left to the AI scheduler
+        self.assertFalse(self.level.engine.ai_scheduler.is_idle())
+        self.level.engine.ai_scheduler.run_until_idle()
+        self.assertEqual(set(foes), set(self.level.engine.side_plan))
+
+        # The plan is played back until a foe ends its turn
+        foe = foes[0]
+        action = self.level.engine.side_plan[foe]
+        while not foe.turn_is_finished():
+            self.level.engine.process_entity_action(foe, False)
+        expected_tile = (
+            self.level.engine.walkability_grid.position_of(action.path[-1])
+            if action.path
+            else foe.position
+        )
+        self.assertEqual(expected_tile, foe.position)
+
+        # Removing an entity drops the plan, remaining foes are planned again
+        self.level.engine.remove_entity(self.level.engine.players[0])
+        self.assertEqual({}, self.level.engine.side_plan)
+        self.level.engine.process_entity_action(foes[1], False)
+        self.assertEqual(set(foes[1:]), set(self.level.engine.side_plan))
+
+    def test_move_range_cache(self):
+        # Import complete save file
+        self.import_save_file("tests/test_saves/complete_first_level_save.xml")
+
+        player = self.level.engine.players[0]
+        foe = self.level.engine.entities.foes[0]
+        possible_moves = self.level.engine.get_entity_possible_moves(
+            player, player.max_moves
+        )
+        possible_attacks = self.level.engine.get_entity_possible_attacks(
+            player, player.max_moves, True
+        )
+        self.assertEqual(
+            self.level.engine.get_possible_moves(player.position, player.max_moves),
+            possible_moves,
+        )
+        self.assertEqual(
+            self.level.engine.get_possible_attacks(possible_moves, player.reach, True),
+            possible_attacks,
+        )
+        self.assertIs(
+            possible_moves,
+            self.level.engine.get_entity_possible_moves(player, player.max_moves),
+        )
+        self.assertIs(
+            possible_attacks,
+            self.level.engine.get_entity_possible_attacks(
+                player, player.max_moves, True
+            ),
+        )
+        self.assertIsNot(
+            possible_moves,
+            self.level.engine.get_entity_possible_moves(player, player.max_moves + 1),
+        )
+
+        # Any move on the level invalidates the cache
+        foe.position = next(tile for tile in possible_moves if tile != player.position)
+        new_possible_moves = self.level.engine.get_entity_possible_moves(
+            player, player.max_moves
+        )
+        self.assertIsNot(possible_moves, new_possible_moves)
+        self.assertNotIn(foe.position, new_possible_moves)
+
     def test_cancel_movement_after_trade_item_sent(self):
         # Import complete save file
         self.import_save_file("tests/test_saves/complete_first_level_save.xml")
 
-        players = self.level.players
+        players = self.level.engine.players
 
         active_player = [player for player in players if player.name == "raimund"][0]
         receiver_player = [player for player in players if player.name == "braern"][0]
@@ -135,7 +251,7 @@ class TestLevel(unittest.TestCase):
         # Import complete save file
         self.import_save_file("tests/test_saves/complete_first_level_save.xml")
 
-        players = self.level.players
+        players = self.level.engine.players
 
         active_player = [player for player in players if player.name == "raimund"][0]
         sender_player = [player for player in players if player.name == "braern"][0]
@@ -171,7 +287,7 @@ class TestLevel(unittest.TestCase):
         # Import complete save file
         self.import_save_file("tests/test_saves/complete_first_level_save.xml")
 
-        players = self.level.players
+        players = self.level.engine.players
 
         active_player = [player for player in players if player.name == "raimund"][0]
         trade_partner_player = [
@@ -217,7 +333,7 @@ class TestLevel(unittest.TestCase):
         # Import complete save file
         self.import_save_file("tests/test_saves/complete_first_level_save.xml")
 
-        players = self.level.players
+        players = self.level.engine.players
 
         active_player = [player for player in players if player.name == "raimund"][0]
         trade_partner_player = [
@@ -288,7 +404,7 @@ class TestLevel(unittest.TestCase):
         self.import_save_file("tests/test_saves/simple_save.xml")
 
         raimund_player = [
-            player for player in self.level.players if player.name == "raimund"
+            player for player in self.level.engine.players if player.name == "raimund"
         ][0]
         item_to_be_thrown = [
             item for item in raimund_player.items if item.name == "life_potion"
@@ -308,7 +424,7 @@ class TestLevel(unittest.TestCase):
         self.import_save_file("tests/test_saves/simple_save.xml")
 
         raimund_player = [
-            player for player in self.level.players if player.name == "raimund"
+            player for player in self.level.engine.players if player.name == "raimund"
         ][0]
         equipment_to_be_thrown = [
             item for item in raimund_player.equipments if item.name == "basic_bow"
@@ -332,7 +448,7 @@ class TestLevel(unittest.TestCase):
         self.import_save_file("tests/test_saves/simple_save.xml")
 
         raimund_player = [
-            player for player in self.level.players if player.name == "raimund"
+            player for player in self.level.engine.players if player.name == "raimund"
         ][0]
         equipment_to_be_thrown_from_inventory = parse_item_file("basic_bow")
         raimund_player.set_item(equipment_to_be_thrown_from_inventory)
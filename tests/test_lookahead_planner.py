@@ -0,0 +1,125 @@
+import unittest
+
+from src.game_entities.movable import EntityStrategy
+from src.services.assets_manager import enable_headless_mode
+from src.services.level_engine import LevelEngine
+from src.services.lookahead_planner import (BUDGET_CHECK_INTERVAL, BoardUnit,
+                                            LookaheadPlanner)
+from src.services.player_controller import AutoPlayerController
+from src.services.random_service import RandomService
+from src.services.side_turn_planner import PlannedAction
+from src.services.walkability_grid import WalkabilityGrid
+from tests.tools import minimal_setup_for_game
+
+
+class TestLookaheadPlanner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.grid = WalkabilityGrid(0, 0, 8, 3)
+
+    def add_unit(self, tile, hit_points, damage, max_moves=2, reach=(1,)):
+        self.grid.blocked[tile] = True
+        return BoardUnit(tile, hit_points, max_moves, reach, damage)
+
+    def test_attacks_target_it_can_kill(self):
+        entity = self.add_unit(1 * 8 + 2, 50, (0, 5, 5))
+        strong_opponent = self.add_unit(1 * 8 + 3, 50, (1, 0, 0), max_moves=0)
+        weak_opponent = self.add_unit(0 * 8 + 2, 5, (1, 0, 0), max_moves=0)
+
+        action = LookaheadPlanner(
+            self.grid, [entity, strong_opponent, weak_opponent]
+        ).search()
+
+        self.assertEqual(2, action.attack)
+        self.assertEqual(2, action.target)
+
+    def test_avoids_deadly_reply(self):
+        entity = self.add_unit(1 * 8, 5, (0, 1), max_moves=3)
+        opponent = self.add_unit(1 * 8 + 4, 50, (10, 0), max_moves=1)
+        units = [entity, opponent]
+
+        greedy_action = LookaheadPlanner(self.grid, units, max_depth=1).search()
+        action = LookaheadPlanner(self.grid, units, max_depth=2).search()
+
+        self.assertEqual(1, greedy_action.attack)
+        self.assertEqual(1 * 8 + 3, greedy_action.path[-1])
+        self.assertIsNone(action.attack)
+        for tile in action.path:
+            self.assertFalse(self.grid.blocked[tile])
+        destination = action.path[-1] if action.path else entity.tile
+        # The opponent cannot get at reach of the entity after its move
+        self.assertGreater(abs(destination % 8 - 4) + abs(destination // 8 - 1), 2)
+
+    def test_board_is_restored_after_search(self):
+        entity = self.add_unit(1 * 8 + 1, 30, (0, 4, 4))
+        first_opponent = self.add_unit(1 * 8 + 4, 10, (3, 0, 0))
+        second_opponent = self.add_unit(0 * 8 + 5, 10, (3, 0, 0))
+        planner = LookaheadPlanner(
+            self.grid, [entity, first_opponent, second_opponent], max_depth=3
+        )
+        initial_hash = planner.hash
+        initial_grid = bytes(planner.walkability_grid.blocked)
+
+        planner.search()
+
+        self.assertEqual(3, planner.depth)
+        self.assertEqual(initial_hash, planner.hash)
+        self.assertEqual(initial_grid, bytes(planner.walkability_grid.blocked))
+        self.assertEqual([30, 10, 10], planner.hit_points)
+        self.assertTrue(planner.transposition_table)
+
+    def test_search_is_stopped_by_budget(self):
+        entity = self.add_unit(1 * 8 + 1, 30, (0, 4))
+        opponent = self.add_unit(1 * 8 + 4, 10, (3, 0))
+
+        planner = LookaheadPlanner(self.grid, [entity, opponent], max_nodes=50)
+        action = planner.search()
+
+        self.assertLess(planner.depth, planner.max_depth)
+        self.assertLessEqual(planner.nodes, 50)
+        self.assertIsInstance(action, PlannedAction)
+
+        planner = LookaheadPlanner(self.grid, [entity, opponent], time_budget=0)
+        action = planner.search()
+
+        self.assertIsInstance(action, PlannedAction)
+
+    def test_search_is_resumable(self):
+        entity = self.add_unit(1 * 8 + 1, 30, (0, 4))
+        opponent = self.add_unit(1 * 8 + 4, 10, (3, 0))
+        planner = LookaheadPlanner(self.grid, [entity, opponent])
+
+        steps = sum(1 for _ in planner.iter_search())
+
+        # The search is resumed regularly, not only between the moves of the entity
+        self.assertGreaterEqual(steps, planner.nodes // BUDGET_CHECK_INTERVAL)
+        self.assertGreater(steps, 1)
+        self.assertEqual(
+            planner.action, LookaheadPlanner(self.grid, [entity, opponent]).search()
+        )
+
+    def test_level_with_lookahead_foe(self):
+        enable_headless_mode()
+        try:
+            level = LevelEngine("maps/level_0/", 0, random_service=RandomService(0))
+            level.load_level_content()
+            foe = level.entities.foes[0]
+            foe.strategy = EntityStrategy.LOOKAHEAD
+            level.schedule_lookahead_action(foe, False)
+            level.ai_scheduler.run_until_idle()
+            action = level.side_plan[foe]
+            for tile in action.path:
+                self.assertFalse(level.walkability_grid.blocked[tile])
+            level.side_plan.clear()
+            level.run(AutoPlayerController(), max_turns=5)
+        finally:
+            enable_headless_mode(False)
+
+        self.assertGreater(level.turn, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
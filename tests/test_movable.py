@@ -1,8 +1,12 @@
 import random as rd
 import unittest
 
-from src.game_entities.movable import DamageKind, EntityStrategy, Movable
-from tests.random_data_library import (STATS, random_alteration, random_item,
+from src.constants import TILE_SIZE
+from src.game_entities.movable import (DamageKind, EntityState, EntityStrategy,
+                                       Movable)
+from src.gui.position import Position
+from tests.random_data_library import (STATS, random_alteration,
+                                       random_foe_entity, random_item,
                                        random_movable_entity, random_string)
 from tests.tools import minimal_setup_for_game
 
@@ -72,6 +76,69 @@ class TestMovable(unittest.TestCase):
 
         self.assertTrue(movable_entity.is_on_position(new_pos))
 
+    def test_act_only_requests_needed_data(self):
+        movable_entity = random_foe_entity()
+        movable_entity.strategy = EntityStrategy.STATIC
+        requests = []
+
+        def get_possible_moves():
+            requests.append("moves")
+            return {movable_entity.position: 0}
+
+        def get_targets():
+            requests.append("targets")
+            return {}
+
+        def get_path_towards(target):
+            requests.append("path")
+            return []
+
+        self.assertEqual(
+            movable_entity.position,
+            movable_entity.act(get_possible_moves, get_targets, get_path_towards),
+        )
+        self.assertEqual(["targets"], requests)
+
+        requests.clear()
+        movable_entity.set_move([movable_entity.position])
+        movable_entity._timer = 0
+        self.assertIsNone(
+            movable_entity.act(get_possible_moves, get_targets, get_path_towards)
+        )
+        self.assertEqual([], requests)
+        self.assertIs(EntityState.HAVE_TO_ATTACK, movable_entity.state)
+
+        self.assertIsNone(
+            movable_entity.act(get_possible_moves, get_targets, get_path_towards)
+        )
+        self.assertEqual(["targets"], requests)
+        self.assertTrue(movable_entity.turn_is_finished())
+
+    def test_active_entity_follows_path_towards_nearest_target(self):
+        movable_entity = random_foe_entity()
+        movable_entity.strategy = EntityStrategy.ACTIVE
+        nearest_target = random_foe_entity()
+        other_target = random_foe_entity()
+        paths = {nearest_target: [Position(0, 0), Position(TILE_SIZE, 0)]}
+
+        self.assertEqual(
+            Position(TILE_SIZE, 0),
+            movable_entity.act(
+                lambda: self.fail("possible moves should not be computed"),
+                lambda: {other_target: 4, nearest_target: 2},
+                lambda target: paths[target],
+            ),
+        )
+        self.assertIs(nearest_target, movable_entity.target)
+
+        paths[nearest_target] = []
+        self.assertEqual(
+            movable_entity.position,
+            movable_entity.act(
+                lambda: {}, lambda: {nearest_target: 0}, lambda target: paths[target]
+            ),
+        )
+
     def test_new_alteration(self):
         movable_entity = random_movable_entity()
         alteration = random_alteration(name="alt_test")
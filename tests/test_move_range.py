@@ -0,0 +1,38 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.move_range import MoveRange
+
+
+class TestMoveRange(unittest.TestCase):
+    def setUp(self):
+        self.start = Position(0, 0)
+        self.first_step = Position(TILE_SIZE, 0)
+        self.second_step = Position(TILE_SIZE, TILE_SIZE)
+        self.move_range = MoveRange(
+            {self.start: 0, self.first_step: 1, self.second_step: 2},
+            {self.first_step: self.start, self.second_step: self.first_step},
+        )
+
+    def test_behaves_like_distances_dictionary(self):
+        self.assertEqual(2, self.move_range[self.second_step])
+        self.assertIn((TILE_SIZE, 0), self.move_range)
+        self.assertEqual(3, len(self.move_range))
+
+    def test_path_to(self):
+        self.assertEqual(
+            [self.first_step, self.second_step],
+            self.move_range.path_to(self.second_step),
+        )
+        self.assertEqual([self.first_step], self.move_range.path_to(self.first_step))
+        self.assertEqual([self.start], self.move_range.path_to(self.start))
+
+    def test_clear(self):
+        self.move_range.clear()
+        self.assertFalse(self.move_range)
+        self.assertFalse(self.move_range.predecessors)
+
+
+if __name__ == "__main__":
+    unittest.main()
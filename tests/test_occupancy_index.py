@@ -0,0 +1,81 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.scenes.level_scene import LevelEntityCollections
+from src.services.occupancy_index import OccupancyIndex
+from tests.random_data_library import (random_foe_entity, random_objective,
+                                       random_player_entity)
+from tests.tools import minimal_setup_for_game
+
+
+class TestOccupancyIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.entities = LevelEntityCollections()
+        self.foe = random_foe_entity()
+        self.foe.position = Position(2 * TILE_SIZE, 3 * TILE_SIZE)
+        self.entities.foes.append(self.foe)
+        self.occupancy = OccupancyIndex(self.entities)
+
+    def test_get_entity_on_tile(self):
+        self.assertIs(self.foe, self.occupancy.get_entity(self.foe.position))
+        self.assertIs(
+            self.foe, self.occupancy.get_entity((2 * TILE_SIZE, 3 * TILE_SIZE))
+        )
+        self.assertIsNone(self.occupancy.get_entity(Position(0, 0)))
+
+    def test_entity_move_is_tracked(self):
+        old_position = self.foe.position
+        new_position = Position(5 * TILE_SIZE, 3 * TILE_SIZE)
+        self.foe.set_move([new_position])
+        self.foe._timer = 0
+        self.foe.move()
+
+        self.assertIsNone(self.occupancy.get_entity(old_position))
+        self.assertIs(self.foe, self.occupancy.get_entity(new_position))
+
+    def test_add_and_remove_entity(self):
+        player = random_player_entity()
+        player.set_initial_pos(Position(4 * TILE_SIZE, 4 * TILE_SIZE))
+        self.entities.players.append(player)
+        self.occupancy.add(player)
+        self.assertIs(player, self.occupancy.get_entity(player.position))
+
+        self.entities.foes.remove(self.foe)
+        self.occupancy.remove(self.foe)
+        self.assertIsNone(self.occupancy.get_entity(self.foe.position))
+
+        # A removed entity is not tracked anymore
+        self.foe.position = player.position
+        self.assertIs(player, self.occupancy.get_entity(player.position))
+
+    def test_shared_tile_follows_collections_order(self):
+        objective = random_objective(position=Position(TILE_SIZE, TILE_SIZE))
+        self.entities.objectives.append(objective)
+        self.occupancy.add(objective)
+        self.assertIs(objective, self.occupancy.get_entity(objective.position))
+
+        player = random_player_entity()
+        self.entities.players.append(player)
+        self.occupancy.add(player)
+        player.set_initial_pos(Position(TILE_SIZE, TILE_SIZE))
+        self.assertIs(player, self.occupancy.get_entity(objective.position))
+
+        player.set_initial_pos(Position(6 * TILE_SIZE, TILE_SIZE))
+        self.assertIs(objective, self.occupancy.get_entity(objective.position))
+
+    def test_version_changes_with_occupancy(self):
+        version = self.occupancy.version
+        self.occupancy.get_entity(self.foe.position)
+        self.assertEqual(version, self.occupancy.version)
+
+        self.foe.position = Position(4 * TILE_SIZE, 3 * TILE_SIZE)
+        self.assertLess(version, self.occupancy.version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import pickle
+import random
+import unittest
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+from src.game_entities.movable import EntityStrategy
+from src.services.parallel_side_turn_planner import (BoardSnapshot,
+                                                     ParallelSideTurnPlanner,
+                                                     create_executor,
+                                                     evaluate_agents)
+from src.services.side_turn_planner import AgentSnapshot, SideTurnPlanner
+from src.services.walkability_grid import WalkabilityGrid
+
+
+def random_board(seed, agents_count=40, targets_count=5):
+    generator = random.Random(seed)
+    grid = WalkabilityGrid(0, 0, 20, 15)
+    for tile in range(20 * 15):
+        grid.blocked[tile] = generator.random() < 0.15
+    free_tiles = [tile for tile in range(20 * 15) if not grid.blocked[tile]]
+    occupied_tiles = generator.sample(free_tiles, agents_count + targets_count)
+    for tile in occupied_tiles:
+        grid.blocked[tile] = True
+    agents = [
+        AgentSnapshot(
+            tile,
+            generator.randint(1, 5),
+            generator.choice([(1,), (2,), (1, 2)]),
+            generator.choice(list(EntityStrategy)),
+        )
+        for tile in occupied_tiles[:agents_count]
+    ]
+    return grid, agents, occupied_tiles[agents_count:]
+
+
+class StalledExecutor(Executor):
+    """
+    An executor whose tasks never end, or end with the given error.
+    """
+
+    def __init__(self, error=None):
+        self.error = error
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        if self.error is not None:
+            future.set_exception(self.error)
+        return future
+
+
+class TestParallelSideTurnPlanner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = create_executor(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_same_plan_as_single_process(self):
+        for seed in range(5):
+            grid, agents, targets = random_board(seed)
+            expected_actions = SideTurnPlanner(grid).plan(agents, targets)
+            for chunk_size in (1, 7, 100):
+                planner = ParallelSideTurnPlanner(grid, self.executor, chunk_size)
+                self.assertEqual(expected_actions, planner.plan(agents, targets))
+
+    def test_iter_plan_waits_for_workers(self):
+        grid, agents, targets = random_board(0)
+        expected_actions = SideTurnPlanner(grid).plan(agents, targets)
+        actions = ParallelSideTurnPlanner(grid, self.executor, 10).iter_plan(
+            agents, targets
+        )
+        self.assertEqual(
+            expected_actions, [action for action in actions if action is not None]
+        )
+
+    def test_worker_decisions_are_reused(self):
+        grid, agents, targets = random_board(1)
+        static_agents = [
+            agent._replace(strategy=EntityStrategy.STATIC) for agent in agents
+        ]
+        planner = ParallelSideTurnPlanner(grid, self.executor, 10)
+        planner.plan(static_agents, targets)
+        self.assertEqual(len(static_agents), planner.reused_decisions)
+
+    def test_stalled_workers_raise_timeout(self):
+        grid, agents, targets = random_board(3)
+        planner = ParallelSideTurnPlanner(grid, StalledExecutor(), 10, timeout=0.05)
+        with self.assertRaises(TimeoutError):
+            planner.plan(agents, targets)
+        with self.assertRaises(TimeoutError):
+            list(planner.iter_plan(agents, targets))
+
+    def test_dead_worker_raises(self):
+        grid, agents, targets = random_board(4)
+        planner = ParallelSideTurnPlanner(
+            grid, StalledExecutor(BrokenProcessPool()), 10
+        )
+        with self.assertRaises(BrokenProcessPool):
+            planner.plan(agents, targets)
+        with self.assertRaises(BrokenProcessPool):
+            list(planner.iter_plan(agents, targets))
+
+    def test_snapshot_can_be_sent_to_workers(self):
+        grid, agents, targets = random_board(2)
+        snapshot = BoardSnapshot(
+            grid.width, grid.height, bytes(grid.blocked), tuple(targets)
+        )
+        self.assertEqual(snapshot, pickle.loads(pickle.dumps(snapshot)))
+        self.assertEqual(
+            evaluate_agents(snapshot, agents),
+            pickle.loads(pickle.dumps(evaluate_agents(snapshot, agents))),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from src.services.path_finder import PathFinder
+from src.services.walkability_grid import WalkabilityGrid
+
+
+class TestPathFinder(unittest.TestCase):
+    def setUp(self):
+        # 6 columns and 4 rows, with a wall on the third column except on the last row
+        self.grid = WalkabilityGrid(0, 0, 6, 4)
+        for row in range(3):
+            self.grid.blocked[row * 6 + 2] = True
+        self.path_finder = PathFinder(self.grid)
+
+    def assert_is_valid_path(self, start, path):
+        previous_tile = start
+        for tile in path:
+            self.assertIn(tile, self.grid.neighbours[previous_tile])
+            self.assertFalse(self.grid.blocked[tile])
+            previous_tile = tile
+
+    def test_find_path_around_obstacles(self):
+        self.grid.blocked[5] = True
+        path, found = self.path_finder.find_path(0, 5, [1])
+        self.assertTrue(found)
+        self.assert_is_valid_path(0, path)
+        # Down to the last row, across it and up next to the target
+        self.assertEqual(10, len(path))
+        self.assertIn(path[-1], (4, 11))
+
+    def test_find_path_with_longer_reach(self):
+        self.grid.blocked[5] = True
+        path, found = self.path_finder.find_path(0, 5, [1, 2])
+        self.assertTrue(found)
+        self.assert_is_valid_path(0, path)
+        self.assertEqual(9, len(path))
+        self.assertEqual(2, abs(path[-1] % 6 - 5) + abs(path[-1] // 6))
+
+    def test_target_already_at_reach(self):
+        path, found = self.path_finder.find_path(0, 1, [1])
+        self.assertTrue(found)
+        self.assertEqual([], path)
+
+    def test_move_budget(self):
+        self.grid.blocked[5] = True
+        path, found = self.path_finder.find_path(0, 5, [1], max_moves=4)
+        self.assertFalse(found)
+        self.assert_is_valid_path(0, path)
+        self.assertLessEqual(len(path), 4)
+
+        path, found = self.path_finder.find_path(0, 5, [1], max_moves=10)
+        self.assertTrue(found)
+        self.assertEqual(10, len(path))
+
+    def test_unreachable_target(self):
+        self.grid.blocked[19] = True
+        self.grid.blocked[5] = True
+        path, found = self.path_finder.find_path(0, 5, [1])
+        self.assertFalse(found)
+        self.assert_is_valid_path(0, path)
+        # Get as close as possible to the target
+        self.assertEqual(1, path[-1])
+
+    def test_searches_do_not_interfere(self):
+        self.grid.blocked[5] = True
+        first_result = self.path_finder.find_path(0, 5, [1])
+        self.path_finder.find_path(23, 0, [1])
+        self.assertEqual(first_result, self.path_finder.find_path(0, 5, [1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from src.services.random_service import (RandomService, RandomStream,
+                                         RandomStreamKind,
+                                         get_active_random_service,
+                                         get_random_stream,
+                                         set_active_random_service)
+
+
+class TestRandomService(unittest.TestCase):
+    def setUp(self):
+        self.previous_service = get_active_random_service()
+
+    def tearDown(self):
+        set_active_random_service(self.previous_service)
+
+    def test_same_seed_same_numbers(self):
+        stream = RandomStream("42:loot")
+        other_stream = RandomStream("42:loot")
+
+        self.assertEqual(
+            [stream.random() for _ in range(20)],
+            [other_stream.random() for _ in range(20)],
+        )
+        self.assertEqual(20, stream.draws)
+
+    def test_randint_and_choice_bounds(self):
+        stream = RandomStream("7:combat")
+        values = [stream.randint(1, 6) for _ in range(1000)]
+        self.assertEqual(set(range(1, 7)), set(values))
+
+        sequence = ["a", "b", "c"]
+        choices = {stream.choice(sequence) for _ in range(1000)}
+        self.assertEqual(set(sequence), choices)
+        self.assertEqual(2000, stream.draws)
+
+    def test_skip_to(self):
+        stream = RandomStream("3:growth")
+        numbers = [stream.randint(0, 100) for _ in range(10)]
+
+        resumed_stream = RandomStream("3:growth", draws=4)
+        self.assertEqual(
+            numbers[4:], [resumed_stream.randint(0, 100) for _ in range(6)]
+        )
+
+        resumed_stream.skip_to(2)
+        self.assertEqual(numbers[2], resumed_stream.randint(0, 100))
+
+    def test_streams_are_independent(self):
+        service = RandomService(123)
+        other_service = RandomService(123)
+
+        for _ in range(50):
+            service.get_stream(RandomStreamKind.COMBAT).random()
+
+        self.assertEqual(
+            other_service.get_stream(RandomStreamKind.LOOT).random(),
+            service.get_stream(RandomStreamKind.LOOT).random(),
+        )
+        self.assertNotEqual(
+            RandomService(123).get_stream(RandomStreamKind.LOOT).random(),
+            RandomService(124).get_stream(RandomStreamKind.LOOT).random(),
+        )
+
+    def test_restore_draws(self):
+        service = RandomService(99)
+        for kind in RandomStreamKind:
+            for _ in range(len(kind.value)):
+                service.get_stream(kind).random()
+        draws = service.get_draws()
+
+        restored_service = RandomService(99, draws)
+        for kind in RandomStreamKind:
+            self.assertEqual(
+                service.get_stream(kind).random(),
+                restored_service.get_stream(kind).random(),
+            )
+
+        service.set_draws(draws)
+        self.assertEqual(draws, service.get_draws())
+
+    def test_active_service(self):
+        service = RandomService(5)
+        set_active_random_service(service)
+
+        self.assertIs(service, get_active_random_service())
+        self.assertIs(
+            service.get_stream(RandomStreamKind.LOOT),
+            get_random_stream(RandomStreamKind.LOOT),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from src.services.reach_offsets import get_reach_offsets, get_ring_offsets
+
+
+class TestReachOffsets(unittest.TestCase):
+    def test_ring_offsets(self):
+        self.assertEqual({(-1, 0), (0, 1), (0, -1), (1, 0)}, get_ring_offsets(1))
+        self.assertEqual(8, len(get_ring_offsets(2)))
+        for x_offset, y_offset in get_ring_offsets(3):
+            self.assertEqual(3, abs(x_offset) + abs(y_offset))
+
+    def test_ring_offsets_are_computed_once(self):
+        self.assertIs(get_ring_offsets(2), get_ring_offsets(2))
+        self.assertIs(get_reach_offsets([1, 2]), get_reach_offsets((1, 2)))
+
+    def test_reach_offsets(self):
+        self.assertEqual(get_ring_offsets(1), get_reach_offsets([1]))
+        self.assertEqual(
+            get_ring_offsets(1) | get_ring_offsets(2), get_reach_offsets([1, 2])
+        )
+        self.assertEqual(frozenset(), get_reach_offsets([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,11 @@ from src.game_entities.foe import Keyword
 from src.services.load_from_xml_manager import (load_ally_from_save,
                                                 load_alteration,
                                                 load_foe_from_save, load_item,
-                                                load_player, parse_item_file)
+                                                load_player,
+                                                load_random_service,
+                                                parse_item_file)
+from src.services.random_service import (MAX_SEED, RandomService,
+                                         RandomStreamKind)
 from tests.random_data_library import (random_alteration,
                                        random_character_entity,
                                        random_foe_entity, random_gold,
@@ -152,3 +156,19 @@ class TestSaveAndLoad(unittest.TestCase):
         self.assertEqual(potion.description, loaded_potion.description)
         self.assertEqual(potion.price, loaded_potion.price)
         self.assertEqual(potion.resell_price, loaded_potion.resell_price)
+
+    def test_save_and_load_random_service(self):
+        random_service = RandomService(random.randrange(MAX_SEED))
+        for kind in RandomStreamKind:
+            for _ in range(random.randint(0, 20)):
+                random_service.get_stream(kind).random()
+
+        random_service_saved = random_service.save("random")
+        loaded_random_service = load_random_service(random_service_saved)
+        self.assertEqual(random_service.seed, loaded_random_service.seed)
+        self.assertEqual(random_service.get_draws(), loaded_random_service.get_draws())
+        for kind in RandomStreamKind:
+            self.assertEqual(
+                random_service.get_stream(kind).random(),
+                loaded_random_service.get_stream(kind).random(),
+            )
@@ -0,0 +1,74 @@
+import unittest
+
+from src.game_entities.movable import EntityStrategy
+from src.services.side_turn_planner import (AgentSnapshot, PlannedAction,
+                                            SideTurnPlanner)
+from src.services.walkability_grid import WalkabilityGrid
+from tests.tools import minimal_setup_for_game
+
+
+class TestSideTurnPlanner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        # A 6x3 map with a target on the tile (5, 1)
+        self.grid = WalkabilityGrid(0, 0, 6, 3)
+        self.target = 1 * 6 + 5
+        self.grid.blocked[self.target] = True
+
+    def add_agent(self, tile, strategy, max_moves=2, reach=(1,)):
+        self.grid.blocked[tile] = True
+        return AgentSnapshot(tile, max_moves, reach, strategy)
+
+    def test_static_agent_stays(self):
+        agent = self.add_agent(1 * 6 + 4, EntityStrategy.STATIC)
+        actions = SideTurnPlanner(self.grid).plan([agent], [self.target])
+        self.assertEqual([PlannedAction((), None, 0)], actions)
+
+    def test_active_agent_goes_toward_nearest_target(self):
+        other_target = 0
+        self.grid.blocked[other_target] = True
+        agent = self.add_agent(1 * 6 + 3, EntityStrategy.ACTIVE)
+        actions = SideTurnPlanner(self.grid).plan(
+            [agent], [other_target, self.target]
+        )
+        self.assertEqual(1, len(actions))
+        self.assertEqual(1, actions[0].target)
+        self.assertEqual((1 * 6 + 4,), actions[0].path)
+        self.assertEqual(1, actions[0].attack)
+
+    def test_semi_active_agent_only_moves_when_target_is_at_reach(self):
+        agent = self.add_agent(1 * 6 + 3, EntityStrategy.SEMI_ACTIVE, max_moves=1)
+        far_agent = self.add_agent(1 * 6, EntityStrategy.SEMI_ACTIVE, max_moves=1)
+        actions = SideTurnPlanner(self.grid).plan([agent, far_agent], [self.target])
+        self.assertEqual(PlannedAction((1 * 6 + 4,), 0, 0), actions[0])
+        self.assertEqual(PlannedAction((), None, None), actions[1])
+
+    def test_moves_are_committed_for_next_agents(self):
+        first_agent = self.add_agent(1 * 6 + 3, EntityStrategy.ACTIVE, max_moves=1)
+        second_agent = self.add_agent(1 * 6 + 2, EntityStrategy.ACTIVE)
+        actions = SideTurnPlanner(self.grid).plan(
+            [first_agent, second_agent], [self.target]
+        )
+        self.assertEqual((1 * 6 + 4,), actions[0].path)
+        # The tile next to the target is taken, the second agent goes around the first one
+        destination = actions[1].path[-1]
+        self.assertIn(destination, (0 * 6 + 3, 2 * 6 + 3))
+        self.assertNotIn(1 * 6 + 4, actions[1].path)
+
+    def test_planning_does_not_alter_level_grid(self):
+        agent = self.add_agent(1 * 6 + 2, EntityStrategy.ACTIVE)
+        blocked = bytes(self.grid.blocked)
+        SideTurnPlanner(self.grid).plan([agent], [self.target])
+        self.assertEqual(blocked, bytes(self.grid.blocked))
+
+    def test_agent_outside_map_does_nothing(self):
+        agent = AgentSnapshot(None, 2, (1,), EntityStrategy.ACTIVE)
+        actions = SideTurnPlanner(self.grid).plan([agent], [self.target])
+        self.assertEqual([PlannedAction((), None, None)], actions)
+
+
+if __name__ == "__main__":
+    unittest.main()
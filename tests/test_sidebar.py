@@ -0,0 +1,78 @@
+import unittest
+
+import pygame
+
+from src.constants import MAX_MAP_HEIGHT, MENU_HEIGHT, MENU_WIDTH
+from src.game_entities.mission import Mission, MissionType
+from src.gui.position import Position
+from src.gui.sidebar import Sidebar
+from tests.random_data_library import random_foe_entity, random_player_entity
+from tests.tools import minimal_setup_for_game
+
+MARKER_COLOR = (255, 0, 255)
+
+
+class TestSidebar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.mission = Mission(True, MissionType.KILL_EVERYBODY, [], "Test mission", 1)
+        self.sidebar = Sidebar(
+            (MENU_WIDTH, MENU_HEIGHT), Position(0, MAX_MAP_HEIGHT), [self.mission], 0
+        )
+        self.screen = pygame.Surface((MENU_WIDTH, MAX_MAP_HEIGHT + MENU_HEIGHT))
+
+    def display_is_rendered_again(self, number_turns, hovered_entity):
+        # Mark the cached surface so that we can know if it has been rendered again
+        self.sidebar.surface.set_at((0, 0), MARKER_COLOR)
+        self.sidebar.display(self.screen, number_turns, hovered_entity)
+        return tuple(self.sidebar.surface.get_at((0, 0)))[:3] != MARKER_COLOR
+
+    def test_display(self):
+        self.sidebar.display(self.screen, 1, None)
+
+        self.assertEqual(
+            pygame.image.tobytes(self.sidebar.surface, "RGB"),
+            pygame.image.tobytes(
+                self.screen.subsurface(
+                    pygame.Rect(self.sidebar.position, self.sidebar.size)
+                ),
+                "RGB",
+            ),
+        )
+
+    def test_render_only_when_turn_or_missions_change(self):
+        self.assertTrue(self.display_is_rendered_again(1, None))
+        self.assertFalse(self.display_is_rendered_again(1, None))
+        self.assertTrue(self.display_is_rendered_again(2, None))
+        self.assertFalse(self.display_is_rendered_again(2, None))
+
+        self.mission.ended = True
+
+        self.assertTrue(self.display_is_rendered_again(2, None))
+        self.assertFalse(self.display_is_rendered_again(2, None))
+
+    def test_render_only_when_hovered_entity_changes(self):
+        player = random_player_entity()
+        foe = random_foe_entity()
+        self.sidebar.display(self.screen, 1, None)
+
+        self.assertTrue(self.display_is_rendered_again(1, player))
+        self.assertFalse(self.display_is_rendered_again(1, player))
+        self.assertTrue(self.display_is_rendered_again(1, foe))
+
+        foe.hit_points -= 1
+
+        self.assertTrue(self.display_is_rendered_again(1, foe))
+        self.assertFalse(self.display_is_rendered_again(1, foe))
+
+        foe.lvl += 1
+
+        self.assertTrue(self.display_is_rendered_again(1, foe))
+        self.assertTrue(self.display_is_rendered_again(1, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
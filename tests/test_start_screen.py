@@ -99,7 +99,7 @@ class TestStartScreen(unittest.TestCase):
         self.start_screen.click(LEFT_BUTTON, position)
 
         self.assertIsInstance(self.start_screen.level, self.level_class)
-        self.assertEqual(self.start_screen.level.number, 0)
+        self.assertEqual(self.start_screen.level.engine.number, 0)
         self.assertNotEqual(self.start_screen.screen.get_rect(), screen.get_rect())
 
     def test_load_nonexistent_save(self):
@@ -147,7 +147,7 @@ class TestStartScreen(unittest.TestCase):
         self.start_screen.click(LEFT_BUTTON, position)
 
         self.assertIsInstance(self.start_screen.level, self.level_class)
-        self.assertEqual(self.start_screen.level.number, 0)
+        self.assertEqual(self.start_screen.level.engine.number, 0)
         self.assertNotEqual(self.start_screen.screen.get_rect(), screen.get_rect())
 
     def test_options_menu(self):
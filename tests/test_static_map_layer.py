@@ -0,0 +1,93 @@
+import unittest
+
+import pygame
+
+from src.constants import TILE_SIZE
+from src.game_entities.obstacle import Obstacle
+from src.gui.position import Position
+from src.gui.static_map_layer import StaticMapLayer
+from tests.random_data_library import random_chest
+from tests.tools import minimal_setup_for_game
+
+GROUND_COLOR = (90, 90, 90)
+OBSTACLE_COLOR = (200, 30, 30)
+
+
+class TestStaticMapLayer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        minimal_setup_for_game()
+
+    def setUp(self):
+        self.ground = pygame.Surface((4 * TILE_SIZE, 3 * TILE_SIZE))
+        self.ground.fill(GROUND_COLOR)
+        self.position = Position(TILE_SIZE, 2 * TILE_SIZE)
+        sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        sprite.fill(OBSTACLE_COLOR)
+        self.first_obstacle = Obstacle(Position(TILE_SIZE, 2 * TILE_SIZE), sprite)
+        self.second_obstacle = Obstacle(Position(3 * TILE_SIZE, 3 * TILE_SIZE), sprite)
+
+    def get_color(self, layer, tile_x, tile_y):
+        return tuple(
+            layer.surface.get_at(
+                (
+                    tile_x * TILE_SIZE + TILE_SIZE // 2,
+                    tile_y * TILE_SIZE + TILE_SIZE // 2,
+                )
+            )
+        )[:3]
+
+    def test_bake_static_entities(self):
+        layer = StaticMapLayer(
+            self.ground, self.position, [self.first_obstacle, self.second_obstacle]
+        )
+
+        self.assertEqual(pygame.Rect(self.position, self.ground.get_size()), layer.rect)
+        self.assertEqual(OBSTACLE_COLOR, self.get_color(layer, 0, 0))
+        self.assertEqual(OBSTACLE_COLOR, self.get_color(layer, 2, 1))
+        self.assertEqual(GROUND_COLOR, self.get_color(layer, 1, 0))
+        self.assertEqual([], layer.update([self.first_obstacle, self.second_obstacle]))
+
+    def test_only_changed_tiles_are_baked_again(self):
+        layer = StaticMapLayer(
+            self.ground, self.position, [self.first_obstacle, self.second_obstacle]
+        )
+
+        changed_rects = layer.update([self.second_obstacle])
+
+        self.assertEqual([self.first_obstacle.get_rect()], changed_rects)
+        self.assertEqual(GROUND_COLOR, self.get_color(layer, 0, 0))
+        self.assertEqual(OBSTACLE_COLOR, self.get_color(layer, 2, 1))
+
+        chest = random_chest()
+        chest.position = Position(2 * TILE_SIZE, 2 * TILE_SIZE)
+        self.assertEqual(
+            [chest.get_rect()], layer.update([self.second_obstacle, chest])
+        )
+        closed_chest = layer.surface.copy()
+        self.assertEqual([], layer.update([self.second_obstacle, chest]))
+
+        chest.open()
+
+        self.assertEqual(
+            [chest.get_rect()], layer.update([self.second_obstacle, chest])
+        )
+        self.assertNotEqual(
+            pygame.image.tobytes(closed_chest, "RGB"),
+            pygame.image.tobytes(layer.surface, "RGB"),
+        )
+
+    def test_display(self):
+        layer = StaticMapLayer(self.ground, self.position, [self.first_obstacle])
+        screen = pygame.Surface((6 * TILE_SIZE, 6 * TILE_SIZE))
+
+        layer.display(screen)
+
+        self.assertEqual(
+            OBSTACLE_COLOR, tuple(screen.get_at(self.first_obstacle.position))[:3]
+        )
+        self.assertEqual((0, 0, 0), tuple(screen.get_at((0, 0)))[:3])
+
+
+if __name__ == "__main__":
+    unittest.main()
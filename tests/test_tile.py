@@ -0,0 +1,32 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.tile import Tile
+
+
+class TestTile(unittest.TestCase):
+    def test_from_position(self):
+        tile = Tile.from_position(Position(3 * TILE_SIZE, 5 * TILE_SIZE))
+        self.assertEqual(Tile(3, 5), tile)
+        self.assertIsInstance(tile, Tile)
+        self.assertIsInstance(tile.column, int)
+        self.assertEqual(
+            Tile(3, 5), Tile.from_position((3.5 * TILE_SIZE, 5 * TILE_SIZE))
+        )
+        self.assertEqual(Tile(-1, -1), Tile.from_position((-1, -1)))
+
+    def test_to_position(self):
+        position = Tile(3, 5).to_position()
+        self.assertIsInstance(position, Position)
+        self.assertEqual(Position(3 * TILE_SIZE, 5 * TILE_SIZE), position)
+        self.assertEqual(Tile(3, 5), Tile.from_position(position))
+
+    def test_tile_is_a_plain_key(self):
+        tiles = {Tile(1, 2): "tile"}
+        self.assertEqual("tile", tiles[(1, 2)])
+        self.assertEqual(hash((1, 2)), hash(Tile(1, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
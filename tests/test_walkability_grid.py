@@ -0,0 +1,70 @@
+import unittest
+
+from src.constants import TILE_SIZE
+from src.gui.position import Position
+from src.services.walkability_grid import WalkabilityGrid
+
+
+class TestWalkabilityGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = WalkabilityGrid(TILE_SIZE, 2 * TILE_SIZE, 5, 4)
+
+    def test_index_and_position_conversions(self):
+        self.assertEqual(0, self.grid.index_of(Position(TILE_SIZE, 2 * TILE_SIZE)))
+        self.assertEqual(7, self.grid.index_of(Position(3 * TILE_SIZE, 3 * TILE_SIZE)))
+        self.assertIsNone(self.grid.index_of(Position(0, 2 * TILE_SIZE)))
+        self.assertIsNone(self.grid.index_of(Position(6 * TILE_SIZE, 2 * TILE_SIZE)))
+        self.assertEqual(
+            Position(3 * TILE_SIZE, 3 * TILE_SIZE), self.grid.position_of(7)
+        )
+
+    def test_blocked_tiles_are_not_walkable(self):
+        tile = Position(2 * TILE_SIZE, 2 * TILE_SIZE)
+        self.assertTrue(self.grid.is_walkable(tile))
+        self.grid.set_blocked(tile, True)
+        self.assertFalse(self.grid.is_walkable(tile))
+        self.grid.clear()
+        self.assertTrue(self.grid.is_walkable(tile))
+        self.assertFalse(self.grid.is_walkable(Position(0, 0)))
+
+    def test_reachable_tiles(self):
+        # Wall on the third column, except on the last row
+        for row in range(3):
+            self.grid.blocked[row * 5 + 2] = True
+        self.grid.blocked[0] = True
+
+        reachable_tiles = self.grid.reachable_tiles(0, 4)
+        self.assertEqual(0, reachable_tiles[0])
+        self.assertEqual(1, reachable_tiles[1])
+        self.assertEqual(4, reachable_tiles[16])
+        self.assertNotIn(2, reachable_tiles)
+        self.assertNotIn(3, reachable_tiles)
+        self.assertEqual({0: 0, 1: 1, 5: 1}, self.grid.reachable_tiles(0, 1))
+
+    def test_reachable_tiles_predecessors(self):
+        for row in range(3):
+            self.grid.blocked[row * 5 + 2] = True
+
+        predecessors = {}
+        reachable_tiles = self.grid.reachable_tiles(0, 6, predecessors)
+        self.assertNotIn(0, predecessors)
+        self.assertEqual(reachable_tiles.keys() - {0}, predecessors.keys())
+        for tile, predecessor in predecessors.items():
+            self.assertEqual(reachable_tiles[tile] - 1, reachable_tiles[predecessor])
+            self.assertIn(predecessor, self.grid.neighbours[tile])
+
+    def test_distances_from(self):
+        for row in range(3):
+            self.grid.blocked[row * 5 + 2] = True
+
+        distances = self.grid.distances_from([0, 4])
+        self.assertEqual(0, distances[0])
+        self.assertEqual(0, distances[4])
+        self.assertEqual(3, distances[15])
+        self.assertEqual(4, distances[16])
+        self.assertNotIn(2, distances)
+        self.assertEqual({}, self.grid.distances_from([]))
+
+
+if __name__ == "__main__":
+    unittest.main()